@@ -28,6 +28,10 @@ Tag inspection and setter methods
     setting dynamic tags          - set_tag(**tag_dict: dict)
     set/clone dynamic tags        - clone_tags(estimator, tag_names=None)
 
+Config inspection and setter methods
+    get configs (all)             - get_config()
+    set configs                   - set_config(**config_dict: dict)
+
 Blueprinting: resetting and cloning, post-init state with same hyper-parameters
     reset estimator to post-init  - reset()
     cloneestimator (copy&reset)   - clone()
@@ -58,6 +62,7 @@ import inspect
 import warnings
 from collections import defaultdict
 from copy import deepcopy
+from weakref import WeakKeyDictionary
 
 from sklearn import clone
 from sklearn.base import BaseEstimator as _BaseEstimator
@@ -65,6 +70,14 @@ from sklearn.ensemble._base import _set_random_states
 
 from sktime.exceptions import NotFittedError
 
+# memoized class tags, class -> (_tags attribute of class, dict of class tags)
+_CLASS_TAGS_CACHE = WeakKeyDictionary()
+# memoized tags of objects, object -> (_tags_dynamic of object, dict of tags)
+_OBJECT_TAGS_CACHE = WeakKeyDictionary()
+
+# tag values of these types are returned by get_tag without copying
+_IMMUTABLE_TAG_TYPES = (str, bool, int, float, type(None))
+
 
 class BaseObject(_BaseEstimator):
     """Base class for parametric objects with tags sktime.
@@ -72,8 +85,12 @@ class BaseObject(_BaseEstimator):
     Extends scikit-learn's BaseEstimator to include sktime interface for tags.
     """
 
+    # default config values - configs control behaviour, not estimator logic
+    _config = {}
+
     def __init__(self):
         self._tags_dynamic = dict()
+        self._config_dynamic = dict()
         super(BaseObject, self).__init__()
 
     def reset(self):
@@ -92,9 +109,11 @@ class BaseObject(_BaseEstimator):
         Not affected by the reset are:
         object attributes containing double-underscores
         class and object methods, class attributes
+        configs set via set_config
         """
-        # retrieve parameters to copy them later
+        # retrieve parameters and config to copy them later
         params = self.get_params(deep=False)
+        config = deepcopy(getattr(self, "_config_dynamic", dict()))
 
         # delete all object attributes in self
         attrs = [attr for attr in dir(self) if "__" not in attr]
@@ -105,6 +124,8 @@ class BaseObject(_BaseEstimator):
 
         # run init with a copy of parameters self had at the start
         self.__init__(**params)
+        # restore config, configs are not hyper-parameters and survive reset
+        self.set_config(**config)
 
         return self
 
@@ -112,14 +133,19 @@ class BaseObject(_BaseEstimator):
         """Obtain a clone of the object with same hyper-parameters.
 
         A clone is a different object without shared references, in post-init state.
-        This function is equivalent to returning sklearn.clone of self.
+        This function is equivalent to returning sklearn.clone of self,
+        with configs set via set_config carried over to the clone.
         Equal in value to `type(self)(**self.get_params(deep=False))`.
 
         Returns
         -------
         instance of type(self), clone of self (see above)
         """
-        return clone(self)
+        self_clone = clone(self)
+        config = getattr(self, "_config_dynamic", dict())
+        if len(config) > 0:
+            self_clone.set_config(**config)
+        return self_clone
 
     @classmethod
     def _get_init_signature(cls):
@@ -245,6 +271,27 @@ class BaseObject(_BaseEstimator):
             class attribute via nested inheritance. NOT overridden by dynamic
             tags set by set_tags or mirror_tags.
         """
+        return deepcopy(cls._get_class_tags_memo())
+
+    @classmethod
+    def _get_class_tags_memo(cls):
+        """Get class tags, memoized per class, returns reference, not a copy.
+
+        The collected tags are memoized on first call, and re-collected only if
+        the _tags attribute of cls is replaced. Changing _tags of parent classes
+        after the first call is not supported.
+
+        Returns
+        -------
+        collected_tags : dict
+            Dictionary of tag name : tag value pairs, same as get_class_tags.
+            Must not be mutated by the caller.
+        """
+        own_tags = cls.__dict__.get("_tags")
+        memo = _CLASS_TAGS_CACHE.get(cls)
+        if memo is not None and memo[0] is own_tags:
+            return memo[1]
+
         collected_tags = dict()
 
         # We exclude the last two parent classes: sklearn.base.BaseEstimator and
@@ -257,7 +304,9 @@ class BaseObject(_BaseEstimator):
                 more_tags = parent_class._tags
                 collected_tags.update(more_tags)
 
-        return deepcopy(collected_tags)
+        collected_tags = deepcopy(collected_tags)
+        _CLASS_TAGS_CACHE[cls] = (own_tags, collected_tags)
+        return collected_tags
 
     @classmethod
     def get_class_tag(cls, tag_name, tag_value_default=None):
@@ -276,9 +325,9 @@ class BaseObject(_BaseEstimator):
             Value of the `tag_name` tag in self. If not found, returns
             `tag_value_default`.
         """
-        collected_tags = cls.get_class_tags()
+        collected_tags = cls._get_class_tags_memo()
 
-        return collected_tags.get(tag_name, tag_value_default)
+        return _copy_tag_value(collected_tags.get(tag_name, tag_value_default))
 
     def get_tags(self):
         """Get tags from estimator class and dynamic tag overrides.
@@ -290,12 +339,39 @@ class BaseObject(_BaseEstimator):
             class attribute via nested inheritance and then any overrides
             and new tags from _tags_dynamic object attribute.
         """
-        collected_tags = self.get_class_tags()
+        return deepcopy(self._get_tags_memo())
 
-        if hasattr(self, "_tags_dynamic"):
-            collected_tags.update(self._tags_dynamic)
+    def _get_tags_memo(self):
+        """Get tags of self, memoized per object, returns reference, not a copy.
 
-        return deepcopy(collected_tags)
+        The collected tags are memoized on first call, the memo is invalidated by
+        set_tags and clone_tags, or if the _tags_dynamic attribute is replaced.
+
+        Returns
+        -------
+        collected_tags : dict
+            Dictionary of tag name : tag value pairs, same as get_tags.
+            Must not be mutated by the caller.
+        """
+        tags_dynamic = getattr(self, "_tags_dynamic", None)
+        try:
+            memo = _OBJECT_TAGS_CACHE.get(self)
+            hashable = True
+        except TypeError:
+            # self is not hashable, e.g., due to custom __eq__, so is not memoized
+            memo, hashable = None, False
+        if memo is not None and memo[0] is tags_dynamic:
+            return memo[1]
+
+        collected_tags = self._get_class_tags_memo()
+
+        if tags_dynamic:
+            collected_tags = collected_tags.copy()
+            collected_tags.update(deepcopy(tags_dynamic))
+
+        if hashable and tags_dynamic is not None:
+            _OBJECT_TAGS_CACHE[self] = (tags_dynamic, collected_tags)
+        return collected_tags
 
     def get_tag(self, tag_name, tag_value_default=None, raise_error=True):
         """Get tag value from estimator class and dynamic tag overrides.
@@ -320,14 +396,12 @@ class BaseObject(_BaseEstimator):
         ValueError if raise_error is True i.e. if tag_name is not in self.get_tags(
         ).keys()
         """
-        collected_tags = self.get_tags()
+        collected_tags = self._get_tags_memo()
 
-        tag_value = collected_tags.get(tag_name, tag_value_default)
-
-        if raise_error and tag_name not in collected_tags.keys():
+        if raise_error and tag_name not in collected_tags:
             raise ValueError(f"Tag with name {tag_name} could not be found.")
 
-        return tag_value
+        return _copy_tag_value(collected_tags.get(tag_name, tag_value_default))
 
     def set_tags(self, **tag_dict):
         """Set dynamic tags to given values.
@@ -353,6 +427,12 @@ class BaseObject(_BaseEstimator):
         else:
             self._tags_dynamic = tag_update
 
+        # invalidate memoized tags, see _get_tags_memo
+        try:
+            _OBJECT_TAGS_CACHE.pop(self, None)
+        except TypeError:
+            pass
+
         return self
 
     def clone_tags(self, estimator, tag_names=None):
@@ -375,7 +455,7 @@ class BaseObject(_BaseEstimator):
         Changes object state by setting tag values in tag_set from estimator as
         dynamic tags in self.
         """
-        tags_est = deepcopy(estimator.get_tags())
+        tags_est = estimator.get_tags()
 
         # if tag_set is not passed, default is all tags in estimator
         if tag_names is None:
@@ -392,6 +472,81 @@ class BaseObject(_BaseEstimator):
 
         return self
 
+    def get_config(self):
+        """Get config flags for self.
+
+        Configs are key-value pairs of self, typically used as transient flags
+        for controlling behaviour, e.g., the parallelization backend.
+        Configs do not change the logic or results of the estimator.
+
+        Returns
+        -------
+        config_dict : dict
+            Dictionary of config name : config value pairs. Collected from _config
+            class attribute via nested inheritance and then any overrides
+            and new configs from _config_dynamic object attribute.
+        """
+        config_dict = dict()
+
+        for parent_class in reversed(inspect.getmro(type(self))[:-2]):
+            if hasattr(parent_class, "_config"):
+                config_dict.update(parent_class._config)
+
+        if hasattr(self, "_config_dynamic"):
+            config_dict.update(self._config_dynamic)
+
+        return deepcopy(config_dict)
+
+    def _get_config_value(self, config_name):
+        """Get value of a single config flag of self, without copying all configs.
+
+        Parameters
+        ----------
+        config_name : str
+            Name of the config flag.
+
+        Returns
+        -------
+        config_value :
+            Value of config_name in get_config(), None if config_name is not found.
+            Returned by reference, must not be mutated by the caller.
+        """
+        config_dynamic = getattr(self, "_config_dynamic", dict())
+        if config_name in config_dynamic:
+            return config_dynamic[config_name]
+
+        for parent_class in inspect.getmro(type(self)):
+            parent_config = parent_class.__dict__.get("_config")
+            if parent_config is not None and config_name in parent_config:
+                return parent_config[config_name]
+
+        return None
+
+    def set_config(self, **config_dict):
+        """Set config flags to given values.
+
+        Parameters
+        ----------
+        config_dict : dict
+            Dictionary of config name : config value pairs.
+
+        Returns
+        -------
+        self : reference to self.
+
+        Notes
+        -----
+        Changes object state, copies configs in config_dict to self._config_dynamic.
+        Configs are retained by reset and clone, unlike dynamic tags.
+        """
+        config_update = deepcopy(config_dict)
+        if hasattr(self, "_config_dynamic"):
+            self._config_dynamic.update(config_update)
+        else:
+            self._config_dynamic = config_update
+
+        return self
+
     @classmethod
     def get_test_params(cls, parameter_set="default"):
         """Return testing parameter settings for the estimator.
@@ -597,6 +752,22 @@ class BaseObject(_BaseEstimator):
         return comp_dict
 
 
+def _copy_tag_value(tag_value):
+    """Return tag_value, or a deep copy if it is of a mutable type.
+
+    Parameters
+    ----------
+    tag_value : any object, value of a tag
+
+    Returns
+    -------
+    tag_value if it is of an immutable type, e.g., str or bool, otherwise a deep copy
+    """
+    if isinstance(tag_value, _IMMUTABLE_TAG_TYPES):
+        return tag_value
+    return deepcopy(tag_value)
+
+
 class TagAliaserMixin:
     """Mixin class for tag aliasing and deprecation of old tags.
 
@@ -13,6 +13,7 @@ tests in this module:
 
     test_reset           - tests reset logic on a simple, non-composite estimator
     test_reset_composite - tests reset logic on a composite estimator
+    test_set_get_config  - tests set_config and get_config logic, and persistence
 """
 
 __author__ = ["fkiraly"]
@@ -25,6 +26,7 @@ __all__ = [
     "test_set_tags",
     "test_reset",
     "test_reset_composite",
+    "test_set_get_config",
 ]
 
 from copy import deepcopy
@@ -171,6 +173,34 @@ def test_set_tags():
     assert FIXTURE_OBJECT_SET.get_tags() == FIXTURE_OBJECT_SET_TAGS, msg
 
 
+def test_tags_memo_invalidation():
+    """Tests that memoized tags are updated by set_tags, clone_tags and reset.
+
+    Raises
+    ------
+    AssertionError if get_tag or get_tags return outdated or mutable memoized tags
+    """
+    obj = FixtureClassChild()
+    obj.set_tags(F=["a"])
+    assert obj.get_tag("A") == 42
+
+    obj.set_tags(A=43)
+    assert obj.get_tag("A") == 43
+    assert obj.get_tags()["A"] == 43
+
+    obj.clone_tags(FIXTURE_OBJECT, ["A"])
+    assert obj.get_tag("A") == 42424241
+
+    # mutating returned values must not affect the tags
+    obj.get_tag("F").append("b")
+    obj.get_tags()["F"].append("c")
+    assert obj.get_tag("F") == ["a"]
+
+    obj.reset()
+    assert obj.get_tags() == FIXTURE_CLASSCHILD_TAGS
+    assert FixtureClassChild.get_class_tags() == FIXTURE_CLASSCHILD_TAGS
+
+
 class CompositionDummy(BaseObject):
     """Potentially composite object, for testing."""
 
@@ -252,6 +282,43 @@ def test_reset_composite():
     assert not hasattr(x.a, "d")
 
 
+class ConfigTester(BaseObject):
+
+    _config = {"foo_config": 42, "bar": "a"}
+
+    def __init__(self, a=42):
+        self.a = a
+        super(ConfigTester, self).__init__()
+
+
+def test_set_get_config():
+    """Tests set_config and get_config, and that configs persist on reset and clone.
+
+    Raises
+    ------
+    AssertionError if logic behind set_config, get_config is incorrect, logic tested:
+        get_config returns class configs, overridden by configs set via set_config
+        configs set via set_config are retained by reset and clone
+        hyper-parameters of the clone are the same as of the original
+    """
+    obj = ConfigTester(a=84)
+    assert obj.get_config() == {"foo_config": 42, "bar": "a"}
+
+    obj.set_config(foobar=126, bar="b")
+    expected = {"foo_config": 42, "bar": "b", "foobar": 126}
+    assert obj.get_config() == expected
+
+    obj.reset()
+    assert obj.get_config() == expected
+
+    obj_clone = obj.clone()
+    assert obj_clone.get_config() == expected
+    assert obj_clone.a == 84
+
+    # class configs must not have been modified
+    assert ConfigTester().get_config() == {"foo_config": 42, "bar": "a"}
+
+
 def test_components():
     """Tests component retrieval.
 
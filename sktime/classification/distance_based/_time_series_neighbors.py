@@ -23,12 +23,13 @@ __all__ = ["KNeighborsTimeSeriesClassifier"]
 from inspect import signature
 
 import numpy as np
+from scipy.sparse import csr_matrix
 from sklearn.neighbors import KNeighborsClassifier
 from sklearn.neighbors._base import _check_weights
 
 from sktime.classification.base import BaseClassifier
 from sktime.datatypes import check_is_mtype
-from sktime.distances import pairwise_distance
+from sktime.distances import KNeighborsSearch, pairwise_distance
 
 # add new distance string codes here
 DISTANCES_SUPPORTED = [
@@ -71,7 +72,13 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
           containing the weights.
     algorithm : str, optional. default = 'brute'
         search method for neighbours
-        one of {'auto’, 'ball_tree', 'kd_tree', 'brute'}
+        one of {'auto’, 'ball_tree', 'kd_tree', 'brute', 'lb_cascade'}
+        'lb_cascade' uses ``sktime.distances.KNeighborsSearch``, which avoids
+        computing the full distance matrix in predict, via lower bounds and
+        early abandoning for 'dtw' and 'ddtw'. For other distances, distances are
+        computed in tiles, keeping a running top-k, so the full distance matrix
+        is never allocated in predict or kneighbors. Neighbours found are identical
+        to 'brute'. Only applies if distance is a str, otherwise 'brute' is used.
     distance : str or callable, optional. default ='dtw'
         distance measure between time series
         if str, must be one of the following strings:
@@ -104,6 +111,8 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
         ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
         for more details.
+        If distance is a str, also the number of threads used to compute
+        the distance matrix with ``pairwise_distance``.
         Doesn't affect :meth:`fit` method.
 
     Examples
@@ -156,9 +165,15 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
                 "Alternatively, pass a callable distance measure into the constuctor."
             )
 
+        # lb_cascade searches neighbours in sktime, sklearn sees a precomputed graph
+        if algorithm == "lb_cascade":
+            sklearn_algorithm = "brute"
+        else:
+            sklearn_algorithm = algorithm
+
         self.knn_estimator_ = KNeighborsClassifier(
             n_neighbors=n_neighbors,
-            algorithm=algorithm,
+            algorithm=sklearn_algorithm,
             metric="precomputed",
             metric_params=distance_params,
             leaf_size=leaf_size,
@@ -181,7 +196,9 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
             distance_params = {}
 
         if isinstance(distance, str):
-            return pairwise_distance(X, X2, distance, **distance_params)
+            return pairwise_distance(
+                X, X2, distance, n_jobs=self.n_jobs, **distance_params
+            )
         else:
             if X2 is not None:
                 return distance(X, X2, **distance_params)
@@ -194,6 +211,25 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
                 else:
                     return distance(X, **distance_params)
 
+    def _test_distances(self, X, n_neighbors=None):
+        """Compute distances of X to training data, as input for knn_estimator_.
+
+        Returns full distance matrix, or sparse neighbours graph if lb_cascade is used.
+        """
+        if getattr(self, "_nn_search", None) is None:
+            # self._X should be the stored _X
+            return self._distance(X, self._X)
+
+        if n_neighbors is None:
+            n_neighbors = self.n_neighbors
+        dist, ind = self._nn_search.kneighbors(X, n_neighbors=n_neighbors)
+
+        # explicit zeros in the csr graph are neighbours at distance zero
+        n_queries = dist.shape[0]
+        indptr = np.arange(0, n_queries * n_neighbors + 1, n_neighbors)
+        shape = (n_queries, self._X.shape[0])
+        return csr_matrix((dist.ravel(), ind.ravel(), indptr), shape=shape)
+
     def _fit(self, X, y):
         """Fit the model using X as training data and y as target values.
 
@@ -207,6 +243,16 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         # store full data as indexed X
         self._X = X
 
+        if self.algorithm == "lb_cascade" and isinstance(self.distance, str):
+            distance_params = self.distance_params
+            if distance_params is None:
+                distance_params = {}
+            self._nn_search = KNeighborsSearch(
+                metric=self.distance, n_neighbors=self.n_neighbors, **distance_params
+            ).fit(X)
+        else:
+            self._nn_search = None
+
         if self.pass_train_distances:
             dist_mat = self._distance(X)
         else:
@@ -248,8 +294,7 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         """
         self.check_is_fitted()
 
-        # self._X should be the stored _X
-        dist_mat = self._distance(X, self._X)
+        dist_mat = self._test_distances(X, n_neighbors=n_neighbors)
 
         result = self.knn_estimator_.kneighbors(
             dist_mat, n_neighbors=n_neighbors, return_distance=return_distance
@@ -271,8 +316,7 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         y : array of shape [n_samples] or [n_samples, n_outputs]
             Class labels for each data sample.
         """
-        # self._X should be the stored _X
-        dist_mat = self._distance(X, self._X)
+        dist_mat = self._test_distances(X)
 
         y_pred = self.knn_estimator_.predict(dist_mat)
 
@@ -293,8 +337,7 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
             The class probabilities of the input samples. Classes are ordered
             by lexicographic order.
         """
-        # self._X should be the stored _X
-        dist_mat = self._distance(X, self._X)
+        dist_mat = self._test_distances(X)
 
         y_pred = self.knn_estimator_.predict_proba(dist_mat)
 
@@ -334,4 +377,7 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         dist = AggrDist.create_test_instance()
         params3 = {"distance": dist}
 
-        return [params1, params2, params3]
+        # testing lower bound cascade search
+        params4 = {"distance": "dtw", "algorithm": "lb_cascade", "n_neighbors": 2}
+
+        return [params1, params2, params3, params4]
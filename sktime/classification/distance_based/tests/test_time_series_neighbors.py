@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Test function of elastic distance nearest neighbour classifiers."""
+import numpy as np
 import pytest
 
 from sktime.classification.distance_based._time_series_neighbors import (
@@ -73,3 +74,21 @@ def test_knn_bounding_matrix(distance_key):
         if pred[j] == y_test[j]:
             correct = correct + 1
     assert correct == expected_correct_window[distance_key]
+
+
+@pytest.mark.parametrize("distance_key", ["dtw", "ddtw", "msm"])
+def test_knn_lb_cascade_equals_brute(distance_key):
+    """Test that lb_cascade search gives same predictions as brute force."""
+    X_train, y_train = load_unit_test(split="train", return_X_y=True)
+    X_test, _ = load_unit_test(split="test", return_X_y=True)
+    params = {"distance": distance_key, "distance_params": {"window": 0.2}}
+
+    knn_brute = KNeighborsTimeSeriesClassifier(algorithm="brute", **params)
+    knn_lb = KNeighborsTimeSeriesClassifier(algorithm="lb_cascade", **params)
+    knn_brute.fit(X_train, y_train)
+    knn_lb.fit(X_train, y_train)
+
+    np.testing.assert_array_equal(knn_lb.predict(X_test), knn_brute.predict(X_test))
+    np.testing.assert_array_equal(
+        knn_lb.predict_proba(X_test), knn_brute.predict_proba(X_test)
+    )
@@ -3,6 +3,7 @@
 
 __author__ = ["fkiraly"]
 
+from sktime.datatypes._cache import CheckCache
 from sktime.datatypes._check import (
     check_is_mtype,
     check_is_scitype,
@@ -28,6 +29,7 @@ from sktime.datatypes._utilities import get_cutoff, update_data
 from sktime.datatypes._vectorize import VectorizedDF
 
 __all__ = [
+    "CheckCache",
     "check_is_mtype",
     "check_is_scitype",
     "check_raise",
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+# copyright: sktime developers, BSD-3-Clause License (see LICENSE file)
+"""Opt-in cache for results of mtype checks.
+
+Exports
+-------
+CheckCache
+    context manager, while active, results of mtype checks in check_is_mtype,
+    check_is_scitype, mtype and convert_to are cached per object
+
+Checks of the same object are repeated in every fit, predict, update or transform
+call, and in every step of a pipeline. While a CheckCache is active, the result of
+checking an object as a given mtype is computed once, and re-used as long as the
+object is alive and its fingerprint (shape, index and column identity, dtypes)
+is unchanged. In-place changes of values are not detected, objects must not be
+mutated in place while the cache is active.
+"""
+
+__all__ = ["CheckCache"]
+
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# the active CheckCache, None if no cache is active
+_ACTIVE_CACHE = None
+
+
+class CheckCache:
+    """Cache for results of mtype checks, keyed on object identity.
+
+    While active, i.e., inside a ``with`` statement, checks of mtypes in
+    ``check_is_mtype``, ``check_is_scitype``, ``mtype`` and ``convert_to`` are
+    looked up in the cache first. Results are stored per object, and per mtype,
+    scitype and variable name in error messages, including the metadata.
+
+    An entry is re-used only if the object is the identical object, and its
+    fingerprint is unchanged: type, shape, identity of index and columns, and
+    dtypes for pandas objects; type, shape, dtype, strides and data pointer for
+    numpy arrays. Other objects, e.g., lists, are not cached.
+    In-place changes of values are not detected, objects must not be mutated in
+    place while the cache is active.
+
+    Entries are evicted when their object is garbage collected, via weak
+    references, or when more than ``max_size`` objects are cached, least recently
+    used first.
+
+    Parameters
+    ----------
+    max_size : int, optional, default=128
+        maximum number of objects with cached check results
+
+    Attributes
+    ----------
+    hits : int, number of checks whose result was found in the cache
+    misses : int, number of checks that were computed, for cacheable objects
+
+    Examples
+    --------
+    >>> from sktime.datatypes import CheckCache, check_is_mtype
+    >>> from sktime.datasets import load_airline
+    >>> y = load_airline()
+    >>> with CheckCache() as cache:
+    ...     _ = check_is_mtype(y, "pd.Series", return_metadata=True)
+    ...     _ = check_is_mtype(y, "pd.Series", return_metadata=True)
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+
+    def __init__(self, max_size=128):
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError(f"max_size must be a positive int, but found {max_size}")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # id of object -> (weakref to object, fingerprint, dict of results)
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._previous = None
+
+    def __enter__(self):
+        """Activate the cache, return self."""
+        global _ACTIVE_CACHE
+        self._previous = _ACTIVE_CACHE
+        _ACTIVE_CACHE = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Deactivate the cache, re-activate the previously active cache."""
+        global _ACTIVE_CACHE
+        _ACTIVE_CACHE = self._previous
+        self._previous = None
+        self.clear()
+
+    def __len__(self):
+        """Return number of objects with cached check results."""
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all cached results, counters are not reset."""
+        with self._lock:
+            self._entries.clear()
+
+    def check(self, obj, check, key, return_metadata=False, var_name="obj"):
+        """Return result of check for obj, from the cache if possible.
+
+        Parameters
+        ----------
+        obj : object to check
+        check : callable, check function from check_dict, with signature
+            check(obj, return_metadata, var_name)
+        key : tuple of str, (mtype, scitype) that check is for
+        return_metadata : bool, optional, default=False, passed to check
+        var_name : str, optional, default="obj", passed to check
+
+        Returns
+        -------
+        same as check(obj, return_metadata=return_metadata, var_name=var_name)
+        """
+        fingerprint = _fingerprint(obj)
+        if fingerprint is None:
+            return check(obj, return_metadata=return_metadata, var_name=var_name)
+
+        res_key = (key, var_name)
+        with self._lock:
+            results = self._get_results(obj, fingerprint)
+            cached = results.get(res_key)
+            # results without metadata are only re-used if metadata is not needed
+            if cached is not None and (cached[0] or not return_metadata):
+                self.hits += 1
+                return _copy_result(cached[1], return_metadata)
+            self.misses += 1
+
+        res = check(obj, return_metadata=return_metadata, var_name=var_name)
+
+        with self._lock:
+            results = self._get_results(obj, fingerprint)
+            if res_key not in results or return_metadata:
+                results[res_key] = (return_metadata, _copy_result(res, return_metadata))
+        return res
+
+    def _get_results(self, obj, fingerprint):
+        """Return dict of results for obj, create entry and evict if needed."""
+        obj_id = id(obj)
+        entry = self._entries.get(obj_id)
+        if entry is None or entry[0]() is not obj or entry[1] != fingerprint:
+            ref = weakref.ref(obj, lambda ref: self._remove(obj_id, ref))
+            entry = (ref, fingerprint, dict())
+            self._entries[obj_id] = entry
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(obj_id)
+        return entry[2]
+
+    def _remove(self, obj_id, ref):
+        """Remove entry of a garbage collected object, called by weakref."""
+        with self._lock:
+            entry = self._entries.get(obj_id)
+            if entry is not None and entry[0] is ref:
+                del self._entries[obj_id]
+
+
+def _get_active_cache():
+    """Return the active CheckCache, or None if no cache is active."""
+    return _ACTIVE_CACHE
+
+
+def _fingerprint(obj):
+    """Return cheap fingerprint of obj, or None if obj is not cacheable.
+
+    Parameters
+    ----------
+    obj : any object
+
+    Returns
+    -------
+    tuple, fingerprint of obj for pd.DataFrame, pd.Series, np.ndarray;
+        None for other objects
+    """
+    if isinstance(obj, pd.DataFrame):
+        dtypes = tuple(obj.dtypes)
+        return (type(obj), obj.shape, id(obj.index), id(obj.columns), dtypes)
+    if isinstance(obj, pd.Series):
+        return (type(obj), obj.shape, id(obj.index), obj.name, obj.dtype)
+    if isinstance(obj, np.ndarray):
+        data = obj.__array_interface__["data"][0]
+        return (type(obj), obj.shape, obj.dtype, obj.strides, data)
+    return None
+
+
+def _copy_result(res, return_metadata):
+    """Return copy of check result, with a copy of the metadata dict.
+
+    Parameters
+    ----------
+    res : return of a check function, bool, or tuple (valid, msg, metadata)
+    return_metadata : bool, whether res is a tuple with metadata
+
+    Returns
+    -------
+    copy of res, metadata is copied since callers may add keys to it
+    """
+    if not return_metadata:
+        return res
+    valid, msg, metadata = res
+    if isinstance(metadata, dict):
+        metadata = metadata.copy()
+    return valid, msg, metadata
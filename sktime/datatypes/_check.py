@@ -29,6 +29,7 @@ from typing import List, Union
 import numpy as np
 
 from sktime.datatypes._alignment import check_dict_Alignment
+from sktime.datatypes._cache import _get_active_cache
 from sktime.datatypes._hierarchical import check_dict_Hierarchical
 from sktime.datatypes._panel import check_dict_Panel
 from sktime.datatypes._proba import check_dict_Proba
@@ -68,6 +69,29 @@ def _ret(valid, msg, metadata, return_metadata):
         return valid
 
 
+def _check_mtype(obj, key, return_metadata=False, var_name="obj"):
+    """Run check for key in check_dict on obj, via the active CheckCache if any.
+
+    Parameters
+    ----------
+    obj : object to check
+    key : tuple of str, (mtype, scitype), key of check_dict
+    return_metadata : bool, optional, default=False, passed to the check
+    var_name : str, optional, default="obj", passed to the check
+
+    Returns
+    -------
+    same as check_dict[key](obj, return_metadata=return_metadata, var_name=var_name)
+    """
+    check = check_dict[key]
+    cache = _get_active_cache()
+    if cache is None:
+        return check(obj, return_metadata=return_metadata, var_name=var_name)
+    return cache.check(
+        obj, check, key, return_metadata=return_metadata, var_name=var_name
+    )
+
+
 def _coerce_list_of_str(obj, var_name="obj"):
     """Check whether object is string or list of string.
 
@@ -177,7 +201,7 @@ def check_is_mtype(
         if (m, scitype_of_m) not in valid_keys:
             raise TypeError(f"no check defined for mtype {m}, scitype {scitype_of_m}")
 
-        res = check_dict[key](obj, return_metadata=return_metadata, var_name=var_name)
+        res = _check_mtype(obj, key, return_metadata=return_metadata, var_name=var_name)
 
         if return_metadata:
             check_passed = res[0]
@@ -410,7 +434,7 @@ def check_is_scitype(
     found_scitype = []
 
     for key in keys:
-        res = check_dict[key](obj, return_metadata=return_metadata, var_name=var_name)
+        res = _check_mtype(obj, key, return_metadata=return_metadata, var_name=var_name)
 
         if return_metadata:
             check_passed = res[0]
@@ -42,28 +42,9 @@ __author__ = ["fkiraly"]
 
 __all__ = ["check_dict"]
 
-import numpy as np
 import pandas as pd
 
-from sktime.datatypes._series._check import check_pddataframe_series
-
-
-def _list_all_equal(obj):
-    """Check whether elements of list are all equal.
-
-    Parameters
-    ----------
-    obj: list - assumed, not checked
-
-    Returns
-    -------
-    bool, True if elements of obj are all equal
-    """
-    if len(obj) < 2:
-        return True
-
-    return np.all([s == obj[0] for s in obj])
-
+from sktime.datatypes._panel._check import _check_instances
 
 check_dict = dict()
 
@@ -95,13 +76,9 @@ def check_pdmultiindex_hierarchical(obj, return_metadata=False, var_name="obj"):
         msg = f"{var_name} have a MultiIndex with 3 or more levels, found {nlevels}"
         return _ret(False, msg, None, return_metadata)
 
-    inst_inds = obj.index.droplevel(-1).unique()
+    inst_inds, valid, inst_metadata = _check_instances(obj)
     panel_inds = inst_inds.droplevel(-1).unique()
-
-    check_res = [
-        check_pddataframe_series(obj.loc[i], return_metadata=True) for i in inst_inds
-    ]
-    bad_inds = [i[1] for i in enumerate(inst_inds) if not check_res[i[0]][0]]
+    bad_inds = [i[1] for i in enumerate(inst_inds) if not valid[i[0]]]
 
     if len(bad_inds) > 0:
         msg = (
@@ -111,17 +88,15 @@ def check_pdmultiindex_hierarchical(obj, return_metadata=False, var_name="obj"):
         return _ret(False, msg, None, return_metadata)
 
     metadata = dict()
-    metadata["is_univariate"] = np.all([res[2]["is_univariate"] for res in check_res])
-    metadata["is_equally_spaced"] = np.all(
-        [res[2]["is_equally_spaced"] for res in check_res]
-    )
-    metadata["is_empty"] = np.any([res[2]["is_empty"] for res in check_res])
+    metadata["is_univariate"] = inst_metadata["is_univariate"]
+    metadata["is_equally_spaced"] = inst_metadata["is_equally_spaced"]
+    metadata["is_empty"] = inst_metadata["is_empty"]
     metadata["n_instances"] = len(inst_inds)
     metadata["n_panels"] = len(panel_inds)
     metadata["is_one_series"] = len(inst_inds) == 1
     metadata["is_one_panel"] = len(panel_inds) == 1
     metadata["has_nans"] = obj.isna().values.any()
-    metadata["is_equal_length"] = _list_all_equal([len(obj.loc[i]) for i in inst_inds])
+    metadata["is_equal_length"] = inst_metadata["is_equal_length"]
 
     return _ret(True, None, metadata, return_metadata)
 
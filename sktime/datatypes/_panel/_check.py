@@ -43,8 +43,9 @@ __all__ = ["check_dict"]
 import numpy as np
 import pandas as pd
 
+from sktime.datatypes._series import _check as _series_check
 from sktime.datatypes._series._check import check_pddataframe_series
-from sktime.utils.validation.series import is_integer_index
+from sktime.utils.validation.series import is_in_valid_index_types, is_integer_index
 
 VALID_MULTIINDEX_TYPES = (pd.RangeIndex, pd.Index)
 
@@ -78,6 +79,132 @@ def _list_all_equal(obj):
     return np.all([s == obj[0] for s in obj])
 
 
+def _check_instances(obj):
+    """Check all instances of a pd.DataFrame with MultiIndex as pd.DataFrame Series.
+
+    Instances are indexed by all index levels but the last, the last level is time.
+    Results are identical to calling check_pddataframe_series on obj.loc[i], for
+    all instances i. Uses a grouped pass over the index, see
+    _check_instances_grouped, if applicable; otherwise, loops over instances.
+
+    Parameters
+    ----------
+    obj : pd.DataFrame with MultiIndex of 2 or more levels, with unique columns
+
+    Returns
+    -------
+    inst_inds : pd.Index, unique values of obj.index.droplevel(-1),
+        in order of first appearance
+    valid : 1D np.ndarray of bool, of same length as inst_inds
+        i-th entry is whether obj.loc[inst_inds[i]] is a valid pd.DataFrame Series
+    metadata : dict, or None if any instance is not valid, with keys
+        "is_univariate", "is_equally_spaced", "is_empty": aggregated over instances,
+            using all, all, any, from metadata of check_pddataframe_series
+        "is_equal_length": whether all instances have the same number of rows
+    """
+    index = obj.index
+    inst_codes = index.codes[:-1]
+    if len(obj) == 0 or any(np.any(codes == -1) for codes in inst_codes):
+        inst_inds = index.droplevel(-1).unique()
+    else:
+        # instance number of rows, instances numbered in order of first appearance
+        inst_levels = list(range(index.nlevels - 1))
+        group = obj.groupby(level=inst_levels, sort=False).ngroup().values
+        # a row is the first of its instance iff its number exceeds all previous
+        is_first = np.ones(len(group), dtype=bool)
+        is_first[1:] = group[1:] > np.maximum.accumulate(group)[:-1]
+        inst_inds = index.droplevel(-1)[is_first]
+
+        res = _check_instances_grouped(obj, group, n_instances=len(inst_inds))
+        if res is not None:
+            return (inst_inds,) + res
+
+    check_res = [
+        check_pddataframe_series(obj.loc[i], return_metadata=True) for i in inst_inds
+    ]
+    valid = np.array([res[0] for res in check_res], dtype=bool)
+    if not np.all(valid):
+        return inst_inds, valid, None
+
+    metadata = dict()
+    metadata["is_univariate"] = np.all([res[2]["is_univariate"] for res in check_res])
+    metadata["is_equally_spaced"] = np.all(
+        [res[2]["is_equally_spaced"] for res in check_res]
+    )
+    metadata["is_empty"] = np.any([res[2]["is_empty"] for res in check_res])
+    metadata["is_equal_length"] = _list_all_equal([len(obj.loc[i]) for i in inst_inds])
+    return inst_inds, valid, metadata
+
+
+def _check_instances_grouped(obj, group, n_instances):
+    """Check all instances of a pd.DataFrame with MultiIndex in one grouped pass.
+
+    Computes the same as the loop in _check_instances, from instance numbers and
+    integer values of the time index, with numpy operations over all rows,
+    instead of one check_pddataframe_series call per instance.
+
+    Parameters
+    ----------
+    obj : pd.DataFrame with MultiIndex of 2 or more levels, with unique columns
+    group : 1D np.ndarray of int, instance number of each row of obj,
+        instances numbered from 0 in order of first appearance
+    n_instances : int, number of instances
+
+    Returns
+    -------
+    valid, metadata : as returned by _check_instances, or None if the grouped check
+        does not apply, i.e., if the time index contains missing values,
+        or is not of integer, datetime or period dtype
+    """
+    if _series_check.FREQ_SET_CHECK:
+        return None
+
+    time_index = obj.index.get_level_values(-1)
+    if time_index.hasnans:
+        return None
+    if isinstance(time_index, (pd.DatetimeIndex, pd.PeriodIndex)):
+        times = time_index.asi8
+    elif time_index.dtype.kind == "i":
+        times = time_index.values.astype(np.int64, copy=False)
+    else:
+        return None
+
+    # these properties are the same for the time index of every instance
+    n_cols = len(obj.columns)
+    valid_type = is_in_valid_index_types(time_index)
+    valid_dtypes = "object" not in obj.dtypes.values
+    if not valid_type or not valid_dtypes:
+        return np.zeros(n_instances, dtype=bool), None
+
+    # sort rows by instance, keeping row order within instances, as in obj.loc[i]
+    if np.any(group[1:] < group[:-1]):
+        order = np.argsort(group, kind="stable")
+        group = group[order]
+        times = times[order]
+    same_inst = group[1:] == group[:-1]
+    diffs = np.diff(times)
+
+    # monotonicity, i.e., no negative time difference within an instance
+    decreasing = same_inst & (diffs < 0)
+    valid = np.ones(n_instances, dtype=bool)
+    valid[group[1:][decreasing]] = False
+    if not np.all(valid):
+        return valid, None
+
+    # equal spacing, i.e., all time differences equal the first of the instance
+    lengths = np.bincount(group, minlength=n_instances)
+    starts = np.cumsum(lengths) - lengths
+    first_diff = np.append(diffs, 0)[starts]
+    equally_spaced = diffs[same_inst] == first_diff[group[1:][same_inst]]
+
+    metadata = dict()
+    metadata["is_univariate"] = np.bool_(n_cols < 2)
+    metadata["is_equally_spaced"] = np.all(equally_spaced)
+    metadata["is_empty"] = np.bool_(n_cols < 1)
+    metadata["is_equal_length"] = n_instances < 2 or np.all(lengths == lengths[0])
+    return valid, metadata
+
+
 check_dict = dict()
 
 
@@ -179,13 +306,8 @@ def check_pdmultiindex_panel(obj, return_metadata=False, var_name="obj"):
         )
         return _ret(False, msg, None, return_metadata)
 
-    inst_inds = obj.index.get_level_values(0).unique()
-    # inst_inds = np.unique(obj.index.get_level_values(0))
-
-    check_res = [
-        check_pddataframe_series(obj.loc[i], return_metadata=True) for i in inst_inds
-    ]
-    bad_inds = [i for i in range(len(inst_inds)) if not check_res[i][0]]
+    inst_inds, valid, inst_metadata = _check_instances(obj)
+    bad_inds = [i for i in range(len(inst_inds)) if not valid[i]]
 
     if len(bad_inds) > 0:
         msg = (
@@ -195,15 +317,13 @@ def check_pdmultiindex_panel(obj, return_metadata=False, var_name="obj"):
         return _ret(False, msg, None, return_metadata)
 
     metadata = dict()
-    metadata["is_univariate"] = np.all([res[2]["is_univariate"] for res in check_res])
-    metadata["is_equally_spaced"] = np.all(
-        [res[2]["is_equally_spaced"] for res in check_res]
-    )
-    metadata["is_empty"] = np.any([res[2]["is_empty"] for res in check_res])
+    metadata["is_univariate"] = inst_metadata["is_univariate"]
+    metadata["is_equally_spaced"] = inst_metadata["is_equally_spaced"]
+    metadata["is_empty"] = inst_metadata["is_empty"]
     metadata["n_instances"] = len(inst_inds)
     metadata["is_one_series"] = len(inst_inds) == 1
     metadata["has_nans"] = obj.isna().values.any()
-    metadata["is_equal_length"] = _list_all_equal([len(obj.loc[i]) for i in inst_inds])
+    metadata["is_equal_length"] = inst_metadata["is_equal_length"]
 
     return _ret(True, None, metadata, return_metadata)
 
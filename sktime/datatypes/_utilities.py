@@ -337,6 +337,9 @@ def update_data(X, X_new=None):
         X = X.X
     if isinstance(X_new, VectorizedDF):
         X_new = X_new.X
+    # if X_new only appends rows to X, concatenate, without conversion or alignment
+    if _is_append(X, X_new):
+        return pd.concat([X, X_new])
     # we want to ensure that X is either numpy (1D, 2D, 3D)
     # or in one of the long pandas formats
     X = convert_to(
@@ -355,15 +358,45 @@ def update_data(X, X_new=None):
     if isinstance(X, np.ndarray):
         # if 1D or 2D, axis 0 is "time"
         if X_new.ndim in [1, 2]:
-            return np.concatenate(X, X_new, axis=0)
+            return np.concatenate([X, X_new], axis=0)
         # if 3D, axis 2 is "time"
         elif X_new.ndim == 3:
-            return np.concatenate(X, X_new, axis=2)
+            return np.concatenate([X, X_new], axis=2)
     #  if y is pandas, we use combine_first to update
     elif isinstance(X_new, (pd.Series, pd.DataFrame)) and len(X_new) > 0:
         return X_new.combine_first(X)
 
 
+def _is_append(X, X_new):
+    """Check whether X_new adds rows to X strictly after its last index.
+
+    Parameters
+    ----------
+    X : sktime data container
+    X_new : sktime data container
+
+    Returns
+    -------
+    bool, True iff X and X_new are both pd.Series or both pd.DataFrame, with the
+        same columns and index type, a time index that is not a pd.MultiIndex, and
+        the first index of X_new is later than the last index of X
+    """
+    if not isinstance(X, (pd.Series, pd.DataFrame)) or type(X) is not type(X_new):
+        return False
+    if len(X) == 0 or len(X_new) == 0:
+        return False
+    if isinstance(X.index, pd.MultiIndex) or type(X.index) is not type(X_new.index):
+        return False
+    if isinstance(X, pd.DataFrame) and not X.columns.equals(X_new.columns):
+        return False
+    if isinstance(X, pd.Series) and X.name != X_new.name:
+        return False
+    try:
+        return bool(X_new.index[0] > X.index[-1])
+    except (TypeError, ValueError):
+        return False
+
+
 GET_WINDOW_SUPPORTED_MTYPES = [
     "pd.DataFrame",
     "pd-multiindex",
@@ -6,6 +6,7 @@ Contains VectorizedDF class.
 """
 from itertools import product
 
+import numpy as np
 import pandas as pd
 
 from sktime.datatypes._check import check_is_scitype, mtype
@@ -319,7 +320,7 @@ class VectorizedDF:
         if row_ix is None and col_ix is None:
             X_mi_reconstructed = self.X_multiindex
         elif col_ix is None:
-            X_mi_reconstructed = pd.concat(df_list, keys=row_ix, axis=0)
+            X_mi_reconstructed = _concat_rows(df_list, keys=row_ix)
         elif row_ix is None:
             force_flat = _force_flat(df_list)
             if col_multiindex in ["flat", "multiindex"] or force_flat:
@@ -340,7 +341,7 @@ class VectorizedDF:
                     col_keys = None
                 col_concats += [pd.concat(ith_col_block, axis=1, keys=col_keys)]
 
-            X_mi_reconstructed = pd.concat(col_concats, keys=row_ix, axis=0)
+            X_mi_reconstructed = _concat_rows(col_concats, keys=row_ix)
 
         X_mi_index = X_mi_reconstructed.index
         X_orig_row_index = self.X_multiindex.index
@@ -370,6 +371,92 @@ class VectorizedDF:
             return X_reconstructed_orig_format
 
 
+def _concat_rows(df_list, keys):
+    """Row-concatenate data frames with keys, same as pd.concat with keys.
+
+    If data frames are homogeneous, i.e., have equal columns, a single common
+    numeric dtype, and a flat row index of the same type and name,
+    values are written into one preallocated array, and the row MultiIndex is
+    built once from level codes. Otherwise, pd.concat is used.
+
+    Parameters
+    ----------
+    df_list : list of pd.DataFrame
+    keys : pd.Index or pd.MultiIndex, of same length as df_list
+        keys of the data frames, become the outer levels of the row index
+
+    Returns
+    -------
+    pd.DataFrame, equal to pd.concat(df_list, keys=keys, axis=0)
+    """
+    X = _concat_rows_homogeneous(df_list, keys)
+    if X is None:
+        X = pd.concat(df_list, keys=keys, axis=0)
+    return X
+
+
+def _concat_rows_homogeneous(df_list, keys):
+    """Fast path of _concat_rows, returns None if df_list is not homogeneous."""
+    if len(df_list) == 0 or len(df_list) != len(keys):
+        return None
+
+    first = df_list[0]
+    columns = first.columns
+    inner = first.index
+    dtypes = set(first.dtypes)
+    if len(dtypes) != 1 or isinstance(inner, pd.MultiIndex):
+        return None
+    dtype = dtypes.pop()
+    if not isinstance(dtype, np.dtype) or dtype.kind not in "biufc":
+        return None
+
+    # if the values of a frame are of dtype, its column dtypes are cast to dtype,
+    # so pd.concat with the first frame also results in dtype for all columns
+    arrays = [first.to_numpy()]
+    same_index = True
+    for df in df_list[1:]:
+        if not (df.columns is columns or df.columns.equals(columns)):
+            return None
+        index = df.index
+        if type(index) is not type(inner) or index.name != inner.name:
+            return None
+        same_index = same_index and (index is inner or index.equals(inner))
+        array = df.to_numpy()
+        if array.dtype != dtype:
+            return None
+        arrays.append(array)
+
+    lengths = np.array([len(array) for array in arrays])
+    values = np.empty((lengths.sum(), len(columns)), dtype=dtype)
+    ends = np.cumsum(lengths)
+    for array, end, length in zip(arrays, ends, lengths):
+        values[end - length : end] = array
+
+    # outer levels from keys, inner level from the row indices of df_list
+    if isinstance(keys, pd.MultiIndex):
+        levels = list(keys.levels)
+        codes = [np.repeat(level_codes, lengths) for level_codes in keys.codes]
+    else:
+        levels = [keys]
+        codes = [np.repeat(np.arange(len(keys)), lengths)]
+    if same_index and inner.is_unique:
+        levels.append(inner)
+        codes.append(np.tile(np.arange(len(inner)), len(df_list)))
+    else:
+        inner_all = inner.append([df.index for df in df_list[1:]])
+        inner_codes, inner_levels = pd.factorize(inner_all)
+        levels.append(inner_levels)
+        codes.append(inner_codes)
+
+    index = pd.MultiIndex(
+        levels=levels,
+        codes=codes,
+        names=list(keys.names) + [inner.name],
+        verify_integrity=False,
+    )
+    return pd.DataFrame(values, index=index, columns=columns)
+
+
 def _enforce_index_freq(item: pd.Series) -> pd.Series:
     """Enforce the frequency of a Series index using pd.infer_freq.
 
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Testing the opt-in cache for mtype checks."""
+
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sktime.datatypes import CheckCache, check_is_mtype, check_is_scitype, mtype
+from sktime.datatypes._cache import _get_active_cache
+from sktime.utils._testing.hierarchical import _make_hierarchical
+
+
+def test_check_cache_hits_and_metadata():
+    """Test that repeated checks are cache hits and return equal metadata."""
+    X = _make_hierarchical(hierarchy_levels=(2, 3), min_timepoints=5)
+
+    expected = check_is_mtype(X, "pd_multiindex_hier", return_metadata=True)
+
+    with CheckCache() as cache:
+        assert _get_active_cache() is cache
+        first = check_is_mtype(X, "pd_multiindex_hier", return_metadata=True)
+        second = check_is_mtype(X, "pd_multiindex_hier", return_metadata=True)
+        assert cache.misses == 1
+        assert cache.hits == 1
+
+        # callers may mutate the returned metadata, this must not affect the cache
+        second[2]["is_univariate"] = "mutated"
+        third = check_is_mtype(X, "pd_multiindex_hier", return_metadata=True)
+
+        # a result without metadata is served from a result with metadata
+        assert check_is_mtype(X, "pd_multiindex_hier")
+        assert cache.hits == 3
+
+    assert _get_active_cache() is None
+    for res in [first, third]:
+        assert res[0] == expected[0]
+        assert res[2] == expected[2]
+
+
+def test_check_cache_without_metadata_then_with():
+    """Test that results without metadata are not served if metadata is needed."""
+    y = pd.Series(np.arange(10, dtype=float))
+
+    with CheckCache() as cache:
+        assert check_is_mtype(y, "pd.Series")
+        valid, _, metadata = check_is_mtype(y, "pd.Series", return_metadata=True)
+        assert cache.misses == 2
+        assert valid
+        assert metadata["mtype"] == "pd.Series"
+
+        assert check_is_scitype(y, "Series")
+        assert mtype(y, as_scitype="Series") == "pd.Series"
+        assert cache.hits > 0
+
+
+def test_check_cache_fingerprint_and_eviction():
+    """Test that changed objects are re-checked and dead objects are evicted."""
+    with CheckCache(max_size=2) as cache:
+        y = pd.Series(np.arange(10, dtype=float))
+        check_is_mtype(y, "pd.Series")
+
+        # changing the index changes the fingerprint, so this is a miss
+        y.index = pd.RangeIndex(5, 15)
+        check_is_mtype(y, "pd.Series")
+        assert cache.hits == 0
+        assert cache.misses == 2
+        assert len(cache) == 1
+
+        # entries of garbage collected objects are removed
+        del y
+        gc.collect()
+        assert len(cache) == 0
+
+        # no more than max_size objects are cached
+        ys = [pd.Series(np.arange(i + 1, dtype=float)) for i in range(4)]
+        for y in ys:
+            check_is_mtype(y, "pd.Series")
+        assert len(cache) == 2
+
+        # lists are not cached
+        check_is_mtype([1, 2, 3], "pd.Series")
+        assert cache.misses == 6
+
+
+def test_check_cache_max_size_raises():
+    """Test that invalid max_size raises a ValueError."""
+    with pytest.raises(ValueError, match="max_size"):
+        CheckCache(max_size=0)
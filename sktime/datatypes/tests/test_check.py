@@ -4,6 +4,7 @@
 __author__ = ["fkiraly"]
 
 import numpy as np
+import pytest
 
 from sktime.datatypes._check import AMBIGUOUS_MTYPES, check_dict, check_is_mtype
 from sktime.datatypes._check import mtype as infer_mtype
@@ -294,3 +295,56 @@ def test_scitype_infer(scitype, mtype, fixture_index):
         assert scitype == infer_scitype(
             fixture, candidate_scitypes=SCITYPES_FOR_INFER_TEST
         ), f"mtype {mtype} not correctly identified for fixture {fixture_index}"
+
+
+def _make_multiindex_check_fixtures():
+    """Return pd_multiindex_hier fixtures for grouped instance checks."""
+    import pandas as pd
+
+    from sktime.utils._testing.hierarchical import _make_hierarchical
+
+    X = _make_hierarchical((2, 3), min_timepoints=5, max_timepoints=8, random_state=1)
+    X_int = X.reset_index()
+    X_int["time"] = X_int.groupby(["h0", "h1"]).cumcount() * 2
+    X_period = X.reset_index()
+    X_period["time"] = X_period["time"].dt.to_period("D")
+    X_spacing = X.reset_index()
+    X_spacing.loc[4, "time"] += pd.Timedelta("1h")
+    X_nat = X.reset_index()
+    X_nat.loc[4, "time"] = pd.NaT
+    X_float = X_int.copy()
+    X_float["time"] = X_float["time"].astype(float)
+    X_object = X.copy()
+    X_object["c1"] = "a"
+
+    fixtures = [X, X.sort_index(level="time"), X.iloc[::-1], X_object]
+    fixtures += [
+        x.set_index(["h0", "h1", "time"])
+        for x in [X_int, X_period, X_spacing, X_nat, X_float]
+    ]
+    fixtures += [_make_hierarchical((2, 2, 2), min_timepoints=4, max_timepoints=4)]
+    return fixtures
+
+
+@pytest.mark.parametrize("fixture", _make_multiindex_check_fixtures())
+def test_check_multiindex_grouped(fixture, monkeypatch):
+    """Tests that grouped checks of multiindex mtypes equal checks per instance."""
+    from sktime.datatypes._panel import _check as panel_check
+
+    hier_check = check_dict[("pd_multiindex_hier", "Hierarchical")]
+    panel_check_fun = check_dict[("pd-multiindex", "Panel")]
+
+    X_panel = fixture.reset_index()
+    inst_cols = list(X_panel.columns[: fixture.index.nlevels - 1])
+    X_panel["instance"] = X_panel.groupby(inst_cols, sort=False).ngroup()
+    X_panel = X_panel.drop(columns=inst_cols).set_index(["instance", "time"])
+
+    res_hier = hier_check(fixture, return_metadata=True)
+    res_panel = panel_check_fun(X_panel, return_metadata=True)
+
+    # loop over instances, with check_pddataframe_series for every instance
+    monkeypatch.setattr(
+        panel_check, "_check_instances_grouped", lambda *args, **kwargs: None
+    )
+    assert hier_check(fixture, return_metadata=True) == res_hier
+    assert panel_check_fun(X_panel, return_metadata=True) == res_panel
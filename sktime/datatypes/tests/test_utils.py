@@ -15,6 +15,7 @@ from sktime.datatypes._utilities import (
     get_slice,
     get_time_index,
     get_window,
+    update_data,
 )
 from sktime.utils._testing.hierarchical import _make_hierarchical
 
@@ -334,3 +335,23 @@ def test_get_slice_expected_result():
 
     X_np = get_examples(mtype="numpy3D")[0]
     assert get_slice(X_np, start=1, end=3).shape == (2, 2, 3)
+
+
+def test_update_data_append():
+    """Tests that update_data appends new rows, or overwrites overlapping rows."""
+    index = pd.period_range("2000-01", periods=10, freq="M")
+    y = pd.DataFrame({"a": np.arange(10.0), "b": np.arange(10)}, index=index)
+
+    # appending rows after the last index keeps index type and column dtypes
+    y_appended = update_data(y.iloc[:7], y.iloc[7:])
+    pd.testing.assert_frame_equal(y_appended, y)
+
+    # overlapping rows are overwritten by the new data
+    y_new = y.iloc[5:] + 1
+    y_updated = update_data(y.iloc[:7], y_new)
+    expected = pd.concat([y.iloc[:5], y_new])
+    pd.testing.assert_frame_equal(y_updated, expected, check_dtype=False)
+
+    # numpy arrays are concatenated along the time axis
+    X = np.arange(10.0).reshape(5, 2)
+    np.testing.assert_array_equal(update_data(X[:3], X[3:]), X)
@@ -10,7 +10,12 @@ import pytest
 from sktime.datatypes import MTYPE_REGISTER, SCITYPE_REGISTER
 from sktime.datatypes._check import AMBIGUOUS_MTYPES, check_is_mtype
 from sktime.datatypes._examples import get_examples
-from sktime.datatypes._vectorize import VectorizedDF, _enforce_index_freq
+from sktime.datatypes._vectorize import (
+    VectorizedDF,
+    _concat_rows,
+    _concat_rows_homogeneous,
+    _enforce_index_freq,
+)
 from sktime.utils._testing.deep_equals import deep_equals
 
 SCITYPES = ["Panel", "Hierarchical"]
@@ -414,3 +419,42 @@ def test_enforce_index_freq(item, freq):
     """Tests that enforce freq infers the right frequency."""
     item = _enforce_index_freq(item)
     assert item.index.freq == freq
+
+
+def _make_frames(index_type, n_frames=4, n_columns=2):
+    """Make list of data frames for testing _concat_rows."""
+    dfs = []
+    for i in range(n_frames):
+        if index_type == "period":
+            index = pd.period_range("2000-01", periods=3, freq="M")
+        elif index_type == "datetime_unequal":
+            index = pd.date_range("2000-01-01", periods=2 + i, freq="D")
+        else:
+            index = pd.RangeIndex(i, i + 3)
+        values = np.arange(len(index) * n_columns).reshape(-1, n_columns) + i
+        dfs.append(pd.DataFrame(values, index=index, columns=["a", "b"][:n_columns]))
+    return dfs
+
+
+@pytest.mark.parametrize("index_type", ["period", "datetime_unequal", "range"])
+@pytest.mark.parametrize("n_columns", [1, 2])
+@pytest.mark.parametrize("multiindex_keys", [True, False])
+def test_concat_rows(index_type, n_columns, multiindex_keys):
+    """Tests that _concat_rows equals pd.concat, with and without fast path."""
+    dfs = _make_frames(index_type, n_columns=n_columns)
+    if multiindex_keys:
+        keys = pd.MultiIndex.from_product([["x", "y"], [0, 1]], names=["h0", "h1"])
+    else:
+        keys = pd.Index(["w", "x", "y", "z"], name="instances")
+
+    expected = pd.concat(dfs, keys=keys, axis=0)
+    # fast path, homogeneous frames
+    assert _concat_rows_homogeneous(dfs, keys) is not None
+    pd.testing.assert_frame_equal(_concat_rows(dfs, keys), expected)
+
+    # mixed dtypes across frames are not homogeneous, pd.concat is used
+    dfs[2] = dfs[2].astype(float)
+    assert _concat_rows_homogeneous(dfs, keys) is None
+    pd.testing.assert_frame_equal(
+        _concat_rows(dfs, keys), pd.concat(dfs, keys=keys, axis=0)
+    )
@@ -5,6 +5,7 @@ __all__ = [
     "distance",
     "distance_factory",
     "pairwise_distance",
+    "pairwise_distance_blocks",
     "euclidean_distance",
     "squared_distance",
     "dtw_distance",
@@ -17,6 +18,7 @@ __all__ = [
     "lcss_distance",
     "twe_distance",
     "LowerBounding",
+    "KNeighborsSearch",
     "dtw_alignment_path",
     "ddtw_alignment_path",
     "wdtw_alignment_path",
@@ -49,6 +51,7 @@ from sktime.distances._distance import (
     msm_alignment_path,
     msm_distance,
     pairwise_distance,
+    pairwise_distance_blocks,
     squared_distance,
     twe_alignment_path,
     twe_distance,
@@ -57,4 +60,5 @@ from sktime.distances._distance import (
     wdtw_alignment_path,
     wdtw_distance,
 )
+from sktime.distances._knn_search import KNeighborsSearch
 from sktime.distances.lower_bounding import LowerBounding
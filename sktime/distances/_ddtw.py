@@ -10,14 +10,17 @@ from numba import njit
 from numba.core.errors import NumbaWarning
 
 from sktime.distances._distance_alignment_paths import compute_min_return_path
-from sktime.distances._dtw import _cost_matrix
+from sktime.distances._dtw import _banded_cost, _cost_matrix
 from sktime.distances._numba_utils import is_no_python_compiled_callable
 from sktime.distances.base import (
     DistanceAlignmentPathCallable,
     DistanceCallable,
     NumbaDistance,
 )
-from sktime.distances.lower_bounding import resolve_bounding_matrix
+from sktime.distances.lower_bounding import (
+    resolve_bounding_band,
+    resolve_bounding_matrix,
+)
 
 # Warning occurs when using large time series (i.e. 1000x1000)
 warnings.simplefilter("ignore", category=NumbaWarning)
@@ -235,7 +238,7 @@ class _DdtwDistance(NumbaDistance):
             If the itakura_max_slope is not a float or int.
             If the compute derivative callable is not no_python compiled.
         """
-        _bounding_matrix = resolve_bounding_matrix(
+        _row_band, _col_band, _bounding_matrix = resolve_bounding_band(
             x, y, window, itakura_max_slope, bounding_matrix
         )
 
@@ -253,7 +256,6 @@ class _DdtwDistance(NumbaDistance):
         ) -> float:
             _x = compute_derivative(_x)
             _y = compute_derivative(_y)
-            cost_matrix = _cost_matrix(_x, _y, _bounding_matrix)
-            return cost_matrix[-1, -1]
+            return _banded_cost(_x, _y, _row_band, _col_band, _bounding_matrix)
 
         return numba_ddtw_distance
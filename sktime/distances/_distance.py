@@ -2,7 +2,7 @@
 __author__ = ["chrisholder", "TonyBagnall"]
 
 
-from typing import Any, Callable, Union
+from typing import Any, Callable, Iterator, Tuple, Union
 
 import numpy as np
 from numba import njit
@@ -1968,6 +1968,8 @@ def pairwise_distance(
         Callable[[np.ndarray, np.ndarray], float],
         NumbaDistance,
     ] = "euclidean",
+    n_jobs: int = 1,
+    out: np.ndarray = None,
     **kwargs: Any,
 ) -> np.ndarray:
     """Compute the pairwise distance matrix between two time series.
@@ -1998,6 +2000,17 @@ def pairwise_distance(
         A distance factory takes the form (must return a no_python callable):
         Callable[[np.ndarray, np.ndarray, bool, dict], Callable[[np.ndarray,
         np.ndarray], float]].
+    n_jobs: int, defaults = 1
+        Number of threads to compute the distances with. If 1 or None, distances are
+        computed sequentially. If -1, all numba threads are used, and -2 all but one.
+        For symmetric pairwise matrices, i.e., if y is None or equal to x, only the
+        upper triangle is computed, evenly split over the threads.
+        Parallel computation compiles the pairwise loop for the metric, so only
+        pays off for larger pairwise matrices.
+    out: np.ndarray (2d array of shape (len(x), len(y))), defaults = None
+        Array to write the pairwise distances into. Pass a np.memmap to compute
+        pairwise matrices that do not fit into memory. If None, a new array is
+        allocated.
     kwargs: Any
         Extra arguments for metric. Refer to each metric documentation for a list of
         possible arguments.
@@ -2005,7 +2018,8 @@ def pairwise_distance(
     Returns
     -------
     np.ndarray (2d of size mxn where m is len(x) and n is len(y)).
-        Pairwise distance matrix between the two time series.
+        Pairwise distance matrix between the two time series. If out is passed,
+        this is out.
 
     Raises
     ------
@@ -2049,13 +2063,115 @@ def pairwise_distance(
     """
     _x = _make_3d_series(x)
     if y is None:
-        y = x
-    _y = _make_3d_series(y)
-    symmetric = np.array_equal(_x, _y)
+        _y = _x
+        symmetric = True
+    else:
+        _y = _make_3d_series(y)
+        symmetric = np.array_equal(_x, _y)
     _metric_callable = _resolve_metric_to_factory(
         metric, _x[0], _y[0], _METRIC_INFOS, **kwargs
     )
-    return _compute_pairwise_distance(_x, _y, symmetric, _metric_callable)
+    return _compute_pairwise_distance(
+        _x, _y, symmetric, _metric_callable, n_jobs=n_jobs, out=out
+    )
+
+
+def pairwise_distance_blocks(
+    x: np.ndarray,
+    y: np.ndarray = None,
+    metric: Union[
+        str,
+        Callable[
+            [np.ndarray, np.ndarray, dict], Callable[[np.ndarray, np.ndarray], float]
+        ],
+        Callable[[np.ndarray, np.ndarray], float],
+        NumbaDistance,
+    ] = "euclidean",
+    block_size: int = 1024,
+    n_jobs: int = 1,
+    **kwargs: Any,
+) -> Iterator[Tuple[slice, slice, np.ndarray]]:
+    """Compute the pairwise distance matrix between two time series in tiles.
+
+    Yields the tiles of the pairwise distance matrix returned by
+    ``pairwise_distance``, so pairwise distances between large collections of time
+    series can be processed without allocating the full matrix. The metric is
+    resolved once, for all tiles.
+
+    Tiles are yielded row block by row block, and within a row block, by ascending
+    column block. To write the full matrix into a np.memmap instead, pass it as
+    ``out`` to ``pairwise_distance``.
+
+    Parameters
+    ----------
+    x: np.ndarray (1d, 2d or 3d array)
+        First time series.
+    y: np.ndarray (1d, 2d or 3d array), defaults = None
+        Second time series. If not specified then y is set to the value of x.
+    metric: str or Callable, defaults = 'euclidean'
+        The distance metric to use, see ``pairwise_distance``.
+    block_size: int, defaults = 1024
+        Maximum number of rows and columns of a tile.
+    n_jobs: int, defaults = 1
+        Number of threads to compute the distances of a tile with, see
+        ``pairwise_distance``.
+    kwargs: Any
+        Extra arguments for metric. Refer to each metric documentation for a list of
+        possible arguments.
+
+    Yields
+    ------
+    row_block: slice
+        Indices of x the tile contains distances of.
+    col_block: slice
+        Indices of y the tile contains distances to.
+    tile: np.ndarray (2d array)
+        Pairwise distances between x[row_block] and y[col_block], equal to
+        ``pairwise_distance(x, y, metric)[row_block, col_block]``.
+
+    Raises
+    ------
+    ValueError
+        If block_size is not a positive int.
+        If the metric cannot be resolved, see ``pairwise_distance``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> x_2d = np.array([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]])  # 2d array
+    >>> for rows, cols, tile in pairwise_distance_blocks(x_2d, block_size=2):
+    ...     print(rows, cols, tile.tolist())
+    slice(0, 2, None) slice(0, 2, None) [[0.0, 8.0], [8.0, 0.0]]
+    slice(0, 2, None) slice(2, 3, None) [[16.0], [8.0]]
+    slice(2, 3, None) slice(0, 2, None) [[16.0, 8.0]]
+    slice(2, 3, None) slice(2, 3, None) [[0.0]]
+    """
+    if not isinstance(block_size, (int, np.integer)) or block_size < 1:
+        raise ValueError(f"block_size must be a positive int, but found {block_size}")
+    _x = _make_3d_series(x)
+    if y is None:
+        _y = _x
+        symmetric = True
+    else:
+        _y = _make_3d_series(y)
+        symmetric = np.array_equal(_x, _y)
+    _metric_callable = _resolve_metric_to_factory(
+        metric, _x[0], _y[0], _METRIC_INFOS, **kwargs
+    )
+
+    for row_start in range(0, _x.shape[0], block_size):
+        row_block = slice(row_start, min(row_start + block_size, _x.shape[0]))
+        for col_start in range(0, _y.shape[0], block_size):
+            col_block = slice(col_start, min(col_start + block_size, _y.shape[0]))
+            # only tiles on the diagonal of a symmetric matrix are symmetric
+            tile = _compute_pairwise_distance(
+                _x[row_block],
+                _y[col_block],
+                symmetric and row_start == col_start,
+                _metric_callable,
+                n_jobs=n_jobs,
+            )
+            yield row_block, col_block, tile
 
 
 def distance_alignment_path(
@@ -11,7 +11,12 @@ from numba.core.errors import NumbaWarning
 from sktime.distances._distance_alignment_paths import compute_min_return_path
 from sktime.distances.base import DistanceCallable, NumbaDistance
 from sktime.distances.base._types import DistanceAlignmentPathCallable
-from sktime.distances.lower_bounding import resolve_bounding_matrix
+from sktime.distances.lower_bounding import (
+    band_row_range,
+    in_bounding_band,
+    resolve_bounding_band,
+    resolve_bounding_matrix,
+)
 
 # Warning occurs when using large time series (i.e. 1000x1000)
 warnings.simplefilter("ignore", category=NumbaWarning)
@@ -185,7 +190,7 @@ class _DtwDistance(NumbaDistance):
             If the sakoe_chiba_window_radius is not an integer.
             If the itakura_max_slope is not a float or int.
         """
-        _bounding_matrix = resolve_bounding_matrix(
+        _row_band, _col_band, _bounding_matrix = resolve_bounding_band(
             x, y, window, itakura_max_slope, bounding_matrix
         )
 
@@ -194,8 +199,7 @@ class _DtwDistance(NumbaDistance):
             _x: np.ndarray,
             _y: np.ndarray,
         ) -> float:
-            cost_matrix = _cost_matrix(_x, _y, _bounding_matrix)
-            return cost_matrix[-1, -1]
+            return _banded_cost(_x, _y, _row_band, _col_band, _bounding_matrix)
 
         return numba_dtw_distance
 
@@ -244,3 +248,63 @@ def _cost_matrix(
                 )
 
     return cost_matrix[1:, 1:]
+
+
+@njit(cache=True)
+def _banded_cost(
+    x: np.ndarray,
+    y: np.ndarray,
+    row_band: np.ndarray,
+    col_band: np.ndarray,
+    bounding_matrix: np.ndarray,
+) -> float:
+    """Dtw distance compiled to no_python, iterating only inside a band.
+
+    Computes the same value as _cost_matrix(x, y, bounding_matrix)[-1, -1], but only
+    visits indexes inside the band, and only stores two rows of the cost matrix.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array of shape dxm1).
+        First time series.
+    y: np.ndarray (2d array of shape dxm2).
+        Second time series.
+    row_band: np.ndarray (2d array of int of shape (2, m1))
+        Row band, as returned by resolve_bounding_band.
+    col_band: np.ndarray (2d array of int of shape (2, m2))
+        Column band, as returned by resolve_bounding_band.
+    bounding_matrix: np.ndarray (2d array)
+        Custom bounding matrix, or empty array, as returned by resolve_bounding_band.
+
+    Returns
+    -------
+    float
+        The dtw distance, i.e., the last value of the dtw cost matrix.
+    """
+    dimensions = x.shape[0]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev = np.full(y_size + 1, np.inf)
+    curr = np.full(y_size + 1, np.inf)
+    prev[0] = 0.0
+    # columns written in prev, and columns in curr still holding values of an
+    # earlier row, which are reset before curr is reused
+    prev_first, prev_last = 0, 0
+    stale_first, stale_last = 1, 0
+
+    for i in range(x_size):
+        for j in range(stale_first, stale_last + 1):
+            curr[j] = np.inf
+        first, last = band_row_range(row_band, i, y_size)
+        for j in range(first, last + 1):
+            if in_bounding_band(i, j, col_band, bounding_matrix):
+                sum = 0
+                for k in range(dimensions):
+                    sum += (x[k][i] - y[k][j]) ** 2
+                curr[j + 1] = sum
+                curr[j + 1] += min(prev[j + 1], curr[j], prev[j])
+        stale_first, stale_last = prev_first, prev_last
+        prev_first, prev_last = first + 1, last + 1
+        prev, curr = curr, prev
+
+    return prev[y_size]
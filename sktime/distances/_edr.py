@@ -14,7 +14,12 @@ from sktime.distances.base import (
     DistanceCallable,
     NumbaDistance,
 )
-from sktime.distances.lower_bounding import resolve_bounding_matrix
+from sktime.distances.lower_bounding import (
+    band_row_range,
+    in_bounding_band,
+    resolve_bounding_band,
+    resolve_bounding_matrix,
+)
 
 # Warning occurs when using large time series (i.e. 1000x1000)
 warnings.simplefilter("ignore", category=NumbaWarning)
@@ -184,7 +189,7 @@ class _EdrDistance(NumbaDistance):
             If the itakura_max_slope is not a float or int.
             If epsilon is not a float.
         """
-        _bounding_matrix = resolve_bounding_matrix(
+        _row_band, _col_band, _bounding_matrix = resolve_bounding_band(
             x, y, window, itakura_max_slope, bounding_matrix
         )
 
@@ -199,8 +204,10 @@ class _EdrDistance(NumbaDistance):
                 _epsilon = max(np.std(_x), np.std(_y)) / 4
             else:
                 _epsilon = epsilon
-            cost_matrix = _edr_cost_matrix(_x, _y, _bounding_matrix, _epsilon)
-            return float(cost_matrix[-1, -1] / max(_x.shape[1], _y.shape[1]))
+            cost = _edr_banded_cost(
+                _x, _y, _row_band, _col_band, _bounding_matrix, _epsilon
+            )
+            return float(cost / max(_x.shape[1], _y.shape[1]))
 
         return numba_edr_distance
 
@@ -255,3 +262,77 @@ def _edr_cost_matrix(
                     cost_matrix[i, j - 1] + 1,
                 )
     return cost_matrix[1:, 1:]
+
+
+@njit(cache=True)
+def _edr_banded_cost(
+    x: np.ndarray,
+    y: np.ndarray,
+    row_band: np.ndarray,
+    col_band: np.ndarray,
+    bounding_matrix: np.ndarray,
+    epsilon: float,
+) -> float:
+    """Compute the last value of the edr cost matrix, iterating only inside a band.
+
+    Computes the same value as _edr_cost_matrix(x, y, bounding_matrix, epsilon)[-1, -1],
+    but only visits indexes inside the band, and only stores two rows of the cost
+    matrix.
+
+    Parameters
+    ----------
+    x: np.ndarray, 2d shape (d (n_dimensions),m (series_length))
+        First time series.
+    y: np.ndarray, 2d array shape (d, m)
+        Second time series.
+    row_band: np.ndarray (2d array of int of shape (2, len(x)))
+        Row band, as returned by resolve_bounding_band.
+    col_band: np.ndarray (2d array of int of shape (2, len(y)))
+        Column band, as returned by resolve_bounding_band.
+    bounding_matrix: np.ndarray (2d array)
+        Custom bounding matrix, or empty array, as returned by resolve_bounding_band.
+    epsilon : float
+        Matching threshold to determine if distance between two subsequences are
+        considered similar (similar if distance less than the threshold).
+
+    Returns
+    -------
+    float
+        The last value of the edr cost matrix.
+    """
+    dimensions = x.shape[0]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev = np.zeros(y_size + 1)
+    curr = np.zeros(y_size + 1)
+    # columns written in prev, and columns in curr still holding values of an
+    # earlier row, which are reset before curr is reused
+    prev_first, prev_last = 1, 0
+    stale_first, stale_last = 1, 0
+
+    for i in range(1, x_size + 1):
+        for j in range(stale_first, stale_last + 1):
+            curr[j] = 0.0
+        first, last = band_row_range(row_band, i - 1, y_size)
+        for j in range(first + 1, last + 2):
+            if in_bounding_band(i - 1, j - 1, col_band, bounding_matrix):
+                curr_dist = 0
+                for k in range(dimensions):
+                    curr_dist += (x[k][i - 1] - y[k][j - 1]) * (
+                        x[k][i - 1] - y[k][j - 1]
+                    )
+                curr_dist = np.sqrt(curr_dist)
+                if curr_dist < epsilon:
+                    cost = 0
+                else:
+                    cost = 1
+                curr[j] = min(
+                    prev[j - 1] + cost,
+                    prev[j] + 1,
+                    curr[j - 1] + 1,
+                )
+        stale_first, stale_last = prev_first, prev_last
+        prev_first, prev_last = first + 1, last + 1
+        prev, curr = curr, prev
+
+    return prev[y_size]
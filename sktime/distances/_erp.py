@@ -14,7 +14,12 @@ from sktime.distances.base import (
     DistanceCallable,
     NumbaDistance,
 )
-from sktime.distances.lower_bounding import resolve_bounding_matrix
+from sktime.distances.lower_bounding import (
+    band_row_range,
+    in_bounding_band,
+    resolve_bounding_band,
+    resolve_bounding_matrix,
+)
 
 # Warning occurs when using large time series (i.e. 1000x1000)
 warnings.simplefilter("ignore", category=NumbaWarning)
@@ -158,7 +163,7 @@ class _ErpDistance(NumbaDistance):
             If the itakura_max_slope is not a float or int.
             If g is not a float.
         """
-        _bounding_matrix = resolve_bounding_matrix(
+        _row_band, _col_band, _bounding_matrix = resolve_bounding_band(
             x, y, window, itakura_max_slope, bounding_matrix
         )
         if not isinstance(g, float):
@@ -166,9 +171,7 @@ class _ErpDistance(NumbaDistance):
 
         @njit(cache=True)
         def numba_erp_distance(_x: np.ndarray, _y: np.ndarray) -> float:
-            cost_matrix = _erp_cost_matrix(_x, _y, _bounding_matrix, g)
-
-            return cost_matrix[-1, -1]
+            return _erp_banded_cost(_x, _y, _row_band, _col_band, _bounding_matrix, g)
 
         return numba_erp_distance
 
@@ -229,3 +232,87 @@ def _erp_cost_matrix(
                     cost_matrix[i, j - 1] + gy_distance[j - 1],
                 )
     return cost_matrix[1:, 1:]
+
+
+@njit(cache=True)
+def _erp_banded_cost(
+    x: np.ndarray,
+    y: np.ndarray,
+    row_band: np.ndarray,
+    col_band: np.ndarray,
+    bounding_matrix: np.ndarray,
+    g: float,
+) -> float:
+    """Compute the erp distance, iterating only inside a band.
+
+    Computes the same value as _erp_cost_matrix(x, y, bounding_matrix, g)[-1, -1],
+    but only visits indexes inside the band, and only stores two rows of the cost
+    matrix.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array)
+        First time series.
+    y: np.ndarray (2d array)
+        Second time series.
+    row_band: np.ndarray (2d array of int of shape (2, len(x)))
+        Row band, as returned by resolve_bounding_band.
+    col_band: np.ndarray (2d array of int of shape (2, len(y)))
+        Column band, as returned by resolve_bounding_band.
+    bounding_matrix: np.ndarray (2d array)
+        Custom bounding matrix, or empty array, as returned by resolve_bounding_band.
+    g: float
+        The reference value to penalise gaps ('gap' defined when an alignment to
+        the next value (in x) in value can't be found).
+
+    Returns
+    -------
+    float
+        The erp distance, i.e., the last value of the erp cost matrix.
+    """
+    dimensions = x.shape[0]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    gx_distance = np.zeros(x_size)
+    gy_distance = np.zeros(y_size)
+    for j in range(x_size):
+        for i in range(dimensions):
+            gx_distance[j] += (x[i][j] - g) * (x[i][j] - g)
+        gx_distance[j] = np.sqrt(gx_distance[j])
+    for j in range(y_size):
+        for i in range(dimensions):
+            gy_distance[j] += (y[i][j] - g) * (y[i][j] - g)
+        gy_distance[j] = np.sqrt(gy_distance[j])
+    gx_sum = np.sum(gx_distance)
+
+    prev = np.full(y_size + 1, np.sum(gy_distance))
+    curr = np.zeros(y_size + 1)
+    prev[0] = 0.0
+    # columns written in prev, and columns in curr still holding values of an
+    # earlier row, which are reset before curr is reused
+    prev_first, prev_last = 1, y_size
+    stale_first, stale_last = 1, 0
+
+    for i in range(1, x_size + 1):
+        for j in range(stale_first, stale_last + 1):
+            curr[j] = 0.0
+        curr[0] = gx_sum
+        first, last = band_row_range(row_band, i - 1, y_size)
+        for j in range(first + 1, last + 2):
+            if in_bounding_band(i - 1, j - 1, col_band, bounding_matrix):
+                curr_dist = 0
+                for k in range(dimensions):
+                    curr_dist += (x[k][i - 1] - y[k][j - 1]) * (
+                        x[k][i - 1] - y[k][j - 1]
+                    )
+                curr_dist = np.sqrt(curr_dist)
+                curr[j] = min(
+                    prev[j - 1] + curr_dist,
+                    prev[j] + gx_distance[i - 1],
+                    curr[j - 1] + gy_distance[j - 1],
+                )
+        stale_first, stale_last = prev_first, prev_last
+        prev_first, prev_last = first + 1, last + 1
+        prev, curr = curr, prev
+
+    return prev[y_size]
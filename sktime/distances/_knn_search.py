@@ -0,0 +1,480 @@
+# -*- coding: utf-8 -*-
+"""Exact k-nearest neighbour search for time series distances.
+
+For dtw and ddtw, the search uses a cascade of lower bounds (LB_Kim, LB_Keogh),
+and early abandoning of the dtw computation, as in the UCR suite [1]_.
+For all other distances, the search falls back to brute force distance computation,
+in tiles of the distance matrix.
+
+References
+----------
+.. [1] Rakthanmanon T., Campana B., Mueen A., Batista G., Westover B., Zhu Q.,
+   Zakaria J., Keogh E.: Searching and mining trillions of time series subsequences
+   under dynamic time warping. Proceedings of the 18th ACM SIGKDD international
+   conference on Knowledge discovery and data mining, 2012
+"""
+__all__ = ["KNeighborsSearch"]
+
+from typing import Any, Tuple
+
+import numpy as np
+from numba import njit
+
+from sktime.distances._ddtw import average_of_slope
+from sktime.distances._numba_utils import _make_3d_series
+from sktime.distances.lower_bounding import in_bounding_band, resolve_bounding_band
+
+# distances for which the lower bound cascade is valid, all others use brute force
+LOWER_BOUND_DISTANCES = ["dtw", "ddtw"]
+
+
+class KNeighborsSearch:
+    """Exact k-nearest neighbour search for time series distances.
+
+    The time series searched in are passed to ``fit``, where lower bounding
+    envelopes are precomputed. ``kneighbors`` returns the nearest neighbours of
+    query series, with distances identical to those of ``pairwise_distance``.
+
+    For ``metric`` "dtw" or "ddtw" and equal length series, each query is
+    processed as follows, see [1]_:
+
+    1. LB_Kim, the cost of aligning first and last points, is computed for all
+       candidates, and candidates are visited in ascending order of LB_Kim.
+       Once LB_Kim exceeds the k-th best distance so far, the search stops.
+    2. LB_Keogh, the distance of the query to the envelope of the candidate, is
+       computed, abandoning early once it exceeds the k-th best distance so far.
+    3. dtw is computed with early abandoning, using the remaining LB_Keogh as
+       lower bound for the rows of the cost matrix not computed yet.
+
+    For all other metrics, or unequal length series, distances to all candidates
+    are computed via ``pairwise_distance_blocks``, keeping a running top-k per
+    query, so the full distance matrix is never allocated.
+
+    Parameters
+    ----------
+    metric: str or Callable, defaults = "dtw"
+        The distance metric to use, any metric accepted by ``pairwise_distance``.
+    n_neighbors: int, defaults = 1
+        Number of neighbours returned by ``kneighbors`` if not specified there.
+    block_size: int, defaults = 1024
+        Maximum number of query and fitted series per tile of distances computed at
+        once, if distances to all candidates are computed.
+    kwargs: Any
+        Extra arguments for metric, e.g., window or itakura_max_slope.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from sktime.distances import KNeighborsSearch
+    >>> X = np.array([[[1, 2, 3, 4]], [[5, 6, 7, 8]], [[2, 2, 3, 3]]])
+    >>> knn = KNeighborsSearch(metric="dtw", n_neighbors=2, window=0.5).fit(X)
+    >>> dist, ind = knn.kneighbors(np.array([[[1, 2, 2, 4]]]))
+    >>> dist
+    array([[1., 3.]])
+    >>> ind
+    array([[0, 2]])
+
+    References
+    ----------
+    .. [1] Rakthanmanon T., Campana B., Mueen A., Batista G., Westover B., Zhu Q.,
+       Zakaria J., Keogh E.: Searching and mining trillions of time series
+       subsequences under dynamic time warping. Proceedings of the 18th ACM SIGKDD
+       international conference on Knowledge discovery and data mining, 2012
+    """
+
+    def __init__(
+        self,
+        metric: str = "dtw",
+        n_neighbors: int = 1,
+        block_size: int = 1024,
+        **kwargs: Any,
+    ):
+        self.metric = metric
+        self.n_neighbors = n_neighbors
+        self.block_size = block_size
+        self.kwargs = kwargs
+
+    def fit(self, X: np.ndarray) -> "KNeighborsSearch":
+        """Store the series to search in, and precompute lower bounding envelopes.
+
+        Parameters
+        ----------
+        X: np.ndarray (2d or 3d array)
+            The series to search in, of shape (n_instances, n_dims, n_timepoints), or
+            (n_instances, n_timepoints) for univariate series.
+
+        Returns
+        -------
+        self: reference to self
+        """
+        self._X = _make_3d_series(np.asarray(X, dtype=float))
+        from sktime.distances._distance import _METRIC_ALIAS
+
+        metric_info = (
+            _METRIC_ALIAS.get(self.metric) if isinstance(self.metric, str) else None
+        )
+        self._metric_name = metric_info.canonical_name if metric_info else None
+        self._use_lower_bounds = self._metric_name in LOWER_BOUND_DISTANCES
+
+        if self._use_lower_bounds:
+            x_0 = self._X[0]
+            row_band, col_band, bounding_matrix = resolve_bounding_band(
+                x_0,
+                x_0,
+                self.kwargs.get("window"),
+                self.kwargs.get("itakura_max_slope"),
+                self.kwargs.get("bounding_matrix"),
+            )
+            X_inner = self._transform(self._X)
+            # for ddtw, the bounds are created for the underived series
+            # and their upper left block is used for the shorter derived series
+            n_timepoints = X_inner.shape[2]
+
+            self._X_inner = X_inner
+            self._col_band = col_band
+            self._bounding_matrix = bounding_matrix
+            self._lo = np.ascontiguousarray(row_band[0, :n_timepoints])
+            self._hi = np.minimum(row_band[1, :n_timepoints], n_timepoints - 1)
+            self._upper, self._lower = _envelopes(X_inner, self._lo, self._hi)
+
+        return self
+
+    def kneighbors(
+        self, X: np.ndarray, n_neighbors: int = None, return_distance: bool = True
+    ):
+        """Find the k nearest neighbours of query series, among the fitted series.
+
+        Parameters
+        ----------
+        X: np.ndarray (2d or 3d array)
+            Query series, of shape (n_queries, n_dims, n_timepoints), or
+            (n_queries, n_timepoints) for univariate series.
+        n_neighbors: int, optional
+            Number of neighbours to return, defaults to the value passed to the
+            constructor.
+        return_distance: bool, defaults = True
+            Whether to return the distances in addition to the indices.
+
+        Returns
+        -------
+        dist: np.ndarray (2d array of shape (n_queries, n_neighbors))
+            Distances to the nearest neighbours, ascending in each row.
+            Only returned if return_distance=True.
+        ind: np.ndarray (2d array of int, of shape (n_queries, n_neighbors))
+            Indices of the nearest neighbours among the fitted series.
+            Ties in distance are broken by lower index first.
+        """
+        if n_neighbors is None:
+            n_neighbors = self.n_neighbors
+        n_fit = self._X.shape[0]
+        if n_neighbors > n_fit:
+            raise ValueError(
+                f"n_neighbors must be at most the number of fitted series, {n_fit}, "
+                f"but found n_neighbors={n_neighbors}"
+            )
+
+        _X = _make_3d_series(np.asarray(X, dtype=float))
+
+        if self._use_lower_bounds and _X.shape[1:] == self._X.shape[1:]:
+            dist, ind = self._kneighbors_lower_bound(_X, n_neighbors)
+        else:
+            dist, ind = self._kneighbors_brute(_X, n_neighbors)
+
+        if return_distance:
+            return dist, ind
+        else:
+            return ind
+
+    def _transform(self, X: np.ndarray) -> np.ndarray:
+        """Transform series in X as the distance does before computing dtw."""
+        if self._metric_name == "ddtw":
+            compute_derivative = self.kwargs.get("compute_derivative", average_of_slope)
+            return np.array([compute_derivative(x) for x in X])
+        return X
+
+    def _kneighbors_lower_bound(
+        self, X: np.ndarray, n_neighbors: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Search with lower bound cascade and early abandoning, see class docstring."""
+        X_inner = self._transform(X)
+        n_queries = X_inner.shape[0]
+        dist = np.empty((n_queries, n_neighbors))
+        ind = np.empty((n_queries, n_neighbors), dtype=np.int64)
+
+        for i in range(n_queries):
+            dist[i], ind[i] = _knn_lower_bound_query(
+                X_inner[i],
+                self._X_inner,
+                self._upper,
+                self._lower,
+                self._lo,
+                self._hi,
+                self._col_band,
+                self._bounding_matrix,
+                n_neighbors,
+            )
+        return dist, ind
+
+    def _kneighbors_brute(
+        self, X: np.ndarray, n_neighbors: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Search by computing all distances between X and fitted series, in tiles.
+
+        A running top-k is kept per query, so at most one tile of the distance
+        matrix is held in memory. Ties are broken by lower index, as with a stable
+        sort of the full distance matrix.
+        """
+        from sktime.distances._distance import pairwise_distance_blocks
+
+        n_fitted = self._X.shape[0]
+        dist = np.empty((X.shape[0], n_neighbors))
+        ind = np.empty((X.shape[0], n_neighbors), dtype=np.int64)
+
+        blocks = pairwise_distance_blocks(
+            X, self._X, metric=self.metric, block_size=self.block_size, **self.kwargs
+        )
+        for row_block, col_block, tile in blocks:
+            tile_ind = np.broadcast_to(
+                np.arange(col_block.start, col_block.stop), tile.shape
+            )
+            # column blocks of a row block arrive in ascending order, so the
+            # running top-k precedes the tile in the stable sort below
+            if col_block.start == 0:
+                best_dist, best_ind = tile, tile_ind
+            else:
+                best_dist = np.hstack((best_dist, tile))
+                best_ind = np.hstack((best_ind, tile_ind))
+            order = np.argsort(best_dist, axis=1, kind="stable")[:, :n_neighbors]
+            best_dist = np.take_along_axis(best_dist, order, axis=1)
+            best_ind = np.take_along_axis(best_ind, order, axis=1)
+            if col_block.stop == n_fitted:
+                dist[row_block] = best_dist
+                ind[row_block] = best_ind
+        return dist, ind
+
+
+@njit(cache=True)
+def _envelopes(
+    X: np.ndarray, lo: np.ndarray, hi: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute upper and lower LB_Keogh envelopes for all series in X.
+
+    Parameters
+    ----------
+    X: np.ndarray (3d array of shape (n, d, m))
+        Series to compute envelopes of.
+    lo, hi: np.ndarray (1d arrays of int)
+        First and last column to consider in every row, from the row band
+        returned by resolve_bounding_band. Query index i can be aligned with series
+        indices lo[i], ..., hi[i].
+
+    Returns
+    -------
+    upper, lower: np.ndarray (3d arrays of shape (n, d, len(lo)))
+        upper[s, k, i] is the maximum of X[s, k, lo[i]:hi[i] + 1], lower the minimum.
+        If the band of i is empty, upper is -inf and lower is inf.
+    """
+    n_instances, n_dims, _ = X.shape
+    n_rows = lo.shape[0]
+    upper = np.full((n_instances, n_dims, n_rows), -np.inf)
+    lower = np.full((n_instances, n_dims, n_rows), np.inf)
+    for s in range(n_instances):
+        for k in range(n_dims):
+            for i in range(n_rows):
+                for j in range(lo[i], hi[i] + 1):
+                    val = X[s, k, j]
+                    if val > upper[s, k, i]:
+                        upper[s, k, i] = val
+                    if val < lower[s, k, i]:
+                        lower[s, k, i] = val
+    return upper, lower
+
+
+@njit(cache=True)
+def _lb_kim(x: np.ndarray, y: np.ndarray) -> float:
+    """Compute LB_Kim, the cost of aligning first and last points of x and y."""
+    n_dims = x.shape[0]
+    x_last = x.shape[1] - 1
+    y_last = y.shape[1] - 1
+    lb = 0.0
+    for k in range(n_dims):
+        lb += (x[k, 0] - y[k, 0]) ** 2
+    if x_last > 0 or y_last > 0:
+        for k in range(n_dims):
+            lb += (x[k, x_last] - y[k, y_last]) ** 2
+    return lb
+
+
+@njit(cache=True)
+def _lb_keogh_cumulative(
+    x: np.ndarray, upper: np.ndarray, lower: np.ndarray, cutoff: float
+) -> Tuple[float, np.ndarray]:
+    """Compute LB_Keogh of x to an envelope, with early abandoning.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array of shape (d, m))
+        Query series.
+    upper, lower: np.ndarray (2d arrays of shape (d, m))
+        Envelope of the candidate series.
+    cutoff: float
+        Computation is abandoned once the bound exceeds cutoff.
+
+    Returns
+    -------
+    lb: float
+        LB_Keogh lower bound, or a partial sum exceeding cutoff if abandoned.
+    cb: np.ndarray (1d array of length m + 1)
+        cb[i] is the part of LB_Keogh from indices i, ..., m - 1, cb[m] = 0.
+        Only valid if not abandoned.
+    """
+    n_dims, n_timepoints = x.shape
+    cb = np.zeros(n_timepoints + 1)
+    lb = 0.0
+    for i in range(n_timepoints):
+        contrib = 0.0
+        for k in range(n_dims):
+            val = x[k, i]
+            if val > upper[k, i]:
+                contrib += (val - upper[k, i]) ** 2
+            elif val < lower[k, i]:
+                contrib += (val - lower[k, i]) ** 2
+        cb[i] = contrib
+        lb += contrib
+        if lb > cutoff:
+            return lb, cb
+    for i in range(n_timepoints - 1, -1, -1):
+        cb[i] += cb[i + 1]
+    return lb, cb
+
+
+@njit(cache=True)
+def _early_abandon_dtw(
+    x: np.ndarray,
+    y: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    col_band: np.ndarray,
+    bounding_matrix: np.ndarray,
+    cb: np.ndarray,
+    cutoff: float,
+) -> float:
+    """Compute dtw distance, abandoning once it is known to exceed cutoff.
+
+    Computes the same cost recursion as _cost_matrix in _dtw, keeping two rows only.
+
+    Parameters
+    ----------
+    x, y: np.ndarray (2d arrays of shape (d, m1), (d, m2))
+        Series to compute dtw distance between.
+    lo, hi: np.ndarray (1d arrays of int)
+        First and last column to consider in every row, from the row band
+        returned by resolve_bounding_band.
+    col_band, bounding_matrix: np.ndarray
+        Column band and custom bounding matrix, as returned by resolve_bounding_band.
+    cb: np.ndarray (1d array of length m1 + 1)
+        cb[i] is a lower bound for the cost contributed by rows i, ..., m1 - 1.
+    cutoff: float
+        Computation is abandoned once the distance is known to exceed cutoff.
+
+    Returns
+    -------
+    float
+        dtw distance between x and y, or inf if abandoned.
+    """
+    n_dims = x.shape[0]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev = np.full(y_size + 1, np.inf)
+    curr = np.full(y_size + 1, np.inf)
+    prev[0] = 0.0
+    prev_first, prev_last = 0, 0
+    stale_first, stale_last = 1, 0
+
+    for i in range(x_size):
+        for j in range(stale_first, stale_last + 1):
+            curr[j] = np.inf
+        row_min = np.inf
+        for j in range(lo[i], hi[i] + 1):
+            if in_bounding_band(i, j, col_band, bounding_matrix):
+                sum = 0
+                for k in range(n_dims):
+                    sum += (x[k][i] - y[k][j]) ** 2
+                curr[j + 1] = sum
+                curr[j + 1] += min(prev[j + 1], curr[j], prev[j])
+                if curr[j + 1] < row_min:
+                    row_min = curr[j + 1]
+        if row_min + cb[i + 1] > cutoff:
+            return np.inf
+        stale_first, stale_last = prev_first, prev_last
+        prev_first, prev_last = lo[i] + 1, hi[i] + 1
+        prev, curr = curr, prev
+
+    return prev[y_size]
+
+
+@njit(cache=True)
+def _knn_lower_bound_query(
+    q: np.ndarray,
+    X: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    col_band: np.ndarray,
+    bounding_matrix: np.ndarray,
+    n_neighbors: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the k nearest neighbours of q in X, using the lower bound cascade.
+
+    Parameters
+    ----------
+    q: np.ndarray (2d array of shape (d, m))
+        Query series.
+    X: np.ndarray (3d array of shape (n, d, m))
+        Candidate series.
+    upper, lower: np.ndarray (3d arrays of shape (n, d, m))
+        Envelopes of candidate series, see _envelopes.
+    lo, hi, col_band, bounding_matrix: bounds, see _early_abandon_dtw
+    n_neighbors: int
+        Number of neighbours k to find.
+
+    Returns
+    -------
+    best_dist: np.ndarray (1d array of length k)
+        Distances of the k nearest neighbours, ascending.
+    best_ind: np.ndarray (1d array of int, of length k)
+        Indices of the k nearest neighbours, ties broken by lower index.
+    """
+    n_instances = X.shape[0]
+    kim = np.empty(n_instances)
+    for c in range(n_instances):
+        kim[c] = _lb_kim(q, X[c])
+    order = np.argsort(kim, kind="mergesort")
+
+    best_dist = np.full(n_neighbors, np.inf)
+    best_ind = np.full(n_neighbors, n_instances, dtype=np.int64)
+    last = n_neighbors - 1
+
+    for c in order:
+        bsf = best_dist[last]
+        if kim[c] > bsf:
+            # candidates are sorted by LB_Kim, no later candidate can be closer
+            break
+        lb, cb = _lb_keogh_cumulative(q, upper[c], lower[c], bsf)
+        if lb > bsf:
+            continue
+        dist = _early_abandon_dtw(q, X[c], lo, hi, col_band, bounding_matrix, cb, bsf)
+        if dist < bsf or (dist == bsf and c < best_ind[last]):
+            pos = last
+            while pos > 0 and (
+                best_dist[pos - 1] > dist
+                or (best_dist[pos - 1] == dist and best_ind[pos - 1] > c)
+            ):
+                best_dist[pos] = best_dist[pos - 1]
+                best_ind[pos] = best_ind[pos - 1]
+                pos -= 1
+            best_dist[pos] = dist
+            best_ind[pos] = c
+
+    return best_dist, best_ind
@@ -15,7 +15,12 @@ from sktime.distances.base import (
     DistanceCallable,
     NumbaDistance,
 )
-from sktime.distances.lower_bounding import resolve_bounding_matrix
+from sktime.distances.lower_bounding import (
+    band_row_range,
+    in_bounding_band,
+    resolve_bounding_band,
+    resolve_bounding_matrix,
+)
 
 # Warning occurs when using large time series (i.e. 1000x1000)
 warnings.simplefilter("ignore", category=NumbaWarning)
@@ -208,7 +213,7 @@ class _LcssDistance(NumbaDistance):
             If the itakura_max_slope is not a float or int.
             If epsilon is not a float.
         """
-        _bounding_matrix = resolve_bounding_matrix(
+        _row_band, _col_band, _bounding_matrix = resolve_bounding_band(
             x, y, window, itakura_max_slope, bounding_matrix
         )
 
@@ -222,8 +227,10 @@ class _LcssDistance(NumbaDistance):
         ) -> float:
             x_size = _x.shape[1]
             y_size = _y.shape[1]
-            cost_matrix = _sequence_cost_matrix(_x, _y, _bounding_matrix, epsilon)
-            return 1 - float(cost_matrix[x_size, y_size] / min(x_size, y_size))
+            cost = _sequence_banded_cost(
+                _x, _y, _row_band, _col_band, _bounding_matrix, epsilon
+            )
+            return 1 - float(cost / min(x_size, y_size))
 
         return numba_lcss_distance
 
@@ -271,3 +278,68 @@ def _sequence_cost_matrix(
                         cost_matrix[i, j - 1], cost_matrix[i - 1, j]
                     )
     return cost_matrix
+
+
+@njit(cache=True)
+def _sequence_banded_cost(
+    x: np.ndarray,
+    y: np.ndarray,
+    row_band: np.ndarray,
+    col_band: np.ndarray,
+    bounding_matrix: np.ndarray,
+    epsilon: float,
+) -> float:
+    """Compute the last value of the lcss cost matrix, iterating only inside a band.
+
+    Computes the same value as _sequence_cost_matrix(x, y, bounding_matrix,
+    epsilon)[-1, -1], but only visits indexes inside the band, and only stores two
+    rows of the cost matrix.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array), first time series.
+    y: np.ndarray (2d array), second time series.
+    row_band: np.ndarray (2d array of int of shape (2, len(x)))
+        Row band, as returned by resolve_bounding_band.
+    col_band: np.ndarray (2d array of int of shape (2, len(y)))
+        Column band, as returned by resolve_bounding_band.
+    bounding_matrix: np.ndarray (2d array)
+        Custom bounding matrix, or empty array, as returned by resolve_bounding_band.
+    epsilon : float
+        Matching threshold to determine if distance between two subsequences are
+        considered similar (similar if distance less than the threshold).
+
+    Returns
+    -------
+    float
+        The last value of the lcss cost matrix.
+    """
+    dimensions = x.shape[0]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev = np.zeros(y_size + 1)
+    curr = np.zeros(y_size + 1)
+    # columns written in prev, and columns in curr still holding values of an
+    # earlier row, which are reset before curr is reused
+    prev_first, prev_last = 1, 0
+    stale_first, stale_last = 1, 0
+
+    for i in range(1, x_size + 1):
+        for j in range(stale_first, stale_last + 1):
+            curr[j] = 0.0
+        first, last = band_row_range(row_band, i - 1, y_size)
+        for j in range(first + 1, last + 2):
+            if in_bounding_band(i - 1, j - 1, col_band, bounding_matrix):
+                curr_dist = 0
+                for k in range(dimensions):
+                    curr_dist += (x[k][i - 1] - y[k][j - 1]) ** 2
+                curr_dist = np.sqrt(curr_dist)
+                if curr_dist <= epsilon:
+                    curr[j] = 1 + prev[j - 1]
+                else:
+                    curr[j] = max(curr[j - 1], prev[j])
+        stale_first, stale_last = prev_first, prev_last
+        prev_first, prev_last = first + 1, last + 1
+        prev, curr = curr, prev
+
+    return prev[y_size]
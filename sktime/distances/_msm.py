@@ -14,7 +14,12 @@ from sktime.distances.base import (
     DistanceCallable,
     NumbaDistance,
 )
-from sktime.distances.lower_bounding import resolve_bounding_matrix
+from sktime.distances.lower_bounding import (
+    band_row_range,
+    in_bounding_band,
+    resolve_bounding_band,
+    resolve_bounding_matrix,
+)
 
 # Warning occurs when using large time series (i.e. 1000x1000)
 warnings.simplefilter("ignore", category=NumbaWarning)
@@ -192,7 +197,7 @@ class _MsmDistance(NumbaDistance):
                 f"univariate series, passed seris shape {x.shape[0]} and"
                 f"shape {y.shape[0]}"
             )
-        _bounding_matrix = resolve_bounding_matrix(
+        _row_band, _col_band, _bounding_matrix = resolve_bounding_band(
             x, y, window, itakura_max_slope, bounding_matrix
         )
 
@@ -201,8 +206,7 @@ class _MsmDistance(NumbaDistance):
             _x: np.ndarray,
             _y: np.ndarray,
         ) -> float:
-            cost_matrix = _cost_matrix(_x, _y, _bounding_matrix, c)
-            return cost_matrix[-1, -1]
+            return _banded_cost(_x, _y, _row_band, _col_band, _bounding_matrix, c)
 
         return numba_msm_distance
 
@@ -282,3 +286,72 @@ def _cost_matrix(
                 cost[i][j] = min(d1, d2, d3)
 
     return cost[0:, 0:]
+
+
+@njit(cache=True)
+def _banded_cost(
+    x: np.ndarray,
+    y: np.ndarray,
+    row_band: np.ndarray,
+    col_band: np.ndarray,
+    bounding_matrix: np.ndarray,
+    c: float,
+) -> float:
+    """MSM distance compiled to no_python, iterating only inside a band.
+
+    Computes the same value as _cost_matrix(x, y, bounding_matrix, c)[-1, -1], but only
+    visits indexes inside the band, and only stores two rows of the cost matrix.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array)
+        First time series.
+    y: np.ndarray (2d array)
+        Second time series.
+    row_band: np.ndarray (2d array of int of shape (2, len(x)))
+        Row band, as returned by resolve_bounding_band.
+    col_band: np.ndarray (2d array of int of shape (2, len(y)))
+        Column band, as returned by resolve_bounding_band.
+    bounding_matrix: np.ndarray (2d array)
+        Custom bounding matrix, or empty array, as returned by resolve_bounding_band.
+    c: float
+        Cost for split or merge operation.
+
+    Returns
+    -------
+    distance: float
+        MSM distance between the x and y time series.
+    """
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev = np.zeros(y_size)
+    curr = np.zeros(y_size)
+    # init the first cell and the rest of the first row
+    if x[0][0] > y[0][0]:
+        prev[0] = x[0][0] - y[0][0]
+    else:
+        prev[0] = y[0][0] - x[0][0]
+    for j in range(1, y_size):
+        prev[j] = prev[j - 1] + _cost_function(y[0][j], y[0][j - 1], x[0][0], c)
+    # columns written in prev, and columns in curr still holding values of an
+    # earlier row, which are reset before curr is reused
+    prev_first, prev_last = 1, y_size - 1
+    stale_first, stale_last = 1, 0
+
+    for i in range(1, x_size):
+        for j in range(stale_first, stale_last + 1):
+            curr[j] = 0.0
+        curr[0] = prev[0] + _cost_function(x[0][i], x[0][i - 1], y[0][0], c)
+        first, last = band_row_range(row_band, i, y_size)
+        first = max(first, 1)
+        for j in range(first, last + 1):
+            if in_bounding_band(i, j, col_band, bounding_matrix):
+                d1 = prev[j - 1] + np.abs(x[0][i] - y[0][j])
+                d2 = prev[j] + _cost_function(x[0][i], x[0][i - 1], y[0][j], c)
+                d3 = curr[j - 1] + _cost_function(y[0][j], x[0][i], y[0][j - 1], c)
+                curr[j] = min(d1, d2, d3)
+        stale_first, stale_last = prev_first, prev_last
+        prev_first, prev_last = first, last
+        prev, curr = curr, prev
+
+    return prev[y_size - 1]
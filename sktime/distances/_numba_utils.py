@@ -4,10 +4,15 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import Callable
 
 import numpy as np
-from numba import njit
+from numba import config, get_num_threads, njit, prange, set_num_threads
 
 from sktime.distances.base import DistanceCallable
 
+# the threaded pairwise loop is compiled for every distance callable, which takes
+# seconds, so it is only used above this many cost matrix cells (pairs times the
+# product of series lengths), where the threads make up for the compile time
+_MIN_PARALLEL_CELLS = 10**9
+
 
 @njit(cache=True)
 def _make_3d_series(x: np.ndarray) -> np.ndarray:
@@ -50,7 +55,12 @@ def _make_3d_series(x: np.ndarray) -> np.ndarray:
 
 
 def _compute_pairwise_distance(
-    x: np.ndarray, y: np.ndarray, symmetric: bool, distance_callable: DistanceCallable
+    x: np.ndarray,
+    y: np.ndarray,
+    symmetric: bool,
+    distance_callable: DistanceCallable,
+    n_jobs: int = 1,
+    out: np.ndarray = None,
 ) -> np.ndarray:
     """Compute pairwise distance between two numpy arrays.
 
@@ -66,29 +76,120 @@ def _compute_pairwise_distance(
     distance_callable: Callable[[np.ndarray, np.ndarray], float]
         No_python distance callable to measure the distance between two 2d numpy
         arrays.
+    n_jobs: int, defaults = 1
+        Number of threads to compute the distances with. If 1 or None, distances are
+        computed sequentially. If -1, all numba threads are used, and -2 all but one.
+        Threads are only used for large pairwise matrices, as the threaded loop is
+        compiled for every distance, which takes longer than computing small
+        pairwise matrices sequentially.
+    out: np.ndarray (2d array of shape (len(x), len(y))), defaults = None
+        Array to write the pairwise distances into, e.g., a np.memmap for pairwise
+        matrices that do not fit into memory. If None, a new array is allocated.
 
     Returns
     -------
     np.ndarray (2d of size mxn where m is len(x) and n is len(y)).
-        Pairwise distance matrix between the two time series.
+        Pairwise distance matrix between the two time series. If out is passed,
+        this is out.
     """
     _x = _make_3d_series(x)
     _y = _make_3d_series(y)
     x_size = _x.shape[0]
     y_size = _y.shape[0]
 
-    pairwise_matrix = np.zeros((x_size, y_size))
-
-    for i in range(x_size):
-        curr_x = _x[i]
-        for j in range(y_size):
-            if symmetric and j < i:
-                pairwise_matrix[i, j] = pairwise_matrix[j, i]
-            else:
-                pairwise_matrix[i, j] = distance_callable(curr_x, _y[j])
+    if out is None:
+        pairwise_matrix = np.zeros((x_size, y_size))
+    else:
+        if out.shape != (x_size, y_size):
+            raise ValueError(
+                f"out must be of shape {(x_size, y_size)}, but found {out.shape}"
+            )
+        pairwise_matrix = out
+
+    n_threads = _get_n_threads(n_jobs)
+    n_cells = x_size * y_size * _x.shape[-1] * _y.shape[-1]
+    if n_threads == 1 or n_cells < _MIN_PARALLEL_CELLS:
+        for i in range(x_size):
+            curr_x = _x[i]
+            for j in range(y_size):
+                if symmetric and j < i:
+                    pairwise_matrix[i, j] = pairwise_matrix[j, i]
+                else:
+                    pairwise_matrix[i, j] = distance_callable(curr_x, _y[j])
+        return pairwise_matrix
+
+    prev_n_threads = get_num_threads()
+    set_num_threads(n_threads)
+    try:
+        # np.asarray gives a plain ndarray on the same buffer, e.g., of a np.memmap
+        _parallel_pairwise_distance(
+            _x, _y, symmetric, distance_callable, np.asarray(pairwise_matrix)
+        )
+    finally:
+        set_num_threads(prev_n_threads)
     return pairwise_matrix
 
 
+def _get_n_threads(n_jobs: int) -> int:
+    """Resolve n_jobs to a number of numba threads, following joblib conventions."""
+    if n_jobs is None:
+        return 1
+    if not isinstance(n_jobs, (int, np.integer)) or n_jobs == 0:
+        raise ValueError(f"n_jobs must be a non-zero int or None, but found {n_jobs}")
+    max_threads = config.NUMBA_NUM_THREADS
+    if n_jobs < 0:
+        return max(1, max_threads + 1 + n_jobs)
+    return min(n_jobs, max_threads)
+
+
+@njit(parallel=True)
+def _parallel_pairwise_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    symmetric: bool,
+    distance_callable: DistanceCallable,
+    out: np.ndarray,
+) -> None:
+    """Compute pairwise distances with numba threads, writing into out.
+
+    In the symmetric case, only the upper triangle (including the diagonal) is
+    computed, and mirrored to the lower triangle. Row i is scheduled together with
+    row n - 1 - i, so every parallel iteration computes the same number of
+    distances, and threads are evenly loaded.
+
+    Parameters
+    ----------
+    x: np.ndarray (3d array of shape (m, d, l1))
+        First time series.
+    y: np.ndarray (3d array of shape (n, d, l2))
+        Second time series.
+    symmetric: bool
+        Boolean that is true when x equals y, and distance_callable is symmetric.
+    distance_callable: Callable[[np.ndarray, np.ndarray], float]
+        No_python distance callable.
+    out: np.ndarray (2d array of shape (m, n))
+        Array the pairwise distances are written into.
+    """
+    x_size = x.shape[0]
+    y_size = y.shape[0]
+
+    if symmetric:
+        for k in prange((x_size + 1) // 2):
+            for j in range(k, y_size):
+                out[k, j] = distance_callable(x[k], y[j])
+            i = x_size - 1 - k
+            if i != k:
+                for j in range(i, y_size):
+                    out[i, j] = distance_callable(x[i], y[j])
+        for i in prange(x_size):
+            for j in range(i):
+                out[i, j] = out[j, i]
+    else:
+        for i in prange(x_size):
+            for j in range(y_size):
+                out[i, j] = distance_callable(x[i], y[j])
+
+
 def is_no_python_compiled_callable(
     no_python_callable: Callable, raise_error: bool = False
 ):
@@ -10,7 +10,12 @@ from numba.core.errors import NumbaWarning
 
 from sktime.distances._distance_alignment_paths import compute_min_return_path
 from sktime.distances.base import DistanceCallable, NumbaDistance
-from sktime.distances.lower_bounding import resolve_bounding_matrix
+from sktime.distances.lower_bounding import (
+    band_row_range,
+    in_bounding_band,
+    resolve_bounding_band,
+    resolve_bounding_matrix,
+)
 
 # Warning occurs when using large time series (i.e. 1000x1000)
 warnings.simplefilter("ignore", category=NumbaWarning)
@@ -178,9 +183,17 @@ class _TweDistance(NumbaDistance):
             If the sakoe_chiba_window_radius is not an integer.
             If the itakura_max_slope is not a float or int.
         """
+        if bounding_matrix is not None and bounding_matrix.shape == (
+            x.shape[1],
+            y.shape[1],
+        ):
+            # bounding matrix for the unpadded series, align with the padded series
+            padded_bounding_matrix = np.zeros((x.shape[1] + 1, y.shape[1] + 1))
+            padded_bounding_matrix[1:, 1:] = bounding_matrix
+            bounding_matrix = padded_bounding_matrix
         x = pad_ts(x)
         y = pad_ts(y)
-        _bounding_matrix = resolve_bounding_matrix(
+        _row_band, _col_band, _bounding_matrix = resolve_bounding_band(
             x, y, window, itakura_max_slope, bounding_matrix
         )
 
@@ -189,8 +202,9 @@ class _TweDistance(NumbaDistance):
             _x: np.ndarray,
             _y: np.ndarray,
         ) -> float:
-            cost_matrix = _twe_cost_matrix(_x, _y, _bounding_matrix, lmbda, nu, p)
-            return cost_matrix[-1, -1]
+            return _twe_banded_cost(
+                _x, _y, _row_band, _col_band, _bounding_matrix, lmbda, nu, p
+            )
 
         return numba_twe_distance
 
@@ -308,3 +322,116 @@ def _twe_cost_matrix(
                 # Choose the operation with the minimal cost and update DP Matrix
                 cost_matrix[i, j] = min(del_x, del_y, match)
     return cost_matrix
+
+
+@njit(cache=True)
+def _twe_banded_cost(
+    x: np.ndarray,
+    y: np.ndarray,
+    row_band: np.ndarray,
+    col_band: np.ndarray,
+    bounding_matrix: np.ndarray,
+    lmbda: float,
+    nu: float,
+    p: int,
+) -> float:
+    """Twe distance compiled to no_python, iterating only inside a band.
+
+    Computes the same value as _twe_cost_matrix(x, y, bounding_matrix, lmbda, nu,
+    p)[-1, -1], but only visits indexes inside the band, and only stores two rows of
+    the cost matrix. The band is for the padded time series, see pad_ts.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array of shape dxm1).
+        First time series.
+    y: np.ndarray (2d array of shape dxm1).
+        Second time series.
+    row_band: np.ndarray (2d array of int of shape (2, m1 + 1))
+        Row band, as returned by resolve_bounding_band.
+    col_band: np.ndarray (2d array of int of shape (2, m2 + 1))
+        Column band, as returned by resolve_bounding_band.
+    bounding_matrix: np.ndarray (2d array)
+        Custom bounding matrix, or empty array, as returned by resolve_bounding_band.
+    lmbda: float
+        A constant penalty that punishes the editing efforts. Must be >= 1.0.
+    nu: float
+        A non-negative constant which characterizes the stiffness of the elastic
+        TWE measure. Must be > 0.
+    p: int
+        Order of the p-norm for local cost.
+
+    Returns
+    -------
+    float
+        The twe distance, i.e., the last value of the twe cost matrix.
+    """
+    x = pad_ts(x)
+    y = pad_ts(y)
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    dimensions = x.shape[0]
+
+    prev = np.full(y_size, np.inf)
+    curr = np.zeros(y_size)
+    prev[0] = 0.0
+    # columns written in prev, and columns in curr still holding values of an
+    # earlier row, which are reset before curr is reused
+    prev_first, prev_last = 1, y_size - 1
+    stale_first, stale_last = 1, 0
+
+    delete_addition = nu + lmbda
+
+    for i in range(1, x_size):
+        for j in range(stale_first, stale_last + 1):
+            curr[j] = 0.0
+        curr[0] = np.inf
+        first, last = band_row_range(row_band, i, y_size)
+        first = max(first, 1)
+        for j in range(first, last + 1):
+            if in_bounding_band(i, j, col_band, bounding_matrix):
+                # Deletion in x
+                # Euclidean distance to x[:, i - 1] and y[:, i]
+                deletion_x_euclid_dist = 0
+                for k in range(dimensions):
+                    deletion_x_euclid_dist += (x[k][i - 1] - y[k][i]) ** 2
+                deletion_x_euclid_dist = np.sqrt(deletion_x_euclid_dist)
+
+                del_x = prev[j] + deletion_x_euclid_dist + delete_addition
+
+                # Deletion in y
+                # Euclidean distance to x[:, j - 1] and y[:, j]
+                deletion_y_euclid_dist = 0
+                for k in range(dimensions):
+                    deletion_y_euclid_dist += (x[k][j - 1] - y[k][j]) ** 2
+                deletion_y_euclid_dist = np.sqrt(deletion_y_euclid_dist)
+
+                del_y = curr[j - 1] + deletion_y_euclid_dist + delete_addition
+
+                # Keep data points in both time series
+                # Euclidean distance to x[:, i] and y[:, j]
+                match_same_euclid_dist = 0
+                for k in range(dimensions):
+                    match_same_euclid_dist += (x[k][i] - y[k][j]) ** 2
+                match_same_euclid_dist = np.sqrt(match_same_euclid_dist)
+
+                # Euclidean distance to x[:, i - 1] and y[:, j - 1]
+                match_previous_euclid_dist = 0
+                for k in range(dimensions):
+                    match_previous_euclid_dist += (x[k][i - 1] - y[k][j - 1]) ** 2
+                match_previous_euclid_dist = np.sqrt(match_previous_euclid_dist)
+
+                match = (
+                    prev[j - 1]
+                    + match_same_euclid_dist
+                    + match_previous_euclid_dist
+                    + (nu * (2 * abs(i - j)))
+                )
+
+                # Choose the operation with the minimal cost and update DP Matrix
+                curr[j] = min(del_x, del_y, match)
+        stale_first, stale_last = prev_first, prev_last
+        prev_first, prev_last = first, last
+        prev, curr = curr, prev
+
+    return prev[y_size - 1]
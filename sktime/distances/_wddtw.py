@@ -11,13 +11,16 @@ from numba.core.errors import NumbaWarning
 from sktime.distances._ddtw import DerivativeCallable, average_of_slope
 from sktime.distances._distance_alignment_paths import compute_min_return_path
 from sktime.distances._numba_utils import is_no_python_compiled_callable
-from sktime.distances._wdtw import _weighted_cost_matrix
+from sktime.distances._wdtw import _weighted_banded_cost, _weighted_cost_matrix
 from sktime.distances.base import (
     DistanceAlignmentPathCallable,
     DistanceCallable,
     NumbaDistance,
 )
-from sktime.distances.lower_bounding import resolve_bounding_matrix
+from sktime.distances.lower_bounding import (
+    resolve_bounding_band,
+    resolve_bounding_matrix,
+)
 
 # Warning occurs when using large time series (i.e. 1000x1000)
 warnings.simplefilter("ignore", category=NumbaWarning)
@@ -195,7 +198,7 @@ class _WddtwDistance(NumbaDistance):
             If the compute derivative callable is not no_python compiled.
             If the value of g is not a float
         """
-        _bounding_matrix = resolve_bounding_matrix(
+        _row_band, _col_band, _bounding_matrix = resolve_bounding_band(
             x, y, window, itakura_max_slope, bounding_matrix
         )
 
@@ -218,7 +221,8 @@ class _WddtwDistance(NumbaDistance):
         ) -> float:
             _x = compute_derivative(_x)
             _y = compute_derivative(_y)
-            cost_matrix = _weighted_cost_matrix(_x, _y, _bounding_matrix, g)
-            return cost_matrix[-1, -1]
+            return _weighted_banded_cost(
+                _x, _y, _row_band, _col_band, _bounding_matrix, g
+            )
 
         return numba_wddtw_distance
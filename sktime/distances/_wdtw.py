@@ -14,7 +14,12 @@ from sktime.distances.base import (
     DistanceCallable,
     NumbaDistance,
 )
-from sktime.distances.lower_bounding import resolve_bounding_matrix
+from sktime.distances.lower_bounding import (
+    band_row_range,
+    in_bounding_band,
+    resolve_bounding_band,
+    resolve_bounding_matrix,
+)
 
 # Warning occurs when using large time series (i.e. 1000x1000)
 warnings.simplefilter("ignore", category=NumbaWarning)
@@ -189,7 +194,7 @@ class _WdtwDistance(NumbaDistance):
             If the itakura_max_slope is not a float or int.
             If the value of g is not a float
         """
-        _bounding_matrix = resolve_bounding_matrix(
+        _row_band, _col_band, _bounding_matrix = resolve_bounding_band(
             x, y, window, itakura_max_slope, bounding_matrix
         )
 
@@ -203,8 +208,9 @@ class _WdtwDistance(NumbaDistance):
             _x: np.ndarray,
             _y: np.ndarray,
         ) -> float:
-            cost_matrix = _weighted_cost_matrix(_x, _y, _bounding_matrix, g)
-            return cost_matrix[-1, -1]
+            return _weighted_banded_cost(
+                _x, _y, _row_band, _col_band, _bounding_matrix, g
+            )
 
         return numba_wdtw_distance
 
@@ -239,8 +245,9 @@ def _weighted_cost_matrix(
     cost_matrix = np.full((x_size + 1, y_size + 1), np.inf)
     cost_matrix[0, 0] = 0.0
 
+    # one weight per phase difference, which is up to max(x_size, y_size) - 1
     weight_vector = np.array(
-        [1 / (1 + np.exp(-g * (i - x_size / 2))) for i in range(0, x_size)]
+        [1 / (1 + np.exp(-g * (i - x_size / 2))) for i in range(0, max(x_size, y_size))]
     )
 
     for i in range(x_size):
@@ -255,3 +262,73 @@ def _weighted_cost_matrix(
                 )
 
     return cost_matrix[1:, 1:]
+
+
+@njit(cache=True)
+def _weighted_banded_cost(
+    x: np.ndarray,
+    y: np.ndarray,
+    row_band: np.ndarray,
+    col_band: np.ndarray,
+    bounding_matrix: np.ndarray,
+    g: float,
+) -> float:
+    """Compute the wdtw distance, iterating only inside a band.
+
+    Computes the same value as _weighted_cost_matrix(x, y, bounding_matrix, g)[-1, -1],
+    but only visits indexes inside the band, and only stores two rows of the cost
+    matrix.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array)
+        First time series.
+    y: np.ndarray (2d array)
+        Second time series.
+    row_band: np.ndarray (2d array of int of shape (2, len(x)))
+        Row band, as returned by resolve_bounding_band.
+    col_band: np.ndarray (2d array of int of shape (2, len(y)))
+        Column band, as returned by resolve_bounding_band.
+    bounding_matrix: np.ndarray (2d array)
+        Custom bounding matrix, or empty array, as returned by resolve_bounding_band.
+    g: float
+        Constant that controls the curvature (slope) of the function; that is, g
+        controls the level of penalisation for the points with larger phase difference.
+
+    Returns
+    -------
+    float
+        The wdtw distance, i.e., the last value of the weighted cost matrix.
+    """
+    dimensions = x.shape[0]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev = np.full(y_size + 1, np.inf)
+    curr = np.full(y_size + 1, np.inf)
+    prev[0] = 0.0
+    prev_first, prev_last = 0, 0
+    stale_first, stale_last = 1, 0
+
+    # one weight per phase difference, which is up to max(x_size, y_size) - 1
+    weight_vector = np.array(
+        [1 / (1 + np.exp(-g * (i - x_size / 2))) for i in range(0, max(x_size, y_size))]
+    )
+
+    for i in range(x_size):
+        for j in range(stale_first, stale_last + 1):
+            curr[j] = np.inf
+        first, last = band_row_range(row_band, i, y_size)
+        for j in range(first, last + 1):
+            if in_bounding_band(i, j, col_band, bounding_matrix):
+                sum = 0
+                for k in range(dimensions):
+                    sum += (x[k][i] - y[k][j]) * (x[k][i] - y[k][j])
+                curr[j + 1] = (
+                    min(prev[j + 1], curr[j], prev[j])
+                    + weight_vector[np.abs(i - j)] * sum
+                )
+        stale_first, stale_last = prev_first, prev_last
+        prev_first, prev_last = first + 1, last + 1
+        prev, curr = curr, prev
+
+    return prev[y_size]
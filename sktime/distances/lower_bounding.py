@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 """Lower bounding enum."""
 __author__ = ["chrisholder", "TonyBagnall"]
-__all__ = ["LowerBounding", "resolve_bounding_matrix"]
+__all__ = ["LowerBounding", "resolve_bounding_matrix", "resolve_bounding_band"]
 
 import math
 from enum import Enum
-from typing import Union
+from typing import Tuple, Union
 
 import numpy as np
 from numba import njit
@@ -154,7 +154,41 @@ def sakoe_chiba(x: np.ndarray, y: np.ndarray, window: float) -> np.ndarray:
 
     x_size = x.shape[1]
     y_size = y.shape[1]
-    bounding_matrix = np.full((x_size, y_size), np.inf)
+    bounding_matrix = np.full((y_size, x_size), np.inf)
+    x_upper_line_values, x_lower_line_values = _sakoe_chiba_lines(
+        x_size, y_size, window
+    )
+
+    bounding_matrix = create_shape_on_matrix(
+        bounding_matrix, x_upper_line_values, x_lower_line_values
+    )
+
+    # the lines are over the indexes of x, the shape is created on rows of y
+    return bounding_matrix.T.copy()
+
+
+@njit(cache=True)
+def _sakoe_chiba_lines(
+    x_size: int, y_size: int, window: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute upper and lower lines of the sakoe chiba window.
+
+    Parameters
+    ----------
+    x_size: int
+        Length of the first time series.
+    y_size: int
+        Length of the second time series.
+    window: float
+        Float that is the size of the window, between 0 and 1.
+
+    Returns
+    -------
+    x_upper_line_values: np.ndarray (1d array of length x_size)
+        Y points of the upper line.
+    x_lower_line_values: np.ndarray (1d array of length x_size)
+        Y points of the lower line.
+    """
     sakoe_chiba_window_radius = ((x_size / 100) * window) * 100
 
     x_upper_line_values = np.interp(
@@ -167,12 +201,7 @@ def sakoe_chiba(x: np.ndarray, y: np.ndarray, window: float) -> np.ndarray:
         [0, x_size - 1],
         [0 + sakoe_chiba_window_radius, y_size + sakoe_chiba_window_radius - 1],
     )
-
-    bounding_matrix = create_shape_on_matrix(
-        bounding_matrix, x_upper_line_values, x_lower_line_values
-    )
-
-    return bounding_matrix
+    return x_upper_line_values, x_lower_line_values
 
 
 @njit(cache=True)
@@ -206,6 +235,44 @@ def itakura_parallelogram(
     x_size = x.shape[1]
     y_size = y.shape[1]
     bounding_matrix = np.full((y_size, x_size), np.inf)
+    x_upper_line_values, x_lower_line_values = _itakura_parallelogram_lines(
+        x_size, y_size, itakura_max_slope
+    )
+
+    bounding_matrix = create_shape_on_matrix(
+        bounding_matrix, x_upper_line_values, x_lower_line_values
+    )
+
+    # the lines are over the indexes of x, the shape is created on rows of y,
+    # series of equal length use the shape as is, which is not symmetric
+    if x_size != y_size:
+        bounding_matrix = bounding_matrix.T.copy()
+
+    return bounding_matrix
+
+
+@njit(cache=True)
+def _itakura_parallelogram_lines(
+    x_size: int, y_size: int, itakura_max_slope: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute upper and lower lines of the itakura parallelogram.
+
+    Parameters
+    ----------
+    x_size: int
+        Length of the first time series.
+    y_size: int
+        Length of the second time series.
+    itakura_max_slope: float
+        Gradient of the slope, between 0 and 1.
+
+    Returns
+    -------
+    x_upper_line_values: np.ndarray (1d array of length x_size)
+        Y points of the upper line.
+    x_lower_line_values: np.ndarray (1d array of length x_size)
+        Y points of the lower line.
+    """
     itakura_max_slope = math.floor(((x_size / 100) * itakura_max_slope) * 100) / 2
 
     middle_x_upper = math.ceil(x_size / 2)
@@ -232,11 +299,7 @@ def itakura_parallelogram(
     if np.array_equal(x_upper_line_values, x_lower_line_values):
         x_upper_line_values = _check_line_steps(x_upper_line_values)
 
-    bounding_matrix = create_shape_on_matrix(
-        bounding_matrix, x_upper_line_values, x_lower_line_values
-    )
-
-    return bounding_matrix
+    return x_upper_line_values, x_lower_line_values
 
 
 @njit(cache=True)
@@ -271,6 +334,175 @@ def numba_create_bounding_matrix(
     return bounding_matrix
 
 
+@njit(cache=True)
+def create_shape_band(
+    n_rows: int,
+    n_cols: int,
+    y_upper_line: np.ndarray,
+    y_lower_line: np.ndarray,
+) -> np.ndarray:
+    """Create the band of a shape, without creating the bounding matrix.
+
+    The shape is the same as the one created by create_shape_on_matrix on a matrix
+    of size (n_rows, n_cols), but only the first and last in bound row of every
+    column are stored, which needs O(n_cols) rather than O(n_rows * n_cols) memory.
+
+    Parameters
+    ----------
+    n_rows: int
+        Number of rows of the bounding matrix.
+    n_cols: int
+        Number of columns of the bounding matrix.
+    y_upper_line: np.ndarray (1d array)
+        Y points of the upper line.
+    y_lower_line: np.ndarray (1d array)
+        Y points of the lower line, same length as y_upper_line.
+
+    Returns
+    -------
+    np.ndarray (2d array of int of shape (2, n_cols))
+        Column band, where column j is in bound for rows col_band[0, j] to
+        col_band[1, j] (inclusive). Columns with col_band[0, j] > col_band[1, j]
+        have no in bound rows.
+    """
+    col_band = np.empty((2, n_cols), dtype=np.int64)
+    col_band[0, :] = n_rows
+    col_band[1, :] = -1
+
+    for i in range(min(y_upper_line.shape[0], n_cols)):
+        upper_y = max(0, min(n_rows - 1, math.ceil(y_upper_line[i])))
+        lower_y = max(0, min(n_rows - 1, math.floor(y_lower_line[i])))
+        if upper_y <= lower_y:
+            col_band[0, i] = upper_y
+            col_band[1, i] = lower_y
+
+    return col_band
+
+
+@njit(cache=True)
+def _row_band_from_col_band(col_band: np.ndarray, n_rows: int) -> np.ndarray:
+    """Compute first and last in bound column of every row, from a column band.
+
+    Parameters
+    ----------
+    col_band: np.ndarray (2d array of int of shape (2, n_cols))
+        Column band, see create_shape_band.
+    n_rows: int
+        Number of rows of the bounding matrix.
+
+    Returns
+    -------
+    np.ndarray (2d array of int of shape (2, n_rows))
+        Row band, where all in bound columns of row i lie between row_band[0, i]
+        and row_band[1, i] (inclusive). Rows with row_band[0, i] > row_band[1, i]
+        have no in bound columns.
+    """
+    n_cols = col_band.shape[1]
+    row_band = np.empty((2, n_rows), dtype=np.int64)
+    row_band[0, :] = n_cols
+    row_band[1, :] = -1
+    for j in range(n_cols):
+        for i in range(col_band[0, j], col_band[1, j] + 1):
+            if j < row_band[0, i]:
+                row_band[0, i] = j
+            row_band[1, i] = j
+    return row_band
+
+
+@njit(cache=True)
+def _bands_from_bounding_matrix(
+    bounding_matrix: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute row and column band enclosing the in bound values of a matrix.
+
+    Parameters
+    ----------
+    bounding_matrix: np.ndarray (2d array)
+        Bounding matrix where in bound values are finite, out of bound values
+        are infinite.
+
+    Returns
+    -------
+    row_band: np.ndarray (2d array of int of shape (2, n_rows))
+        First and last in bound column of every row, see _row_band_from_col_band.
+    col_band: np.ndarray (2d array of int of shape (2, n_cols))
+        First and last in bound row of every column, see create_shape_band.
+    """
+    n_rows, n_cols = bounding_matrix.shape
+    row_band = np.empty((2, n_rows), dtype=np.int64)
+    row_band[0, :] = n_cols
+    row_band[1, :] = -1
+    col_band = np.empty((2, n_cols), dtype=np.int64)
+    col_band[0, :] = n_rows
+    col_band[1, :] = -1
+    for i in range(n_rows):
+        for j in range(n_cols):
+            if np.isfinite(bounding_matrix[i, j]):
+                if j < row_band[0, i]:
+                    row_band[0, i] = j
+                row_band[1, i] = j
+                if i < col_band[0, j]:
+                    col_band[0, j] = i
+                col_band[1, j] = i
+    return row_band, col_band
+
+
+@njit(cache=True)
+def in_bounding_band(
+    i: int, j: int, col_band: np.ndarray, bounding_matrix: np.ndarray
+) -> bool:
+    """Check if index (i, j) is in bound, for a band created by resolve_bounding_band.
+
+    Only valid for indexes inside the row band, i.e., for j between row_band[0, i]
+    and row_band[1, i].
+
+    Parameters
+    ----------
+    i: int
+        Row index (index in the first time series).
+    j: int
+        Column index (index in the second time series).
+    col_band: np.ndarray (2d array of int of shape (2, n_cols))
+        Column band, see create_shape_band.
+    bounding_matrix: np.ndarray (2d array)
+        Custom bounding matrix the band was created from, or an empty array of
+        shape (0, 0) if the band was created from window or itakura_max_slope.
+
+    Returns
+    -------
+    bool
+        True if the index is in bound, False otherwise.
+    """
+    if bounding_matrix.shape[0] == 0:
+        return col_band[0, j] <= i <= col_band[1, j]
+    return np.isfinite(bounding_matrix[i, j])
+
+
+@njit(cache=True)
+def band_row_range(row_band: np.ndarray, i: int, n_cols: int) -> Tuple[int, int]:
+    """Return first and last column of row i to consider, for a row band.
+
+    Parameters
+    ----------
+    row_band: np.ndarray (2d array of int of shape (2, m))
+        Row band, see _row_band_from_col_band.
+    i: int
+        Row index.
+    n_cols: int
+        Number of columns of the cost matrix, the last column is clipped to this.
+
+    Returns
+    -------
+    first: int
+        First column to consider.
+    last: int
+        Last column to consider (inclusive), smaller than first if there is none.
+    """
+    if i >= row_band.shape[1]:
+        return 0, -1
+    return row_band[0, i], min(row_band[1, i], n_cols - 1)
+
+
 class LowerBounding(Enum):
     r"""Enum for various lower bounding implementations.
 
@@ -401,6 +633,88 @@ class LowerBounding(Enum):
 
         return bounding_matrix
 
+    def create_bounding_band(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        sakoe_chiba_window_radius: Union[float, None] = None,
+        itakura_max_slope: Union[float, int, None] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Create the band of a bounding matrix, without creating the matrix.
+
+        The in bound indexes are the same as for create_bounding_matrix, but only
+        the first and last in bound index of every row and column are stored.
+
+        Parameters
+        ----------
+        x: np.ndarray (1d, 2d or 3d array)
+            First time series.
+        y: np.ndarray (1d, 2d or 3d array)
+            Second time series.
+        sakoe_chiba_window_radius: int, defaults = None
+            Integer that is the radius of the sakoe chiba window. Must be between 0
+            and 1.
+        itakura_max_slope: float or int, defaults = None
+            Gradient of the slope for itakura parallelogram. Must be between 0 and 1.
+
+        Returns
+        -------
+        row_band: np.ndarray (2d array of int of shape (2, m))
+            First and last in bound column of every row, m is len(x).
+        col_band: np.ndarray (2d array of int of shape (2, n))
+            First and last in bound row of every column, n is len(y).
+            Index (i, j) is in bound if col_band[0, j] <= i <= col_band[1, j].
+
+        Raises
+        ------
+        ValueError
+            If the input time series is not a numpy array.
+            If the input time series doesn't have exactly 2 dimensions.
+            If the sakoe_chiba_window_radius is not an integer.
+            If the itakura_max_slope is not a float or int.
+        """
+        _x = self._check_input_timeseries(x)
+        _y = self._check_input_timeseries(y)
+        x_size = _x.shape[1]
+        y_size = _y.shape[1]
+        if self.int_val == 2:
+            if not isinstance(sakoe_chiba_window_radius, float):
+                raise ValueError(
+                    f"The sakoe chiba window must be a float, passed "
+                    f"{sakoe_chiba_window_radius} of type"
+                    f" {type(sakoe_chiba_window_radius)}."
+                )
+            if sakoe_chiba_window_radius < 0 or sakoe_chiba_window_radius > 1:
+                raise ValueError("Window must between 0 and 1")
+            upper_line, lower_line = _sakoe_chiba_lines(
+                x_size, y_size, sakoe_chiba_window_radius
+            )
+            # the lines are over the indexes of x, with values in the indexes of y
+            row_band = create_shape_band(y_size, x_size, upper_line, lower_line)
+            col_band = _row_band_from_col_band(row_band, y_size)
+        elif self.int_val == 3:
+            if not isinstance(itakura_max_slope, float):
+                raise ValueError("The itakura max slope must be a float or int.")
+            if itakura_max_slope < 0 or itakura_max_slope > 1:
+                raise ValueError("Window must between 0 and 1")
+            upper_line, lower_line = _itakura_parallelogram_lines(
+                x_size, y_size, itakura_max_slope
+            )
+            # same orientation as itakura_parallelogram, see there
+            if x_size == y_size:
+                col_band = create_shape_band(x_size, y_size, upper_line, lower_line)
+                row_band = _row_band_from_col_band(col_band, x_size)
+            else:
+                row_band = create_shape_band(y_size, x_size, upper_line, lower_line)
+                col_band = _row_band_from_col_band(row_band, y_size)
+        else:
+            col_band = np.empty((2, y_size), dtype=np.int64)
+            col_band[0, :] = 0
+            col_band[1, :] = x_size - 1
+            row_band = _row_band_from_col_band(col_band, x_size)
+
+        return row_band, col_band
+
     @staticmethod
     def _check_input_timeseries(x: np.ndarray) -> np.ndarray:
         """Check and validate input time series.
@@ -500,3 +814,82 @@ def resolve_bounding_matrix(
         )
     else:
         return bounding_matrix
+
+
+def resolve_bounding_band(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: Union[float, None] = None,
+    itakura_max_slope: Union[float, None] = None,
+    bounding_matrix: np.ndarray = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Resolve the bounding parameters to a band.
+
+    Same as resolve_bounding_matrix, but returns the bounds as a band, which needs
+    O(len(x) + len(y)) memory instead of O(len(x) * len(y)) for the bounding matrix.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array)
+        First time series.
+    y: np.ndarray (2d array)
+        Second time series.
+    window: float, defaults = None
+        Float that is the % radius of the sakoe chiba window (if using Sakoe-Chiba
+        lower bounding). Must be between 0 and 1.
+    itakura_max_slope: float, defaults = None
+        Gradient of the slope for itakura parallelogram (if using Itakura
+        Parallelogram lower bounding). Must be between 0 and 1.
+    bounding_matrix: np.ndarray (2d array)
+        Custom bounding matrix to use. If defined then the band is computed from this
+        matrix, and the matrix is returned as well. Other lower_bounding params
+        and creation will be ignored.
+
+    Returns
+    -------
+    row_band: np.ndarray (2d array of int of shape (2, m))
+        First and last in bound column of every row, m is len(x). Bounded
+        distances only need to consider index (i, j) if
+        row_band[0, i] <= j <= row_band[1, i].
+    col_band: np.ndarray (2d array of int of shape (2, n))
+        First and last in bound row of every column, n is len(y).
+    bounding_matrix: np.ndarray (2d array)
+        The custom bounding matrix if passed, otherwise empty array of shape (0, 0).
+        Use in_bounding_band(i, j, col_band, bounding_matrix) to check whether
+        an index inside the row band is in bound.
+
+    Raises
+    ------
+    ValueError
+        If the input time series is not a numpy array.
+        If the input time series doesn't have exactly 2 dimensions.
+        If the sakoe_chiba_window_radius is not an float.
+        If the itakura_max_slope is not a float or int.
+        If both window and itakura_max_slope are set
+    """
+    if bounding_matrix is None:
+        if itakura_max_slope is not None and window is not None:
+            raise ValueError(
+                "You can only use one bounding matrix at once. You"
+                "have set both window and itakura_max_slope parameter."
+            )
+        if window is not None:
+            # Sakoe-chiba
+            lower_bounding = LowerBounding(2)
+        elif itakura_max_slope is not None:
+            # Itakura parallelogram
+            lower_bounding = LowerBounding(3)
+        else:
+            # No bounding
+            lower_bounding = LowerBounding(1)
+
+        row_band, col_band = lower_bounding.create_bounding_band(
+            x,
+            y,
+            sakoe_chiba_window_radius=window,
+            itakura_max_slope=itakura_max_slope,
+        )
+        return row_band, col_band, np.empty((0, 0))
+    else:
+        row_band, col_band = _bands_from_bounding_matrix(bounding_matrix)
+        return row_band, col_band, bounding_matrix
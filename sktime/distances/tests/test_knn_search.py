@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Tests for exact nearest neighbour search with lower bound cascades."""
+
+import numpy as np
+import pytest
+
+from sktime.distances import KNeighborsSearch, pairwise_distance
+
+SEARCH_PARAMS = [
+    ("dtw", {}),
+    ("dtw", {"window": 0.1}),
+    ("dtw", {"itakura_max_slope": 0.5}),
+    ("ddtw", {"window": 0.2}),
+    ("wdtw", {}),
+    ("euclidean", {}),
+]
+
+
+@pytest.mark.parametrize("metric, kwargs", SEARCH_PARAMS)
+@pytest.mark.parametrize("n_dims", [1, 3])
+@pytest.mark.parametrize("n_neighbors", [1, 3])
+@pytest.mark.parametrize("block_size", [1024, 4])
+def test_knn_search_equals_brute_force(metric, kwargs, n_dims, n_neighbors, block_size):
+    """Test that KNeighborsSearch returns the same neighbours as brute force."""
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(30, n_dims, 25)).cumsum(axis=2)
+    X_query = rng.normal(size=(8, n_dims, 25)).cumsum(axis=2)
+    # exact duplicates produce ties, which must be broken by lower index
+    X[4] = X[2]
+    X_query[0] = X[2]
+
+    search = KNeighborsSearch(
+        metric=metric, n_neighbors=n_neighbors, block_size=block_size, **kwargs
+    )
+    dist, ind = search.fit(X).kneighbors(X_query)
+
+    dist_mat = pairwise_distance(X_query, X, metric=metric, **kwargs)
+    expected_ind = np.argsort(dist_mat, axis=1, kind="stable")[:, :n_neighbors]
+    expected_dist = np.take_along_axis(dist_mat, expected_ind, axis=1)
+
+    np.testing.assert_array_equal(ind, expected_ind)
+    np.testing.assert_array_equal(dist, expected_dist)
+
+    ind_only = search.kneighbors(X_query, return_distance=False)
+    np.testing.assert_array_equal(ind_only, expected_ind)
+
+
+def test_knn_search_too_many_neighbors():
+    """Test that asking for more neighbours than fitted series raises error."""
+    X = np.zeros((3, 1, 10))
+    search = KNeighborsSearch(n_neighbors=4).fit(X)
+    with pytest.raises(ValueError, match="n_neighbors"):
+        search.kneighbors(X)
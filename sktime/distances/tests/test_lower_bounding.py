@@ -4,7 +4,12 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from sktime.distances.lower_bounding import LowerBounding
+from sktime.distances.lower_bounding import (
+    LowerBounding,
+    in_bounding_band,
+    resolve_bounding_band,
+    resolve_bounding_matrix,
+)
 from sktime.distances.tests._utils import create_test_distance_numpy
 
 
@@ -214,3 +219,51 @@ def test_incorrect_parameters() -> None:
         sakoe_chiba.create_bounding_matrix(
             numpy_x, numpy_y, sakoe_chiba_window_radius=1.2, itakura_max_slope=10.0
         )
+
+
+BOUNDING_PARAMS = [
+    {},
+    {"window": 0.0},
+    {"window": 0.1},
+    {"window": 0.5},
+    {"window": 1.0},
+    {"itakura_max_slope": 0.0},
+    {"itakura_max_slope": 0.2},
+    {"itakura_max_slope": 1.0},
+]
+
+
+@pytest.mark.parametrize("bounding_params", BOUNDING_PARAMS)
+@pytest.mark.parametrize(
+    "n_timepoints", [(1, 1), (2, 2), (10, 10), (33, 33), (10, 7), (7, 10), (33, 20)]
+)
+def test_bounding_band(bounding_params, n_timepoints) -> None:
+    """Test the bounding band has the same in bound indexes as the bounding matrix."""
+    x_size, y_size = n_timepoints
+    x = np.zeros((1, x_size))
+    y = np.ones((1, y_size))
+    matrix = resolve_bounding_matrix(x, y, **bounding_params)
+    assert matrix.shape == (x_size, y_size)
+    custom_bands = resolve_bounding_band(x, y, bounding_matrix=matrix)
+
+    for bands in [resolve_bounding_band(x, y, **bounding_params), custom_bands]:
+        row_band, col_band, bounding_matrix = bands
+        in_bound = np.zeros(matrix.shape, dtype=bool)
+        for i in range(x_size):
+            for j in range(row_band[0, i], row_band[1, i] + 1):
+                in_bound[i, j] = in_bounding_band(i, j, col_band, bounding_matrix)
+        np.testing.assert_array_equal(in_bound, np.isfinite(matrix))
+
+
+@pytest.mark.parametrize("n_timepoints", [(20, 15), (15, 20)])
+def test_itakura_unequal_length(n_timepoints) -> None:
+    """Test the itakura parallelogram connects the ends of series of unequal length."""
+    x_size, y_size = n_timepoints
+    x = np.zeros((1, x_size))
+    y = np.ones((1, y_size))
+    matrix = LowerBounding.ITAKURA_PARALLELOGRAM.create_bounding_matrix(
+        x, y, itakura_max_slope=0.2
+    )
+
+    assert matrix.shape == (x_size, y_size)
+    assert np.isfinite(matrix[0, 0]) and np.isfinite(matrix[-1, -1])
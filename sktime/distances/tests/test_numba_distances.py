@@ -9,8 +9,14 @@ import numpy as np
 import pytest
 from numpy.testing import assert_almost_equal
 
-from sktime.distances._distance import _METRIC_INFOS, distance, distance_factory
+from sktime.distances._distance import (
+    _METRIC_INFOS,
+    distance,
+    distance_alignment_path,
+    distance_factory,
+)
 from sktime.distances.base import MetricInfo, NumbaDistance
+from sktime.distances.lower_bounding import resolve_bounding_matrix
 from sktime.distances.tests._expected_results import _expected_distance_results
 from sktime.distances.tests._shared_tests import (
     _test_incorrect_parameters,
@@ -217,3 +223,32 @@ def test_distance_factory_1d():
 
     assert first == 14.906015491572047
     assert second == 422.81946268212846
+
+
+# twe is excluded, as its alignment path bounds the unpadded series
+BANDED_METRICS = ["dtw", "ddtw", "wdtw", "wddtw", "erp", "edr", "lcss", "msm"]
+
+
+@pytest.mark.parametrize("metric", BANDED_METRICS)
+@pytest.mark.parametrize(
+    "bounding_params",
+    [{}, {"window": 0.2}, {"window": 0.5}, {"itakura_max_slope": 0.5}],
+)
+@pytest.mark.parametrize("n_timepoints", [(40, 40), (40, 30), (30, 40)])
+def test_banded_distance(metric, bounding_params, n_timepoints):
+    """Test distances computed in band equal those from the full cost matrix."""
+    n_dims = 1 if metric == "msm" else 2
+    rng = np.random.default_rng(42)
+    x = rng.normal(size=(n_dims, n_timepoints[0]))
+    y = rng.normal(size=(n_dims, n_timepoints[1]))
+
+    dist = distance(x, y, metric=metric, **bounding_params)
+    bounding_matrix = resolve_bounding_matrix(x, y, **bounding_params)
+    matrix_dist = distance(x, y, metric=metric, bounding_matrix=bounding_matrix)
+    assert dist == matrix_dist
+
+    # the lcss path does not terminate if it leaves the itakura parallelogram
+    if metric == "lcss" and "itakura_max_slope" in bounding_params:
+        return
+    _, path_dist = distance_alignment_path(x, y, metric=metric, **bounding_params)
+    assert dist == path_dist
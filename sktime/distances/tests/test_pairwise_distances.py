@@ -8,7 +8,12 @@ from typing import Callable
 import numpy as np
 import pytest
 
-from sktime.distances._distance import _METRIC_INFOS, pairwise_distance
+from sktime.distances import _numba_utils
+from sktime.distances._distance import (
+    _METRIC_INFOS,
+    pairwise_distance,
+    pairwise_distance_blocks,
+)
 from sktime.distances._numba_utils import _make_3d_series
 from sktime.distances.base import MetricInfo, NumbaDistance
 from sktime.distances.tests._shared_tests import (
@@ -277,3 +282,73 @@ def test_metric_parameters():
 def test_incorrect_parameters():
     """Ensure incorrect parameters raise errors."""
     _test_incorrect_parameters(pairwise_distance)
+
+
+@pytest.mark.parametrize("metric", ["euclidean", "dtw", "msm"])
+@pytest.mark.parametrize("n_jobs", [2, -1])
+def test_parallel_pairwise_distance(monkeypatch, metric: str, n_jobs: int):
+    """Test that threaded pairwise distances equal sequential pairwise distances."""
+    monkeypatch.setattr(_numba_utils, "_MIN_PARALLEL_CELLS", 0)
+    x = create_test_distance_numpy(11, 1, 10)
+    y = create_test_distance_numpy(6, 1, 10, random_state=2)
+
+    serial = pairwise_distance(x, metric=metric)
+    parallel = pairwise_distance(x, metric=metric, n_jobs=n_jobs)
+    np.testing.assert_allclose(parallel, serial)
+    assert np.array_equal(parallel, parallel.T)
+
+    serial = pairwise_distance(x, y, metric=metric)
+    parallel = pairwise_distance(x, y, metric=metric, n_jobs=n_jobs)
+    np.testing.assert_allclose(parallel, serial)
+
+
+def test_small_pairwise_distance_sequential(monkeypatch):
+    """Test that small pairwise matrices are computed without compiling threads."""
+
+    def _raise(*args):
+        raise AssertionError("threaded pairwise loop used for small input")
+
+    monkeypatch.setattr(_numba_utils, "_parallel_pairwise_distance", _raise)
+    x = create_test_distance_numpy(11, 1, 10)
+
+    np.testing.assert_allclose(
+        pairwise_distance(x, metric="dtw", n_jobs=-1),
+        pairwise_distance(x, metric="dtw"),
+    )
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_pairwise_distance_out(monkeypatch, tmp_path, n_jobs: int):
+    """Test that pairwise distances can be written into a memory-mapped array."""
+    monkeypatch.setattr(_numba_utils, "_MIN_PARALLEL_CELLS", 0)
+    x = create_test_distance_numpy(7, 1, 10)
+    out = np.memmap(tmp_path / "pw.dat", dtype=float, mode="w+", shape=(7, 7))
+
+    result = pairwise_distance(x, metric="dtw", n_jobs=n_jobs, out=out)
+
+    assert result is out
+    np.testing.assert_allclose(np.asarray(out), pairwise_distance(x, metric="dtw"))
+
+    with pytest.raises(ValueError, match="out must be of shape"):
+        pairwise_distance(x, metric="dtw", out=np.zeros((7, 6)))
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 100])
+@pytest.mark.parametrize("symmetric", [True, False])
+def test_pairwise_distance_blocks(block_size: int, symmetric: bool):
+    """Test that tiles of pairwise_distance_blocks make up pairwise_distance."""
+    x = create_test_distance_numpy(8, 2, 10)
+    y = None if symmetric else create_test_distance_numpy(5, 2, 10, random_state=2)
+    expected = pairwise_distance(x, y, metric="dtw", window=0.3)
+
+    result = np.full(expected.shape, np.nan)
+    for rows, cols, tile in pairwise_distance_blocks(
+        x, y, metric="dtw", block_size=block_size, window=0.3
+    ):
+        assert tile.shape[0] <= block_size and tile.shape[1] <= block_size
+        result[rows, cols] = tile
+
+    np.testing.assert_array_equal(result, expected)
+
+    with pytest.raises(ValueError, match="block_size"):
+        next(pairwise_distance_blocks(x, y, metric="dtw", block_size=0))
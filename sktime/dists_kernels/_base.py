@@ -26,6 +26,7 @@ Inspection methods:
 Scitype defining methods:
     computing distance/kernel matrix (shorthand) - __call__(self, X, X2=X)
     computing distance/kernel matrix             - transform(self, X, X2=X)
+    computing distance/kernel matrix in tiles    - transform_blocks(self, X, X2=X)
 
 Inspection methods:
     hyper-parameter inspection  - get_params()
@@ -33,6 +34,9 @@ Inspection methods:
 
 __author__ = ["fkiraly"]
 
+import numpy as np
+import pandas as pd
+
 from sktime.base import BaseEstimator
 from sktime.datatypes import check_is_scitype, convert_to
 from sktime.datatypes._series_as_panel import convert_Series_to_Panel
@@ -266,6 +270,54 @@ class BasePairwiseTransformerPanel(BaseEstimator):
 
         return self._transform(X=X, X2=X2)
 
+    def transform_blocks(self, X, X2=None, block_size=1024):
+        """Compute distance/kernel matrix in tiles.
+
+        Behaviour: yields tiles of the pairwise distance/kernel matrix
+            between samples in X and X2 (equal to X if not passed),
+            row block by row block, and within a row block by ascending column block.
+            Allows processing distance/kernel matrices too large to allocate.
+
+        Parameters
+        ----------
+        X : Series or Panel, any supported mtype, of n instances
+            Data to transform, see transform
+        X2 : Series or Panel, any supported mtype, of m instances
+                optional, default: X = X2
+            Data to transform, see transform
+        block_size : int, optional, default=1024
+            maximum number of rows and columns of a tile
+
+        Yields
+        ------
+        row_block : slice, indices of instances in X the tile contains
+        col_block : slice, indices of instances in X2 the tile contains
+        tile : np.array of shape [len(row_block), len(col_block)]
+            (i,j)-th entry contains distance/kernel between
+            X[row_block][i] and X2[col_block][j]
+        """
+        if not isinstance(block_size, (int, np.integer)) or block_size < 1:
+            raise ValueError(
+                f"block_size must be a positive int, but found {block_size}"
+            )
+
+        X = self._pairwise_panel_x_check(X)
+
+        if X2 is None:
+            X2 = X
+        else:
+            X2 = self._pairwise_panel_x_check(X2, var_name="X2")
+
+        n = _n_instances(X)
+        m = _n_instances(X2)
+        for row_start in range(0, n, block_size):
+            row_block = slice(row_start, min(row_start + block_size, n))
+            X_block = _subset_instances(X, row_block)
+            for col_start in range(0, m, block_size):
+                col_block = slice(col_start, min(col_start + block_size, m))
+                X2_block = _subset_instances(X2, col_block)
+                yield row_block, col_block, self._transform(X=X_block, X2=X2_block)
+
     def _transform(self, X, X2=None):
         """Compute distance/kernel matrix.
 
@@ -346,3 +398,30 @@ class BasePairwiseTransformerPanel(BaseEstimator):
         X_coerced = convert_to(X, to_type=X_inner_mtype, as_scitype="Panel")
 
         return X_coerced
+
+
+def _n_instances(X):
+    """Return number of instances in Panel X, of any mtype in SUPPORTED_MTYPES."""
+    if isinstance(X, pd.DataFrame) and isinstance(X.index, pd.MultiIndex):
+        return len(X.index.get_level_values(0).unique())
+    return len(X)
+
+
+def _subset_instances(X, instances):
+    """Return Panel with instances of X at positions in slice instances.
+
+    Parameters
+    ----------
+    X : Panel of mtype pd-multiindex, nested_univ, df-list or numpy3D
+    instances : slice of integer positions of instances
+
+    Returns
+    -------
+    Panel of same mtype as X, containing the selected instances
+    """
+    if isinstance(X, pd.DataFrame) and isinstance(X.index, pd.MultiIndex):
+        inst_index = X.index.get_level_values(0)
+        return X[inst_index.isin(inst_index.unique()[instances])]
+    if isinstance(X, pd.DataFrame):
+        return X.iloc[instances]
+    return X[instances]
@@ -88,3 +88,21 @@ class TestAllPanelTransformers(TransformerPairwisePanelFixtureGenerator, QuickTe
             dist_mat.shape
             == (len_X, len_X2)
         ), f"Shape of matrix returned by transform is wrong for {trafo_name}"
+
+    def test_pairwise_transformers_panel_blocks(self, estimator_instance, scenario):
+        """Test that tiles of transform_blocks make up the matrix of transform."""
+        trafo_name = type(estimator_instance).__name__
+        dist_mat = scenario.run(estimator_instance, method_sequence=["transform"])
+
+        X = scenario.args["transform"]["X"]
+        X2 = scenario.args["transform"].get("X2")
+
+        blocks_mat = np.full(dist_mat.shape, np.nan)
+        for rows, cols, tile in estimator_instance.transform_blocks(
+            X, X2, block_size=2
+        ):
+            blocks_mat[rows, cols] = tile
+
+        assert np.allclose(
+            blocks_mat, dist_mat
+        ), f"tiles of transform_blocks differ from transform for {trafo_name}"
@@ -24,6 +24,7 @@ Optional, special capability methods (check capability tags if available):
 
 Inspection methods:
     hyper-parameter inspection  - get_params()
+    config inspection/setting   - get_config(), set_config(**config_dict)
     fitted parameter inspection - get_fitted_params()
     current ForecastingHorizon  - fh
     current cutoff              - cutoff
@@ -44,6 +45,7 @@ from warnings import warn
 
 import numpy as np
 import pandas as pd
+from scipy.stats import norm
 
 from sktime.base import BaseEstimator
 from sktime.datatypes import (
@@ -57,6 +59,7 @@ from sktime.datatypes import (
 )
 from sktime.forecasting.base import ForecastingHorizon
 from sktime.utils.datetime import _shift
+from sktime.utils.parallel import parallelize
 from sktime.utils.validation._dependencies import (
     _check_dl_dependencies,
     _check_estimator_deps,
@@ -83,6 +86,30 @@ class BaseForecaster(BaseEstimator):
 
     Specific implementations of these methods is deferred to concrete
     forecasters.
+
+    Configs, set via `set_config`, control how methods are executed:
+
+    backend:parallel : str, optional, default=None
+        backend for the loop over series if the forecaster is vectorized,
+        i.e., applied to Panel or Hierarchical data it does not natively support.
+        None or "None" loops sequentially; "loky", "multiprocessing" and
+        "threading" use `joblib.Parallel` with the respective backend.
+    backend:parallel:params : dict, optional, default=None
+        parameters passed to the backend, e.g., `n_jobs` for joblib backends.
+        the key "chunksize" sends batches of that many series per task.
+        See `sktime.utils.parallel.parallelize` for details.
+    input_conversion : str, one of "on" (default) or "off"
+        "on" checks fh and X in predict-like methods, converts X to the inner mtype.
+        "off" passes X to the inner methods as is, without checks or conversion,
+        for low-latency calls where the caller ensures X is None or of the
+        mtype in the "X_inner_mtype" tag. Ignored for X if the forecaster is
+        vectorized. A ForecastingHorizon passed as fh is also used as is, without
+        coercion, setting of freq, or the check against the fh passed in fit,
+        e.g., the fh returned by check_fh(fh, freq=forecaster.cutoff).
+    output_conversion : str, one of "on" (default) or "off"
+        "on" converts the return of predict to the mtype of the last y seen.
+        "off" returns the output of the inner _predict as is, without conversion,
+        of the mtype in the "y_inner_mtype" tag.
     """
 
     # default tag values - these typically make the "safest" assumption
@@ -98,6 +125,15 @@ class BaseForecaster(BaseEstimator):
         "enforce_index_type": None,  # index type that needs to be enforced in X/y
         "fit_is_empty": False,  # is fit empty and can be skipped?
         "python_version": None,  # PEP 440 python version specifier to limit versions
+        "capability:batch_panel": False,  # can fit aligned panels in one pass?
+    }
+
+    # default config values, see set_config for descriptions
+    _config = {
+        "backend:parallel": None,  # parallelization backend for vectorization
+        "backend:parallel:params": None,  # parameters passed to the backend
+        "input_conversion": "on",  # check X and fh in predict-like methods?
+        "output_conversion": "on",  # convert output of predict to mtype of y?
     }
 
     def __init__(self):
@@ -358,6 +394,10 @@ class BaseForecaster(BaseEstimator):
             # otherwise we call the vectorized version of predict
             y_pred = self._vectorize("predict", X=X_inner, fh=fh)
 
+        # return inner mtype as is if output_conversion config is "off"
+        if self._get_config_value("output_conversion") == "off":
+            return y_pred
+
         # convert to output mtype, identical with last y mtype seen
         y_out = convert_to(
             y_pred,
@@ -1353,7 +1393,16 @@ class BaseForecaster(BaseEstimator):
         return X_inner, y_inner
 
     def _check_X(self, X=None):
-        """Shorthand for _check_X_y with one argument X, see _check_X_y."""
+        """Shorthand for _check_X_y with one argument X, see _check_X_y.
+
+        If the input_conversion config is "off" and self is not vectorized,
+        returns X as is, without checks or conversion.
+        """
+        if (
+            not self._is_vectorized
+            and self._get_config_value("input_conversion") == "off"
+        ):
+            return X
         return self._check_X_y(X=X)[0]
 
     def _update_X(self, X, enforce_index_type=None):
@@ -1563,6 +1612,17 @@ class BaseForecaster(BaseEstimator):
                 # this is fine, nothing to check/raise
 
         # B. fh is passed
+        # with the input_conversion config "off", a ForecastingHorizon passed to
+        # a predict-like method is used as is, without coercion or checks
+        elif (
+            self._is_fitted
+            and isinstance(fh, ForecastingHorizon)
+            and self._get_config_value("input_conversion") == "off"
+        ):
+            if not requires_fh or not self._fh:
+                self._fh = fh
+            return fh
+
         else:
             # If fh is passed, coerce to ForecastingHorizon and validate (all cases)
             fh = check_fh(fh=fh, freq=self._cutoff)
@@ -1596,6 +1656,21 @@ class BaseForecaster(BaseEstimator):
         """Vectorized/iterated loop over method of BaseForecaster.
 
         Uses forecasters_ attribute to store one forecaster per loop index.
+
+        The loop is executed by `sktime.utils.parallel.parallelize`, with backend
+        and backend parameters taken from the "backend:parallel" and
+        "backend:parallel:params" configs of self, see `set_config`.
+        Fitted forecasters are returned from the loop and written to forecasters_,
+        so forecasters_ is available for all backends, including process backends.
+
+        If the "capability:batch_panel" tag is True, and y is an aligned panel,
+        i.e., all series have the same time index, no missing values, and a single
+        column, fit and predict run in batch mode: a clone is fitted to the first
+        series, and then to all series at once via _fit_batch, and predict calls
+        its _predict_batch. If _predict_var_batch is implemented, predict_var,
+        predict_quantiles and predict_interval also run in batch mode, with a normal
+        predictive distribution. forecasters_ is then fitted only when needed,
+        by methods other than these, or by get_fitted_params, see _unbatch.
         """
         FIT_METHODS = ["fit", "update"]
         PREDICT_METHODS = [
@@ -1605,11 +1680,40 @@ class BaseForecaster(BaseEstimator):
             "predict_interval",
             "predict_var",
         ]
+        BATCH_PREDICT_METHODS = [
+            "predict",
+            "predict_quantiles",
+            "predict_interval",
+            "predict_var",
+        ]
 
         # retrieve data arguments
         y = kwargs.pop("y", None)
         X = kwargs.pop("X", None)
 
+        config = self.get_config()
+        backend = config["backend:parallel"]
+        backend_params = config["backend:parallel:params"]
+        meta = {"methodname": methodname, "kwargs": kwargs}
+
+        # _batch_forecaster is None, not absent, when _unbatch fits forecasters_
+        batch_fit = "_batch_forecaster" not in self.__dict__
+        batch_fit = batch_fit and self.get_tag("capability:batch_panel")
+        if methodname == "fit" and X is None and batch_fit:
+            Y = _get_aligned_panel_values(y)
+            if Y is not None:
+                self._fit_batch_vectorized(y=y, Y=Y, fh=kwargs["fh"])
+                return self
+
+        batch_forecaster = self.__dict__.get("_batch_forecaster")
+        if methodname in BATCH_PREDICT_METHODS and batch_forecaster is not None:
+            y_pred = self._predict_batch_vectorized(methodname, **kwargs)
+            if y_pred is not None:
+                return y_pred
+
+        # all other methods use forecasters_, fitted here if in batch mode
+        self._unbatch()
+
         if methodname in FIT_METHODS:
             # create container for clones
             self._yvec = y
@@ -1629,12 +1733,25 @@ class BaseForecaster(BaseEstimator):
 
             if methodname == "fit":
                 self.forecasters_ = pd.DataFrame(index=row_idx, columns=col_idx)
-            for ix in range(len(ys)):
-                i, j = y.get_iloc_indexer(ix)
-                if methodname == "fit":
+                # clones are created here, so workers never receive self and its data
+                for ix in range(len(ys)):
+                    i, j = y.get_iloc_indexer(ix)
                     self.forecasters_.iloc[i].iloc[j] = self.clone()
-                method = getattr(self.forecasters_.iloc[i].iloc[j], methodname)
-                method(y=ys[ix], X=Xs[i], **kwargs)
+
+            iloc_ix = [y.get_iloc_indexer(ix) for ix in range(len(ys))]
+            tasks = [
+                (self.forecasters_.iloc[i].iloc[j], ys[ix], Xs[i])
+                for ix, (i, j) in enumerate(iloc_ix)
+            ]
+            fitted = parallelize(
+                fun=_vectorize_one,
+                iter=tasks,
+                meta=meta,
+                backend=backend,
+                backend_params=backend_params,
+            )
+            for (i, j), forecaster in zip(iloc_ix, fitted):
+                self.forecasters_.iloc[i].iloc[j] = forecaster
             return self
 
         elif methodname in PREDICT_METHODS:
@@ -1651,17 +1768,27 @@ class BaseForecaster(BaseEstimator):
             if methodname == "update_predict_single":
                 self._yvec = y
                 ys = y.as_list()
+            else:
+                ys = [None] * n * m
+
+            iloc_ix = list(product(range(n), range(m)))
+            tasks = [
+                (self.forecasters_.iloc[i].iloc[j], ys[ix], Xs[i])
+                for ix, (i, j) in enumerate(iloc_ix)
+            ]
+            y_preds = parallelize(
+                fun=_vectorize_one,
+                iter=tasks,
+                meta=meta,
+                backend=backend,
+                backend_params=backend_params,
+            )
 
-            y_preds = []
-            ix = -1
-            for i, j in product(range(n), range(m)):
-                ix += 1
-                method = getattr(self.forecasters_.iloc[i].iloc[j], methodname)
-
-                if methodname != "update_predict_single":
-                    y_preds += [method(X=Xs[i], **kwargs)]
-                else:
-                    y_preds += [method(y=ys[ix], X=Xs[i], **kwargs)]
+            # update_predict_single changes state, write back updated forecasters
+            if methodname == "update_predict_single":
+                for (i, j), (forecaster, _) in zip(iloc_ix, y_preds):
+                    self.forecasters_.iloc[i].iloc[j] = forecaster
+                y_preds = [y_pred for _, y_pred in y_preds]
 
             # if we vectorize over columns,
             #   we need to replace top column level with variable names - part 1
@@ -1674,6 +1801,204 @@ class BaseForecaster(BaseEstimator):
                 y_pred.columns = y_pred.columns.droplevel(1)
             return y_pred
 
+    def _fit_batch_vectorized(self, y, Y, fh):
+        """Fit in batch mode to an aligned panel, see _vectorize.
+
+        Writes to self:
+            _yvec : y, as in _vectorize
+            _batch_forecaster : clone of self, fitted to the first series of y,
+                and to all series of y via _fit_batch
+
+        Parameters
+        ----------
+        y : VectorizedDF, iterating over the series of an aligned panel
+        Y : 2D np.ndarray of shape (n_series, n_timepoints), values of y
+        fh : ForecastingHorizon or None, passed to fit
+        """
+        self._yvec = y
+        self._batch_fh = fh
+        # the clone runs all checks of fit, and holds hyper-parameters as fitted
+        batch_forecaster = self.clone()
+        batch_forecaster.fit(y=y[0], fh=fh)
+        batch_forecaster._fit_batch(Y)
+        self._batch_forecaster = batch_forecaster
+
+    def _unbatch(self):
+        """Fit forecasters_ as in _vectorize, if self was fitted in batch mode.
+
+        Must be called before forecasters_ is read, outside of _vectorize, e.g.,
+        in get_fitted_params of vectorized forecasters.
+        """
+        if self.__dict__.get("_batch_forecaster") is None:
+            return
+        # remove batch mode before fitting, so _vectorize loops over series
+        self._batch_forecaster = None
+        self._vectorize("fit", y=self._yvec, X=None, fh=self._batch_fh)
+
+    def _predict_batch_vectorized(self, methodname, fh, **kwargs):
+        """Predict in batch mode, see _vectorize.
+
+        Parameters
+        ----------
+        methodname : str, one of "predict", "predict_quantiles", "predict_interval",
+            "predict_var"
+        fh : ForecastingHorizon, passed to the method
+        kwargs : further arguments passed to the method, i.e., X, and one of alpha,
+            coverage or cov for the probabilistic methods
+
+        Returns
+        -------
+        y_pred : pd.DataFrame with MultiIndex, as returned by _vectorize(methodname),
+            or None if the batch forecaster cannot compute it, e.g., for in-sample fh
+        """
+        batch_forecaster = self._batch_forecaster
+        # as predict of the series forecasters, sets the freq of the series in fh
+        fh = batch_forecaster._check_fh(fh)
+
+        if methodname == "predict":
+            Y_pred = batch_forecaster._predict_batch(fh=fh)
+            if Y_pred is None:
+                return None
+            columns = self._yvec.X_multiindex.columns
+            return self._reconstruct_batch(Y_pred, fh=fh, columns=columns)
+
+        if kwargs.get("cov", False):
+            return None
+        if not batch_forecaster._has_implementation_of("_predict_var_batch"):
+            return None
+        Y_var = batch_forecaster._predict_var_batch(fh=fh)
+        if Y_var is None:
+            return None
+
+        if methodname == "predict_var":
+            # columns as in the pd.DataFrame returned by _predict_var for one series
+            return self._reconstruct_batch(Y_var, fh=fh, columns=pd.RangeIndex(1))
+
+        Y_pred = batch_forecaster._predict_batch(fh=fh)
+        if Y_pred is None:
+            return None
+
+        # columns as in the defaults of _predict_quantiles and _predict_interval
+        if methodname == "predict_quantiles":
+            alpha = kwargs["alpha"]
+            columns = pd.MultiIndex.from_product([["Quantiles"], alpha])
+        else:
+            coverage = kwargs["coverage"]
+            alpha = []
+            for c in coverage:
+                alpha.extend([0.5 - 0.5 * float(c), 0.5 + 0.5 * float(c)])
+            columns = pd.MultiIndex.from_product(
+                [["Coverage"], coverage, ["lower", "upper"]]
+            )
+
+        # normal predictive distribution, with mean Y_pred and variance Y_var
+        Y_std = np.sqrt(Y_var)[:, :, None]
+        Y_quantiles = Y_pred[:, :, None] + Y_std * norm.ppf(alpha)
+        return self._reconstruct_batch(Y_quantiles, fh=fh, columns=columns)
+
+    def _reconstruct_batch(self, Y_pred, fh, columns):
+        """Return batch mode predictions in the format of vectorized predict.
+
+        Parameters
+        ----------
+        Y_pred : np.ndarray of shape (n_series, len(fh)) or
+            (n_series, len(fh), len(columns)), from _predict_batch or
+            _predict_var_batch
+        fh : ForecastingHorizon, passed to predict
+        columns : pd.Index, columns of the returned pd.DataFrame
+
+        Returns
+        -------
+        y_pred : pd.DataFrame with MultiIndex, as returned by _vectorize,
+            or None if fh cannot be converted to absolute time points
+        """
+        X_multiindex = self._yvec.X_multiindex
+        row_idx, _ = self._yvec.get_iter_indices()
+        n_series, n_fh = Y_pred.shape[:2]
+
+        # the cutoff of the panel has no freq if the time index has none set,
+        # the batch forecaster was fitted to a series and has the inferred freq
+        try:
+            fh_abs = fh.to_absolute(self._batch_forecaster.cutoff).to_pandas()
+        except ValueError:
+            return None
+        series_idx = row_idx.repeat(n_fh)
+        if isinstance(series_idx, pd.MultiIndex):
+            levels = [series_idx.get_level_values(i) for i in range(series_idx.nlevels)]
+        else:
+            levels = [series_idx]
+        levels += [fh_abs.take(np.tile(np.arange(n_fh), n_series))]
+        index = pd.MultiIndex.from_arrays(levels, names=X_multiindex.index.names)
+
+        return pd.DataFrame(
+            Y_pred.reshape(n_series * n_fh, -1), index=index, columns=columns
+        )
+
+    def _fit_batch(self, Y):
+        """Fit forecaster to all series of an aligned panel at once.
+
+        private _fit_batch containing the core logic of batch mode, see _vectorize.
+        Optional, only called if the "capability:batch_panel" tag is True.
+
+        Called on a clone of the vectorized forecaster, after it was fitted to the
+        first series. Hyper-parameters determined in fit, and the time index in
+        self._y, apply to all series.
+
+        Writes to self:
+            fitted model attributes for all series, used in _predict_batch
+
+        Parameters
+        ----------
+        Y : 2D np.ndarray of shape (n_series, n_timepoints)
+            values of all series, i-th row is i-th series, all series have the
+            time index self._y.index and contain no missing values
+        """
+        raise NotImplementedError("abstract method")
+
+    def _predict_batch(self, fh):
+        """Forecast all series fitted in _fit_batch at once.
+
+        private _predict_batch containing the core logic of batch mode, see _vectorize.
+        Optional, only called if the "capability:batch_panel" tag is True.
+
+        Parameters
+        ----------
+        fh : ForecastingHorizon
+            The forecasting horizon with the steps ahead to to predict.
+
+        Returns
+        -------
+        Y_pred : 2D np.ndarray of shape (n_series, len(fh)), or None
+            i-th row are point predictions for the i-th series in _fit_batch,
+            equal to predict of the forecaster fitted to the i-th series.
+            None if fh is not supported in batch mode, e.g., in-sample fh;
+            predictions are then obtained from forecasters_.
+        """
+        raise NotImplementedError("abstract method")
+
+    def _predict_var_batch(self, fh):
+        """Compute prediction variances for all series fitted in _fit_batch at once.
+
+        private _predict_var_batch containing the core logic of batch mode for
+        predict_var, predict_quantiles and predict_interval, see _vectorize.
+        Optional, only called if the "capability:batch_panel" tag is True.
+        Batch mode quantiles and intervals are those of a normal distribution,
+        with mean from _predict_batch and variance from _predict_var_batch.
+
+        Parameters
+        ----------
+        fh : ForecastingHorizon
+            The forecasting horizon with the steps ahead to to predict.
+
+        Returns
+        -------
+        pred_var : 2D np.ndarray of shape (n_series, len(fh)), or None
+            i-th row are marginal predictive variances for the i-th series in
+            _fit_batch, equal to predict_var of the forecaster fitted to the i-th
+            series. None if fh is not supported in batch mode, e.g., in-sample fh.
+        """
+        raise NotImplementedError("abstract method")
+
     def _fit(self, y, X=None, fh=None):
         """Fit forecaster to training data.
 
@@ -2213,6 +2538,82 @@ class BaseForecaster(BaseEstimator):
         return _format_moving_cutoff_predictions(y_preds, cutoffs)
 
 
+def _get_aligned_panel_values(y):
+    """Return values of y as 2D array, if y is an aligned panel, otherwise None.
+
+    Parameters
+    ----------
+    y : VectorizedDF
+
+    Returns
+    -------
+    Y : 2D np.ndarray of shape (n_series, n_timepoints), or None
+        i-th row contains values of i-th series iterated over by y.
+        None unless y iterates over series in rows only, has a single column,
+        and all series have the same time index and no missing values.
+    """
+    row_idx, col_idx = y.get_iter_indices()
+    X_multiindex = y.X_multiindex
+    if y.iterate_as != "Series" or col_idx is not None:
+        return None
+    if len(X_multiindex.columns) != 1 or len(X_multiindex) % len(row_idx) != 0:
+        return None
+
+    n_series = len(row_idx)
+    n_timepoints = len(X_multiindex) // n_series
+    index = X_multiindex.index
+    time_idx = index.get_level_values(-1)
+
+    # series must be contiguous, in order of row_idx, and with the same time index
+    if not index.droplevel(-1).equals(row_idx.repeat(n_timepoints)):
+        return None
+    tile = np.tile(np.arange(n_timepoints), n_series)
+    if not time_idx.equals(time_idx[:n_timepoints].take(tile)):
+        return None
+
+    Y = X_multiindex.iloc[:, 0].to_numpy(dtype="float").reshape(n_series, -1)
+    if np.isnan(Y).any():
+        return None
+    return Y
+
+
+def _vectorize_one(task, meta):
+    """Call one forecaster method in the vectorization loop of BaseForecaster.
+
+    Defined at module level, so it can be pickled by process backends.
+
+    Parameters
+    ----------
+    task : tuple of (forecaster, y, X)
+        forecaster to call the method of, and data arguments for the method
+        y is not passed to the method if None
+    meta : dict with keys "methodname" and "kwargs"
+        name of the method to call, and further keyword arguments to pass
+
+    Returns
+    -------
+    forecaster, if method is "fit" or "update"
+    (forecaster, return of method), if method is "update_predict_single"
+    return of method, otherwise
+    """
+    forecaster, y, X = task
+    methodname = meta["methodname"]
+    kwargs = meta["kwargs"]
+
+    method = getattr(forecaster, methodname)
+    if y is None:
+        ret = method(X=X, **kwargs)
+    else:
+        ret = method(y=y, X=X, **kwargs)
+
+    if methodname in ["fit", "update"]:
+        return forecaster
+    elif methodname == "update_predict_single":
+        return forecaster, ret
+    else:
+        return ret
+
+
 def _format_moving_cutoff_predictions(y_preds, cutoffs):
     """Format moving-cutoff predictions.
 
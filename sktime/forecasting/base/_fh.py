@@ -573,8 +573,10 @@ class ForecastingHorizon:
     def _is_in_sample(self, cutoff=None) -> np.ndarray:
         """Get index location of in-sample values."""
         relative = self.to_relative(cutoff).to_pandas()
-        null = 0 if is_integer_index(relative) else pd.Timedelta(0)
-        return relative <= null
+        if is_integer_index(relative):
+            # compare numpy values, avoids overhead of pandas comparison
+            return relative.to_numpy() <= 0
+        return relative <= pd.Timedelta(0)
 
     def is_all_in_sample(self, cutoff=None) -> bool:
         """Whether the forecasting horizon is purely in-sample for given cutoff.
@@ -27,14 +27,13 @@ class _BaseWindowForecaster(BaseForecaster):
         kwargs = {"X": X}
 
         # all values are out-of-sample
+        # fh is passed on as is, so the absolute fh cached for fh is re-used
         if fh.is_all_out_of_sample(self.cutoff):
-            return self._predict_fixed_cutoff(
-                fh.to_out_of_sample(self.cutoff), **kwargs
-            )
+            return self._predict_fixed_cutoff(fh, **kwargs)
 
         # all values are in-sample
         elif fh.is_all_in_sample(self.cutoff):
-            return self._predict_in_sample(fh.to_in_sample(self.cutoff), **kwargs)
+            return self._predict_in_sample(fh, **kwargs)
 
         # both in-sample and out-of-sample values
         else:
@@ -68,7 +67,7 @@ class _BaseWindowForecaster(BaseForecaster):
         if isinstance(y_pred, pd.Series) or isinstance(y_pred, pd.DataFrame):
             return y_pred
         else:
-            index = fh.to_absolute(self.cutoff)
+            index = fh.to_absolute(self.cutoff).to_pandas()
             return pd.Series(y_pred, index=index)
 
     def _predict_in_sample(
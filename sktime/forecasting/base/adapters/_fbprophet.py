@@ -272,6 +272,8 @@ class _ProphetAdapter(BaseForecaster):
         self.check_is_fitted()
 
         if hasattr(self, "_is_vectorized") and self._is_vectorized:
+            # forecasters_ is not fitted yet if self was fitted in batch mode
+            self._unbatch()
             return {"forecasters": self.forecasters_}
 
         fitted_params = {}
@@ -101,6 +101,8 @@ class _StatsModelsAdapter(BaseForecaster):
         self.check_is_fitted()
 
         if hasattr(self, "_is_vectorized") and self._is_vectorized:
+            # forecasters_ is not fitted yet if self was fitted in batch mode
+            self._unbatch()
             return {"forecasters": self.forecasters_}
 
         fitted_params = {}
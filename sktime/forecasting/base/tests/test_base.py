@@ -13,9 +13,11 @@ import pytest
 from sktime.datatypes import check_is_mtype, convert
 from sktime.datatypes._utilities import get_cutoff, get_window
 from sktime.forecasting.arima import ARIMA
+from sktime.forecasting.base import ForecastingHorizon
 from sktime.utils._testing.hierarchical import _make_hierarchical
 from sktime.utils._testing.panel import _make_panel
 from sktime.utils._testing.series import _make_series
+from sktime.utils.parallel import _get_parallel_test_fixtures
 from sktime.utils.validation._dependencies import _check_soft_dependencies
 
 PANEL_MTYPES = ["pd-multiindex", "nested_univ", "numpy3D"]
@@ -287,3 +289,265 @@ def test_dynamic_tags_reset_properly():
     # fit should reset the estimator, and set scitype:y tag to "multivariate"
     # the fit will cause an error if this is not happening properly
     f.fit(X_multivariate)
+
+
+def test_construction_checks_soft_dependencies():
+    """Test that constructing a forecaster checks its soft dependencies."""
+    from sktime.forecasting.naive import NaiveForecaster
+
+    class _NaiveForecasterWithMissingDep(NaiveForecaster):
+        _tags = {"python_dependencies": "_sktime_nonexistent_package_"}
+
+    with pytest.raises(ModuleNotFoundError, match="_sktime_nonexistent_package_"):
+        _NaiveForecasterWithMissingDep()
+
+
+@pytest.mark.parametrize("backend", _get_parallel_test_fixtures())
+@pytest.mark.parametrize("method", ["predict"] + PROBA_DF_METHODS)
+def test_vectorization_parallel_backend(backend, method):
+    """Test that vectorization gives same results for all parallel backends."""
+    from sktime.forecasting.theta import ThetaForecaster
+
+    hierarchy_levels = (2, 3)
+    y = _make_hierarchical(hierarchy_levels=hierarchy_levels, random_state=84)
+    fh = [1, 2, 3]
+
+    f_serial = ThetaForecaster(deseasonalize=False).fit(y, fh=fh)
+    y_pred_serial = getattr(f_serial, method)()
+
+    f_par = ThetaForecaster(deseasonalize=False)
+    f_par.set_config(
+        **{
+            "backend:parallel": backend["backend"],
+            "backend:parallel:params": backend["backend_params"],
+        }
+    )
+    f_par.fit(y, fh=fh)
+    y_pred_par = getattr(f_par, method)()
+
+    pd.testing.assert_frame_equal(pd.DataFrame(y_pred_serial), pd.DataFrame(y_pred_par))
+
+    # fitted forecasters must be retrievable after a parallel fit
+    assert f_par.forecasters_.shape == f_serial.forecasters_.shape
+    assert all(f.is_fitted for f in f_par.forecasters_.values.flatten())
+
+
+BATCH_PANEL_FORECASTERS = [
+    ("NaiveForecaster", {"strategy": "mean", "sp": 3}),
+    ("NaiveForecaster", {"strategy": "drift"}),
+    ("PolynomialTrendForecaster", {"degree": 2}),
+    (
+        "ExponentialSmoothing",
+        {
+            "trend": "add",
+            "smoothing_level": 0.3,
+            "smoothing_trend": 0.1,
+            "optimized": False,
+            "initialization_method": "legacy-heuristic",
+        },
+    ),
+]
+
+
+def _make_batch_panel_forecaster(name, params):
+    """Return forecaster for batch mode tests, from class name and parameters."""
+    from sktime.forecasting.exp_smoothing import ExponentialSmoothing
+    from sktime.forecasting.naive import NaiveForecaster
+    from sktime.forecasting.trend import PolynomialTrendForecaster
+
+    classes = [ExponentialSmoothing, NaiveForecaster, PolynomialTrendForecaster]
+    cls = {cls.__name__: cls for cls in classes}[name]
+    return cls(**params)
+
+
+def _make_batch_panel_data(aggregate):
+    """Return aligned panel for batch mode tests.
+
+    If aggregate, totals are added with Aggregator, which results in a time index
+    without freq set.
+    """
+    from sktime.transformations.hierarchical.aggregate import Aggregator
+
+    y = _make_hierarchical(
+        hierarchy_levels=(2, 3), min_timepoints=15, max_timepoints=15, random_state=0
+    )
+    if aggregate:
+        y = Aggregator().fit_transform(y)
+    return y
+
+
+@pytest.mark.parametrize("name, params", BATCH_PANEL_FORECASTERS)
+@pytest.mark.parametrize("fh", [[1, 2, 3], [2, 5]])
+@pytest.mark.parametrize("aggregate", [False, True])
+def test_batch_panel_equals_vectorized(name, params, fh, aggregate, monkeypatch):
+    """Test that batch mode predicts the same as looping over series."""
+    from sktime.forecasting.base import _base
+
+    y = _make_batch_panel_data(aggregate)
+    f = _make_batch_panel_forecaster(name, params)
+    assert f.get_tag("capability:batch_panel")
+
+    f_batch = f.clone().fit(y, fh=fh)
+    y_pred_batch = f_batch.predict()
+    assert f_batch._batch_forecaster is not None
+    assert "forecasters_" not in f_batch.__dict__
+
+    # no aligned panel found means that _vectorize loops over series
+    monkeypatch.setattr(_base, "_get_aligned_panel_values", lambda y: None)
+    f_loop = f.clone().fit(y, fh=fh)
+    y_pred_loop = f_loop.predict()
+    assert "_batch_forecaster" not in f_loop.__dict__
+
+    pd.testing.assert_frame_equal(y_pred_batch, y_pred_loop)
+
+    # absolute fh, which has no freq if the time index of y has none
+    fh_abs = ForecastingHorizon(
+        y_pred_loop.index.get_level_values(-1).unique(), is_relative=False
+    )
+    y_pred_batch_abs = f_batch.predict(fh=fh_abs)
+    assert "forecasters_" not in f_batch.__dict__
+    pd.testing.assert_frame_equal(y_pred_batch_abs, y_pred_loop)
+
+    # forecasters_ are fitted only explicitly, not by attribute lookup
+    assert not hasattr(f_batch, "forecasters_")
+    assert f_batch._batch_forecaster is not None
+    f_batch._unbatch()
+    assert f_batch.forecasters_.shape == f_loop.forecasters_.shape
+    assert f_batch._batch_forecaster is None
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"strategy": "last", "sp": 4},
+        {"strategy": "mean", "window_length": 7, "sp": 3},
+        {"strategy": "drift", "window_length": 6},
+    ],
+)
+@pytest.mark.parametrize("aggregate", [False, True])
+def test_batch_panel_proba_equals_vectorized(params, aggregate, monkeypatch):
+    """Test that batch mode probabilistic predictions equal looping over series."""
+    from sktime.forecasting.base import _base
+    from sktime.forecasting.naive import NaiveForecaster
+
+    y = _make_batch_panel_data(aggregate)
+    fh = [1, 2, 5]
+
+    def _predict_proba(f):
+        return [
+            f.predict_var(fh=fh),
+            f.predict_quantiles(fh=fh, alpha=[0.1, 0.6]),
+            f.predict_interval(fh=fh, coverage=[0.5, 0.9]),
+        ]
+
+    f_batch = NaiveForecaster(**params).fit(y)
+    y_preds_batch = _predict_proba(f_batch)
+    assert f_batch._batch_forecaster is not None
+
+    monkeypatch.setattr(_base, "_get_aligned_panel_values", lambda y: None)
+    f_loop = NaiveForecaster(**params).fit(y)
+    y_preds_loop = _predict_proba(f_loop)
+
+    for y_pred_batch, y_pred_loop in zip(y_preds_batch, y_preds_loop):
+        pd.testing.assert_frame_equal(y_pred_batch, y_pred_loop)
+
+
+def test_batch_panel_fallback():
+    """Test that batch mode falls back to looping if it does not apply."""
+    from sktime.forecasting.naive import NaiveForecaster
+
+    y = _make_hierarchical(
+        hierarchy_levels=(2, 3), min_timepoints=15, max_timepoints=15, random_state=0
+    )
+    f = NaiveForecaster().fit(y, fh=[1, 2])
+
+    # in-sample predictions are not computed in batch mode
+    y_pred = f.predict(fh=[-1, 0, 1])
+    assert "forecasters_" in f.__dict__
+    assert len(y_pred) == 6 * 3
+
+    # update uses forecasters_ as well
+    f = NaiveForecaster().fit(y, fh=[1, 2])
+    y_new = (
+        _make_hierarchical(
+            hierarchy_levels=(2, 3),
+            min_timepoints=16,
+            max_timepoints=16,
+            random_state=0,
+        )
+        .groupby(level=[0, 1])
+        .tail(1)
+    )
+    f.update(y_new)
+    assert "forecasters_" in f.__dict__
+
+    # unequal length series are not an aligned panel
+    y_unequal = _make_hierarchical(
+        hierarchy_levels=(2, 3), min_timepoints=10, max_timepoints=15, random_state=0
+    )
+    f = NaiveForecaster().fit(y_unequal, fh=[1, 2])
+    assert "_batch_forecaster" not in f.__dict__
+
+
+def test_batch_panel_get_fitted_params():
+    """Test that get_fitted_params fits forecasters_ of a batch mode forecaster."""
+    y = _make_batch_panel_data(aggregate=False)
+    f = _make_batch_panel_forecaster(*BATCH_PANEL_FORECASTERS[-1])
+    f.fit(y, fh=[1, 2])
+    assert f._batch_forecaster is not None
+
+    forecasters = f.get_fitted_params()["forecasters"]
+    assert f._batch_forecaster is None
+    assert forecasters is f.forecasters_
+    assert all(f.is_fitted for f in forecasters.values.flatten())
+
+
+def test_input_output_conversion_off(monkeypatch):
+    """Test that predict with conversion configs "off" skips checks, same values."""
+    from sklearn.linear_model import LinearRegression
+
+    from sktime.forecasting.base import _base
+    from sktime.forecasting.compose import make_reduction
+    from sktime.forecasting.naive import NaiveForecaster
+    from sktime.utils.profiling import profile_predict_overhead
+
+    y = _make_series(n_timepoints=30, n_columns=1, random_state=0)
+    X = _make_series(n_timepoints=33, n_columns=2, random_state=1)
+    X_train, X_test = X.iloc[:30], X.iloc[30:]
+    fh = [1, 2, 3]
+    configs = {"input_conversion": "off", "output_conversion": "off"}
+
+    f = make_reduction(LinearRegression(), window_length=3, strategy="recursive")
+    y_pred = f.clone().fit(y, X=X_train, fh=fh).predict(X=X_test)
+
+    f_trusted = f.clone().set_config(**configs).fit(y, X=X_train, fh=fh)
+    y_pred_trusted = f_trusted.predict(X=X_test)
+    pd.testing.assert_series_equal(y_pred, y_pred_trusted)
+
+    # X is not checked, the inner method receives it as is
+    def _raise(*args, **kwargs):
+        raise AssertionError("input checks must not be called")
+
+    f_trusted._check_X_y = _raise
+    f_trusted.predict(X=X_test)
+
+    # a ForecastingHorizon passed to predict is used as is, without checks
+    fh_trusted = f_trusted.fh
+    f_default = f.clone().fit(y, X=X_train)
+    with monkeypatch.context() as m:
+        m.setattr(_base, "check_fh", _raise)
+        y_pred_trusted = f_trusted.predict(fh=fh_trusted, X=X_test)
+        pd.testing.assert_series_equal(y_pred, y_pred_trusted)
+        with pytest.raises(AssertionError, match="must not be called"):
+            f_default.predict(fh=fh_trusted, X=X_test)
+
+    # output is returned in the inner mtype, not the mtype of y
+    y_np = y.values
+    f_trusted = NaiveForecaster().set_config(**configs).fit(y_np, fh=fh)
+    assert isinstance(f_trusted.predict(), pd.Series)
+    assert isinstance(NaiveForecaster().fit(y_np, fh=fh).predict(), type(y_np))
+
+    results = profile_predict_overhead(NaiveForecaster(), y, fh=fh, n_calls=2)
+    assert list(results.index) == ["default", "trusted"]
+    assert (results["time_per_call"] > 0).all()
@@ -30,6 +30,7 @@ from warnings import warn
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.base import RegressorMixin, clone
 from sklearn.multioutput import MultiOutputRegressor
 
@@ -40,8 +41,13 @@ from sktime.forecasting.base._fh import _index_range
 from sktime.forecasting.base._sktime import _BaseWindowForecaster
 from sktime.regression.base import BaseRegressor
 from sktime.transformations.compose import FeatureUnion
+from sktime.transformations.series.summarize import (
+    _WINDOW_FUNCS_NUMPY,
+    WindowSummarizer,
+    _summarize_windows,
+)
 from sktime.utils.datetime import _shift
-from sktime.utils.validation import check_window_length
+from sktime.utils.validation import check_window_length, is_int
 
 
 def _concat_y_X(y, X):
@@ -62,7 +68,13 @@ def _check_fh(fh):
 
 
 def _sliding_window_transform(
-    y, window_length, fh, X=None, transformers=None, scitype="tabular-regressor"
+    y,
+    window_length,
+    fh,
+    X=None,
+    transformers=None,
+    scitype="tabular-regressor",
+    chunk_size=None,
 ):
     """Transform time series data using sliding window.
 
@@ -89,6 +101,11 @@ def _sliding_window_transform(
         Scitype of estimator to use with transformed data.
         - If "tabular-regressor", returns X as tabular 2d array
         - If "time-series-regressor", returns X as panel 3d array
+    chunk_size : int, optional (default=None)
+        If None, returns the transformed data in one piece.
+        If int, returns a generator of (yt, Xt) pairs with at most chunk_size rows
+        each, in temporal order, so the full transformed data is never allocated.
+        Not supported if transformers are passed.
 
     Returns
     -------
@@ -98,16 +115,15 @@ def _sliding_window_transform(
     window_length)
         Transformed lagged values of target variable and exogenous variables,
         excluding contemporaneous values.
+    if chunk_size is int, generator of (yt, Xt) instead, with rows of above in chunks
     """
-    # There are different ways to implement this transform. Pre-allocating an
-    # array and filling it by iterating over the window length seems to be the most
-    # efficient one.
-
     ts_index = get_time_index(y)
     n_timepoints = ts_index.shape[0]
     window_length = check_window_length(window_length, n_timepoints)
 
     if transformers is not None:
+        if chunk_size is not None:
+            raise ValueError("chunk_size is not supported if transformers are passed")
         if len(transformers) == 1:
             tf_fit = transformers[0].fit(y)
         else:
@@ -123,52 +139,178 @@ def _sliding_window_transform(
             Xt = pd.concat([X_from_y_cut, X_cut], axis=1)
         else:
             Xt = X_from_y_cut
-    else:
-        z = _concat_y_X(y, X)
-        n_timepoints, n_variables = z.shape
+        return yt, Xt
 
-        fh = _check_fh(fh)
-        fh_max = fh[-1]
+    windows, fh = _sliding_window_view(y, window_length, fh, X=X)
 
-        if window_length + fh_max >= n_timepoints:
-            raise ValueError(
-                "The `window_length` and `fh` are incompatible with the length of `y`"
-            )
+    if chunk_size is None:
+        return _slice_windows(windows, window_length, fh, scitype)
 
-        # Get the effective window length accounting for the forecasting horizon.
-        effective_window_length = window_length + fh_max
-        Zt = np.zeros(
-            (
-                n_timepoints + effective_window_length,
-                n_variables,
-                effective_window_length + 1,
-            )
+    if not is_int(chunk_size) or chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive int, but found {chunk_size}")
+    return (
+        _slice_windows(windows[i : i + chunk_size], window_length, fh, scitype)
+        for i in range(0, len(windows), chunk_size)
+    )
+
+
+def _sliding_window_view(y, window_length, fh, X=None):
+    """Return read-only sliding window view of concatenated y and X.
+
+    Parameters
+    ----------
+    y : pd.Series
+        Endogenous time series
+    window_length : int
+        Window length for transformed feature variables
+    fh : ForecastingHorizon
+        Forecasting horizon for transformed target variable, relative
+    X : pd.DataFrame, optional (default=None)
+        Exogenous series.
+
+    Returns
+    -------
+    windows : np.ndarray, shape = (n_timepoints - window_length - fh_max, n_variables,
+    window_length + fh_max + 1)
+        windows[i, :, k] are the values of y and X at time index i + k,
+        read-only view on the data, no copy of size window_length is made
+    fh : np.ndarray of int, zero-based indexer of fh
+    """
+    z = _concat_y_X(y, X).astype(float, copy=False)
+    n_timepoints = z.shape[0]
+
+    fh = _check_fh(fh)
+    fh_max = fh[-1]
+
+    if window_length + fh_max >= n_timepoints:
+        raise ValueError(
+            "The `window_length` and `fh` are incompatible with the length of `y`"
         )
 
-        # Transform data.
-        for k in range(effective_window_length + 1):
-            i = effective_window_length - k
-            j = n_timepoints + effective_window_length - k
-            Zt[i:j, :, k] = z
-
-        # Truncate data, selecting only full windows, discarding incomplete ones.
-        Zt = Zt[effective_window_length:-effective_window_length]
-
-        # Return transformed feature and target variables separately. This
-        # excludes contemporaneous values of the exogenous variables. Including them
-        # would lead to unequal-length data, with more time points for
-        # exogenous series than the target series, which is currently not supported.
-        yt = Zt[:, 0, window_length + fh]
-        Xt = Zt[:, :, :window_length]
-    # Pre-allocate array for sliding windows.
+    # Get the effective window length accounting for the forecasting horizon.
+    effective_window_length = window_length + fh_max
+
+    # windows of effective length plus one, this is a view with stride tricks
+    windows = sliding_window_view(z, effective_window_length + 1, axis=0)
+    return windows, fh
+
+
+def _slice_windows(windows, window_length, fh, scitype):
+    """Return target and feature variables from sliding window view.
+
+    Parameters
+    ----------
+    windows : np.ndarray, return of _sliding_window_view, or slice of rows
+    window_length : int
+        Window length for transformed feature variables
+    fh : np.ndarray of int, return of _sliding_window_view
+    scitype : str {"tabular-regressor", "time-series-regressor"}
+        Scitype of estimator to use with transformed data.
+
+    Returns
+    -------
+    yt : np.ndarray, shape = (n_windows, len(fh))
+        Transformed target variable.
+    Xt : np.ndarray, shape = (n_windows, n_variables * window_length) if scitype is
+        "tabular-regressor", (n_windows, n_variables, window_length) otherwise
+        Transformed lagged values of target variable and exogenous variables,
+        excluding contemporaneous values.
+    """
+    # Return transformed feature and target variables separately. This
+    # excludes contemporaneous values of the exogenous variables. Including them
+    # would lead to unequal-length data, with more time points for
+    # exogenous series than the target series, which is currently not supported.
+    # Both are copied from the view, this allocates only the returned arrays.
+    yt = windows[:, 0, window_length + fh]
+    Xt = windows[:, :, :window_length]
+
     # If the scitype is tabular regression, we have to convert X into a 2d array.
     if scitype == "tabular-regressor":
-        if transformers is not None:
-            return yt, Xt
-        else:
-            return yt, Xt.reshape(Xt.shape[0], -1)
+        return yt, Xt.reshape(Xt.shape[0], -1)
     else:
-        return yt, Xt
+        return yt, np.ascontiguousarray(Xt)
+
+
+def _get_instance_codes(index):
+    """Return integer codes of instances, and positions of first and last rows.
+
+    Parameters
+    ----------
+    index : pd.MultiIndex, row index of a pd-multiindex or pd_multiindex_hier object
+        last level is the time index, other levels index instances,
+        rows of each instance are assumed to be consecutive and sorted by time
+
+    Returns
+    -------
+    codes : np.ndarray of int, length len(index), code of instance per row,
+        codes are 0, 1, 2, ... in order of first appearance
+    first : np.ndarray of int, positions of the first row of each instance
+    last : np.ndarray of int, positions of the last row of each instance
+    """
+    # a new instance starts where the code of any instance level changes,
+    # this avoids factorizing tuples of the instance levels
+    is_new = np.zeros(len(index), dtype=bool)
+    is_new[:1] = True
+    for level_codes in index.codes[:-1]:
+        is_new[1:] |= level_codes[1:] != level_codes[:-1]
+    codes = np.cumsum(is_new) - 1
+    first = np.flatnonzero(is_new)
+    last = np.append(first[1:] - 1, len(codes) - 1)
+    return codes, first, last
+
+
+def _sliding_window_transform_global(y, window_length, fh, X=None, instance_id=False):
+    """Transform all instances of panel data using sliding window, pooled.
+
+    Same as `_sliding_window_transform` for scitype "tabular-regressor",
+    applied to all instances of y and X at once, in one vectorized pass.
+    The returned rows of all instances are stacked, in order of instances.
+
+    Parameters
+    ----------
+    y : pd.DataFrame with 2 or more level row MultiIndex
+        Endogenous time series, of pd-multiindex or pd_multiindex_hier mtype
+    window_length : int
+        Window length for transformed feature variables
+    fh : ForecastingHorizon
+        Forecasting horizon for transformed target variable, relative
+    X : pd.DataFrame, optional (default=None)
+        Exogenous series, with same row index as y.
+    instance_id : bool, optional (default=False)
+        whether to append the integer code of the instance as last feature column
+
+    Returns
+    -------
+    yt : np.ndarray, shape = (n_windows, len(fh))
+        Transformed target variable, windows of all instances.
+    Xt : np.ndarray, shape = (n_windows, n_variables * window_length [+ 1])
+        Transformed lagged values of target variable and exogenous variables,
+        excluding contemporaneous values, windows of all instances.
+    """
+    z = _concat_y_X(y, X).astype(float, copy=False)
+    codes, _, _ = _get_instance_codes(y.index)
+
+    fh = _check_fh(fh)
+    effective_window_length = window_length + fh[-1]
+
+    if effective_window_length >= len(z):
+        raise ValueError(
+            "The `window_length` and `fh` are incompatible with the length of `y`"
+        )
+
+    # windows over all rows, then select windows that lie within one instance,
+    # i.e., first and last row of the window belong to the same instance
+    windows = sliding_window_view(z, effective_window_length + 1, axis=0)
+    first_codes = codes[:-effective_window_length]
+    idx = np.flatnonzero(first_codes == codes[effective_window_length:])
+
+    yt = windows[idx[:, np.newaxis], 0, window_length + fh]
+    Xt = windows[idx, :, :window_length].reshape(len(idx), -1)
+
+    if instance_id:
+        Xt = np.column_stack([Xt, first_codes[idx]])
+
+    return yt, Xt
 
 
 class _Reducer(_BaseWindowForecaster):
@@ -176,13 +318,255 @@ class _Reducer(_BaseWindowForecaster):
 
     _tags = {"ignores-exogeneous-X": False}  # reduction uses X in non-trivial way
 
-    def __init__(self, estimator, window_length=10, transformers=None):
+    def __init__(
+        self,
+        estimator,
+        window_length=10,
+        transformers=None,
+        chunk_size=None,
+        pooling="local",
+        instance_id=False,
+    ):
         super(_Reducer, self).__init__(window_length=window_length)
         self.transformers = transformers
         self.transformers_ = None
         self.estimator = estimator
+        self.chunk_size = chunk_size
+        self.pooling = pooling
+        self.instance_id = instance_id
         self._cv = None
 
+        # global pooling fits panels and hierarchical data natively
+        if pooling == "global":
+            self.set_tags(
+                **{
+                    "y_inner_mtype": [
+                        "pd.Series",
+                        "pd-multiindex",
+                        "pd_multiindex_hier",
+                    ],
+                    "X_inner_mtype": [
+                        "pd.DataFrame",
+                        "pd-multiindex",
+                        "pd_multiindex_hier",
+                    ],
+                }
+            )
+
+    def _is_global(self, y):
+        """Check whether global pooling is applied to y.
+
+        Parameters
+        ----------
+        y : pd.Series or pd.DataFrame, inner y passed to fit, or self._y
+
+        Returns
+        -------
+        bool, whether pooling is "global" and y has a row MultiIndex
+
+        Raises
+        ------
+        ValueError if pooling is not "local" or "global", or pooling is "global",
+            and transformers or chunk_size are passed too
+        NotImplementedError if pooling is "global" and the estimator scitype
+            is not "tabular-regressor", or the strategy is "dirrec"
+        """
+        if self.pooling not in ["local", "global"]:
+            raise ValueError(
+                f'pooling must be one of "local" or "global", but found {self.pooling}'
+            )
+        if self.pooling == "local" or not isinstance(y.index, pd.MultiIndex):
+            return False
+        if self.transformers is not None or self.chunk_size is not None:
+            raise ValueError(
+                'transformers and chunk_size are not supported for pooling="global"'
+            )
+        if self._estimator_scitype != "tabular-regressor" or self.strategy == "dirrec":
+            raise NotImplementedError(
+                f'pooling="global" is not supported by {type(self).__name__}'
+            )
+        return True
+
+    def _fit_global(self, y, X=None):
+        """Fit one estimator to the windows of all instances of y, pooled.
+
+        Parameters
+        ----------
+        y : pd.DataFrame, of pd-multiindex or pd_multiindex_hier mtype
+            Target time series to which to fit the forecaster.
+        X : pd.DataFrame, optional (default=None)
+            Exogeneous time series, with same row index as y.
+
+        Returns
+        -------
+        self : reference to self
+        """
+        _, first, last = _get_instance_codes(y.index)
+        self.window_length_ = check_window_length(
+            self.window_length, n_timepoints=np.min(last - first + 1)
+        )
+
+        # the recursive strategy fits a one-step-ahead estimator
+        if self.strategy == "recursive":
+            fh = ForecastingHorizon([1])
+        else:
+            fh = self.fh.to_relative(self.cutoff)
+
+        yt, Xt = _sliding_window_transform_global(
+            y, self.window_length_, fh, X=X, instance_id=self.instance_id
+        )
+
+        if self.strategy == "direct":
+            self.estimators_ = []
+            for i in range(yt.shape[1]):
+                estimator = clone(self.estimator)
+                estimator.fit(Xt, yt[:, i])
+                self.estimators_.append(estimator)
+        else:
+            if self.strategy == "recursive":
+                yt = yt.ravel()
+            self.estimator_ = clone(self.estimator)
+            self.estimator_.fit(Xt, yt)
+        return self
+
+    def _predict(self, fh, X=None):
+        """Predict core logic, dispatches to _predict_global for global pooling."""
+        if self._is_global(self._y):
+            return self._predict_global(fh, X=X)
+        return super(_Reducer, self)._predict(fh, X=X)
+
+    def _predict_global(self, fh, X=None):
+        """Predict all instances of self._y at once, from the pooled estimator(s).
+
+        Each estimator's predict is called once per step of the horizon for the
+        recursive strategy, and once in total for the direct and multioutput
+        strategies, with feature rows of all instances.
+        Instances without a full, finite last window are predicted as nan.
+
+        Parameters
+        ----------
+        fh : ForecastingHorizon, relative to the last time point of each instance
+        X : pd.DataFrame, optional (default=None)
+            Exogeneous time series, used by the recursive strategy only,
+            must contain the values for the fh_max time points after the cutoff
+            of each instance, for all instances, in the order of instances in y
+
+        Returns
+        -------
+        y_pred : pd.DataFrame, of same mtype as self._y
+            predictions for all instances, at the absolute fh of each instance
+        """
+        if not fh.is_all_out_of_sample(self.cutoff):
+            raise NotImplementedError("In-sample predictions are not implemented.")
+
+        y = self._y
+        window_length = self.window_length_
+        fh_rel = fh.to_relative(self.cutoff)
+        fh_idx = fh.to_indexer(self.cutoff).to_numpy()
+
+        _, first, last = _get_instance_codes(y.index)
+        n_instances = len(first)
+
+        # last windows of all instances, nan for instances that are too short
+        z = _concat_y_X(y, self._X).astype(float, copy=False)
+        windows = np.full((n_instances, z.shape[1], window_length), np.nan)
+        has_window = last - first + 1 >= window_length
+        all_windows = sliding_window_view(z, window_length, axis=0)
+        windows[has_window] = all_windows[last[has_window] - window_length + 1]
+
+        def _features(windows):
+            """Tabular features from windows, with instance_id, see fit."""
+            Xt = windows.reshape(n_instances, -1)
+            if self.instance_id:
+                Xt = np.column_stack([Xt, np.arange(n_instances)])
+            return Xt
+
+        if self.strategy == "recursive":
+            if self._X is not None and X is None:
+                raise ValueError(
+                    "`X` must be passed to `predict` if `X` is given in `fit`."
+                )
+            fh_max = fh_rel[-1]
+
+            # buffer of last windows, extended by the predictions, step by step
+            buffer = np.full((n_instances, z.shape[1], window_length + fh_max), np.nan)
+            buffer[:, :, :window_length] = windows
+            if self._X is not None:
+                X_future = X.to_numpy().astype(float, copy=False)
+                if X_future.shape[0] != n_instances * fh_max:
+                    raise ValueError(
+                        "`X` passed to `predict` must contain the values at the "
+                        f"{fh_max} time points after the cutoff, for all instances"
+                    )
+                X_future = X_future.reshape(n_instances, fh_max, -1)
+                buffer[:, 1:, window_length:] = X_future.transpose(0, 2, 1)
+
+            y_all = np.full((n_instances, fh_max), np.nan)
+            for i in range(fh_max):
+                Xt = _features(buffer[:, :, i : window_length + i])
+                ok = np.isfinite(Xt).all(axis=1)
+                if ok.any():
+                    y_all[ok, i] = self.estimator_.predict(Xt[ok])
+                buffer[:, 0, window_length + i] = y_all[:, i]
+            y_pred = y_all[:, fh_idx]
+        else:
+            Xt = _features(windows)
+            ok = np.isfinite(Xt).all(axis=1)
+            y_pred = np.full((n_instances, len(fh)), np.nan)
+            if ok.any():
+                if self.strategy == "direct":
+                    for i, estimator in enumerate(self.estimators_):
+                        y_pred[ok, i] = estimator.predict(Xt[ok])
+                else:
+                    y_pred[ok] = self.estimator_.predict(Xt[ok]).reshape(ok.sum(), -1)
+
+        # row index: instances, times at fh relative to the cutoff of the instance
+        instances = y.index.droplevel(-1)[first]
+        time_index = y.index.get_level_values(-1)
+        cutoffs = time_index[last]
+        # per-instance cutoffs carry no freq, infer from the longest instance
+        if isinstance(time_index, pd.DatetimeIndex) and fh_rel.freq is None:
+            i = np.argmax(last - first)
+            freq = pd.infer_freq(time_index[first[i] : last[i] + 1])
+            fh_rel = fh_rel._new(freq=freq)
+        if (cutoffs == cutoffs[0]).all():
+            times = fh_rel.to_absolute(cutoffs[0]).to_pandas()
+            times = times[np.tile(np.arange(len(times)), n_instances)]
+        else:
+            times = [fh_rel.to_absolute(cutoff).to_pandas() for cutoff in cutoffs]
+            times = times[0].append(times[1:])
+        instances = instances.repeat(len(fh))
+        if isinstance(instances, pd.MultiIndex):
+            levels = [instances.get_level_values(i) for i in range(instances.nlevels)]
+        else:
+            levels = [instances]
+        index = pd.MultiIndex.from_arrays(levels + [times], names=y.index.names)
+
+        return pd.DataFrame(y_pred.reshape(-1, 1), index=index, columns=y.columns)
+
+    def _check_chunk_size(self):
+        """Check whether fit is chunked, and whether chunk_size can be used.
+
+        Returns
+        -------
+        bool, whether the estimator is fitted in chunks, i.e., chunk_size is not None
+
+        Raises
+        ------
+        ValueError if chunk_size is passed, and transformers are passed too,
+            or the estimator does not have a partial_fit method
+        """
+        if self.chunk_size is None:
+            return False
+        if self.transformers is not None:
+            raise ValueError("chunk_size is not supported if transformers are passed")
+        if not hasattr(self.estimator, "partial_fit"):
+            raise ValueError(
+                "chunk_size requires an estimator with a partial_fit method, "
+                f"but {type(self.estimator).__name__} has no partial_fit method"
+            )
+        return True
+
     def _is_predictable(self, last_window):
         """Check if we can make predictions from last window."""
         return (
@@ -233,6 +617,16 @@ class _Reducer(_BaseWindowForecaster):
             est = make_pipeline(Tabularizer(), est)
 
         params = {"estimator": est, "window_length": 3}
+
+        # global pooling is supported by the tabular, non-dirrec reducers only
+        if "Tabular" in cls.__name__ and "DirRec" not in cls.__name__:
+            params_global = {
+                "estimator": est,
+                "window_length": 3,
+                "pooling": "global",
+                "instance_id": True,
+            }
+            return [params, params_global]
         return params
 
 
@@ -242,7 +636,7 @@ class _DirectReducer(_Reducer):
         "requires-fh-in-fit": True,  # is the forecasting horizon required in fit?
     }
 
-    def _transform(self, y, X=None):
+    def _transform(self, y, X=None, chunk_size=None):
         fh = self.fh.to_relative(self.cutoff)
         return _sliding_window_transform(
             y,
@@ -251,6 +645,7 @@ class _DirectReducer(_Reducer):
             X=X,
             transformers=self.transformers_,
             scitype=self._estimator_scitype,
+            chunk_size=chunk_size,
         )
 
     def _fit(self, y, X=None, fh=None):
@@ -276,10 +671,22 @@ class _DirectReducer(_Reducer):
         if not self.fh.is_all_out_of_sample(self.cutoff):
             raise NotImplementedError("In-sample predictions are not implemented.")
 
+        # Pool windows of all instances into one fit, if pooling is "global".
+        if self._is_global(y):
+            return self._fit_global(y, X)
+
         self.window_length_ = check_window_length(
             self.window_length, n_timepoints=len(y)
         )
 
+        # Fit estimators in chunks of the transformed data, if chunk_size is passed.
+        if self._check_chunk_size():
+            self.estimators_ = [clone(self.estimator) for _ in range(len(self.fh))]
+            for yt, Xt in self._transform(y, X, chunk_size=self.chunk_size):
+                for i, estimator in enumerate(self.estimators_):
+                    estimator.partial_fit(Xt, yt[:, i])
+            return self
+
         yt, Xt = self._transform(y, X)
 
         # Iterate over forecasting horizon, fitting a separate estimator for each step.
@@ -350,7 +757,7 @@ class _MultioutputReducer(_Reducer):
         "requires-fh-in-fit": True,  # is the forecasting horizon required in fit?
     }
 
-    def _transform(self, y, X=None):
+    def _transform(self, y, X=None, chunk_size=None):
         fh = self.fh.to_relative(self.cutoff)
         return _sliding_window_transform(
             y,
@@ -358,6 +765,7 @@ class _MultioutputReducer(_Reducer):
             fh=fh,
             X=X,
             scitype=self._estimator_scitype,
+            chunk_size=chunk_size,
         )
 
     def _fit(self, y, X=None, fh=None):
@@ -382,14 +790,25 @@ class _MultioutputReducer(_Reducer):
         if not self.fh.is_all_out_of_sample(self.cutoff):
             raise NotImplementedError("In-sample predictions are not implemented.")
 
+        # Pool windows of all instances into one fit, if pooling is "global".
+        if self._is_global(y):
+            return self._fit_global(y, X)
+
         self.window_length_ = check_window_length(
             self.window_length, n_timepoints=len(y)
         )
 
+        self.estimator_ = clone(self.estimator)
+
+        # Fit estimator in chunks of the transformed data, if chunk_size is passed.
+        if self._check_chunk_size():
+            for yt, Xt in self._transform(y, X, chunk_size=self.chunk_size):
+                self.estimator_.partial_fit(Xt, yt)
+            return self
+
         yt, Xt = self._transform(y, X)
 
         # Fit a multi-output estimator to the transformed data.
-        self.estimator_ = clone(self.estimator)
         self.estimator_.fit(Xt, yt)
         return self
 
@@ -446,7 +865,7 @@ class _MultioutputReducer(_Reducer):
 class _RecursiveReducer(_Reducer):
     strategy = "recursive"
 
-    def _transform(self, y, X=None):
+    def _transform(self, y, X=None, chunk_size=None):
         # For the recursive strategy, the forecasting horizon for the sliding-window
         # transform is simply a one-step ahead horizon, regardless of the horizon
         # used during prediction.
@@ -458,6 +877,7 @@ class _RecursiveReducer(_Reducer):
             X=X,
             transformers=self.transformers_,
             scitype=self._estimator_scitype,
+            chunk_size=chunk_size,
         )
 
     def _fit(self, y, X=None, fh=None):
@@ -482,6 +902,10 @@ class _RecursiveReducer(_Reducer):
                 + " to derive reduction features. Window length will be"
                 + " inferred, please set to None"
             )
+        # Pool windows of all instances into one fit, if pooling is "global".
+        if self._is_global(y):
+            return self._fit_global(y, X)
+
         self.window_length_ = check_window_length(
             self.window_length, n_timepoints=len(y)
         )
@@ -501,6 +925,14 @@ class _RecursiveReducer(_Reducer):
                     + "or needs to have it passed by transformer via"
                     + "truncate_start"
                 )
+
+        # Fit estimator in chunks of the transformed data, if chunk_size is passed.
+        if self._check_chunk_size():
+            self.estimator_ = clone(self.estimator)
+            for yt, Xt in self._transform(y, X, chunk_size=self.chunk_size):
+                self.estimator_.partial_fit(Xt, yt.ravel())
+            return self
+
         yt, Xt = self._transform(y, X)
 
         # Make sure yt is 1d array to avoid DataConversion warning from scikit-learn.
@@ -513,6 +945,148 @@ class _RecursiveReducer(_Reducer):
         self.estimator_.fit(Xt, yt)
         return self
 
+    def _get_raw_window(self, shift=0, y_update=None):
+        """Get the window of y that transformers are applied to, for a given shift.
+
+        Parameters
+        ----------
+        shift : integer
+            shift of the window into the future, see _get_shifted_window
+        y_update : a pandas Series or Dataframe
+            y values that were obtained in the recursive fashion.
+
+        Returns
+        -------
+        y_raw : A pandas dataframe or series
+            historical and forecast values of y at the window_length + 1 time points
+            up to cutoff shifted by shift, for each instance, zeros where unknown
+        index_range : time index of the window_length + 1 time points of y_raw
+        """
+        cutoff = _shift(self._cutoff, by=shift)
+
+        # relative _int will give the integer indices of the window
+        relative_int = pd.Index(list(map(int, range(-self.window_length_, 1))))
+        # index_range will give the same indices,
+        # but using the date format of cutoff
+        index_range = _index_range(relative_int, cutoff)
+
+        # y_raw is defined solely for the purpose of deriving a dataframe
+        # window_length forecasting steps into the past in order to calculate the
+        # new X from y features based on the transformer provided
+        y_raw = _create_fcst_df(index_range, self._y)
+
+        # The y_raw dataframe will contain historical and / or recursively
+        # forecast value to calculate the new X features.
+
+        # Historical values are passed here for all time steps of y_raw that lie in
+        # the past .
+        y_raw.update(self._y)
+
+        # Forecast values are passed here for all time steps of y_raw that lie in
+        # the future and were forecast in previous iterations.
+        if y_update is not None:
+            y_raw.update(y_update)
+        return y_raw, index_range
+
+    def _get_incremental_features(self):
+        """Get window functions of fitted transformers, for incremental prediction.
+
+        Returns
+        -------
+        features : list of tuple (summarizer, lag, window_length), one per column
+            of the features generated by transformers_, in order of columns;
+            None if any transformer is not a WindowSummarizer, or y is multivariate,
+            or a window function is not supported by _summarize_windows
+        """
+        if isinstance(self._y, pd.DataFrame) and self._y.shape[1] > 1:
+            return None
+        features = []
+        for transformer in self.transformers_:
+            if not isinstance(transformer, WindowSummarizer):
+                return None
+            if len(transformer._target_cols) > 1:
+                return None
+            # rows of _func_dict are in order of the columns returned by transform
+            for _, (summarizer, window) in transformer._func_dict.iterrows():
+                supported = summarizer in _WINDOW_FUNCS_NUMPY or callable(summarizer)
+                if not supported:
+                    return None
+                features.append((summarizer, window[0], window[1]))
+        return features
+
+    def _predict_incremental(self, X_last, index_range, X=None):
+        """Predict recursively from arrays, without re-applying transformers.
+
+        Instead of transforming a shifted window of y with transformers_ at every
+        step, as in _get_shifted_window, the window functions of the
+        WindowSummarizer transformers are evaluated on the last window_length + 1
+        values of y, kept in a pre-allocated array, which costs O(window_length)
+        per feature and step. Results are the same as from _get_shifted_window.
+
+        Parameters
+        ----------
+        X_last : pd.DataFrame
+            features for the first step, from _get_shifted_window, one row per
+            instance, with columns as passed to estimator_ in fit
+        index_range : time index of the steps 1, ..., fh_max after the cutoff
+        X : pd.DataFrame, optional (default=None)
+            Exogenous time series, passed to predict
+
+        Returns
+        -------
+        y_pred : np.ndarray of shape (n_instances * fh_max,), predictions
+            for the fh_max steps of each instance, in order of y_pred from
+            _create_fcst_df; None if incremental prediction is not supported
+        """
+        features = self._get_incremental_features()
+        if features is None:
+            return None
+
+        n_exog = 0 if self._X is None else self._X.shape[1]
+        if len(features) + n_exog != X_last.shape[1]:
+            return None
+
+        window_length = self.window_length_
+        fh_max = len(index_range)
+        n_instances = len(X_last)
+
+        # values of y in the window up to the cutoff, per instance, as in fit
+        y_raw, _ = self._get_raw_window()
+        y_window = y_raw.to_numpy().reshape(n_instances, -1)
+
+        # pre-allocated values of y, historic and predicted, per instance
+        values = np.zeros((n_instances, window_length + 1 + fh_max))
+        values[:, : window_length + 1] = y_window
+
+        # exogeneous variables at the future time points, per instance
+        if self._X is not None and fh_max > 1:
+            X_future = _create_fcst_df(index_range[:-1], self._X)
+            X_future.update(self._X)
+            if X is not None:
+                X_future.update(X)
+            X_future = X_future.to_numpy().reshape(n_instances, fh_max - 1, -1)
+
+        y_pred = np.zeros((n_instances, fh_max))
+        X_pred = X_last
+        for i in range(fh_max):
+            y_pred[:, i] = self.estimator_.predict(X_pred)
+            values[:, window_length + 1 + i] = y_pred[:, i]
+
+            if i + 1 == fh_max:
+                break
+
+            # window ends at the time point of the latest prediction
+            end = window_length + i + 2
+            X_next = [
+                _summarize_windows(values[:, end - lag - length : end - lag], func)
+                for func, lag, length in features
+            ]
+            if self._X is not None:
+                X_next.extend(X_future[:, i, :].T)
+            X_pred = pd.DataFrame(np.column_stack(X_next), columns=X_last.columns)
+
+        return y_pred.ravel()
+
     def _get_shifted_window(self, shift=0, y_update=None, X_update=None):
         """Get the start and end points of a shifted window.
 
@@ -573,30 +1147,7 @@ class _RecursiveReducer(_Reducer):
         cutoff = _shift(self._cutoff, by=shift)
 
         if self.transformers_ is not None:
-            # Get the last window of the endogenous variable.
-            # If X is given, also get the last window of the exogenous variables.
-            # relative _int will give the integer indices of the window defined above
-            relative_int = pd.Index(list(map(int, range(-self.window_length_, 1))))
-            # index_range will give the same indices,
-            # but using the date format of cutoff
-            index_range = _index_range(relative_int, cutoff)
-
-            # y_raw is defined solely for the purpose of deriving a dataframe
-            # window_length forecasting steps into the past in order to calculate the
-            # new X from y features based on the transformer provided
-            y_raw = _create_fcst_df(index_range, self._y)
-
-            # The y_raw dataframe will contain historical and / or recursively
-            # forecast value to calculate the new X features.
-
-            # Historical values are passed here for all time steps of y_raw that lie in
-            # the past .
-            y_raw.update(self._y)
-
-            # Forecast values are passed here for all time steps of y_raw that lie in
-            # the future and were forecast in previous iterations.
-            if y_update is not None:
-                y_raw.update(y_update)
+            y_raw, index_range = self._get_raw_window(shift=shift, y_update=y_update)
 
             # After filling the empty y_raw frame with historic / forecast values
             # X from y features can be calculated based on the passed transformer.
@@ -680,21 +1231,27 @@ class _RecursiveReducer(_Reducer):
             relative = pd.Index(list(map(int, range(1, fh_max + 1))))
             index_range = _index_range(relative, self.cutoff)
 
-            y_pred = _create_fcst_df(index_range, self._y)
-
-            for i in range(fh_max):
-                # Generate predictions.
-                y_pred_vector = self.estimator_.predict(X_last)
-                y_pred_curr = _create_fcst_df(
-                    [index_range[i]], self._y, fill=y_pred_vector
-                )
-                y_pred.update(y_pred_curr)
+            # Predict incrementally from arrays, if the transformers allow it,
+            # otherwise by re-applying the transformers at every step below.
+            y_pred_values = self._predict_incremental(X_last, index_range, X=X)
+            if y_pred_values is not None:
+                y_pred = _create_fcst_df(index_range, self._y, fill=y_pred_values)
+            else:
+                y_pred = _create_fcst_df(index_range, self._y)
 
-                # # Update last window with previous prediction.
-                if i + 1 != fh_max:
-                    y_last, X_last = self._get_shifted_window(
-                        y_update=y_pred, X_update=X, shift=i + 1
+                for i in range(fh_max):
+                    # Generate predictions.
+                    y_pred_vector = self.estimator_.predict(X_last)
+                    y_pred_curr = _create_fcst_df(
+                        [index_range[i]], self._y, fill=y_pred_vector
                     )
+                    y_pred.update(y_pred_curr)
+
+                    # # Update last window with previous prediction.
+                    if i + 1 != fh_max:
+                        y_last, X_last = self._get_shifted_window(
+                            y_update=y_pred, X_update=X, shift=i + 1
+                        )
 
         else:
             # Pre-allocate arrays.
@@ -791,6 +1348,13 @@ class _DirRecReducer(_Reducer):
         if len(self.fh.to_in_sample(self.cutoff)) > 0:
             raise NotImplementedError("In-sample predictions are not implemented")
 
+        if self.chunk_size is not None:
+            raise NotImplementedError(
+                "chunk_size is not supported for the dirrec strategy"
+            )
+        # raises NotImplementedError if pooling is "global" and y is a panel
+        self._is_global(y)
+
         self.window_length_ = check_window_length(
             self.window_length, n_timepoints=len(y)
         )
@@ -893,6 +1457,16 @@ class DirectTabularRegressionForecaster(_DirectReducer):
     window_length : int, optional (default=10)
         The length of the sliding window used to transform the series into
         a tabular matrix.
+    chunk_size : int, optional (default=None)
+        If int, the estimator is fitted via partial_fit, to chunks of chunk_size
+        rows of the tabular matrix, so the full matrix is never allocated.
+    pooling : str, one of "local" (default) and "global"
+        If "local", panel and hierarchical data are forecast per instance.
+        If "global", windows of all instances are pooled into one tabular matrix,
+        to which one estimator is fitted, and all instances are predicted at once.
+    instance_id : bool, optional (default=False)
+        Only used if pooling is "global". If True, the integer code of the
+        instance is appended to the features, as last column.
     """
 
     _estimator_scitype = "tabular-regressor"
@@ -911,6 +1485,16 @@ class MultioutputTabularRegressionForecaster(_MultioutputReducer):
     window_length : int, optional (default=10)
         The length of the sliding window used to transform the series into
         a tabular matrix.
+    chunk_size : int, optional (default=None)
+        If int, the estimator is fitted via partial_fit, to chunks of chunk_size
+        rows of the tabular matrix, so the full matrix is never allocated.
+    pooling : str, one of "local" (default) and "global"
+        If "local", panel and hierarchical data are forecast per instance.
+        If "global", windows of all instances are pooled into one tabular matrix,
+        to which one estimator is fitted, and all instances are predicted at once.
+    instance_id : bool, optional (default=False)
+        Only used if pooling is "global". If True, the integer code of the
+        instance is appended to the features, as last column.
     """
 
     _estimator_scitype = "tabular-regressor"
@@ -929,6 +1513,16 @@ class RecursiveTabularRegressionForecaster(_RecursiveReducer):
     window_length : int, optional (default=10)
         The length of the sliding window used to transform the series into
         a tabular matrix.
+    chunk_size : int, optional (default=None)
+        If int, the estimator is fitted via partial_fit, to chunks of chunk_size
+        rows of the tabular matrix, so the full matrix is never allocated.
+    pooling : str, one of "local" (default) and "global"
+        If "local", panel and hierarchical data are forecast per instance.
+        If "global", windows of all instances are pooled into one tabular matrix,
+        to which one estimator is fitted, and all instances are predicted at once.
+    instance_id : bool, optional (default=False)
+        Only used if pooling is "global". If True, the integer code of the
+        instance is appended to the features, as last column.
     """
 
     _tags = {
@@ -1010,6 +1604,9 @@ class RecursiveTimeSeriesRegressionForecaster(_RecursiveReducer):
     window_length : int, optional (default=10)
         The length of the sliding window used to transform the series into
         a tabular matrix.
+    chunk_size : int, optional (default=None)
+        If int, the estimator is fitted via partial_fit, to chunks of chunk_size
+        rows of the tabular matrix, so the full matrix is never allocated.
     """
 
     _tags = {
@@ -1046,6 +1643,9 @@ def make_reduction(
     window_length=10,
     scitype="infer",
     transformers=None,
+    chunk_size=None,
+    pooling="local",
+    instance_id=False,
 ):
     """Make forecaster based on reduction to tabular or time-series regression.
 
@@ -1068,6 +1668,27 @@ def make_reduction(
         Must be one of "infer", "tabular-regressor" or "time-series-regressor". If
         the scitype cannot be inferred, please specify it explicitly.
         See :term:`scitype`.
+    chunk_size : int, optional (default=None)
+        If None, the estimator is fitted to the full sliding-window transformed data.
+        If int, the transformed data is generated in chunks of chunk_size rows,
+        which are passed to the estimator's partial_fit method one by one, so the
+        full transformed data is never allocated in memory.
+        Requires an estimator with partial_fit, e.g., SGDRegressor.
+        Not supported for the "dirrec" strategy, or if transformers are passed.
+    pooling : str, one of "local" (default) and "global"
+        How panel and hierarchical data are forecast.
+        If "local", a separate forecaster is fitted to each instance.
+        If "global", the sliding windows of all instances are pooled into one
+        tabular matrix, to which a single estimator is fitted, and predictions for
+        all instances are made with one estimator.predict call per estimator,
+        or per step of the horizon for the "recursive" strategy.
+        "global" is supported for tabular regressors and the "direct",
+        "recursive" and "multioutput" strategies, without transformers or
+        chunk_size. Has no effect on data that is a single series.
+    instance_id : bool, optional (default=False)
+        Only used if pooling is "global". If True, the integer code of the
+        instance is appended as last feature column, so the estimator can learn
+        instance-specific effects.
 
     Returns
     -------
@@ -1100,7 +1721,12 @@ def make_reduction(
 
     Forecaster = _get_forecaster(scitype, strategy)
     return Forecaster(
-        estimator=estimator, window_length=window_length, transformers=transformers
+        estimator=estimator,
+        window_length=window_length,
+        transformers=transformers,
+        chunk_size=chunk_size,
+        pooling=pooling,
+        instance_id=instance_id,
     )
 
 
@@ -27,7 +27,10 @@ from sktime.forecasting.compose import (
     RecursiveTimeSeriesRegressionForecaster,
     make_reduction,
 )
-from sktime.forecasting.compose._reduce import _sliding_window_transform
+from sktime.forecasting.compose._reduce import (
+    _sliding_window_transform,
+    _sliding_window_transform_global,
+)
 from sktime.forecasting.model_selection import (
     SlidingWindowSplitter,
     temporal_train_test_split,
@@ -39,6 +42,7 @@ from sktime.regression.base import BaseRegressor
 from sktime.regression.interval_based import TimeSeriesForestRegressor
 from sktime.transformations.panel.reduce import Tabularizer
 from sktime.utils._testing.forecasting import make_forecasting_problem
+from sktime.utils._testing.hierarchical import _make_hierarchical
 from sktime.utils.validation.forecasting import check_fh
 
 N_TIMEPOINTS = [13, 17]
@@ -184,6 +188,170 @@ def test_sliding_window_transform_explicit():
     np.testing.assert_array_equal(Xt_time_series_actual, Xt_time_series_expected)
 
 
+@pytest.mark.parametrize("chunk_size", [1, 4, 100])
+@pytest.mark.parametrize("scitype", ["tabular-regressor", "time-series-regressor"])
+def test_sliding_window_transform_chunks(chunk_size, scitype):
+    """Test that chunks of sliding window transform concatenate to full transform."""
+    y, X = _make_y_X(n_timepoints=17, n_variables=3)
+    fh = ForecastingHorizon([1, 3], is_relative=True)
+
+    yt, Xt = _sliding_window_transform(y, 3, fh, X, scitype=scitype)
+    chunks = list(
+        _sliding_window_transform(y, 3, fh, X, scitype=scitype, chunk_size=chunk_size)
+    )
+
+    assert all(len(yt_chunk) <= chunk_size for yt_chunk, _ in chunks)
+    np.testing.assert_array_equal(np.concatenate([c[0] for c in chunks]), yt)
+    np.testing.assert_array_equal(np.concatenate([c[1] for c in chunks]), Xt)
+
+
+class _PartialFitLinearRegression(BaseEstimator, RegressorMixin):
+    """Linear regression with partial_fit, refits on all data seen so far."""
+
+    def partial_fit(self, X, y):
+        self.X_ = np.concatenate([self.X_, X]) if hasattr(self, "X_") else X
+        self.y_ = np.concatenate([self.y_, y]) if hasattr(self, "y_") else y
+        self.estimator_ = LinearRegression().fit(self.X_, self.y_)
+        return self
+
+    def predict(self, X):
+        return self.estimator_.predict(X)
+
+
+@pytest.mark.parametrize("strategy", ["recursive", "direct", "multioutput"])
+def test_make_reduction_chunk_size(strategy):
+    """Test that fitting in chunks via partial_fit gives same result as fit."""
+    y = load_airline()
+    fh = [1, 2, 3]
+
+    forecaster = make_reduction(LinearRegression(), window_length=5, strategy=strategy)
+    y_pred = forecaster.fit(y, fh=fh).predict()
+
+    forecaster = make_reduction(
+        _PartialFitLinearRegression(),
+        window_length=5,
+        strategy=strategy,
+        chunk_size=16,
+    )
+    y_pred_chunked = forecaster.fit(y, fh=fh).predict()
+
+    np.testing.assert_allclose(y_pred_chunked, y_pred)
+
+
+def test_make_reduction_chunk_size_raises():
+    """Test that chunk_size raises informative errors if not supported."""
+    y = load_airline()
+
+    forecaster = make_reduction(LinearRegression(), window_length=5, chunk_size=16)
+    with pytest.raises(ValueError, match="partial_fit"):
+        forecaster.fit(y, fh=[1, 2])
+
+    forecaster = make_reduction(
+        _PartialFitLinearRegression(), strategy="dirrec", chunk_size=16
+    )
+    with pytest.raises(NotImplementedError, match="chunk_size"):
+        forecaster.fit(y, fh=[1, 2])
+
+
+def _make_global_problem():
+    """Return panel y and X of unequal length instances, for global pooling."""
+    yX = _make_hierarchical(
+        hierarchy_levels=(3,),
+        min_timepoints=12,
+        max_timepoints=16,
+        n_columns=3,
+        random_state=0,
+    )
+    return yX[["c0"]], yX[["c1", "c2"]]
+
+
+@pytest.mark.parametrize("fh", [[1], [1, 3]])
+def test_sliding_window_transform_global(fh):
+    """Test that global transform stacks sliding window transforms of instances."""
+    y, X = _make_global_problem()
+    fh = ForecastingHorizon(fh)
+
+    yt, Xt = _sliding_window_transform_global(y, 3, fh, X)
+
+    instances = y.index.get_level_values(0).unique()
+    yts, Xts = zip(
+        *[_sliding_window_transform(y.loc[i], 3, fh, X.loc[i]) for i in instances]
+    )
+    np.testing.assert_array_equal(np.concatenate(yts), yt)
+    np.testing.assert_array_equal(np.concatenate(Xts), Xt)
+
+    _, Xt_id = _sliding_window_transform_global(y, 3, fh, X, instance_id=True)
+    codes = np.repeat(np.arange(len(instances)), [len(yti) for yti in yts])
+    np.testing.assert_array_equal(Xt_id[:, -1], codes)
+    np.testing.assert_array_equal(Xt_id[:, :-1], Xt)
+
+
+@pytest.mark.parametrize("strategy", ["direct", "multioutput", "recursive"])
+@pytest.mark.parametrize("instance_id", [False, True])
+def test_make_reduction_global_pooling(strategy, instance_id):
+    """Test that global pooling fits one regressor to windows of all instances."""
+    y, _ = _make_global_problem()
+    fh = [1, 2, 3]
+    window_length = 4
+
+    forecaster = make_reduction(
+        LinearRegression(),
+        strategy=strategy,
+        window_length=window_length,
+        pooling="global",
+        instance_id=instance_id,
+    )
+    y_pred = forecaster.fit(y, fh=fh).predict()
+
+    # expected: one regressor fitted to pooled windows, predicting last windows
+    step_fh = ForecastingHorizon([1] if strategy == "recursive" else fh)
+    yt, Xt = _sliding_window_transform_global(
+        y, window_length, step_fh, instance_id=instance_id
+    )
+    estimator = LinearRegression().fit(Xt, yt)
+
+    expected = []
+    for code, instance in enumerate(y.index.get_level_values(0).unique()):
+        y_instance = y.loc[instance]
+        last_window = list(y_instance.iloc[-window_length:, 0])
+        if strategy == "recursive":
+            for _ in fh:
+                features = last_window[-window_length:]
+                if instance_id:
+                    features = features + [code]
+                last_window.append(estimator.predict([features])[0, 0])
+            y_instance_pred = last_window[window_length:]
+        else:
+            features = last_window + [code] if instance_id else last_window
+            y_instance_pred = estimator.predict([features])[0]
+        expected.append(y_instance_pred)
+
+        # predictions are made at fh, relative to the end of each instance
+        fh_instance = ForecastingHorizon(fh, freq=pd.infer_freq(y_instance.index))
+        expected_index = fh_instance.to_absolute(y_instance.index[-1])
+        actual_index = y_pred.loc[instance].index
+        assert actual_index.equals(expected_index.to_pandas())
+
+    assert y_pred.index.names == y.index.names
+    assert list(y_pred.columns) == list(y.columns)
+    np.testing.assert_allclose(y_pred.to_numpy().ravel(), np.concatenate(expected))
+
+
+def test_make_reduction_global_pooling_raises():
+    """Test that global pooling raises informative errors if not supported."""
+    y, _ = _make_global_problem()
+
+    forecaster = make_reduction(LinearRegression(), pooling="foo")
+    with pytest.raises(ValueError, match="pooling"):
+        forecaster.fit(y, fh=[1, 2])
+
+    forecaster = make_reduction(
+        LinearRegression(), window_length=3, strategy="dirrec", pooling="global"
+    )
+    with pytest.raises(NotImplementedError, match="global"):
+        forecaster.fit(y, fh=[1, 2])
+
+
 def _make_y(start, end, method="linear-trend", slope=1):
     # generate test data
     if method == "linear-trend":
@@ -2,14 +2,17 @@
 """Test extraction of features across (shifted) windows."""
 __author__ = ["danbartl"]
 
+import numpy as np
 import pandas as pd
 import pytest
 from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
 from sklearn.pipeline import make_pipeline
 
 from sktime.datasets import load_airline
 from sktime.datatypes import get_examples
 from sktime.forecasting.compose import make_reduction
+from sktime.forecasting.compose._reduce import _RecursiveReducer
 from sktime.forecasting.model_selection import temporal_train_test_split
 from sktime.transformations.series.summarize import WindowSummarizer
 
@@ -159,3 +162,45 @@ def test_reduction(y, index_names):
     forecaster2.fit(y, fh=[1, 2])
     y_pred = forecaster2.predict(fh=[1, 2, 12])
     check_eval(y_pred.index.names, index_names)
+
+
+@pytest.mark.parametrize(
+    "y, X_train, X_test",
+    [
+        (y_train, None, None),
+        (
+            y_train,
+            pd.DataFrame({"x": np.arange(len(y_train))}, index=y_train.index),
+            pd.DataFrame({"x": np.arange(12)}, index=y_test.index[:12]),
+        ),
+        (y_train_grp, None, None),
+        (y_train_hier_unequal, None, None),
+    ],
+)
+def test_reduction_incremental_predict(y, X_train, X_test, monkeypatch):
+    """Test that incremental recursive prediction equals re-applying transformers."""
+    lag_feature = {
+        "lag": [1, 2],
+        "mean": [[1, 3], [2, 6]],
+        "std": [[1, 4]],
+        "skew": [[1, 5]],
+        "median": [[0, 3]],
+    }
+    forecaster = make_reduction(
+        LinearRegression(),
+        scitype="tabular-regressor",
+        transformers=[WindowSummarizer(lag_feature=lag_feature, n_jobs=1)],
+        window_length=None,
+        strategy="recursive",
+    )
+    forecaster.fit(y, X=X_train, fh=[1, 2, 12])
+    y_pred = forecaster.predict(X=X_test)
+
+    # predictions by re-applying the transformers at every step
+    monkeypatch.setattr(
+        _RecursiveReducer, "_predict_incremental", lambda self, *args, **kwargs: None
+    )
+    y_pred_expected = forecaster.predict(X=X_test)
+
+    np.testing.assert_allclose(y_pred.to_numpy(), y_pred_expected.to_numpy())
+    assert y_pred.index.equals(y_pred_expected.index)
@@ -17,6 +17,7 @@ from sklearn.base import clone
 from sktime.datatypes import convert, convert_to
 from sktime.datatypes._utilities import get_slice
 from sktime.forecasting.base import BaseForecaster
+from sktime.utils.parallel import parallelize
 
 
 class ConformalIntervals(BaseForecaster):
@@ -60,6 +61,42 @@ class ConformalIntervals(BaseForecaster):
         residuals matrix values for (for speeding up calculation)
     verbose : bool, optional, default=False
         whether to print warnings if windows with too few data points occur
+    strategy : str, optional, default="refit"
+        how the forecaster is fitted to the sliding windows to compute residuals,
+        one of "refit", "update", "no-update_params", as in `evaluate`
+        "refit": a new clone of forecaster is fitted to every window
+        "update": a clone of forecaster is fitted to the first window,
+            and updated with the new observations of every later window
+        "no-update_params": as "update", but without updating parameters
+    residuals_store : str, optional, default="matrix"
+        "matrix": residuals_matrix_ has one column per index of y,
+            i.e., residuals at all horizons from every window.
+            If fh is passed in fit, the matrix is not recomputed in update,
+            i.e., intervals use the residuals of the data seen in fit,
+            since new data adds a column to every window of the matrix.
+        "band": residuals_matrix_ has one column per offset to the window,
+            up to the largest horizon in fh, i.e., only residuals at horizons
+            needed for the intervals are computed and stored.
+            If fh is passed in fit, residuals are extended in update,
+            by computing only windows that are new or were incomplete.
+            If predict is called with horizons beyond the band of fit,
+            residuals are recomputed for the fh of predict, without storing them.
+    backend : str, optional, default=None
+        Parallelization backend for the loop over windows, only used if
+        strategy="refit". The update strategies carry state from window to window,
+        so their windows are always computed sequentially.
+        None or "None" loops sequentially; "loky", "multiprocessing" and
+        "threading" use `joblib.Parallel` with the respective backend.
+        See `sktime.utils.parallel.parallelize` for details.
+    backend_params : dict, optional, default=None
+        Parameters passed to the backend, e.g., `n_jobs` for joblib backends.
+
+    Attributes
+    ----------
+    forecaster_ : sktime forecaster, clone of forecaster fitted to all of y
+    residuals_matrix_ : pd.DataFrame, only present if fh was passed in fit
+        signed residuals of forecasts from sliding windows,
+        see `residuals_store` and `_compute_sliding_residuals`
 
     References
     ----------
@@ -94,6 +131,10 @@ class ConformalIntervals(BaseForecaster):
         "conformal_bonferroni",
     ]
 
+    ALLOWED_STRATEGIES = ["refit", "update", "no-update_params"]
+
+    ALLOWED_RESIDUALS_STORES = ["matrix", "band"]
+
     def __init__(
         self,
         forecaster,
@@ -101,6 +142,10 @@ class ConformalIntervals(BaseForecaster):
         initial_window=1,
         sample_frac=None,
         verbose=False,
+        strategy="refit",
+        residuals_store="matrix",
+        backend=None,
+        backend_params=None,
     ):
 
         if not isinstance(method, str):
@@ -111,11 +156,27 @@ class ConformalIntervals(BaseForecaster):
                 f"method must be one of {self.ALLOWED_METHODS}, but found {method}"
             )
 
+        if strategy not in self.ALLOWED_STRATEGIES:
+            raise ValueError(
+                f"strategy must be one of {self.ALLOWED_STRATEGIES}, "
+                f"but found {strategy}"
+            )
+
+        if residuals_store not in self.ALLOWED_RESIDUALS_STORES:
+            raise ValueError(
+                f"residuals_store must be one of {self.ALLOWED_RESIDUALS_STORES}, "
+                f"but found {residuals_store}"
+            )
+
         self.forecaster = forecaster
         self.method = method
         self.verbose = verbose
         self.initial_window = initial_window
         self.sample_frac = sample_frac
+        self.strategy = strategy
+        self.residuals_store = residuals_store
+        self.backend = backend
+        self.backend_params = backend_params
 
         super(ConformalIntervals, self).__init__()
 
@@ -142,6 +203,7 @@ class ConformalIntervals(BaseForecaster):
                 forecaster=self.forecaster,
                 initial_window=self.initial_window,
                 sample_frac=self.sample_frac,
+                width=self._get_band_width(fh),
             )
 
         return self
@@ -151,8 +213,28 @@ class ConformalIntervals(BaseForecaster):
 
     def _update(self, y, X=None, update_params=True):
         self.forecaster_.update(y, X, update_params=update_params)
+
+        if self.fh_early_ and self.residuals_store == "band":
+            self.residuals_matrix_ = self._extend_sliding_residuals(
+                residuals_matrix=self.residuals_matrix_
+            )
         return self
 
+    def _get_band_width(self, fh):
+        """Return number of columns of the residuals band for fh, None for matrix."""
+        if self.residuals_store != "band":
+            return None
+        fh_relative = fh.to_relative(self.cutoff)
+        return max(int(np.max(fh_relative)), 0) + 1
+
+    def _get_residuals(self, residuals_matrix, offset):
+        """Return residuals at horizon offset, from residuals matrix or band."""
+        if self.residuals_store == "band":
+            if offset not in residuals_matrix.columns:
+                return np.array([])
+            return residuals_matrix[offset].to_numpy()
+        return np.diagonal(residuals_matrix, offset=offset)
+
     def _predict_interval(self, fh, X=None, coverage=None):
         """Compute/return prediction quantiles for a forecast.
 
@@ -194,7 +276,11 @@ class ConformalIntervals(BaseForecaster):
         fh_relative = fh.to_relative(self.cutoff)
         fh_absolute = fh.to_absolute(self.cutoff)
 
-        if self.fh_early_:
+        width = self._get_band_width(fh)
+        # the band of fit does not contain horizons beyond the fh of fit
+        if self.fh_early_ and (
+            width is None or width <= len(self.residuals_matrix_.columns)
+        ):
             residuals_matrix = self.residuals_matrix_
         else:
             residuals_matrix = self._compute_sliding_residuals(
@@ -203,6 +289,7 @@ class ConformalIntervals(BaseForecaster):
                 forecaster=self.forecaster,
                 initial_window=self.initial_window,
                 sample_frac=self.sample_frac,
+                width=width,
             )
 
         ABS_RESIDUAL_BASED = ["conformal", "conformal_bonferroni", "empirical_residual"]
@@ -210,7 +297,7 @@ class ConformalIntervals(BaseForecaster):
         cols = pd.MultiIndex.from_product([["Coverage"], coverage, ["lower", "upper"]])
         pred_int = pd.DataFrame(index=fh_absolute, columns=cols)
         for fh_ind, offset in zip(fh_absolute, fh_relative):
-            resids = np.diagonal(residuals_matrix, offset=offset)
+            resids = self._get_residuals(residuals_matrix, offset)
             resids = resids[~np.isnan(resids)]
             abs_resids = np.abs(resids)
             coverage2 = np.repeat(coverage, 2)
@@ -273,7 +360,9 @@ class ConformalIntervals(BaseForecaster):
 
         return pred_int
 
-    def _compute_sliding_residuals(self, y, X, forecaster, initial_window, sample_frac):
+    def _compute_sliding_residuals(
+        self, y, X, forecaster, initial_window, sample_frac, width=None, ids=None
+    ):
         """Compute sliding residuals used in uncertainty estimates.
 
         Parameters
@@ -290,6 +379,13 @@ class ConformalIntervals(BaseForecaster):
             for speeding up computing of residuals matrix.
             sample value in range (0, 1) to obtain a fraction of y indices to
             compute residuals matrix for
+        width : int, optional, default=None
+            if passed, only residuals at the first width indices of every window
+            are computed, and stored in a band instead of a matrix
+        ids : pd.Index, optional, default=None
+            subset of y.index[initial_window:] to compute rows for, other rows are nan
+            if None, all rows are computed, or a sample if sample_frac is passed
+
         Returns
         -------
         residuals_matrix : pd.DataFrame, row and column index = y.index[initial_window:]
@@ -297,41 +393,87 @@ class ConformalIntervals(BaseForecaster):
             using a clone of the forecaster passed through the forecaster arg.
             if sample_frac is passed this will have NaN values for 1 - sample_frac
             fraction of the matrix
+            if width is passed, column index is instead range(width), and
+            [i,k]-th entry is signed residual of forecasting y.iloc[y_loc(i) + k],
+            i.e., the same as the k-th diagonal of the residuals matrix
         """
         y = convert_to(y, "pd.Series")
 
         y_index = y.index[initial_window:]
 
-        residuals_matrix = pd.DataFrame(columns=y_index, index=y_index, dtype="float")
+        if ids is None:
+            ids = y_index
+            if sample_frac:
+                ids = y_index.to_series().sample(frac=sample_frac).index
+        # windows are computed in temporal order, needed for the update strategies
+        row_locs = np.sort(y_index.get_indexer(ids))
+        ids = y_index[row_locs]
+
+        meta = {"y": y, "X": X, "forecaster": forecaster, "width": width}
+        if self.strategy == "refit":
+            rows = parallelize(
+                fun=_get_window_residuals,
+                iter=list(ids),
+                meta=meta,
+                backend=self.backend,
+                backend_params=self.backend_params,
+            )
+        else:
+            update_params = self.strategy == "update"
+            rows = _get_window_residuals_update(ids, meta, update_params)
 
-        if sample_frac:
-            y_index = y_index.to_series().sample(frac=sample_frac)
+        n_columns = len(y_index) if width is None else width
+        residuals = np.full((len(y_index), n_columns), np.nan)
+        for row_loc, row in zip(row_locs, rows):
+            if row is None:
+                continue
+            # in the matrix, residuals of window i start at column i
+            col_start = row_loc if width is None else 0
+            residuals[row_loc, col_start : col_start + len(row)] = row
 
-        for id in y_index:
-            forecaster = clone(forecaster)
-            y_train = get_slice(y, start=None, end=id)  # subset on which we fit
-            y_test = get_slice(y, start=id, end=None)  # subset on which we predict
+        columns = y_index if width is None else pd.RangeIndex(width)
+        return pd.DataFrame(residuals, index=y_index, columns=columns)
 
-            X_train = get_slice(X, start=None, end=id)
-            X_test = get_slice(X, start=id, end=None)
+    def _extend_sliding_residuals(self, residuals_matrix):
+        """Extend residuals band to the windows of data added in update.
 
-            try:
-                forecaster.fit(y_train, X=X_train, fh=y_test.index)
-            except ValueError:
-                warn(
-                    f"Couldn't fit the model on "
-                    f"time series window length {len(y_train)}.\n"
-                )
-                continue
-            try:
-                residuals_matrix.loc[id] = forecaster.predict_residuals(y_test, X_test)
-            except IndexError:
-                warn(
-                    f"Couldn't predict after fitting on time series of length \
-                     {len(y_train)}.\n"
-                )
+        Computes only rows for windows that are new, or that were incomplete,
+        i.e., have indices after the previous end of the data.
+
+        Parameters
+        ----------
+        residuals_matrix : pd.DataFrame
+            residuals band computed on a past state of self._y, self._X
 
-        return residuals_matrix
+        Returns
+        -------
+        residuals_matrix : pd.DataFrame
+            residuals band on self._y, self._X
+        """
+        y = convert_to(self._y, "pd.Series")
+        y_index = y.index[self.initial_window :]
+        width = len(residuals_matrix.columns)
+
+        new_ids = y_index.difference(residuals_matrix.index)
+        if self.sample_frac:
+            new_ids = new_ids.to_series().sample(frac=self.sample_frac).index
+        # windows that did not have all width indices available, and were computed
+        n_complete = max(len(residuals_matrix) - width + 1, 0)
+        incomplete = residuals_matrix.iloc[n_complete:]
+        incomplete_ids = incomplete.index[incomplete.notna().any(axis=1)]
+
+        residuals = self._compute_sliding_residuals(
+            y=y,
+            X=self._X,
+            forecaster=self.forecaster,
+            initial_window=self.initial_window,
+            sample_frac=None,
+            width=width,
+            ids=incomplete_ids.append(new_ids),
+        )
+        keep_ids = residuals_matrix.index.difference(incomplete_ids)
+        residuals.loc[keep_ids] = residuals_matrix.loc[keep_ids]
+        return residuals
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -350,6 +492,140 @@ class ConformalIntervals(BaseForecaster):
         from sktime.forecasting.naive import NaiveForecaster
 
         FORECASTER = NaiveForecaster()
-        params_list = {"forecaster": FORECASTER}
+        params_list = [
+            {"forecaster": FORECASTER},
+            {
+                "forecaster": FORECASTER,
+                "strategy": "update",
+                "residuals_store": "band",
+                "initial_window": 3,
+            },
+        ]
 
         return params_list
+
+
+def _get_slice(obj, start=None, end=None):
+    """Slice obj as get_slice, without mtype checks for pandas Series and DataFrame.
+
+    get_slice checks and converts obj in every call, which dominates the cost of
+    computing residuals of many windows of the same y and X.
+    """
+    if not isinstance(obj, (pd.Series, pd.DataFrame)) or isinstance(
+        obj.index, pd.MultiIndex
+    ):
+        return get_slice(obj, start=start, end=end)
+    select = np.ones(len(obj), dtype=bool)
+    if start is not None:
+        select &= obj.index >= start
+    if end is not None:
+        select &= obj.index < end
+    return obj.iloc[select]
+
+
+def _get_window_residuals(id, meta):
+    """Compute residuals of forecasts of y from id on, fitted to y before id.
+
+    Parameters
+    ----------
+    id : index element of y, start of the window to forecast
+    meta : dict with keys
+        "y" : pd.Series, "X" : sktime compatible time series or None,
+        "forecaster" : forecaster to clone and fit,
+        "width" : int or None, number of indices to forecast, all if None
+
+    Returns
+    -------
+    1D np.ndarray of residuals from id on, or None if fit or predict failed
+    """
+    y = meta["y"]
+    X = meta["X"]
+    width = meta["width"]
+
+    forecaster = clone(meta["forecaster"])
+    y_train = _get_slice(y, start=None, end=id)  # subset on which we fit
+    y_test = _get_slice(y, start=id, end=None)  # subset on which we predict
+    if width is not None:
+        y_test = y_test.iloc[:width]
+
+    X_train = _get_slice(X, start=None, end=id)
+    X_test = _get_slice(X, start=id, end=None)
+
+    try:
+        forecaster.fit(y_train, X=X_train, fh=y_test.index)
+    except ValueError:
+        warn(
+            f"Couldn't fit the model on " f"time series window length {len(y_train)}.\n"
+        )
+        return None
+    try:
+        residuals = forecaster.predict_residuals(y_test, X_test)
+    except IndexError:
+        warn(
+            f"Couldn't predict after fitting on time series of length \
+             {len(y_train)}.\n"
+        )
+        return None
+    return np.asarray(residuals, dtype="float").reshape(-1)
+
+
+def _get_window_residuals_update(ids, meta, update_params=True):
+    """Compute residuals of all windows, fitting once and updating in between.
+
+    Parameters
+    ----------
+    ids : pd.Index, sorted index elements of y, starts of the windows to forecast
+    meta : dict, as in _get_window_residuals
+    update_params : bool, optional, default=True
+        whether parameters of the forecaster are updated in update
+
+    Returns
+    -------
+    list of residuals for windows in ids, as returned by _get_window_residuals
+    """
+    if len(ids) == 0:
+        return []
+
+    y = meta["y"]
+    X = meta["X"]
+    width = meta["width"]
+    if width is None:
+        width = len(_get_slice(y, start=ids[0], end=None))
+    fh = list(range(1, width + 1))
+
+    forecaster = clone(meta["forecaster"])
+    cutoff_id = None
+    rows = []
+    for id in ids:
+        y_test = _get_slice(y, start=id, end=None).iloc[:width]
+        X_test = _get_slice(X, start=id, end=None)
+        try:
+            if cutoff_id is None:
+                y_train = _get_slice(y, start=None, end=id)
+                X_train = _get_slice(X, start=None, end=id)
+                forecaster.fit(y_train, X=X_train, fh=fh)
+            else:
+                y_new = _get_slice(y, start=cutoff_id, end=id)
+                X_new = _get_slice(X, start=cutoff_id, end=id)
+                forecaster.update(y_new, X=X_new, update_params=update_params)
+        except ValueError:
+            warn(f"Couldn't fit or update the model on window ending before {id}.\n")
+            rows.append(None)
+            continue
+        cutoff_id = id
+
+        # at the end of y, only the horizons that have observations are predicted,
+        # unless the forecaster requires the fh in fit to be the same in predict
+        fh_window = fh
+        if len(y_test) < width and not forecaster.get_tag("requires-fh-in-fit"):
+            fh_window = y_test.index
+        try:
+            y_pred = forecaster.predict(fh=fh_window, X=X_test)
+        except (IndexError, ValueError):
+            warn(f"Couldn't predict the window starting at {id}.\n")
+            rows.append(None)
+            continue
+        y_pred = np.asarray(y_pred, dtype="float").reshape(-1)[: len(y_test)]
+        rows.append(y_test.to_numpy(dtype="float") - y_pred)
+
+    return rows
@@ -6,6 +6,7 @@
 __all__ = ["ExponentialSmoothing"]
 __author__ = ["mloning", "big-o"]
 
+import numpy as np
 from statsmodels.tsa.holtwinters import ExponentialSmoothing as _ExponentialSmoothing
 
 from sktime.forecasting.base.adapters import _StatsModelsAdapter
@@ -166,6 +167,22 @@ class ExponentialSmoothing(_StatsModelsAdapter):
 
         super().__init__(random_state=random_state)
 
+        # without optimization, simple and Holt's linear exponential smoothing
+        # are recursions that can be computed for many series at once
+        batch_panel = (
+            not optimized
+            and trend in [None, "add", "additive"]
+            and not damped_trend
+            and seasonal is None
+            and not use_boxcox
+            and initialization_method in ["known", "legacy-heuristic"]
+            and smoothing_level is not None
+            and (trend is None or smoothing_trend is not None)
+            and not remove_bias
+        )
+        if batch_panel:
+            self.set_tags(**{"capability:batch_panel": True})
+
     def _fit_forecaster(self, y, X=None):
         self._forecaster = _ExponentialSmoothing(
             y,
@@ -192,3 +209,53 @@ class ExponentialSmoothing(_StatsModelsAdapter):
             minimize_kwargs=self.minimize_kwargs,
             use_brute=self.use_brute,
         )
+
+    def _fit_batch(self, Y):
+        """Fit to all series of an aligned panel at once.
+
+        Only used without optimization, for simple or Holt's linear exponential
+        smoothing, computes the smoothing recursion for all series at once.
+
+        Parameters
+        ----------
+        Y : 2D np.ndarray of shape (n_series, n_timepoints)
+            values of all series, with the time index of self._y, without NaN
+        """
+        alpha = self.smoothing_level
+        beta = self.smoothing_trend
+        has_trend = self.trend is not None
+
+        if self.initialization_method == "known":
+            level = np.full(Y.shape[0], self.initial_level, dtype="float")
+            slope = np.full(Y.shape[0], self.initial_trend if has_trend else 0.0)
+        else:  # "legacy-heuristic"
+            level = Y[:, 0].copy()
+            slope = Y[:, 1] - Y[:, 0] if has_trend else np.zeros(Y.shape[0])
+
+        for t in range(Y.shape[1]):
+            prev_level = level
+            level = alpha * Y[:, t] + (1 - alpha) * (level + slope)
+            if has_trend:
+                slope = beta * (level - prev_level) + (1 - beta) * slope
+
+        self._level_batch = level
+        self._slope_batch = slope
+        return self
+
+    def _predict_batch(self, fh):
+        """Forecast all series fitted in _fit_batch at once.
+
+        Parameters
+        ----------
+        fh : ForecastingHorizon
+            The forecasting horizon with the steps ahead to to predict.
+
+        Returns
+        -------
+        Y_pred : 2D np.ndarray of shape (n_series, len(fh)), or None
+            point predictions, i-th row for i-th series; None if fh is in-sample
+        """
+        if not fh.is_all_out_of_sample(self.cutoff):
+            return None
+        steps = fh.to_relative(self.cutoff).to_numpy()
+        return self._level_batch[:, None] + np.outer(self._slope_batch, steps)
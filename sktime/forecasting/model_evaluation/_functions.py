@@ -7,13 +7,16 @@ __author__ = ["aiwalter", "mloning"]
 __all__ = ["evaluate"]
 
 import time
+import tracemalloc
 import warnings
 
 import numpy as np
 import pandas as pd
+from joblib import effective_n_jobs
 
 from sktime.exceptions import FitFailedWarning
 from sktime.forecasting.base import ForecastingHorizon
+from sktime.utils.parallel import parallelize
 from sktime.utils.validation.forecasting import (
     check_cv,
     check_fh,
@@ -32,6 +35,10 @@ def evaluate(
     scoring=None,
     return_data=False,
     error_score=np.nan,
+    backend=None,
+    backend_params=None,
+    return_generator=False,
+    measure_memory=False,
 ):
     """Evaluate forecaster using timeseries cross-validation.
 
@@ -50,6 +57,8 @@ def evaluate(
         "refit" = forecaster is refitted to each training window
         "update" = forecaster is updated with training window data, in sequence provided
         "no-update_params" = fit to first training window, re-used without fit or update
+        With "update" and "no-update_params", only the observations of the training
+        window that are later than the cutoff of the forecaster are passed to update.
     scoring : subclass of sktime.performance_metrics.BaseMetric, default=None.
         Used to get a score function that takes y_pred and y_test arguments
         and accept y_train as keyword argument.
@@ -62,12 +71,32 @@ def evaluate(
         Value to assign to the score if an exception occurs in estimator fitting. If set
         to "raise", the exception is raised. If a numeric value is given,
         FitFailedWarning is raised.
+    backend : str, optional, default=None
+        Parallelization backend for the loop over folds, only used if
+        strategy="refit". The update strategies carry state from fold to fold,
+        so their folds are always evaluated sequentially.
+        None or "None" loops sequentially; "loky", "multiprocessing" and
+        "threading" use `joblib.Parallel` with the respective backend.
+        See `sktime.utils.parallel.parallelize` for details.
+    backend_params : dict, optional, default=None
+        Parameters passed to the backend, e.g., `n_jobs` for joblib backends.
+    return_generator : bool, default=False
+        If False, returns results for all folds as one pd.DataFrame.
+        If True, returns a generator which yields the results of one fold at a time,
+        as a single row pd.DataFrame, in the order of folds, as they are computed.
+        With a parallel backend, folds are computed in batches of size n_jobs.
+    measure_memory : bool, default=False
+        If True, adds a column "peak_memory" to the results, with the peak memory in
+        bytes allocated by python during the fold, measured by `tracemalloc`.
+        Includes splitting, fitting, predicting and scoring. Measurement slows down
+        evaluation; with the "threading" backend, concurrent folds are not separated.
 
     Returns
     -------
-    pd.DataFrame
+    pd.DataFrame, or generator of pd.DataFrame if return_generator=True
         DataFrame that contains several columns with information regarding each
         refit/update and prediction of the forecaster.
+        If return_generator=True, generator yields one row of that DataFrame per fold.
 
     Examples
     --------
@@ -115,119 +144,306 @@ def evaluate(
     # Define score name.
     score_name = "test_" + scoring.name
 
-    # Initialize dataframe.
-    results = []
-
-    # Run temporal cross-validation.
-    for i, (train, test) in enumerate(cv.split(y)):
+    meta = {
+        "forecaster": forecaster,
+        "y": y,
+        "X": X,
+        # checked once, a relative fh is re-used in all folds without conversion
+        "fh": check_fh(cv.fh, freq=y.index),
+        "strategy": strategy,
+        "scoring": scoring,
+        "score_name": score_name,
+        "return_data": return_data,
+        "error_score": error_score,
+        "measure_memory": measure_memory,
+    }
+
+    results = _evaluate_folds(
+        enumerate(cv.split(y)),
+        meta=meta,
+        backend=backend if strategy == "refit" else None,
+        backend_params=backend_params,
+        lazy=return_generator,
+    )
 
-        # set default result values in case estimator fitting fails
-        score = error_score
-        fit_time = np.nan
-        pred_time = np.nan
-        cutoff = np.nan
-        y_pred = np.nan
+    if return_generator:
+        return (_postprocess_results(pd.DataFrame([r]), return_data) for r in results)
+    else:
+        results = _postprocess_results(pd.DataFrame(list(results)), return_data)
+        return results
 
-        # split data
-        y_train, y_test, X_train, X_test = _split(y, X, train, test, cv.fh)
 
-        # create forecasting horizon
-        fh = ForecastingHorizon(y_test.index, is_relative=False)
+def _evaluate_folds(folds, meta, backend=None, backend_params=None, lazy=False):
+    """Evaluate forecaster on all folds, yield dict of results per fold.
 
-        try:
-            # fit/update
-            start_fit = time.perf_counter()
-            if i == 0 or strategy == "refit":
-                forecaster = forecaster.clone()
-                forecaster.fit(y_train, X_train, fh=fh)
-
-            else:  # if strategy in ["update", "no-update_params"]:
-                update_params = strategy == "update"
-                forecaster.update(y_train, X_train, update_params=update_params)
-            fit_time = time.perf_counter() - start_fit
-
-            pred_type = {
-                "pred_quantiles": "forecaster.predict_quantiles",
-                "pred_intervals": "forecaster.predict_interval",
-                "pred_proba": "forecaster.predict_proba",
-                None: "forecaster.predict",
-            }
-            # predict
-            start_pred = time.perf_counter()
-
-            if hasattr(scoring, "metric_args"):
-                metric_args = scoring.metric_args
-
-            try:
-                scitype = scoring.get_tag("scitype:y_pred")
-            except ValueError:
-                # If no scitype exists then metric is not proba and no args needed
-                scitype = None
-                metric_args = {}
-
-            y_pred = eval(pred_type[scitype])(fh, X_test, **metric_args)
-
-            pred_time = time.perf_counter() - start_pred
-
-            # score
-            score = scoring(y_test, y_pred, y_train=y_train)
-
-            # cutoff
-            cutoff = forecaster.cutoff
-
-        except Exception as e:
-            if error_score == "raise":
-                raise e
-            else:
-                warnings.warn(
-                    f"""
-                Fitting of forecaster failed, you can set error_score='raise' to see
-                the exception message. Fit failed for len(y_train)={len(y_train)}.
-                The score will be set to {error_score}.
-                Failed forecaster: {forecaster}.
-                """,
-                    FitFailedWarning,
-                )
-
-        # save results
-        results.append(
-            {
-                score_name: score,
-                "fit_time": fit_time,
-                "pred_time": pred_time,
-                "len_train_window": len(y_train),
-                "cutoff": cutoff,
-                "y_train": y_train if return_data else np.nan,
-                "y_test": y_test if return_data else np.nan,
-                "y_pred": y_pred if return_data else np.nan,
-            }
+    Parameters
+    ----------
+    folds : iterable of (int, (train, test)), enumerated output of cv.split
+    meta : dict, arguments passed to _evaluate_window, see there
+    backend : str, optional, parallelization backend passed to parallelize
+        must be None if meta["strategy"] is not "refit"
+    backend_params : dict, optional, parameters passed to parallelize
+    lazy : bool, default=False
+        whether folds should be evaluated in batches as the generator is consumed,
+        or all at once in a single parallelize call
+
+    Yields
+    ------
+    dict with results of evaluation for one fold, in the order of folds
+    """
+    if backend in [None, "None"]:
+        # sequential loop, forecaster is passed on from fold to fold for update
+        meta = meta.copy()
+        for fold in folds:
+            result, forecaster = _evaluate_window(fold, meta)
+            meta["forecaster"] = forecaster
+            yield result
+        return
+
+    if lazy:
+        n_jobs = (backend_params or {}).get("n_jobs", -1)
+        batch_size = effective_n_jobs(n_jobs)
+    else:
+        folds = list(folds)
+        batch_size = max(len(folds), 1)
+
+    for batch in _batched(folds, batch_size):
+        batch_results = parallelize(
+            fun=_evaluate_window,
+            iter=batch,
+            meta=meta,
+            backend=backend,
+            backend_params=backend_params,
         )
+        for result, _ in batch_results:
+            yield result
+
+
+def _batched(iterable, n):
+    """Yield consecutive lists of length n from iterable, last list can be shorter."""
+    batch = []
+    for x in iterable:
+        batch.append(x)
+        if len(batch) == n:
+            yield batch
+            batch = []
+    if len(batch) > 0:
+        yield batch
+
+
+def _evaluate_window(fold, meta):
+    """Fit/update, predict and score the forecaster on one cv fold.
+
+    Defined at module level, so it can be pickled by process backends.
+
+    Parameters
+    ----------
+    fold : tuple of (int, (train, test))
+        index of fold, and iloc indices of training and test window
+    meta : dict with keys
+        "forecaster" : forecaster to evaluate, fitted if the fold is not the first
+            and strategy is not "refit"
+        "y", "X", "fh", "strategy", "scoring", "return_data", "error_score" :
+            arguments of evaluate, with "fh" being the fh of the cv splitter
+        "score_name" : str, name of score column in results
+        "measure_memory" : bool, whether to add peak memory of the fold to result
 
-    results = pd.DataFrame(results)
-    # post-processing of results
+    Returns
+    -------
+    result : dict with results for the fold, keys are columns of evaluate return
+    forecaster : forecaster after fitting/updating on the fold
+    """
+    if not meta.get("measure_memory", False):
+        return _fit_predict_score(fold, meta)
+
+    tracing_before = tracemalloc.is_tracing()
+    if not tracing_before:
+        tracemalloc.start()
+    # reset_peak is only available for python 3.9 and above
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+    mem_start = tracemalloc.get_traced_memory()[0]
+
+    try:
+        result, forecaster = _fit_predict_score(fold, meta)
+        result["peak_memory"] = tracemalloc.get_traced_memory()[1] - mem_start
+    finally:
+        if not tracing_before:
+            tracemalloc.stop()
+
+    return result, forecaster
+
+
+def _fit_predict_score(fold, meta):
+    """Fit/update, predict and score the forecaster on one cv fold.
+
+    Same as _evaluate_window, but without memory measurement, see there.
+    """
+    i, (train, test) = fold
+    forecaster = meta["forecaster"]
+    y = meta["y"]
+    X = meta["X"]
+    strategy = meta["strategy"]
+    scoring = meta["scoring"]
+    error_score = meta["error_score"]
+    return_data = meta["return_data"]
+
+    # set default result values in case estimator fitting fails
+    score = error_score
+    fit_time = np.nan
+    pred_time = np.nan
+    cutoff = np.nan
+    y_pred = np.nan
+
+    # split data
+    y_train, y_test, X_train, X_test = _split(y, X, train, test, meta["fh"])
+
+    # create forecasting horizon
+    fh = _get_fold_fh(meta["fh"], y_train, y_test)
+
+    try:
+        # fit/update
+        start_fit = time.perf_counter()
+        if i == 0 or strategy == "refit":
+            forecaster = forecaster.clone()
+            forecaster.fit(y_train, X_train, fh=fh)
+
+        else:  # if strategy in ["update", "no-update_params"]:
+            update_params = strategy == "update"
+            # the forecaster has seen y up to its cutoff, pass only the new rows
+            y_new, X_new = _new_observations(y_train, X_train, forecaster.cutoff)
+            forecaster.update(y_new, X_new, update_params=update_params)
+        fit_time = time.perf_counter() - start_fit
+
+        pred_type = {
+            "pred_quantiles": "forecaster.predict_quantiles",
+            "pred_intervals": "forecaster.predict_interval",
+            "pred_proba": "forecaster.predict_proba",
+            None: "forecaster.predict",
+        }
+        # predict
+        start_pred = time.perf_counter()
+
+        if hasattr(scoring, "metric_args"):
+            metric_args = scoring.metric_args
+
+        try:
+            scitype = scoring.get_tag("scitype:y_pred")
+        except ValueError:
+            # If no scitype exists then metric is not proba and no args needed
+            scitype = None
+            metric_args = {}
+
+        y_pred = eval(pred_type[scitype])(fh, X_test, **metric_args)
+
+        pred_time = time.perf_counter() - start_pred
+
+        # score
+        score = scoring(y_test, y_pred, y_train=y_train)
+
+        # cutoff
+        cutoff = forecaster.cutoff
+
+    except Exception as e:
+        if error_score == "raise":
+            raise e
+        else:
+            warnings.warn(
+                f"""
+            Fitting of forecaster failed, you can set error_score='raise' to see
+            the exception message. Fit failed for len(y_train)={len(y_train)}.
+            The score will be set to {error_score}.
+            Failed forecaster: {forecaster}.
+            """,
+                FitFailedWarning,
+            )
+
+    result = {
+        meta["score_name"]: score,
+        "fit_time": fit_time,
+        "pred_time": pred_time,
+        "len_train_window": len(y_train),
+        "cutoff": cutoff,
+        "y_train": y_train if return_data else np.nan,
+        "y_test": y_test if return_data else np.nan,
+        "y_pred": y_pred if return_data else np.nan,
+    }
+
+    return result, forecaster
+
+
+def _postprocess_results(results, return_data):
+    """Drop data columns if not requested and coerce column types, in results."""
     if not return_data:
         results = results.drop(columns=["y_train", "y_test", "y_pred"])
     results["len_train_window"] = results["len_train_window"].astype(int)
-
     return results
 
 
+def _get_fold_fh(fh, y_train, y_test):
+    """Get the absolute forecasting horizon of a fold, from the test window index.
+
+    A relative fh, checked once for all folds, is converted against the cutoff of
+    the fold, which avoids constructing and checking a new fh from y_test.index.
+    The fh is constructed from y_test.index if the conversion fails, e.g., for an
+    index without freq, or does not give y_test.index.
+
+    Parameters
+    ----------
+    fh : ForecastingHorizon, or object coercible by check_fh, fh of the cv splitter
+    y_train : pd.Series or pd.DataFrame, training window of the fold
+    y_test : pd.Series or pd.DataFrame, test window of the fold
+
+    Returns
+    -------
+    fh : absolute ForecastingHorizon, with values equal to y_test.index
+    """
+    if isinstance(fh, ForecastingHorizon) and fh.is_relative:
+        try:
+            fh_abs = fh.to_absolute(y_train.index[-1])
+        except (TypeError, ValueError):
+            fh_abs = None
+        if fh_abs is not None and fh_abs.to_pandas().equals(y_test.index):
+            return fh_abs
+    return ForecastingHorizon(y_test.index, is_relative=False)
+
+
 def _split(y, X, train, test, fh):
-    """Split y and X for given train and test set indices."""
-    y_train = y.iloc[train]
-    y_test = y.iloc[test]
+    """Split y and X for given train and test set indices.
 
-    cutoff = y_train.index[-1]
-    fh = check_fh(fh)
-    fh = fh.to_relative(cutoff)
+    Contiguous train and test windows are sliced, which returns views into y and X,
+    instead of copies, for numpy backed pandas objects.
+
+    Parameters
+    ----------
+    y : pd.Series or pd.DataFrame, endogenous time series
+    X : pd.DataFrame or None, exogenous time series
+    train : np.ndarray of int, iloc indices of training window
+    test : np.ndarray of int, iloc indices of test window
+    fh : ForecastingHorizon, or object coercible by check_fh
+        if relative ForecastingHorizon, is used as is, without checks or conversion,
+        so checks and coercion can be carried out once for all folds by the caller
+
+    Returns
+    -------
+    y_train, y_test, X_train, X_test : iloc subsets of y and X
+        X_train, X_test are None if X is None
+    """
+    y_train = _iloc_view(y, train)
+    y_test = _iloc_view(y, test)
+
+    if not isinstance(fh, ForecastingHorizon) or not fh.is_relative:
+        cutoff = y_train.index[-1]
+        fh = check_fh(fh)
+        fh = fh.to_relative(cutoff)
 
     if X is not None:
-        X_train = X.iloc[train, :]
+        X_train = _iloc_view(X, train)
 
         # We need to expand test indices to a full range, since some forecasters
         # require the full range of exogenous values.
-        test = np.arange(test[0] - fh.min(), test[-1]) + 1
-        X_test = X.iloc[test, :]
+        # the expanded range is contiguous, hence always sliced
+        X_test = X.iloc[test[0] - fh.min() + 1 : test[-1] + 1]
     else:
         X_train = None
         X_test = None
@@ -235,6 +451,46 @@ def _split(y, X, train, test, fh):
     return y_train, y_test, X_train, X_test
 
 
+def _new_observations(y_train, X_train, cutoff):
+    """Return rows of y_train and X_train with time index later than cutoff.
+
+    Parameters
+    ----------
+    y_train : pd.Series or pd.DataFrame, training window, with monotonic index
+    X_train : pd.DataFrame or None, exogenous data of training window, same index
+    cutoff : index element of y_train, cutoff of forecaster before the update
+
+    Returns
+    -------
+    y_new, X_new : views of y_train and X_train, X_new is None if X_train is None
+    """
+    start = y_train.index.searchsorted(cutoff, side="right")
+    y_new = y_train.iloc[start:]
+    X_new = None if X_train is None else X_train.iloc[start:]
+    return y_new, X_new
+
+
+def _iloc_view(obj, iloc):
+    """Return obj.iloc[iloc], as a slice (view) if iloc is a contiguous range.
+
+    Parameters
+    ----------
+    obj : pd.Series or pd.DataFrame
+    iloc : np.ndarray of int, iloc indices to subset obj with
+
+    Returns
+    -------
+    obj.iloc[iloc], a view of obj if iloc is contiguous and increasing
+    """
+    iloc = np.asarray(iloc)
+    n = len(iloc)
+    is_contiguous = n > 0 and iloc[-1] - iloc[0] == n - 1
+    if is_contiguous and np.all(np.diff(iloc) == 1):
+        return obj.iloc[iloc[0] : iloc[-1] + 1]
+    else:
+        return obj.iloc[iloc]
+
+
 def _check_strategy(strategy):
     """Assert strategy value.
 
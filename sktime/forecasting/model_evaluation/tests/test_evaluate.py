@@ -12,6 +12,10 @@ __all__ = [
     "test_evaluate_common_configs",
     "test_evaluate_initial_window",
     "test_evaluate_no_exog_against_with_exog",
+    "test_evaluate_backend_and_generator",
+    "test_split_contiguous_views",
+    "test_evaluate_measure_memory",
+    "test_evaluate_update_new_observations",
 ]
 
 import numpy as np
@@ -23,6 +27,7 @@ from sktime.exceptions import FitFailedWarning
 from sktime.forecasting.arima import ARIMA
 from sktime.forecasting.exp_smoothing import ExponentialSmoothing
 from sktime.forecasting.model_evaluation import evaluate
+from sktime.forecasting.model_evaluation._functions import _get_fold_fh, _split
 from sktime.forecasting.model_selection import (
     ExpandingWindowSplitter,
     SlidingWindowSplitter,
@@ -34,7 +39,9 @@ from sktime.performance_metrics.forecasting import (
     MeanAbsoluteScaledError,
 )
 from sktime.utils._testing.forecasting import make_forecasting_problem
+from sktime.utils.parallel import _get_parallel_test_fixtures
 from sktime.utils.validation._dependencies import _check_estimator_deps
+from sktime.utils.validation.forecasting import check_fh
 
 
 def _check_evaluate_output(out, cv, y, scoring):
@@ -196,3 +203,113 @@ def test_evaluate_error_score(error_score, return_data, strategy):
                 error_score=error_score,
                 strategy=strategy,
             )
+
+
+@pytest.mark.parametrize("backend", _get_parallel_test_fixtures())
+@pytest.mark.parametrize("return_generator", [True, False])
+def test_evaluate_backend_and_generator(backend, return_generator):
+    """Test that evaluate gives same results for all backends and generator mode."""
+    y = load_airline()
+    forecaster = NaiveForecaster(strategy="drift")
+    cv = ExpandingWindowSplitter(initial_window=24, step_length=12, fh=[1, 2, 3])
+    scoring = MeanAbsolutePercentageError(symmetric=True)
+
+    expected = evaluate(forecaster=forecaster, y=y, cv=cv, scoring=scoring)
+
+    out = evaluate(
+        forecaster=forecaster,
+        y=y,
+        cv=cv,
+        scoring=scoring,
+        return_generator=return_generator,
+        **backend,
+    )
+
+    if return_generator:
+        out = list(out)
+        assert len(out) == cv.get_n_splits(y)
+        assert all(isinstance(x, pd.DataFrame) and len(x) == 1 for x in out)
+        out = pd.concat(out, ignore_index=True)
+
+    _check_evaluate_output(out, cv, y, scoring)
+    non_time_cols = [x for x in expected.columns if not x.endswith("_time")]
+    pd.testing.assert_frame_equal(out[non_time_cols], expected[non_time_cols])
+
+
+def test_split_contiguous_views():
+    """Test that _split slices contiguous windows as views, with same result."""
+    y, X = load_longley()
+    cv = ExpandingWindowSplitter(initial_window=8, step_length=2, fh=[1, 2])
+    fh = check_fh(cv.fh)
+
+    for train, test in cv.split(y):
+        y_train, y_test, X_train, X_test = _split(y, X, train, test, fh)
+
+        # memory check first, as assert_frame_equal may consolidate X_train
+        col = X.columns[0]
+        assert np.shares_memory(y_train.values, y.values)
+        assert np.shares_memory(X_train[col].values, X[col].values)
+
+        pd.testing.assert_series_equal(y_train, y.iloc[train])
+        pd.testing.assert_series_equal(y_test, y.iloc[test])
+        pd.testing.assert_frame_equal(X_train, X.iloc[train])
+        X_test_expected = X.iloc[np.arange(test[0] - fh.min(), test[-1]) + 1]
+        pd.testing.assert_frame_equal(X_test, X_test_expected)
+
+
+@pytest.mark.parametrize("drop_freq", [False, True])
+def test_get_fold_fh(drop_freq):
+    """Test that the fh of a fold is the absolute fh at the test window index."""
+    y = load_airline().to_timestamp(freq="M")
+    if drop_freq:
+        y.index.freq = None
+    cv = ExpandingWindowSplitter(initial_window=24, step_length=12, fh=[1, 2, 6])
+    fh = check_fh(cv.fh, freq=y.index)
+
+    for train, test in cv.split(y):
+        y_train, y_test, _, _ = _split(y, None, train, test, fh)
+        fold_fh = _get_fold_fh(fh, y_train, y_test)
+
+        assert not fold_fh.is_relative
+        pd.testing.assert_index_equal(
+            fold_fh.to_pandas(), y_test.index, check_names=False
+        )
+
+
+def test_evaluate_measure_memory():
+    """Test that evaluate reports peak memory per fold if measure_memory=True."""
+    y = load_airline()
+    cv = ExpandingWindowSplitter(initial_window=24, step_length=24, fh=[1, 2, 3])
+    scoring = MeanAbsolutePercentageError(symmetric=True)
+
+    out = evaluate(NaiveForecaster(), cv, y, scoring=scoring, measure_memory=True)
+
+    assert "peak_memory" in out.columns
+    assert len(out) == cv.get_n_splits(y)
+    assert np.all(out["peak_memory"] > 0)
+
+
+@pytest.mark.parametrize("strategy", ["update", "no-update_params"])
+def test_evaluate_update_new_observations(strategy, monkeypatch):
+    """Test that update strategies pass only new observations to update."""
+    y, X = load_longley()
+    cv = ExpandingWindowSplitter(initial_window=6, step_length=2, fh=[1, 2])
+    scoring = MeanAbsolutePercentageError(symmetric=True)
+
+    update_lengths = []
+    update = NaiveForecaster.update
+
+    def _update(self, y, X=None, update_params=True):
+        update_lengths.append((len(y), len(X)))
+        return update(self, y, X, update_params=update_params)
+
+    monkeypatch.setattr(NaiveForecaster, "update", _update)
+    out = evaluate(NaiveForecaster(), cv, y, X, strategy=strategy, scoring=scoring)
+
+    # after fitting in the first fold, every fold adds step_length observations
+    assert update_lengths == [(2, 2)] * (cv.get_n_splits(y) - 1)
+
+    # the naive forecaster predicts the same after update and refit
+    expected = evaluate(NaiveForecaster(), cv, y, X, scoring=scoring)
+    score = f"test_{scoring.name}"
+    pd.testing.assert_series_equal(out[score], expected[score])
@@ -12,6 +12,7 @@ __all__ = [
     "ExpandingWindowSplitter",
     "ForecastingGridSearchCV",
     "ForecastingRandomizedSearchCV",
+    "ForecastingSuccessiveHalvingCV",
 ]
 
 from sktime.forecasting.model_selection._split import ExpandingWindowSplitter
@@ -21,3 +22,4 @@ from sktime.forecasting.model_selection._split import SlidingWindowSplitter
 from sktime.forecasting.model_selection._split import temporal_train_test_split
 from sktime.forecasting.model_selection._tune import ForecastingGridSearchCV
 from sktime.forecasting.model_selection._tune import ForecastingRandomizedSearchCV
+from sktime.forecasting.model_selection._tune import ForecastingSuccessiveHalvingCV
@@ -4,19 +4,27 @@
 """Implements grid search functionality to tune forecasters."""
 
 __author__ = ["mloning"]
-__all__ = ["ForecastingGridSearchCV", "ForecastingRandomizedSearchCV"]
-
+__all__ = [
+    "ForecastingGridSearchCV",
+    "ForecastingRandomizedSearchCV",
+    "ForecastingSuccessiveHalvingCV",
+]
+
+import time
+import warnings
 from collections.abc import Sequence
 
 import numpy as np
 import pandas as pd
 from joblib import Parallel, delayed
-from sklearn.model_selection import ParameterGrid, ParameterSampler, check_cv
+from sklearn.model_selection import ParameterGrid, ParameterSampler
 
-from sktime.exceptions import NotFittedError
+from sktime.exceptions import FitFailedWarning, NotFittedError
+from sktime.forecasting.base import ForecastingHorizon
 from sktime.forecasting.base._delegate import _DelegatedForecaster
-from sktime.forecasting.model_evaluation import evaluate
-from sktime.utils.validation.forecasting import check_scoring
+from sktime.forecasting.model_evaluation._functions import _evaluate_folds, _split
+from sktime.utils._testing.deep_equals import deep_equals
+from sktime.utils.validation.forecasting import check_cv, check_fh, check_scoring
 
 
 class BaseGridSearch(_DelegatedForecaster):
@@ -43,6 +51,7 @@ class BaseGridSearch(_DelegatedForecaster):
         return_n_best_forecasters=1,
         update_behaviour="full_refit",
         error_score=np.nan,
+        cache_transformers=False,
     ):
 
         self.forecaster = forecaster
@@ -57,6 +66,7 @@ class BaseGridSearch(_DelegatedForecaster):
         self.return_n_best_forecasters = return_n_best_forecasters
         self.update_behaviour = update_behaviour
         self.error_score = error_score
+        self.cache_transformers = cache_transformers
         super(BaseGridSearch, self).__init__()
         tags_to_clone = [
             "requires-fh-in-fit",
@@ -87,6 +97,8 @@ class BaseGridSearch(_DelegatedForecaster):
             raise NotFittedError
 
         if self._is_vectorized:
+            # forecasters_ is not fitted yet if self was fitted in batch mode
+            self._unbatch()
             return {"forecasters_": self.forecasters_}
 
         fitted_params = {}
@@ -97,9 +109,22 @@ class BaseGridSearch(_DelegatedForecaster):
         fitted_params = {**fitted_params, **self.best_params_}
         return fitted_params
 
+    def _use_transformer_cache(self, scoring):
+        """Whether transformers are cached across candidates, see _TransformerCache.
+
+        Requires cache_transformers=True, the "refit" strategy, and a point forecast
+        metric, since cached transformers are only used to inverse point forecasts.
+        """
+        is_point_metric = scoring.get_tag("scitype:y_pred", raise_error=False) is None
+        return self.cache_transformers and self.strategy == "refit" and is_point_metric
+
     def _run_search(self, evaluate_candidates):
         raise NotImplementedError("abstract method")
 
+    def _rank_results(self, results, scoring_name, lower_is_better):
+        """Rank candidates in results, rank 1 is best, nan if score is nan."""
+        return results.loc[:, f"mean_{scoring_name}"].rank(ascending=lower_is_better)
+
     def _fit(self, y, X=None, fh=None):
         """Fit to training data.
 
@@ -116,7 +141,7 @@ class BaseGridSearch(_DelegatedForecaster):
         -------
         self : returns an instance of self.
         """
-        cv = check_cv(self.cv)
+        cv = check_cv(self.cv, enforce_start_with_window=True)
 
         scoring = check_scoring(self.scoring)
         scoring_name = f"test_{scoring.name}"
@@ -125,42 +150,55 @@ class BaseGridSearch(_DelegatedForecaster):
             n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch, backend=self.backend
         )
 
-        def _fit_and_score(params):
+        # folds are split once, and evaluated per (candidate, fold) pair
+        folds = list(cv.split(y))
+        self.n_splits_ = len(folds)
+        meta = {
+            "y": y,
+            "X": X,
+            "fh": check_fh(cv.fh),
+            "strategy": self.strategy,
+            "scoring": scoring,
+            "score_name": scoring_name,
+            "return_data": False,
+            "error_score": self.error_score,
+        }
+        if self._use_transformer_cache(scoring):
+            cache = _TransformerCache()
+        else:
+            cache = None
+
+        def _fit_and_score(params, fold_ids):
             # Clone forecaster.
             forecaster = self.forecaster.clone()
 
             # Set parameters.
             forecaster.set_params(**params)
 
-            # Evaluate.
-            out = evaluate(
-                forecaster,
-                cv,
-                y,
-                X,
-                strategy=self.strategy,
-                scoring=scoring,
-                error_score=self.error_score,
-            )
+            # Evaluate on folds, in sequence, as the strategy may be "update".
+            fold_iter = [(i, folds[i]) for i in fold_ids]
+            if cache is not None and _get_cacheable_steps(forecaster) is not None:
+                out = [
+                    _fit_predict_score_cached(f, forecaster, meta, cache)
+                    for f in fold_iter
+                ]
+            else:
+                fold_meta = {**meta, "forecaster": forecaster}
+                out = list(_evaluate_folds(fold_iter, meta=fold_meta))
 
             # Filter columns.
-            out = out.filter(items=[scoring_name, "fit_time", "pred_time"], axis=1)
-
-            # Aggregate results.
-            out = out.mean()
-            out = out.add_prefix("mean_")
-
-            # Add parameters to output table.
-            out["params"] = params
+            out = pd.DataFrame(out, index=fold_ids)
+            return out.filter(items=[scoring_name, "fit_time", "pred_time"], axis=1)
 
-            return out
-
-        def evaluate_candidates(candidate_params):
+        def evaluate_candidates(candidate_params, fold_ids=None, return_folds=False):
             candidate_params = list(candidate_params)
+            if fold_ids is None:
+                fold_ids = range(len(folds))
+            fold_ids = list(fold_ids)
 
             if self.verbose > 0:
                 n_candidates = len(candidate_params)
-                n_splits = cv.get_n_splits(y)
+                n_splits = len(fold_ids)
                 print(  # noqa
                     "Fitting {0} folds for each of {1} candidates,"
                     " totalling {2} fits".format(
@@ -168,17 +206,40 @@ class BaseGridSearch(_DelegatedForecaster):
                     )
                 )
 
-            out = parallel(
-                delayed(_fit_and_score)(params) for params in candidate_params
+            # with "refit", folds are independent, and tasks are (candidate, fold)
+            # pairs, otherwise a task runs all folds of one candidate in sequence
+            if self.strategy == "refit":
+                tasks = [
+                    (c, [i]) for c in range(len(candidate_params)) for i in fold_ids
+                ]
+            else:
+                tasks = [(c, fold_ids) for c in range(len(candidate_params))]
+
+            task_out = parallel(
+                delayed(_fit_and_score)(candidate_params[c], ids) for c, ids in tasks
             )
 
-            if len(out) < 1:
+            if len(task_out) < 1:
                 raise ValueError(
                     "No fits were performed. "
                     "Was the CV iterator empty? "
                     "Were there no candidates?"
                 )
 
+            fold_out = [[] for _ in candidate_params]
+            for (c, _), out in zip(tasks, task_out):
+                fold_out[c].append(out)
+            fold_out = [pd.concat(out) for out in fold_out]
+            if return_folds:
+                return fold_out
+
+            out = []
+            for params, fold_results in zip(candidate_params, fold_out):
+                # Aggregate results.
+                result = fold_results.mean().add_prefix("mean_")
+                # Add parameters to output table.
+                result["params"] = params
+                out.append(result)
             return out
 
         # Run grid-search cross-validation.
@@ -187,8 +248,8 @@ class BaseGridSearch(_DelegatedForecaster):
         results = pd.DataFrame(results)
 
         # Rank results, according to whether greater is better for the given scoring.
-        results[f"rank_{scoring_name}"] = results.loc[:, f"mean_{scoring_name}"].rank(
-            ascending=scoring.get_tag("lower_is_better")
+        results[f"rank_{scoring_name}"] = self._rank_results(
+            results, scoring_name, scoring.get_tag("lower_is_better")
         )
 
         self.cv_results_ = results
@@ -328,6 +389,17 @@ class ForecastingGridSearchCV(BaseGridSearch):
         Value to assign to the score if an exception occurs in estimator fitting. If set
         to "raise", the exception is raised. If a numeric value is given,
         FitFailedWarning is raised.
+    cache_transformers : bool, optional (default=False)
+        Whether to share fitted transformers across candidates, if forecaster is a
+        TransformedTargetForecaster without transformers after the forecaster.
+        If True, the transformers before the forecaster are fitted once per fold
+        and set of transformer parameters, and re-used by all candidates that only
+        differ in parameters of the forecaster, e.g., a Deseasonalizer is fitted
+        once per fold and not once per candidate and fold.
+        Only used with strategy="refit" and point forecast metrics in scoring.
+        The cache is shared with sequential and threading backends;
+        with process backends, each task has its own cache.
+        Transformers with random state should have a fixed random_state.
 
     Attributes
     ----------
@@ -432,6 +504,7 @@ class ForecastingGridSearchCV(BaseGridSearch):
         backend="loky",
         update_behaviour="full_refit",
         error_score=np.nan,
+        cache_transformers=False,
     ):
         super(ForecastingGridSearchCV, self).__init__(
             forecaster=forecaster,
@@ -446,6 +519,7 @@ class ForecastingGridSearchCV(BaseGridSearch):
             backend=backend,
             update_behaviour=update_behaviour,
             error_score=error_score,
+            cache_transformers=cache_transformers,
         )
         self.param_grid = param_grid
 
@@ -583,6 +657,17 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
         Value to assign to the score if an exception occurs in estimator fitting. If set
         to "raise", the exception is raised. If a numeric value is given,
         FitFailedWarning is raised.
+    cache_transformers : bool, optional (default=False)
+        Whether to share fitted transformers across candidates, if forecaster is a
+        TransformedTargetForecaster without transformers after the forecaster.
+        If True, the transformers before the forecaster are fitted once per fold
+        and set of transformer parameters, and re-used by all candidates that only
+        differ in parameters of the forecaster, e.g., a Deseasonalizer is fitted
+        once per fold and not once per candidate and fold.
+        Only used with strategy="refit" and point forecast metrics in scoring.
+        The cache is shared with sequential and threading backends;
+        with process backends, each task has its own cache.
+        Transformers with random state should have a fixed random_state.
 
     Attributes
     ----------
@@ -619,6 +704,7 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
         backend="loky",
         update_behaviour="full_refit",
         error_score=np.nan,
+        cache_transformers=False,
     ):
         super(ForecastingRandomizedSearchCV, self).__init__(
             forecaster=forecaster,
@@ -633,6 +719,7 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
             backend=backend,
             update_behaviour=update_behaviour,
             error_score=error_score,
+            cache_transformers=cache_transformers,
         )
         self.param_distributions = param_distributions
         self.n_iter = n_iter
@@ -671,3 +758,409 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
             "scoring": MeanAbsolutePercentageError(symmetric=True),
         }
         return params
+
+
+class ForecastingSuccessiveHalvingCV(ForecastingGridSearchCV):
+    """Search over a parameter grid by successive halving over cv folds.
+
+    Successive halving is an iterative selection process, where cv folds are the
+    budget. In the first iteration, all candidates in param_grid are evaluated on
+    the first min_folds folds of cv. Only the best ``1 / factor`` of candidates are
+    kept for the next iteration, where they are evaluated on ``factor`` times as many
+    folds, and so on, until all folds are used or a single candidate is left.
+    Candidates are ranked by their mean score over the folds they are evaluated on.
+
+    With strategy="refit", candidates are only evaluated on folds not seen in earlier
+    iterations, and work is scheduled over (candidate, fold) pairs. With "update" and
+    "no-update_params", folds depend on each other, and candidates are re-evaluated
+    on all folds of the iteration, in sequence.
+
+    Parameters
+    ----------
+    forecaster : estimator object
+        The estimator should implement the sktime or scikit-learn estimator
+        interface. Either the estimator must contain a "score" function,
+        or a scoring function must be passed.
+    cv : cross-validation generator or an iterable
+        e.g. ExpandingWindowSplitter(), the folds are the budget of the search,
+        and are used in the order of cv
+    param_grid : dict or list of dictionaries
+        Model tuning parameters of the forecaster to evaluate
+    factor : int or float, optional (default=3)
+        The proportion of candidates kept in each iteration is ``1 / factor``,
+        and the number of folds is multiplied by factor. Must be larger than 1.
+    min_folds : int, optional (default=1)
+        Number of folds to evaluate all candidates on in the first iteration.
+    scoring: function, optional (default=None)
+        Function to score models for evaluation of optimal parameters
+    strategy : {"refit", "update", "no-update_params"}, optional, default="refit"
+        data ingestion strategy in fitting cv, passed to `evaluate` internally
+        defines the ingestion mode when the forecaster sees new data when window expands
+        "refit" = forecaster is refitted to each training window
+        "update" = forecaster is updated with training window data, in sequence provided
+        "no-update_params" = fit to first training window, re-used without fit or update
+    n_jobs: int, optional (default=None)
+        Number of jobs to run in parallel.
+        None means 1 unless in a joblib.parallel_backend context.
+        -1 means using all processors.
+    refit: bool, optional (default=True)
+        True = refit the forecaster with the best parameters on the entire data in fit
+        False = best forecaster remains fitted on the last fold in cv
+    verbose: int, optional (default=0)
+    return_n_best_forecasters: int, default=1
+        In case the n best forecaster should be returned, this value can be set
+        and the n best forecasters will be assigned to n_best_forecasters_
+    pre_dispatch: str, optional (default='2*n_jobs')
+    backend: str, optional (default="loky")
+        Specify the parallelisation backend implementation in joblib, where
+        "loky" is used by default.
+    update_behaviour: str, optional, default = "full_refit"
+        one of {"full_refit", "inner_only", "no_update"}
+        behaviour of the forecaster when calling update
+        "full_refit" = both tuning parameters and inner estimator refit on all data seen
+        "inner_only" = tuning parameters are not re-tuned, inner estimator is updated
+        "no_update" = neither tuning parameters nor inner estimator are updated
+    error_score : "raise" or numeric, default=np.nan
+        Value to assign to the score if an exception occurs in estimator fitting. If set
+        to "raise", the exception is raised. If a numeric value is given,
+        FitFailedWarning is raised.
+    cache_transformers : bool, optional (default=False)
+        Whether to share fitted transformers across candidates,
+        see ForecastingGridSearchCV.
+
+    Attributes
+    ----------
+    best_index_ : int
+    best_score_: float
+        Score of the best model
+    best_params_ : dict
+        Best parameter values across the parameter grid
+    best_forecaster_ : estimator
+        Fitted estimator with the best parameters
+    cv_results_ : pd.DataFrame
+        Results of the search, one row per candidate, with mean score and times
+        over the folds the candidate was evaluated on, the number of these folds in
+        column "n_folds", and the last iteration the candidate took part in,
+        in column "iter". Candidates of later iterations rank before others.
+    n_splits_: int
+        Number of splits in the data for cross validation
+    n_best_forecasters_: list of tuples ("rank", <forecaster>)
+        The "rank" is in relation to best_forecaster_
+    n_best_scores_: list of float
+        The scores of n_best_forecasters_ sorted from best to worst
+        score of forecasters
+
+    Examples
+    --------
+    >>> from sktime.datasets import load_airline
+    >>> from sktime.forecasting.model_selection import (
+    ...     ExpandingWindowSplitter,
+    ...     ForecastingSuccessiveHalvingCV,
+    ... )
+    >>> from sktime.forecasting.naive import NaiveForecaster
+    >>> y = load_airline()
+    >>> cv = ExpandingWindowSplitter(initial_window=60, step_length=6, fh=[1, 2, 3])
+    >>> forecaster = NaiveForecaster()
+    >>> param_grid = {"strategy": ["last", "mean", "drift"], "sp": [1, 12]}
+    >>> shcv = ForecastingSuccessiveHalvingCV(
+    ...     forecaster=forecaster, param_grid=param_grid, cv=cv, factor=2
+    ... )
+    >>> shcv.fit(y)
+    ForecastingSuccessiveHalvingCV(...)
+    >>> y_pred = shcv.predict(fh=[1, 2, 3])
+    """
+
+    def __init__(
+        self,
+        forecaster,
+        cv,
+        param_grid,
+        factor=3,
+        min_folds=1,
+        scoring=None,
+        strategy="refit",
+        n_jobs=None,
+        refit=True,
+        verbose=0,
+        return_n_best_forecasters=1,
+        pre_dispatch="2*n_jobs",
+        backend="loky",
+        update_behaviour="full_refit",
+        error_score=np.nan,
+        cache_transformers=False,
+    ):
+        super(ForecastingSuccessiveHalvingCV, self).__init__(
+            forecaster=forecaster,
+            cv=cv,
+            param_grid=param_grid,
+            scoring=scoring,
+            strategy=strategy,
+            n_jobs=n_jobs,
+            refit=refit,
+            verbose=verbose,
+            return_n_best_forecasters=return_n_best_forecasters,
+            pre_dispatch=pre_dispatch,
+            backend=backend,
+            update_behaviour=update_behaviour,
+            error_score=error_score,
+            cache_transformers=cache_transformers,
+        )
+        self.factor = factor
+        self.min_folds = min_folds
+
+    def _run_search(self, evaluate_candidates):
+        """Search candidates in param_grid by successive halving over folds."""
+        self._check_param_grid(self.param_grid)
+        factor = self.factor
+        min_folds = self.min_folds
+        if not factor > 1:
+            raise ValueError(f"factor must be larger than 1, but found {factor}")
+        if not isinstance(min_folds, int) or min_folds < 1:
+            raise ValueError(f"min_folds must be a positive int, but found {min_folds}")
+
+        scoring = check_scoring(self.scoring)
+        scoring_name = f"test_{scoring.name}"
+        lower_is_better = scoring.get_tag("lower_is_better")
+        n_splits = self.n_splits_
+        is_refit = self.strategy == "refit"
+
+        candidates = list(ParameterGrid(self.param_grid))
+        fold_results = [[] for _ in candidates]
+        last_iter = [0] * len(candidates)
+        alive = list(range(len(candidates)))
+
+        iteration = 0
+        n_folds_done = 0
+        while True:
+            n_folds = int(min(min_folds * factor**iteration, n_splits))
+            # with "refit", results of folds seen in earlier iterations are re-used
+            fold_ids = range(n_folds_done if is_refit else 0, n_folds)
+            out = evaluate_candidates(
+                [candidates[c] for c in alive], fold_ids=fold_ids, return_folds=True
+            )
+            for c, candidate_out in zip(alive, out):
+                if not is_refit:
+                    fold_results[c] = []
+                fold_results[c].append(candidate_out)
+                last_iter[c] = iteration
+            n_folds_done = n_folds
+
+            if n_folds >= n_splits or len(alive) == 1:
+                break
+
+            # keep the best 1 / factor of candidates, candidates with nan score last
+            def _sort_key(c):
+                score = pd.concat(fold_results[c])[scoring_name].mean()
+                if np.isnan(score):
+                    return (True, 0)
+                return (False, score if lower_is_better else -score)
+
+            n_keep = max(1, int(np.ceil(len(alive) / factor)))
+            alive = sorted(sorted(alive, key=_sort_key)[:n_keep])
+            iteration += 1
+
+        results = []
+        for c, params in enumerate(candidates):
+            candidate_out = pd.concat(fold_results[c])
+            result = candidate_out.mean().add_prefix("mean_")
+            result["n_folds"] = len(candidate_out)
+            result["iter"] = last_iter[c]
+            result["params"] = params
+            results.append(result)
+        return pd.DataFrame(results).astype({"n_folds": int, "iter": int})
+
+    def _rank_results(self, results, scoring_name, lower_is_better):
+        """Rank candidates, candidates of later iterations rank before others."""
+        score = results.loc[:, f"mean_{scoring_name}"]
+        score_rank = score.rank(ascending=lower_is_better)
+        sort_keys = pd.DataFrame({"iter": -results["iter"], "score_rank": score_rank})
+        order = sort_keys.sort_values(["iter", "score_rank"], kind="stable").index
+        ranks = pd.Series(np.arange(1.0, len(results) + 1), index=order)
+        ranks = ranks.reindex(results.index)
+        ranks[score.isna()] = np.nan
+        return ranks
+
+    @classmethod
+    def get_test_params(cls, parameter_set="default"):
+        """Return testing parameter settings for the estimator.
+
+        Parameters
+        ----------
+        parameter_set : str, default="default"
+            Name of the set of test parameters to return, for use in tests. If no
+            special parameters are defined for a value, will return `"default"` set.
+
+        Returns
+        -------
+        params : dict or list of dict
+        """
+        from sktime.forecasting.compose import TransformedTargetForecaster
+        from sktime.forecasting.model_selection._split import (
+            ExpandingWindowSplitter,
+            SingleWindowSplitter,
+        )
+        from sktime.forecasting.naive import NaiveForecaster
+        from sktime.performance_metrics.forecasting import MeanAbsolutePercentageError
+        from sktime.transformations.series.exponent import ExponentTransformer
+
+        params = {
+            "forecaster": NaiveForecaster(strategy="mean"),
+            "cv": SingleWindowSplitter(fh=1),
+            "param_grid": {"window_length": [2, 5]},
+            "scoring": MeanAbsolutePercentageError(symmetric=True),
+        }
+        params2 = {
+            "forecaster": TransformedTargetForecaster(
+                [
+                    ("transformer", ExponentTransformer()),
+                    ("forecaster", NaiveForecaster()),
+                ]
+            ),
+            "cv": ExpandingWindowSplitter(initial_window=6, step_length=5, fh=1),
+            "param_grid": {
+                "forecaster__strategy": ["last", "mean", "drift"],
+                "transformer__power": [1, 2],
+            },
+            "factor": 2,
+            "scoring": MeanAbsolutePercentageError(symmetric=True),
+            "cache_transformers": True,
+        }
+        return [params, params2]
+
+
+class _TransformerCache:
+    """Cache of transformers fitted to the training windows of cv folds.
+
+    Stores, per fold, transformers fitted to the training window, and the
+    transformed training window, keyed by the unfitted transformers.
+    Unfitted transformers are equal as keys if they are of the same class
+    with equal parameters, see _equal_params.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def get(self, fold_id, transformers):
+        """Get fitted transformers and transformed y for fold, None if not cached."""
+        for key, value in self._entries.get(fold_id, []):
+            if _equal_params(key, transformers):
+                return value
+        return None
+
+    def add(self, fold_id, transformers, value):
+        """Add fitted transformers and transformed y for fold to the cache."""
+        self._entries.setdefault(fold_id, []).append((transformers, value))
+
+
+def _equal_params(x, y):
+    """Test whether parameter values x and y are equal, estimators by parameters."""
+    if hasattr(x, "get_params") and not isinstance(x, type):
+        if type(x) is not type(y):
+            return False
+        x_params = x.get_params(deep=False)
+        y_params = y.get_params(deep=False)
+        if x_params.keys() != y_params.keys():
+            return False
+        return all(_equal_params(x_params[k], y_params[k]) for k in x_params)
+    if isinstance(x, (list, tuple)):
+        if type(x) is not type(y) or len(x) != len(y):
+            return False
+        return all(_equal_params(a, b) for a, b in zip(x, y))
+    return deep_equals(x, y)
+
+
+def _get_cacheable_steps(forecaster):
+    """Get steps of forecaster if its transformers can be cached, otherwise None.
+
+    Returns
+    -------
+    None, or tuple of (transformers, inner_forecaster)
+        transformers : list of (str, transformer), steps before the forecaster
+        inner_forecaster : the forecaster step
+        if forecaster is a TransformedTargetForecaster with at least one transformer
+        before and no transformer after the forecaster step
+    """
+    from sktime.forecasting.compose import TransformedTargetForecaster
+
+    if not isinstance(forecaster, TransformedTargetForecaster):
+        return None
+    steps = forecaster._get_estimator_tuples(forecaster.steps, clone_ests=False)
+    forecaster_ind = forecaster._get_forecaster_index(steps)
+    if forecaster_ind == 0 or forecaster_ind != len(steps) - 1:
+        return None
+    return steps[:forecaster_ind], steps[forecaster_ind][1]
+
+
+def _fit_predict_score_cached(fold, forecaster, meta, cache):
+    """Fit, predict and score a TransformedTargetForecaster with cached transformers.
+
+    Same as _fit_predict_score in model_evaluation for strategy="refit" and point
+    forecast metrics, but transformers before the forecaster step are taken from
+    cache if fitted on the same fold with equal parameters, otherwise fitted and
+    added to cache. fit_time includes fitting of transformers if not cached.
+
+    Parameters
+    ----------
+    fold : tuple of (int, (train, test))
+        index of fold, and iloc indices of training and test window
+    forecaster : TransformedTargetForecaster, to evaluate, not fitted
+        must be cacheable, see _get_cacheable_steps
+    meta : dict with keys "y", "X", "fh", "scoring", "score_name", "error_score"
+        see _evaluate_window in model_evaluation
+    cache : _TransformerCache
+
+    Returns
+    -------
+    dict with results for the fold, keys score name, "fit_time", "pred_time"
+    """
+    i, (train, test) = fold
+    scoring = meta["scoring"]
+    error_score = meta["error_score"]
+
+    score = error_score
+    fit_time = np.nan
+    pred_time = np.nan
+
+    y_train, y_test, X_train, X_test = _split(
+        meta["y"], meta["X"], train, test, meta["fh"]
+    )
+    fh = ForecastingHorizon(y_test.index, is_relative=False)
+    transformers, inner_forecaster = _get_cacheable_steps(forecaster)
+
+    try:
+        start_fit = time.perf_counter()
+        cached = cache.get(i, transformers)
+        if cached is None:
+            fitted = [(name, t.clone()) for name, t in transformers]
+            yt = y_train
+            for _, t in fitted:
+                yt = t.fit_transform(X=yt, y=X_train)
+            cached = (fitted, yt)
+            cache.add(i, transformers, cached)
+        fitted, yt = cached
+        inner_forecaster = inner_forecaster.clone()
+        inner_forecaster.fit(y=yt, X=X_train, fh=fh)
+        fit_time = time.perf_counter() - start_fit
+
+        start_pred = time.perf_counter()
+        y_pred = inner_forecaster.predict(fh=fh, X=X_test)
+        y_pred = forecaster._get_inverse_transform(fitted, y_pred, X_test)
+        pred_time = time.perf_counter() - start_pred
+
+        score = scoring(y_test, y_pred, y_train=y_train)
+
+    except Exception as e:
+        if error_score == "raise":
+            raise e
+        else:
+            warnings.warn(
+                f"""
+            Fitting of forecaster failed, you can set error_score='raise' to see
+            the exception message. Fit failed for len(y_train)={len(y_train)}.
+            The score will be set to {error_score}.
+            Failed forecaster: {forecaster}.
+            """,
+                FitFailedWarning,
+            )
+
+    return {meta["score_name"]: score, "fit_time": fit_time, "pred_time": pred_time}
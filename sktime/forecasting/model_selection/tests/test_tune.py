@@ -4,7 +4,7 @@
 """Test grid search CV."""
 
 __author__ = ["mloning"]
-__all__ = ["test_gscv", "test_rscv"]
+__all__ = ["test_gscv", "test_rscv", "test_gscv_cache_transformers", "test_shcv"]
 
 import numpy as np
 import pytest
@@ -14,8 +14,10 @@ from sktime.datasets import load_longley
 from sktime.forecasting.compose import TransformedTargetForecaster
 from sktime.forecasting.model_evaluation import evaluate
 from sktime.forecasting.model_selection import (
+    ExpandingWindowSplitter,
     ForecastingGridSearchCV,
     ForecastingRandomizedSearchCV,
+    ForecastingSuccessiveHalvingCV,
     SingleWindowSplitter,
     SlidingWindowSplitter,
 )
@@ -131,3 +133,71 @@ def test_rscv(forecaster, param_grid, cv, scoring, error_score, n_iter, random_s
         ParameterSampler(param_grid, n_iter, random_state=random_state)
     )
     _check_cv(forecaster, rscv, cv, param_distributions, y, X, scoring)
+
+
+@pytest.mark.parametrize("scoring", TEST_METRICS)
+@pytest.mark.parametrize("cv", CVs)
+def test_gscv_cache_transformers(scoring, cv):
+    """Test ForecastingGridSearchCV with transformers cached across candidates."""
+    y, X = load_longley()
+    gscv = ForecastingGridSearchCV(
+        PIPE,
+        param_grid=PIPE_GRID,
+        cv=cv,
+        scoring=scoring,
+        cache_transformers=True,
+    )
+    gscv.fit(y, X)
+
+    param_grid = ParameterGrid(PIPE_GRID)
+    _check_cv(PIPE, gscv, cv, param_grid, y, X, scoring)
+
+
+@pytest.mark.parametrize(
+    "forecaster, param_grid", [(NAIVE, NAIVE_GRID), (PIPE, PIPE_GRID)]
+)
+@pytest.mark.parametrize("scoring", TEST_METRICS)
+@pytest.mark.parametrize("factor, min_folds", [(2, 1), (3, 2), (2, 100)])
+def test_shcv(forecaster, param_grid, scoring, factor, min_folds):
+    """Test ForecastingSuccessiveHalvingCV.
+
+    Tests that scores of candidates are means over the first folds of cv, that
+    the number of candidates is reduced by factor in each iteration, and that
+    the best candidate is the best of the last iteration.
+    """
+    y, X = load_longley()
+    cv = ExpandingWindowSplitter(initial_window=8, step_length=1, fh=1)
+    shcv = ForecastingSuccessiveHalvingCV(
+        forecaster,
+        param_grid=param_grid,
+        cv=cv,
+        scoring=scoring,
+        factor=factor,
+        min_folds=min_folds,
+        cache_transformers=True,
+    )
+    shcv.fit(y, X)
+
+    param_grid = ParameterGrid(param_grid)
+    results = shcv.cv_results_
+    score_name = f"test_{scoring.name}"
+
+    # scores are means over the first n_folds folds of cv
+    for i, params in enumerate(param_grid):
+        f = forecaster.clone().set_params(**params)
+        scores = evaluate(f, cv, y, X=X, scoring=scoring)[score_name]
+        n_folds = results["n_folds"].iloc[i]
+        assert n_folds == min(min_folds * factor ** results["iter"].iloc[i], 8)
+        expected = scores.iloc[:n_folds].mean()
+        np.testing.assert_allclose(results[f"mean_{score_name}"].iloc[i], expected)
+
+    # number of candidates is reduced by factor in each iteration
+    n_candidates = len(param_grid)
+    for iteration in range(results["iter"].max() + 1):
+        assert (results["iter"] >= iteration).sum() == n_candidates
+        n_candidates = int(np.ceil(n_candidates / factor))
+
+    # best candidate is the best of the last iteration
+    last = results[results["iter"] == results["iter"].max()]
+    assert shcv.best_index_ == last[f"mean_{score_name}"].idxmin()
+    assert shcv.best_params_ == param_grid[shcv.best_index_]
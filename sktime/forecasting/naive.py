@@ -48,6 +48,12 @@ class NaiveForecaster(_BaseWindowForecaster):
       - "mean": np.nanmean over rows
     - tile the predictions using the seasonal periodicity
 
+    Probabilistic forecasts are normal, centred at the point forecast, with variance
+    from the residuals of the strategy in the last window, scaled by the number of
+    steps ahead as in [1]_. On panel or hierarchical data with equal time indices
+    and no missing values, point and probabilistic forecasts are computed for all
+    series at once.
+
     Parameters
     ----------
     strategy : {"last", "mean", "drift"}, default="last"
@@ -78,6 +84,12 @@ class NaiveForecaster(_BaseWindowForecaster):
         Window length to use in the `mean` strategy. If None, entire training
             series will be used.
 
+    References
+    ----------
+    .. [1] Hyndman, R.J., & Athanasopoulos, G. (2021) Forecasting: principles and
+       practice, 3rd edition, OTexts: Melbourne, Australia. OTexts.com/fpp3,
+       section 5.5.
+
     Examples
     --------
     >>> from sktime.datasets import load_airline
@@ -87,6 +99,7 @@ class NaiveForecaster(_BaseWindowForecaster):
     >>> forecaster.fit(y)
     NaiveForecaster(...)
     >>> y_pred = forecaster.predict(fh=[1,2,3])
+    >>> pred_int = forecaster.predict_interval(fh=[1,2,3], coverage=0.9)
     """
 
     _tags = {
@@ -94,6 +107,8 @@ class NaiveForecaster(_BaseWindowForecaster):
         "requires-fh-in-fit": False,
         "handles-missing-data": True,
         "scitype:y": "univariate",
+        "capability:pred_int": True,
+        "capability:batch_panel": True,
     }
 
     def __init__(self, strategy="last", window_length=None, sp=1):
@@ -248,6 +263,240 @@ class NaiveForecaster(_BaseWindowForecaster):
 
         return y_pred
 
+    def _fit_batch(self, Y):
+        """Fit to all series of an aligned panel at once.
+
+        Parameters
+        ----------
+        Y : 2D np.ndarray of shape (n_series, n_timepoints)
+            values of all series, with the time index of self._y, without NaN
+        """
+        # the last window has the same positions in all series
+        last_window, _ = self._get_last_window()
+        self._last_window_batch = Y[:, Y.shape[1] - len(last_window) :]
+        return self
+
+    def _predict_batch(self, fh):
+        """Forecast all series fitted in _fit_batch at once.
+
+        Parameters
+        ----------
+        fh : ForecastingHorizon
+            The forecasting horizon with the steps ahead to to predict.
+
+        Returns
+        -------
+        Y_pred : 2D np.ndarray of shape (n_series, len(fh)), or None
+            point predictions, i-th row for i-th series; None if fh is in-sample
+        """
+        if not fh.is_all_out_of_sample(self.cutoff):
+            return None
+
+        last_window = self._last_window_batch
+        # steps ahead, minus one, i.e., zero-based index of out-of-sample fh
+        fh_idx = fh.to_indexer(self.cutoff)
+        strategy = self.strategy
+        sp = self.sp or 1
+
+        if strategy == "last" or (strategy == "drift" and self.window_length_ == 1):
+            # with sp, last value of each season, in the last row of the window
+            if last_window.shape[1] < sp:
+                return None
+            y_pred = last_window[:, -sp:]
+
+        elif strategy == "mean":
+            if sp == 1:
+                y_pred = last_window.mean(axis=1, keepdims=True)
+            else:
+                # prepend NaN and reshape, as in _reshape_last_window_for_sp
+                n_series = last_window.shape[0]
+                n_rows = int(np.ceil(self.window_length_ / self.sp_))
+                pad_width = n_rows * self.sp_ - last_window.shape[1]
+                last_window = np.hstack(
+                    [np.full((n_series, pad_width), np.nan), last_window]
+                )
+                last_window = last_window.reshape(n_series, n_rows, self.sp_)
+                y_pred = np.nanmean(last_window, axis=1)
+
+        else:  # strategy == "drift"
+            slope = (last_window[:, -1] - last_window[:, 0]) / (self.window_length_ - 1)
+            return last_window[:, [-1]] + np.outer(slope, fh_idx + 1)
+
+        # tile prediction according to seasonal periodicity
+        return y_pred[:, fh_idx % y_pred.shape[1]]
+
+    def _predict_var_batch(self, fh):
+        """Compute prediction variances for all series fitted in _fit_batch at once.
+
+        Parameters
+        ----------
+        fh : ForecastingHorizon
+            The forecasting horizon with the steps ahead to to predict.
+
+        Returns
+        -------
+        pred_var : 2D np.ndarray of shape (n_series, len(fh)), or None
+            marginal predictive variances, i-th row for i-th series;
+            None if fh is in-sample
+        """
+        if not fh.is_all_out_of_sample(self.cutoff):
+            return None
+        return self._compute_pred_var(self._last_window_batch, fh)
+
+    def _compute_pred_var(self, last_window, fh):
+        """Compute marginal prediction variances from 2D last windows.
+
+        Uses the residual variance of the naive model in the last window, scaled
+        by the h-step factor of the strategy, see References in the class docstring:
+
+        * "last", sp=1: sigma^2 * h
+        * "last", sp>1: sigma^2 * (floor((h - 1) / sp) + 1)
+        * "mean": sigma^2 * (1 + 1 / n), n non-missing values in the (season of the)
+          last window
+        * "drift": sigma^2 * h * (1 + h / (T - 1)), T = window length
+
+        Missing values in the last window are ignored.
+
+        Parameters
+        ----------
+        last_window : 2D np.ndarray of shape (n_series, n_timepoints)
+            last windows of one or more series, i-th row is i-th series
+        fh : ForecastingHorizon
+            The forecasting horizon with the steps ahead to to predict.
+
+        Returns
+        -------
+        pred_var : 2D np.ndarray of shape (n_series, len(fh))
+            marginal predictive variances, NaN for in-sample fh
+
+        Raises
+        ------
+        ValueError
+            if the last window is too short to leave any degrees of freedom for
+            the residual variance, e.g., window_length equal to sp for "last"
+        """
+        n_series, width = last_window.shape
+        h = np.asarray(fh.to_relative(self.cutoff), dtype=float)
+        fh_idx = fh.to_indexer(self.cutoff)
+        strategy = self.strategy
+        sp = self.sp or 1
+
+        # minimum window length leaving one degree of freedom for the variance
+        if strategy == "mean":
+            min_width = self.sp_ + 1
+        elif strategy == "drift" and self.window_length_ > 1:
+            min_width = 3
+        else:
+            min_width = sp + 1
+        if width < min_width:
+            raise ValueError(
+                f"{type(self).__name__} cannot estimate the prediction variance "
+                f"with strategy={strategy!r} and sp={sp} from a last window of "
+                f"length {width}, a window_length of at least {min_width} is "
+                f"required for predict_var, predict_interval and predict_quantiles."
+            )
+
+        if strategy == "mean":
+            # prepend NaN and reshape, as in _reshape_last_window_for_sp
+            n_rows = int(np.ceil(self.window_length_ / self.sp_))
+            pad_width = n_rows * self.sp_ - width
+            last_window = np.hstack(
+                [np.full((n_series, pad_width), np.nan), last_window]
+            )
+            last_window = last_window.reshape(n_series, n_rows, self.sp_)
+            with np.errstate(invalid="ignore"):
+                residuals = last_window - np.nanmean(last_window, axis=1)[:, None]
+            # one mean is estimated per season
+            n_obs = (~np.isnan(last_window)).sum(axis=1)
+            dof = n_obs.sum(axis=1) - self.sp_
+            with np.errstate(divide="ignore", invalid="ignore"):
+                factor = 1 + 1 / n_obs[:, fh_idx % self.sp_]
+        elif strategy == "drift" and self.window_length_ > 1:
+            slope = (last_window[:, -1] - last_window[:, 0]) / (self.window_length_ - 1)
+            residuals = np.diff(last_window, axis=1) - slope[:, None]
+            # one slope is estimated
+            dof = (~np.isnan(residuals)).sum(axis=1) - 1
+            factor = h * (1 + h / (self.window_length_ - 1))
+        else:
+            residuals = last_window[:, sp:] - last_window[:, : width - sp]
+            dof = (~np.isnan(residuals)).sum(axis=1)
+            factor = np.floor((h - 1) / sp) + 1
+
+        sum_of_squares = np.nansum(residuals**2, axis=tuple(range(1, residuals.ndim)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sigma2 = np.where(dof > 0, sum_of_squares / dof, np.nan)
+
+        pred_var = sigma2[:, None] * np.broadcast_to(factor, (n_series, len(h)))
+        pred_var[:, h < 1] = np.nan
+        return pred_var
+
+    def _predict_var(self, fh, X=None, cov=False):
+        """Compute/return prediction variance for a forecast.
+
+        private _predict_var containing the core logic,
+            called from predict_var, predict_quantiles and predict_interval
+
+        Variances are computed from the residuals of the naive model in the last
+        window, see `_compute_pred_var`. Variances for in-sample fh are NaN.
+
+        Parameters
+        ----------
+        fh : int, list, np.array or ForecastingHorizon
+            Forecasting horizon
+        X : pd.DataFrame, optional (default=None)
+            Exogenous time series
+        cov : bool, optional (default=False)
+            If True, return the covariance matrix, not implemented.
+            If False, return the marginal variance.
+
+        Returns
+        -------
+        pred_var : pd.DataFrame with index fh
+            a vector of same length as fh with predictive marginal variances
+        """
+        if cov:
+            raise NotImplementedError(
+                "NaiveForecaster does not implement covariance forecasts, "
+                "use cov=False for marginal variance forecasts"
+            )
+        last_window, _ = self._get_last_window()
+        pred_var = self._compute_pred_var(last_window.reshape(1, -1), fh)
+        fh_absolute = fh.to_absolute(self.cutoff).to_pandas()
+        return pd.DataFrame(pred_var[0], index=fh_absolute)
+
+    def _predict_quantiles(self, fh, X=None, alpha=None):
+        """Compute/return prediction quantiles for a forecast.
+
+        private _predict_quantiles containing the core logic,
+            called from predict_quantiles and predict_interval
+
+        Uses a normal predictive distribution, centred at the point forecast, with
+        the variance from `_predict_var`.
+
+        Parameters
+        ----------
+        fh : int, list, np.array or ForecastingHorizon
+            Forecasting horizon
+        X : pd.DataFrame, optional (default=None)
+            Exogenous time series
+        alpha : list of float, optional (default=[0.5])
+            A list of probabilities at which quantile forecasts are computed.
+
+        Returns
+        -------
+        quantiles : pd.DataFrame
+            Column has multi-index: first level is variable name from y in fit,
+                second level being the values of alpha passed to the function.
+            Row index is fh. Entries are quantile forecasts, for var in col index,
+                at quantile probability in second col index, for the row index.
+        """
+        y_pred = self._predict(fh=fh, X=X)
+        pred_std = np.sqrt(self._predict_var(fh=fh, X=X).values[:, 0])
+
+        index = pd.MultiIndex.from_product([["Quantiles"], alpha])
+        quantiles = np.asarray(y_pred)[:, None] + np.outer(pred_std, norm.ppf(alpha))
+        return pd.DataFrame(quantiles, index=y_pred.index, columns=index)
+
     def _reshape_last_window_for_sp(self, last_window):
         """Reshape the 1D last window into a 2D last window, prepended with NaN values.
 
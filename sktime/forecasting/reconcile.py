@@ -20,6 +20,8 @@ from sktime.forecasting.base import BaseForecaster, ForecastingHorizon
 from sktime.transformations.hierarchical.aggregate import _check_index_no_total
 from sktime.transformations.hierarchical.reconcile import (
     Reconciler,
+    _from_forecast_block,
+    _get_forecast_block,
     _get_s_matrix,
     _parent_child_df,
 )
@@ -219,18 +221,10 @@ class ReconcilerForecaster(BaseForecaster):
         if np.isin(self.method, self.TRFORM_LIST):
             return base_fc
 
-        base_fc = base_fc.groupby(level=-1)
-
-        recon_fc = []
-        for _name, group in base_fc:
-            # reconcile via SGy
-            fcst = self.s_matrix.dot(self.g_matrix.dot(group.droplevel(-1)))
-            # add back in time index
-            fcst.index = group.index
-            recon_fc.append(fcst)
-
-        recon_fc = pd.concat(recon_fc, axis=0)
-        recon_fc = recon_fc.sort_index()
+        # reconcile via SGy, for all time points at once
+        block, node_pos, time_pos = _get_forecast_block(base_fc, self.s_matrix.index)
+        recon_block = self.s_matrix.to_numpy() @ (self.g_matrix.to_numpy() @ block)
+        recon_fc = _from_forecast_block(recon_block, base_fc, node_pos, time_pos)
 
         return recon_fc
 
@@ -4,6 +4,7 @@
 
 __author__ = ["fkiraly"]
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -11,6 +12,7 @@ from sktime.datasets import load_airline
 from sktime.datatypes import MTYPE_LIST_SERIES, convert_to
 from sktime.forecasting.conformal import ConformalIntervals
 from sktime.forecasting.naive import NaiveForecaster, NaiveVariance
+from sktime.utils.parallel import _get_parallel_test_fixtures
 
 INTERVAL_WRAPPERS = [ConformalIntervals, NaiveVariance]
 
@@ -50,3 +52,81 @@ def test_wrapper_series_mtype(wrapper, override_y_mtype, mtype):
 
     assert isinstance(pred_var, pd.DataFrame)
     assert len(pred_var) == 3
+
+
+@pytest.mark.parametrize("strategy", ["refit", "update"])
+def test_conformal_residuals_band(strategy):
+    """Test that band residuals of ConformalIntervals equal the matrix diagonals.
+
+    Also tests that intervals are the same for both storages, and that the band
+    after an update equals the band of a forecaster fitted on all of y.
+    With NaiveForecaster, residuals do not depend on the strategy.
+    """
+    y = load_airline()
+    fh = [1, 2, 3]
+
+    f = NaiveForecaster(strategy="drift")
+    matrix = ConformalIntervals(f, initial_window=24).fit(y, fh=fh)
+    band = ConformalIntervals(
+        f, initial_window=24, residuals_store="band", strategy=strategy
+    ).fit(y, fh=fh)
+
+    residuals_matrix = matrix.residuals_matrix_.to_numpy(dtype="float")
+    residuals_band = band.residuals_matrix_
+    assert residuals_band.shape == (len(residuals_matrix), max(fh) + 1)
+    for k in fh:
+        expected = np.diagonal(residuals_matrix, offset=k)
+        np.testing.assert_allclose(
+            residuals_band[k].dropna().to_numpy(), expected[~np.isnan(expected)]
+        )
+
+    pred_int = band.predict_interval(coverage=[0.5, 0.9])
+    pred_int_matrix = matrix.predict_interval(coverage=[0.5, 0.9])
+    np.testing.assert_allclose(
+        pred_int.to_numpy(dtype="float"), pred_int_matrix.to_numpy(dtype="float")
+    )
+
+    updated = ConformalIntervals(
+        f, initial_window=24, residuals_store="band", strategy=strategy
+    ).fit(y.iloc[:-20], fh=fh)
+    updated.update(y.iloc[-20:-7])
+    updated.update(y.iloc[-7:])
+    pd.testing.assert_frame_equal(updated.residuals_matrix_, residuals_band)
+
+
+@pytest.mark.parametrize("backend", _get_parallel_test_fixtures())
+def test_conformal_backend(backend):
+    """Test that residuals of ConformalIntervals do not depend on the backend."""
+    y = load_airline().iloc[:60]
+    f = NaiveForecaster()
+
+    conformal = ConformalIntervals(f, initial_window=24, residuals_store="band")
+    conformal.fit(y, fh=[1, 2])
+    conformal_par = ConformalIntervals(
+        f, initial_window=24, residuals_store="band", **backend
+    )
+    conformal_par.fit(y, fh=[1, 2])
+
+    pd.testing.assert_frame_equal(
+        conformal.residuals_matrix_, conformal_par.residuals_matrix_
+    )
+
+
+def test_conformal_band_beyond_fh_of_fit():
+    """Test that ConformalIntervals predicts with a band beyond the fh of fit."""
+    y = load_airline().iloc[:60]
+    f = NaiveForecaster(strategy="drift")
+    fh = [1, 2, 5]
+
+    band = ConformalIntervals(f, initial_window=24, residuals_store="band")
+    band.fit(y, fh=[1, 2])
+    residuals_band = band.residuals_matrix_.copy()
+    pred_int = band.predict_interval(fh=fh, coverage=[0.5, 0.9])
+
+    matrix = ConformalIntervals(f, initial_window=24).fit(y, fh=[1, 2])
+    pred_int_matrix = matrix.predict_interval(fh=fh, coverage=[0.5, 0.9])
+    np.testing.assert_allclose(
+        pred_int.to_numpy(dtype="float"), pred_int_matrix.to_numpy(dtype="float")
+    )
+    # the band of fit is not replaced in predict
+    pd.testing.assert_frame_equal(band.residuals_matrix_, residuals_band)
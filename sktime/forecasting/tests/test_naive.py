@@ -257,3 +257,66 @@ def test_strategy_mean_and_last_seasonal_additional_combinations(
         for i in range(1 + len(test_data) // sp):
             test_data[i * sp : i * sp + sp - window_length] = np.nan
         pd.testing.assert_series_equal(forecast_data, test_data)
+
+
+@pytest.mark.parametrize(
+    "strategy, sp, expected_factor",
+    [
+        ("last", 1, [1, 2, 3, 4, 5]),
+        ("last", 2, [1, 1, 2, 2, 3]),
+        ("drift", 1, [h * (1 + h / (n_train - 1)) for h in range(1, 6)]),
+    ],
+)
+def test_predict_var_random_walk(strategy, sp, expected_factor):
+    """Test predict_var against the h-step variance of naive models."""
+    y = pd.Series(np.random.RandomState(42).normal(size=n_train).cumsum())
+    f = NaiveForecaster(strategy=strategy, sp=sp)
+    f.fit(y)
+    pred_var = f.predict_var(fh=[1, 2, 3, 4, 5])
+
+    residuals = y.diff(sp).dropna()
+    if strategy == "drift":
+        residuals = residuals - residuals.mean()
+        sigma2 = (residuals**2).sum() / (len(residuals) - 1)
+    else:
+        sigma2 = (residuals**2).mean()
+
+    np.testing.assert_allclose(pred_var.iloc[:, 0], sigma2 * np.array(expected_factor))
+
+    # intervals are symmetric around the point prediction, widening with h
+    y_pred = f.predict(fh=[1, 2, 3, 4, 5])
+    pred_int = f.predict_interval(fh=[1, 2, 3, 4, 5], coverage=0.9)
+    lower = pred_int.iloc[:, 0]
+    upper = pred_int.iloc[:, 1]
+    np.testing.assert_allclose((lower + upper) / 2, y_pred)
+    assert np.all(np.diff(upper - lower) >= 0)
+
+
+def test_predict_var_mean_seasonal():
+    """Test predict_var of mean strategy, with per-season number of observations."""
+    y = pd.Series([1.0, 10.0, 3.0, 12.0, 2.0])
+    f = NaiveForecaster(strategy="mean", sp=2)
+    f.fit(y)
+    pred_var = f.predict_var(fh=[1, 2])
+
+    # seasons [1, 3, 2] with mean 2, and [10, 12] with mean 11, two means estimated
+    sigma2 = (1 + 1 + 0 + 1 + 1) / (5 - 2)
+    # the first step ahead is in the season of 10 and 12, as in predict
+    expected = sigma2 * np.array([1 + 1 / 2, 1 + 1 / 3])
+    np.testing.assert_allclose(pred_var.iloc[:, 0], expected)
+
+
+@pytest.mark.parametrize(
+    "strategy, sp, window_length",
+    [("last", 1, 1), ("last", 4, 4), ("mean", 4, 4), ("drift", 1, 2)],
+)
+def test_predict_var_window_too_short(strategy, sp, window_length):
+    """Test predict_var raises if the last window leaves no residual variance."""
+    y = pd.Series(np.random.RandomState(42).normal(size=n_train).cumsum())
+    f = NaiveForecaster(strategy=strategy, sp=sp, window_length=window_length)
+    f.fit(y)
+
+    with pytest.raises(ValueError, match="window_length of at least"):
+        f.predict_var(fh=[1, 2])
+    with pytest.raises(ValueError, match="window_length of at least"):
+        f.predict_interval(fh=[1, 2])
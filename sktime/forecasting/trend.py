@@ -8,6 +8,7 @@ __all__ = ["TrendForecaster", "PolynomialTrendForecaster", "STLForecaster"]
 
 import numpy as np
 import pandas as pd
+from scipy.linalg import lstsq
 from sklearn.base import clone
 from sklearn.linear_model import LinearRegression
 from sklearn.pipeline import make_pipeline
@@ -143,6 +144,10 @@ class PolynomialTrendForecaster(BaseForecaster):
         self.regressor_ = self.regressor
         super(PolynomialTrendForecaster, self).__init__()
 
+        # the default linear regression can be fitted to many series at once
+        if regressor is None:
+            self.set_tags(**{"capability:batch_panel": True})
+
     def _fit(self, y, X=None, fh=None):
         """Fit to training data.
 
@@ -201,6 +206,42 @@ class PolynomialTrendForecaster(BaseForecaster):
         y_pred = self.regressor_.predict(X_pred)
         return pd.Series(y_pred, index=self.fh.to_absolute(self.cutoff))
 
+    def _fit_batch(self, Y):
+        """Fit to all series of an aligned panel at once.
+
+        Only used with the default regressor, solves one least squares problem
+        with one right hand side per series.
+
+        Parameters
+        ----------
+        Y : 2D np.ndarray of shape (n_series, n_timepoints)
+            values of all series, with the time index of self._y, without NaN
+        """
+        poly = self.regressor_.steps[0][1]
+        n_timepoints = _get_duration(self._y.index, coerce_to_int=True) + 1
+        X = poly.transform(np.arange(n_timepoints).reshape(-1, 1))
+        # same solver as LinearRegression, one coefficient column per series
+        self._coef_batch = lstsq(X, Y.T)[0]
+        return self
+
+    def _predict_batch(self, fh):
+        """Forecast all series fitted in _fit_batch at once.
+
+        Parameters
+        ----------
+        fh : ForecastingHorizon
+            The forecasting horizon with the steps ahead to to predict.
+
+        Returns
+        -------
+        Y_pred : 2D np.ndarray of shape (n_series, len(fh))
+            point predictions, i-th row for i-th series
+        """
+        poly = self.regressor_.steps[0][1]
+        fh_int = fh.to_absolute_int(self._y.index[0], self.cutoff)
+        X_pred = poly.transform(fh_int.to_numpy().reshape(-1, 1))
+        return (X_pred @ self._coef_batch).T
+
 
 class STLForecaster(BaseForecaster):
     """Implements STLForecaster based on statsmodels.tsa.seasonal.STL implementation.
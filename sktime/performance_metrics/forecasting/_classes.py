@@ -18,6 +18,38 @@ from sklearn.utils import check_array
 from sktime.datatypes import VectorizedDF, check_is_scitype, convert_to
 from sktime.performance_metrics.base import BaseMetric
 from sktime.performance_metrics.forecasting._functions import (
+    _geometric_mean_absolute_error_by_index,
+    _geometric_mean_absolute_error_grouped,
+    _geometric_mean_squared_error_by_index,
+    _geometric_mean_squared_error_grouped,
+    _mean_absolute_error_by_index,
+    _mean_absolute_error_grouped,
+    _mean_absolute_percentage_error_by_index,
+    _mean_absolute_percentage_error_grouped,
+    _mean_absolute_scaled_error_by_index,
+    _mean_absolute_scaled_error_grouped,
+    _mean_asymmetric_error_by_index,
+    _mean_asymmetric_error_grouped,
+    _mean_linex_error_by_index,
+    _mean_linex_error_grouped,
+    _mean_squared_error_by_index,
+    _mean_squared_error_grouped,
+    _mean_squared_percentage_error_by_index,
+    _mean_squared_percentage_error_grouped,
+    _mean_squared_scaled_error_by_index,
+    _mean_squared_scaled_error_grouped,
+    _median_absolute_error_by_index,
+    _median_absolute_error_grouped,
+    _median_absolute_percentage_error_by_index,
+    _median_absolute_percentage_error_grouped,
+    _median_absolute_scaled_error_by_index,
+    _median_absolute_scaled_error_grouped,
+    _median_squared_error_by_index,
+    _median_squared_error_grouped,
+    _median_squared_percentage_error_by_index,
+    _median_squared_percentage_error_grouped,
+    _median_squared_scaled_error_by_index,
+    _median_squared_scaled_error_grouped,
     geometric_mean_absolute_error,
     geometric_mean_relative_absolute_error,
     geometric_mean_relative_squared_error,
@@ -340,6 +372,10 @@ class BaseForecastingErrorMetric(BaseMetric):
         Caution: this is only sensible for differentiable statistics,
         i.e., not for medians, quantiles or median/quantile based statistics.
 
+        The default evaluates the metric once per time point, i.e., it is quadratic
+        in the number of time points. Metrics should override it with a vectorized
+        computation where possible, see BaseForecastingErrorMetricFunc.
+
         Parameters
         ----------
         y_true : time series in sktime compatible data container format
@@ -476,9 +512,13 @@ class BaseForecastingErrorMetric(BaseMetric):
             )
             if not valid:
                 raise TypeError(msg)
-            y_inner = convert_to(y, to_type=INNER_MTYPES)
-
             scitype = metadata["scitype"]
+            # skip mtype inference in convert_to if no conversion is needed
+            if metadata["mtype"] in INNER_MTYPES:
+                y_inner = y
+            else:
+                y_inner = convert_to(y, to_type=INNER_MTYPES, as_scitype=scitype)
+
             ignore_index = multilevel == "uniform_average_time"
             if scitype in ["Panel", "Hierarchical"] and not ignore_index:
                 y_inner = VectorizedDF(y_inner, is_scitype=scitype)
@@ -509,15 +549,36 @@ class BaseForecastingErrorMetricFunc(BaseForecastingErrorMetric):
     #                       further args that are parameters
     #       all np.ndarray should be 2D
     # func should return 1D np.ndarray if multioutput="raw_values", otherwise float
-
-    def _evaluate(self, y_true, y_pred, **kwargs):
-        """Evaluate the desired metric on given inputs."""
+    #
+    # descendants may have a func_by_index class attribute, of same signature
+    #   func_by_index should return the jackknife pseudo-values of func,
+    #   2D np.ndarray if multioutput="raw_values", otherwise 1D np.ndarray
+    #   if not present, _evaluate_by_index falls back to the generic jackknife
+    #
+    # descendants may have a func_grouped class attribute, of same signature
+    #   with additional arg groups: 1D np.ndarray of int, instance of each row
+    #   scaled metrics also get y_train_groups, instance of each row of y_train
+    #   func_grouped should return func for each instance, in one pass,
+    #   2D np.ndarray if multioutput="raw_values", otherwise 1D np.ndarray
+    #   if not present, _evaluate_vectorized loops over instances
+
+    def _get_func_params(self, func, **kwargs):
+        """Get parameters and kwargs to pass to func."""
         # this dict should contain all parameters
         params = self.get_params()
 
         # adding kwargs to the metric, should not overwrite params (but does if clashes)
         params.update(kwargs)
 
+        # if func does not catch kwargs, subset to args of func
+        if getfullargspec(func).varkw is None:
+            func_params = signature(func).parameters.keys()
+            func_params = set(func_params).difference(["y_true", "y_pred"])
+            params = {key: params[key] for key in func_params}
+        return params
+
+    def _evaluate(self, y_true, y_pred, **kwargs):
+        """Evaluate the desired metric on given inputs."""
         # calls class variable func, if available, or dynamic (object) variable
         # we need to call type since we store func as a class attribute
         if hasattr(type(self), "func") and isfunction(type(self).func):
@@ -525,15 +586,58 @@ class BaseForecastingErrorMetricFunc(BaseForecastingErrorMetric):
         else:
             func = self.func
 
-        # if func does not catch kwargs, subset to args of func
-        if getfullargspec(func).varkw is None:
-            func_params = signature(func).parameters.keys()
-            func_params = set(func_params).difference(["y_true", "y_pred"])
-            params = {key: params[key] for key in func_params}
-
+        params = self._get_func_params(func, **kwargs)
         res = func(y_true=y_true, y_pred=y_pred, **params)
         return res
 
+    def _evaluate_by_index(self, y_true, y_pred, **kwargs):
+        """Return the metric evaluated at each time point.
+
+        Uses the vectorized func_by_index class variable, if available,
+        otherwise the jackknife of BaseForecastingErrorMetric._evaluate_by_index.
+        """
+        func_by_index = getattr(type(self), "func_by_index", None)
+        if not isfunction(func_by_index):
+            return super(BaseForecastingErrorMetricFunc, self)._evaluate_by_index(
+                y_true=y_true, y_pred=y_pred, **kwargs
+            )
+
+        params = self._get_func_params(func_by_index, **kwargs)
+        res = func_by_index(y_true=y_true, y_pred=y_pred, **params)
+        if res.ndim == 2:
+            return pd.DataFrame(res, index=y_true.index, columns=y_true.columns)
+        return pd.Series(res, index=y_true.index)
+
+    def _evaluate_vectorized(self, y_true, y_pred, **kwargs):
+        """Vectorized version of _evaluate.
+
+        Uses the func_grouped class variable to evaluate all instances at once,
+        if available, otherwise runs _evaluate for all instances in y_true, y_pred.
+        """
+        func_grouped = getattr(type(self), "func_grouped", None)
+        y_train = kwargs.get("y_train")
+        # horizon_weight and y_train not split by instance are left to the loop
+        use_loop = not isfunction(func_grouped) or "horizon_weight" in kwargs
+        use_loop = use_loop or not isinstance(y_train, (VectorizedDF, type(None)))
+        if use_loop:
+            return super(BaseForecastingErrorMetricFunc, self)._evaluate_vectorized(
+                y_true=y_true, y_pred=y_pred, **kwargs
+            )
+
+        instances = y_true.get_iter_indices()[0]
+        kwargs = kwargs.copy()
+        if y_train is not None:
+            y_train_index = y_train.X.index.droplevel(-1)
+            kwargs["y_train"] = y_train.X
+            kwargs["y_train_groups"] = instances.get_indexer(y_train_index)
+        groups = instances.get_indexer(y_true.X.index.droplevel(-1))
+
+        params = self._get_func_params(func_grouped, **kwargs)
+        res = func_grouped(y_true=y_true.X, y_pred=y_pred.X, groups=groups, **params)
+        if res.ndim == 2:
+            return pd.DataFrame(res, index=instances, columns=y_true.X.columns)
+        return pd.DataFrame(res, index=instances)
+
 
 class _DynamicForecastingErrorMetric(BaseForecastingErrorMetricFunc):
     """Class for defining forecasting error metrics from a function dynamically."""
@@ -714,6 +818,8 @@ class MeanAbsoluteScaledError(_ScaledMetricTags, BaseForecastingErrorMetricFunc)
     """
 
     func = mean_absolute_scaled_error
+    func_by_index = _mean_absolute_scaled_error_by_index
+    func_grouped = _mean_absolute_scaled_error_grouped
 
     def __init__(
         self,
@@ -798,6 +904,8 @@ class MedianAbsoluteScaledError(_ScaledMetricTags, BaseForecastingErrorMetricFun
     """
 
     func = median_absolute_scaled_error
+    func_by_index = _median_absolute_scaled_error_by_index
+    func_grouped = _median_absolute_scaled_error_grouped
 
     def __init__(
         self,
@@ -880,6 +988,8 @@ class MeanSquaredScaledError(_ScaledMetricTags, BaseForecastingErrorMetricFunc):
     """
 
     func = mean_squared_scaled_error
+    func_by_index = _mean_squared_scaled_error_by_index
+    func_grouped = _mean_squared_scaled_error_grouped
 
     def __init__(
         self,
@@ -963,6 +1073,8 @@ class MedianSquaredScaledError(_ScaledMetricTags, BaseForecastingErrorMetricFunc
     """
 
     func = median_squared_scaled_error
+    func_by_index = _median_squared_scaled_error_by_index
+    func_grouped = _median_squared_scaled_error_grouped
 
     def __init__(
         self,
@@ -1027,6 +1139,8 @@ class MeanAbsoluteError(BaseForecastingErrorMetricFunc):
     """
 
     func = mean_absolute_error
+    func_by_index = _mean_absolute_error_by_index
+    func_grouped = _mean_absolute_error_grouped
 
 
 class MedianAbsoluteError(BaseForecastingErrorMetricFunc):
@@ -1084,6 +1198,8 @@ class MedianAbsoluteError(BaseForecastingErrorMetricFunc):
     """
 
     func = median_absolute_error
+    func_by_index = _median_absolute_error_by_index
+    func_grouped = _median_absolute_error_grouped
 
 
 class MeanSquaredError(BaseForecastingErrorMetricFunc):
@@ -1151,6 +1267,8 @@ class MeanSquaredError(BaseForecastingErrorMetricFunc):
     """
 
     func = mean_squared_error
+    func_by_index = _mean_squared_error_by_index
+    func_grouped = _mean_squared_error_grouped
 
     def __init__(
         self,
@@ -1234,6 +1352,8 @@ class MedianSquaredError(BaseForecastingErrorMetricFunc):
     """
 
     func = median_squared_error
+    func_by_index = _median_squared_error_by_index
+    func_grouped = _median_squared_error_grouped
 
     def __init__(
         self,
@@ -1310,6 +1430,8 @@ class GeometricMeanAbsoluteError(BaseForecastingErrorMetricFunc):
     """
 
     func = geometric_mean_absolute_error
+    func_by_index = _geometric_mean_absolute_error_by_index
+    func_grouped = _geometric_mean_absolute_error_grouped
 
 
 class GeometricMeanSquaredError(BaseForecastingErrorMetricFunc):
@@ -1395,6 +1517,8 @@ class GeometricMeanSquaredError(BaseForecastingErrorMetricFunc):
     """
 
     func = geometric_mean_squared_error
+    func_by_index = _geometric_mean_squared_error_by_index
+    func_grouped = _geometric_mean_squared_error_grouped
 
     def __init__(
         self,
@@ -1477,6 +1601,8 @@ class MeanAbsolutePercentageError(BaseForecastingErrorMetricFunc):
     """
 
     func = mean_absolute_percentage_error
+    func_by_index = _mean_absolute_percentage_error_by_index
+    func_grouped = _mean_absolute_percentage_error_grouped
 
     def __init__(
         self,
@@ -1563,6 +1689,8 @@ class MedianAbsolutePercentageError(BaseForecastingErrorMetricFunc):
     """
 
     func = median_absolute_percentage_error
+    func_by_index = _median_absolute_percentage_error_by_index
+    func_grouped = _median_absolute_percentage_error_grouped
 
     def __init__(
         self,
@@ -1652,6 +1780,8 @@ class MeanSquaredPercentageError(BaseForecastingErrorMetricFunc):
     """
 
     func = mean_squared_percentage_error
+    func_by_index = _mean_squared_percentage_error_by_index
+    func_grouped = _mean_squared_percentage_error_grouped
 
     def __init__(
         self,
@@ -1747,6 +1877,8 @@ class MedianSquaredPercentageError(BaseForecastingErrorMetricFunc):
     """
 
     func = median_squared_percentage_error
+    func_by_index = _median_squared_percentage_error_by_index
+    func_grouped = _median_squared_percentage_error_grouped
 
     def __init__(
         self,
@@ -2125,6 +2257,8 @@ class MeanAsymmetricError(BaseForecastingErrorMetricFunc):
     """
 
     func = mean_asymmetric_error
+    func_by_index = _mean_asymmetric_error_by_index
+    func_grouped = _mean_asymmetric_error_grouped
 
     def __init__(
         self,
@@ -2229,6 +2363,8 @@ class MeanLinexError(BaseForecastingErrorMetricFunc):
     """
 
     func = mean_linex_error
+    func_by_index = _mean_linex_error_by_index
+    func_grouped = _mean_linex_error_grouped
 
     def __init__(
         self,
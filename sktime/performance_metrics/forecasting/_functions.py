@@ -1666,7 +1666,7 @@ def median_absolute_percentage_error(
     else:
         check_consistent_length(y_true, horizon_weight)
         output_errors = _weighted_percentile(
-            np.abs(_percentage_error(y_pred, y_true, symmetric=symmetric)),
+            np.abs(_percentage_error(y_true, y_pred, symmetric=symmetric)),
             sample_weight=horizon_weight,
         )
 
@@ -2710,3 +2710,950 @@ def _percentage_error(y_true, y_pred, symmetric=False):
     else:
         percentage_error = (y_true - y_pred) / np.maximum(np.abs(y_true), EPS)
     return percentage_error
+
+
+def _leave_one_out_mean(values, horizon_weight=None):
+    """Leave-one-out (weighted) means of the columns of values.
+
+    Parameters
+    ----------
+    values : np.ndarray of shape (n, n_outputs)
+    horizon_weight : np.ndarray of shape (n,), optional, default=None
+        weights of the rows of values, unweighted if None
+
+    Returns
+    -------
+    np.ndarray of shape (n, n_outputs)
+        i,j-th entry is the mean of column j of values, with row i left out
+    """
+    n = values.shape[0]
+    if horizon_weight is None:
+        weights = np.ones((n, 1))
+    else:
+        weights = horizon_weight.reshape(-1, 1)
+    weighted_values = weights * values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (weighted_values.sum(axis=0) - weighted_values) / (
+            weights.sum() - weights
+        )
+
+
+def _leave_one_out_median(values, horizon_weight=None):
+    """Leave-one-out medians of the columns of values, from a single sort.
+
+    Unweighted medians are computed as by ``np.median``, weighted medians
+    as the lower weighted percentile of ``sklearn.utils.stats._weighted_percentile``.
+
+    Parameters
+    ----------
+    values : np.ndarray of shape (n, n_outputs)
+    horizon_weight : np.ndarray of shape (n,), optional, default=None
+        weights of the rows of values, unweighted if None
+
+    Returns
+    -------
+    np.ndarray of shape (n, n_outputs)
+        i,j-th entry is the median of column j of values, with row i left out
+    """
+    n, n_outputs = values.shape
+    if n == 1:
+        return np.full((n, n_outputs), np.nan)
+
+    sorted_idx = np.argsort(values, axis=0)
+    sorted_values = np.take_along_axis(values, sorted_idx, axis=0)
+    # rank of each entry within its column, i.e., position in sorted_values
+    ranks = np.empty_like(sorted_idx)
+    positions = np.broadcast_to(np.arange(n).reshape(-1, 1), values.shape)
+    np.put_along_axis(ranks, sorted_idx, positions, axis=0)
+
+    def _remaining(k):
+        """Return the k-th smallest value of each column, with row i left out."""
+        idx = k + (k >= ranks)
+        return np.take_along_axis(sorted_values, idx, axis=0)
+
+    if horizon_weight is None:
+        m = n - 1
+        if m % 2 == 1:
+            return _remaining(np.full(values.shape, m // 2))
+        lower = _remaining(np.full(values.shape, m // 2 - 1))
+        upper = _remaining(np.full(values.shape, m // 2))
+        return (lower + upper) / 2
+
+    weights = np.broadcast_to(horizon_weight.reshape(-1, 1), values.shape)
+    weight_cdf = np.cumsum(np.take_along_axis(weights, sorted_idx, axis=0), axis=0)
+    # half of the total weight with row i left out
+    target = 0.5 * (weight_cdf[-1] - weights)
+    target = np.where(target == 0, np.nextafter(target, target + 1), target)
+
+    # first position in the remaining values where the cdf reaches target,
+    # the cdf of the remaining values is weight_cdf - weights after the rank
+    before = np.empty(values.shape, dtype=int)
+    after = np.empty(values.shape, dtype=int)
+    for j in range(n_outputs):
+        before[:, j] = np.searchsorted(weight_cdf[:, j], target[:, j])
+        after[:, j] = np.searchsorted(weight_cdf[:, j], target[:, j] + weights[:, j])
+    idx = np.where(before < ranks, before, np.maximum(after, ranks + 1) - 1)
+    return _remaining(np.minimum(idx, n - 2))
+
+
+def _jackknife_by_index(
+    values,
+    statistic="mean",
+    transform=None,
+    horizon_weight=None,
+    multioutput="uniform_average",
+    average_outputs_first=False,
+):
+    """Jackknife pseudo-values of a metric that is a function of a column statistic.
+
+    Computes, without re-evaluating the metric n times, the pseudo-values
+    ``n * metric(values) - (n - 1) * metric(values without row i)``,
+    for metrics of the form ``transform(statistic(values))``, with statistic
+    the (weighted) mean or median of the columns of values.
+    This covers any metric that is a smooth function of a sum over time points.
+
+    Parameters
+    ----------
+    values : np.ndarray of shape (n, n_outputs)
+        errors at each time point, e.g., absolute errors
+    statistic : {"mean", "median"}, default="mean"
+        statistic of values per column
+    transform : callable, optional, default=None
+        vectorized function applied to the statistic, identity if None
+    horizon_weight : array-like of shape (n,), optional, default=None
+        weights of the rows of values, unweighted if None
+    multioutput : {'raw_values', 'uniform_average'}  or array-like of shape \
+            (n_outputs,), default='uniform_average'
+        Defines how to aggregate the pseudo-values for multivariate data.
+    average_outputs_first : bool, default=False
+        whether the statistic is averaged over outputs before transform is applied,
+        as in scaled metrics, only used if multioutput is not "raw_values"
+
+    Returns
+    -------
+    pseudo_values : np.ndarray of shape (n,), or (n, n_outputs) if "raw_values"
+    """
+    n = values.shape[0]
+    if horizon_weight is not None:
+        check_consistent_length(values, horizon_weight)
+        horizon_weight = np.asarray(horizon_weight, dtype=float)
+
+    if statistic == "mean":
+        value = np.average(values, weights=horizon_weight, axis=0)
+        value_loo = _leave_one_out_mean(values, horizon_weight)
+    elif horizon_weight is None:
+        value = np.median(values, axis=0)
+        value_loo = _leave_one_out_median(values)
+    else:
+        value = _weighted_percentile(values, sample_weight=horizon_weight)
+        value_loo = _leave_one_out_median(values, horizon_weight)
+
+    if isinstance(multioutput, str):
+        if multioutput == "uniform_average":
+            # pass None as weights to np.average: uniform mean
+            multioutput = None
+        else:
+            average_outputs_first = False
+    if average_outputs_first:
+        value = np.average(value, weights=multioutput, keepdims=True)
+        value_loo = np.average(value_loo, weights=multioutput, axis=1).reshape(-1, 1)
+
+    if transform is None:
+        transform = np.asarray
+    pseudo_values = np.broadcast_to(n * transform(value), value_loo.shape).copy()
+    if n > 1:
+        pseudo_values -= (n - 1) * transform(value_loo)
+
+    if average_outputs_first:
+        return pseudo_values[:, 0]
+    if isinstance(multioutput, str):
+        return pseudo_values
+    return np.average(pseudo_values, weights=multioutput, axis=1)
+
+
+def _get_naive_seasonal_errors(y_true, y_train, sp):
+    """Return y_train and the naive seasonal prediction of y_train, for scaling."""
+    y_train = check_series(y_train, enforce_univariate=False)
+    # _check_reg_targets converts 1-dim y_true,y_pred to 2-dim so need to match
+    if y_train.ndim == 1:
+        y_train = np.expand_dims(y_train, 1)
+
+    # Check test and train have same dimensions
+    if y_true.ndim != y_train.ndim:
+        raise ValueError("Equal dimension required for y_true and y_train")
+
+    if (y_true.ndim > 1) and (y_true.shape[1] != y_train.shape[1]):
+        raise ValueError("Equal number of columns required for y_true and y_train")
+
+    y_train = np.asarray(y_train)
+    return y_train[sp:], y_train[:-sp]
+
+
+def _sqrt_if(square_root):
+    """Return np.sqrt if square_root, else None (identity transform)."""
+    return np.sqrt if square_root else None
+
+
+def _mean_absolute_error_by_index(
+    y_true, y_pred, horizon_weight=None, multioutput="uniform_average", **kwargs
+):
+    """Jackknife pseudo-values of mean_absolute_error at each time point."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _jackknife_by_index(
+        np.abs(y_true - y_pred),
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+    )
+
+
+def _mean_squared_error_by_index(
+    y_true,
+    y_pred,
+    horizon_weight=None,
+    multioutput="uniform_average",
+    square_root=False,
+    **kwargs,
+):
+    """Jackknife pseudo-values of mean_squared_error at each time point."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _jackknife_by_index(
+        np.square(y_true - y_pred),
+        transform=_sqrt_if(square_root),
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+    )
+
+
+def _median_absolute_error_by_index(
+    y_true, y_pred, horizon_weight=None, multioutput="uniform_average", **kwargs
+):
+    """Jackknife pseudo-values of median_absolute_error at each time point."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _jackknife_by_index(
+        np.abs(y_true - y_pred),
+        statistic="median",
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+    )
+
+
+def _median_squared_error_by_index(
+    y_true,
+    y_pred,
+    horizon_weight=None,
+    multioutput="uniform_average",
+    square_root=False,
+    **kwargs,
+):
+    """Jackknife pseudo-values of median_squared_error at each time point."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _jackknife_by_index(
+        np.square(y_true - y_pred),
+        statistic="median",
+        transform=_sqrt_if(square_root),
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+    )
+
+
+def _geometric_mean_absolute_error_by_index(
+    y_true, y_pred, horizon_weight=None, multioutput="uniform_average", **kwargs
+):
+    """Jackknife pseudo-values of geometric_mean_absolute_error at each time point."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    errors = y_true - y_pred
+    errors = np.where(errors == 0.0, EPS, errors)
+    # the geometric mean is the exponential of the mean of logarithms
+    return _jackknife_by_index(
+        np.log(np.abs(errors)),
+        transform=np.exp,
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+    )
+
+
+def _geometric_mean_squared_error_by_index(
+    y_true,
+    y_pred,
+    horizon_weight=None,
+    multioutput="uniform_average",
+    square_root=False,
+    **kwargs,
+):
+    """Jackknife pseudo-values of geometric_mean_squared_error at each time point."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    errors = y_true - y_pred
+    errors = np.where(errors == 0.0, EPS, errors)
+    exponent = 0.5 if square_root else 1.0
+    return _jackknife_by_index(
+        np.log(np.square(errors)),
+        transform=lambda x: np.exp(exponent * x),
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+    )
+
+
+def _mean_absolute_percentage_error_by_index(
+    y_true,
+    y_pred,
+    horizon_weight=None,
+    multioutput="uniform_average",
+    symmetric=False,
+    **kwargs,
+):
+    """Jackknife pseudo-values of mean_absolute_percentage_error at each index."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _jackknife_by_index(
+        np.abs(_percentage_error(y_true, y_pred, symmetric=symmetric)),
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+    )
+
+
+def _median_absolute_percentage_error_by_index(
+    y_true,
+    y_pred,
+    horizon_weight=None,
+    multioutput="uniform_average",
+    symmetric=False,
+    **kwargs,
+):
+    """Jackknife pseudo-values of median_absolute_percentage_error at each index."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _jackknife_by_index(
+        np.abs(_percentage_error(y_true, y_pred, symmetric=symmetric)),
+        statistic="median",
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+    )
+
+
+def _mean_squared_percentage_error_by_index(
+    y_true,
+    y_pred,
+    horizon_weight=None,
+    multioutput="uniform_average",
+    square_root=False,
+    symmetric=False,
+    **kwargs,
+):
+    """Jackknife pseudo-values of mean_squared_percentage_error at each index."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _jackknife_by_index(
+        np.square(_percentage_error(y_true, y_pred, symmetric=symmetric)),
+        transform=_sqrt_if(square_root),
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+    )
+
+
+def _median_squared_percentage_error_by_index(
+    y_true,
+    y_pred,
+    horizon_weight=None,
+    multioutput="uniform_average",
+    square_root=False,
+    symmetric=False,
+    **kwargs,
+):
+    """Jackknife pseudo-values of median_squared_percentage_error at each index."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _jackknife_by_index(
+        np.square(_percentage_error(y_true, y_pred, symmetric=symmetric)),
+        statistic="median",
+        transform=_sqrt_if(square_root),
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+    )
+
+
+def _mean_absolute_scaled_error_by_index(
+    y_true, y_pred, sp=1, horizon_weight=None, multioutput="uniform_average", **kwargs
+):
+    """Jackknife pseudo-values of mean_absolute_scaled_error at each time point."""
+    y_train = _get_kwarg("y_train", metric_name="mean_absolute_scaled_error", **kwargs)
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    y_train, y_pred_naive = _get_naive_seasonal_errors(y_true, y_train, sp)
+    mae_naive = mean_absolute_error(y_train, y_pred_naive, multioutput=multioutput)
+    return _jackknife_by_index(
+        np.abs(y_true - y_pred),
+        transform=lambda x: x / np.maximum(mae_naive, EPS),
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+        average_outputs_first=True,
+    )
+
+
+def _median_absolute_scaled_error_by_index(
+    y_true, y_pred, sp=1, horizon_weight=None, multioutput="uniform_average", **kwargs
+):
+    """Jackknife pseudo-values of median_absolute_scaled_error at each time point."""
+    y_train = _get_kwarg(
+        "y_train", metric_name="median_absolute_scaled_error", **kwargs
+    )
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    y_train, y_pred_naive = _get_naive_seasonal_errors(y_true, y_train, sp)
+    mdae_naive = median_absolute_error(y_train, y_pred_naive, multioutput=multioutput)
+    return _jackknife_by_index(
+        np.abs(y_true - y_pred),
+        statistic="median",
+        transform=lambda x: x / np.maximum(mdae_naive, EPS),
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+        average_outputs_first=True,
+    )
+
+
+def _mean_squared_scaled_error_by_index(
+    y_true,
+    y_pred,
+    sp=1,
+    horizon_weight=None,
+    multioutput="uniform_average",
+    square_root=False,
+    **kwargs,
+):
+    """Jackknife pseudo-values of mean_squared_scaled_error at each time point."""
+    y_train = _get_kwarg("y_train", metric_name="mean_squared_scaled_error", **kwargs)
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    y_train, y_pred_naive = _get_naive_seasonal_errors(y_true, y_train, sp)
+    mse_naive = mean_squared_error(y_train, y_pred_naive, multioutput=multioutput)
+    exponent = 0.5 if square_root else 1.0
+    return _jackknife_by_index(
+        np.square(y_true - y_pred),
+        transform=lambda x: (x / np.maximum(mse_naive, EPS)) ** exponent,
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+        average_outputs_first=True,
+    )
+
+
+def _median_squared_scaled_error_by_index(
+    y_true,
+    y_pred,
+    sp=1,
+    horizon_weight=None,
+    multioutput="uniform_average",
+    square_root=False,
+    **kwargs,
+):
+    """Jackknife pseudo-values of median_squared_scaled_error at each time point."""
+    y_train = _get_kwarg("y_train", metric_name="median_squared_scaled_error", **kwargs)
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    y_train, y_pred_naive = _get_naive_seasonal_errors(y_true, y_train, sp)
+    mdse_naive = median_squared_error(y_train, y_pred_naive, multioutput=multioutput)
+    exponent = 0.5 if square_root else 1.0
+    return _jackknife_by_index(
+        np.square(y_true - y_pred),
+        statistic="median",
+        transform=lambda x: (x / np.maximum(mdse_naive, EPS)) ** exponent,
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+        average_outputs_first=True,
+    )
+
+
+def _mean_linex_error_by_index(
+    y_true,
+    y_pred,
+    a=1.0,
+    b=1.0,
+    horizon_weight=None,
+    multioutput="uniform_average",
+    **kwargs,
+):
+    """Jackknife pseudo-values of mean_linex_error at each time point."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _jackknife_by_index(
+        _linex_error(y_true, y_pred, a=a, b=b),
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+    )
+
+
+def _mean_asymmetric_error_by_index(
+    y_true,
+    y_pred,
+    asymmetric_threshold=0.0,
+    left_error_function="squared",
+    right_error_function="absolute",
+    left_error_penalty=1.0,
+    right_error_penalty=1.0,
+    horizon_weight=None,
+    multioutput="uniform_average",
+    **kwargs,
+):
+    """Jackknife pseudo-values of mean_asymmetric_error at each time point."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    asymmetric_errors = _asymmetric_error(
+        y_true,
+        y_pred,
+        asymmetric_threshold=asymmetric_threshold,
+        left_error_function=left_error_function,
+        right_error_function=right_error_function,
+        left_error_penalty=left_error_penalty,
+        right_error_penalty=right_error_penalty,
+    )
+    return _jackknife_by_index(
+        asymmetric_errors,
+        horizon_weight=horizon_weight,
+        multioutput=multioutput,
+    )
+
+
+def _group_statistic(values, groups, n_groups, statistic="mean"):
+    """Means or medians of the columns of values, per group of rows.
+
+    Parameters
+    ----------
+    values : np.ndarray of shape (n, n_outputs)
+    groups : np.ndarray of int of shape (n,)
+        group of each row of values, integers in 0, ..., n_groups - 1
+    n_groups : int, number of groups
+    statistic : {"mean", "median"}, default="mean"
+
+    Returns
+    -------
+    np.ndarray of shape (n_groups, n_outputs)
+        i,j-th entry is the statistic of column j of values over rows in group i,
+        nan for groups without rows
+    """
+    n_outputs = values.shape[1]
+    counts = np.bincount(groups, minlength=n_groups)
+    out = np.full((n_groups, n_outputs), np.nan)
+
+    if statistic == "mean":
+        for j in range(n_outputs):
+            sums = np.bincount(groups, weights=values[:, j], minlength=n_groups)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                out[:, j] = sums / counts
+        return out
+
+    # medians are the middle values after sorting by group, then by value
+    nonempty = counts > 0
+    starts = (np.cumsum(counts) - counts)[nonempty]
+    lower = starts + (counts[nonempty] - 1) // 2
+    upper = starts + counts[nonempty] // 2
+    for j in range(n_outputs):
+        sorted_values = values[np.lexsort((values[:, j], groups)), j]
+        out[nonempty, j] = (sorted_values[lower] + sorted_values[upper]) / 2
+    return out
+
+
+def _evaluate_grouped(
+    values,
+    groups,
+    n_groups=None,
+    statistic="mean",
+    transform=None,
+    multioutput="uniform_average",
+    average_outputs_first=False,
+):
+    """Evaluate a metric that is a function of a column statistic, per group.
+
+    Evaluates metrics of the form ``transform(statistic(values))``, for all
+    groups of rows of values at once, see _jackknife_by_index.
+
+    Parameters
+    ----------
+    values : np.ndarray of shape (n, n_outputs)
+        errors at each time point, e.g., absolute errors
+    groups : np.ndarray of int of shape (n,)
+        group of each row of values, integers in 0, ..., n_groups - 1
+    n_groups : int, optional, default = number of groups in groups
+    statistic : {"mean", "median"}, default="mean"
+        statistic of values per column
+    transform : callable, optional, default=None
+        vectorized function applied to the statistic, identity if None
+    multioutput : {'raw_values', 'uniform_average'}  or array-like of shape \
+            (n_outputs,), default='uniform_average'
+        Defines how to aggregate the metric for multivariate data.
+    average_outputs_first : bool, default=False
+        whether the statistic is averaged over outputs before transform is applied,
+        as in scaled metrics, only used if multioutput is not "raw_values"
+
+    Returns
+    -------
+    np.ndarray of shape (n_groups,), or (n_groups, n_outputs) if "raw_values"
+        metric for each group
+    """
+    if n_groups is None:
+        n_groups = np.max(groups) + 1
+    value = _group_statistic(values, groups, n_groups, statistic=statistic)
+
+    if isinstance(multioutput, str):
+        if multioutput == "uniform_average":
+            # pass None as weights to np.average: uniform mean
+            multioutput = None
+        else:
+            average_outputs_first = False
+    if average_outputs_first:
+        value = np.average(value, weights=multioutput, axis=1)
+
+    if transform is not None:
+        value = transform(value)
+
+    if average_outputs_first or isinstance(multioutput, str):
+        return value
+    return np.average(value, weights=multioutput, axis=1)
+
+
+def _get_naive_seasonal_errors_grouped(y_true, y_train, y_train_groups, sp):
+    """Return y_train, its naive seasonal prediction and their groups, per group.
+
+    Pairs of a value and its naive seasonal prediction never span two groups.
+    """
+    y_train = np.asarray(y_train)
+    if y_train.ndim == 1:
+        y_train = np.expand_dims(y_train, 1)
+
+    if y_true.shape[1] != y_train.shape[1]:
+        raise ValueError("Equal number of columns required for y_true and y_train")
+
+    # rows of instances not in y_true have negative group
+    keep = y_train_groups >= 0
+    y_train = y_train[keep]
+    y_train_groups = y_train_groups[keep]
+
+    # make groups contiguous, keeping the temporal order within groups
+    order = np.argsort(y_train_groups, kind="stable")
+    y_train = y_train[order]
+    y_train_groups = y_train_groups[order]
+
+    same_group = y_train_groups[sp:] == y_train_groups[:-sp]
+    return (
+        y_train[sp:][same_group],
+        y_train[:-sp][same_group],
+        y_train_groups[sp:][same_group],
+    )
+
+
+def _mean_absolute_error_grouped(
+    y_true, y_pred, groups, multioutput="uniform_average", **kwargs
+):
+    """Mean_absolute_error of each group of rows of y_true, y_pred."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _evaluate_grouped(np.abs(y_true - y_pred), groups, multioutput=multioutput)
+
+
+def _mean_squared_error_grouped(
+    y_true,
+    y_pred,
+    groups,
+    multioutput="uniform_average",
+    square_root=False,
+    **kwargs,
+):
+    """Mean_squared_error of each group of rows of y_true, y_pred."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _evaluate_grouped(
+        np.square(y_true - y_pred),
+        groups,
+        transform=_sqrt_if(square_root),
+        multioutput=multioutput,
+    )
+
+
+def _median_absolute_error_grouped(
+    y_true, y_pred, groups, multioutput="uniform_average", **kwargs
+):
+    """Median_absolute_error of each group of rows of y_true, y_pred."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _evaluate_grouped(
+        np.abs(y_true - y_pred),
+        groups,
+        statistic="median",
+        multioutput=multioutput,
+    )
+
+
+def _median_squared_error_grouped(
+    y_true,
+    y_pred,
+    groups,
+    multioutput="uniform_average",
+    square_root=False,
+    **kwargs,
+):
+    """Median_squared_error of each group of rows of y_true, y_pred."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _evaluate_grouped(
+        np.square(y_true - y_pred),
+        groups,
+        statistic="median",
+        transform=_sqrt_if(square_root),
+        multioutput=multioutput,
+    )
+
+
+def _geometric_mean_absolute_error_grouped(
+    y_true, y_pred, groups, multioutput="uniform_average", **kwargs
+):
+    """Geometric_mean_absolute_error of each group of rows of y_true, y_pred."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    errors = y_true - y_pred
+    errors = np.where(errors == 0.0, EPS, errors)
+    return _evaluate_grouped(
+        np.log(np.abs(errors)),
+        groups,
+        transform=np.exp,
+        multioutput=multioutput,
+    )
+
+
+def _geometric_mean_squared_error_grouped(
+    y_true,
+    y_pred,
+    groups,
+    multioutput="uniform_average",
+    square_root=False,
+    **kwargs,
+):
+    """Geometric_mean_squared_error of each group of rows of y_true, y_pred."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    errors = y_true - y_pred
+    errors = np.where(errors == 0.0, EPS, errors)
+    exponent = 0.5 if square_root else 1.0
+    return _evaluate_grouped(
+        np.log(np.square(errors)),
+        groups,
+        transform=lambda x: np.exp(exponent * x),
+        multioutput=multioutput,
+    )
+
+
+def _mean_absolute_percentage_error_grouped(
+    y_true,
+    y_pred,
+    groups,
+    multioutput="uniform_average",
+    symmetric=False,
+    **kwargs,
+):
+    """Mean_absolute_percentage_error of each group of rows of y_true, y_pred."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _evaluate_grouped(
+        np.abs(_percentage_error(y_true, y_pred, symmetric=symmetric)),
+        groups,
+        multioutput=multioutput,
+    )
+
+
+def _median_absolute_percentage_error_grouped(
+    y_true,
+    y_pred,
+    groups,
+    multioutput="uniform_average",
+    symmetric=False,
+    **kwargs,
+):
+    """Median_absolute_percentage_error of each group of rows of y_true, y_pred."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _evaluate_grouped(
+        np.abs(_percentage_error(y_true, y_pred, symmetric=symmetric)),
+        groups,
+        statistic="median",
+        multioutput=multioutput,
+    )
+
+
+def _mean_squared_percentage_error_grouped(
+    y_true,
+    y_pred,
+    groups,
+    multioutput="uniform_average",
+    square_root=False,
+    symmetric=False,
+    **kwargs,
+):
+    """Mean_squared_percentage_error of each group of rows of y_true, y_pred."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _evaluate_grouped(
+        np.square(_percentage_error(y_true, y_pred, symmetric=symmetric)),
+        groups,
+        transform=_sqrt_if(square_root),
+        multioutput=multioutput,
+    )
+
+
+def _median_squared_percentage_error_grouped(
+    y_true,
+    y_pred,
+    groups,
+    multioutput="uniform_average",
+    square_root=False,
+    symmetric=False,
+    **kwargs,
+):
+    """Median_squared_percentage_error of each group of rows of y_true, y_pred."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _evaluate_grouped(
+        np.square(_percentage_error(y_true, y_pred, symmetric=symmetric)),
+        groups,
+        statistic="median",
+        transform=_sqrt_if(square_root),
+        multioutput=multioutput,
+    )
+
+
+def _mean_linex_error_grouped(
+    y_true, y_pred, groups, a=1.0, b=1.0, multioutput="uniform_average", **kwargs
+):
+    """Mean_linex_error of each group of rows of y_true, y_pred."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    return _evaluate_grouped(
+        _linex_error(y_true, y_pred, a=a, b=b), groups, multioutput=multioutput
+    )
+
+
+def _mean_asymmetric_error_grouped(
+    y_true,
+    y_pred,
+    groups,
+    asymmetric_threshold=0.0,
+    left_error_function="squared",
+    right_error_function="absolute",
+    left_error_penalty=1.0,
+    right_error_penalty=1.0,
+    multioutput="uniform_average",
+    **kwargs,
+):
+    """Mean_asymmetric_error of each group of rows of y_true, y_pred."""
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    asymmetric_errors = _asymmetric_error(
+        y_true,
+        y_pred,
+        asymmetric_threshold=asymmetric_threshold,
+        left_error_function=left_error_function,
+        right_error_function=right_error_function,
+        left_error_penalty=left_error_penalty,
+        right_error_penalty=right_error_penalty,
+    )
+    return _evaluate_grouped(asymmetric_errors, groups, multioutput=multioutput)
+
+
+def _scaled_error_grouped(
+    y_true,
+    y_pred,
+    groups,
+    error_func,
+    statistic,
+    exponent,
+    sp,
+    multioutput,
+    metric_name,
+    **kwargs,
+):
+    """Scaled error of each group of rows of y_true, y_pred.
+
+    The error of each group is scaled by the same error of the naive seasonal
+    prediction, over the rows of y_train in the same group, in one grouped pass.
+    """
+    y_train = _get_kwarg("y_train", metric_name=metric_name, **kwargs)
+    y_train_groups = _get_kwarg("y_train_groups", metric_name=metric_name, **kwargs)
+    _, y_true, y_pred, multioutput = _check_reg_targets(y_true, y_pred, multioutput)
+    n_groups = np.max(groups) + 1
+    y_train, y_pred_naive, naive_groups = _get_naive_seasonal_errors_grouped(
+        y_true, y_train, np.asarray(y_train_groups), sp
+    )
+    naive_errors = _evaluate_grouped(
+        error_func(y_train - y_pred_naive),
+        naive_groups,
+        n_groups=n_groups,
+        statistic=statistic,
+        multioutput=multioutput,
+        average_outputs_first=True,
+    )
+    return _evaluate_grouped(
+        error_func(y_true - y_pred),
+        groups,
+        n_groups=n_groups,
+        statistic=statistic,
+        transform=lambda x: (x / np.maximum(naive_errors, EPS)) ** exponent,
+        multioutput=multioutput,
+        average_outputs_first=True,
+    )
+
+
+def _mean_absolute_scaled_error_grouped(
+    y_true, y_pred, groups, sp=1, multioutput="uniform_average", **kwargs
+):
+    """Mean_absolute_scaled_error of each group of rows of y_true, y_pred."""
+    return _scaled_error_grouped(
+        y_true,
+        y_pred,
+        groups,
+        error_func=np.abs,
+        statistic="mean",
+        exponent=1.0,
+        sp=sp,
+        multioutput=multioutput,
+        metric_name="mean_absolute_scaled_error",
+        **kwargs,
+    )
+
+
+def _median_absolute_scaled_error_grouped(
+    y_true, y_pred, groups, sp=1, multioutput="uniform_average", **kwargs
+):
+    """Median_absolute_scaled_error of each group of rows of y_true, y_pred."""
+    return _scaled_error_grouped(
+        y_true,
+        y_pred,
+        groups,
+        error_func=np.abs,
+        statistic="median",
+        exponent=1.0,
+        sp=sp,
+        multioutput=multioutput,
+        metric_name="median_absolute_scaled_error",
+        **kwargs,
+    )
+
+
+def _mean_squared_scaled_error_grouped(
+    y_true,
+    y_pred,
+    groups,
+    sp=1,
+    multioutput="uniform_average",
+    square_root=False,
+    **kwargs,
+):
+    """Mean_squared_scaled_error of each group of rows of y_true, y_pred."""
+    return _scaled_error_grouped(
+        y_true,
+        y_pred,
+        groups,
+        error_func=np.square,
+        statistic="mean",
+        exponent=0.5 if square_root else 1.0,
+        sp=sp,
+        multioutput=multioutput,
+        metric_name="mean_squared_scaled_error",
+        **kwargs,
+    )
+
+
+def _median_squared_scaled_error_grouped(
+    y_true,
+    y_pred,
+    groups,
+    sp=1,
+    multioutput="uniform_average",
+    square_root=False,
+    **kwargs,
+):
+    """Median_squared_scaled_error of each group of rows of y_true, y_pred."""
+    return _scaled_error_grouped(
+        y_true,
+        y_pred,
+        groups,
+        error_func=np.square,
+        statistic="median",
+        exponent=0.5 if square_root else 1.0,
+        sp=sp,
+        multioutput=multioutput,
+        metric_name="median_squared_scaled_error",
+        **kwargs,
+    )
@@ -12,6 +12,9 @@ from sktime.performance_metrics.forecasting import (
     _classes,
     make_forecasting_scorer,
 )
+from sktime.performance_metrics.forecasting._classes import (
+    BaseForecastingErrorMetric,
+)
 from sktime.utils._testing.hierarchical import _make_hierarchical
 from sktime.utils._testing.series import _make_series
 
@@ -130,3 +133,74 @@ def test_custom_metric(greater_is_better):
     assert isinstance(score, float)
 
     check_estimator(fc_scorer, return_exceptions=False)
+
+
+@pytest.mark.parametrize("n_columns", [1, 2])
+@pytest.mark.parametrize("multioutput", ["uniform_average", "raw_values"])
+@pytest.mark.parametrize("metric", metrics, ids=names)
+def test_metric_evaluate_by_index(metric, multioutput, n_columns):
+    """Test vectorized evaluate_by_index against jackknife pseudo-values."""
+    if not hasattr(metric, "func_by_index"):
+        return None
+
+    y_pred = pd.DataFrame(_make_series(n_columns=n_columns, random_state=21))
+    y_true = pd.DataFrame(_make_series(n_columns=n_columns, random_state=42))
+    y_pred = y_pred.iloc[:20]
+    y_true = y_true.iloc[:20]
+    # ties, to test leave-one-out medians
+    y_pred.iloc[5:8] = y_true.iloc[5:8] + 0.5
+    kwargs = {"y_train": y_true}
+
+    metric = metric(multioutput=multioutput)
+    res = metric.evaluate_by_index(y_true=y_true, y_pred=y_pred, **kwargs)
+
+    n = len(y_true)
+    value = metric.evaluate(y_true=y_true, y_pred=y_pred, **kwargs)
+    expected = [
+        n * value
+        - (n - 1)
+        * metric.evaluate(y_true=y_true.drop(i), y_pred=y_pred.drop(i), **kwargs)
+        for i in y_true.index
+    ]
+
+    if multioutput == "uniform_average":
+        assert isinstance(res, pd.Series)
+    else:
+        assert isinstance(res, pd.DataFrame)
+        assert res.columns.equals(y_true.columns)
+    assert res.index.equals(y_true.index)
+    np.testing.assert_allclose(res.to_numpy(), np.array(expected))
+
+
+@pytest.mark.parametrize("n_columns", [1, 2])
+@pytest.mark.parametrize("multilevel", ["uniform_average", "raw_values"])
+@pytest.mark.parametrize("multioutput", ["uniform_average", "raw_values"])
+@pytest.mark.parametrize("metric", metrics, ids=names)
+def test_metric_hierarchical_grouped(
+    metric, multioutput, multilevel, n_columns, monkeypatch
+):
+    """Test grouped evaluation of hierarchical input against loop over instances."""
+    if not hasattr(metric, "func_grouped"):
+        return None
+
+    y_pred = _make_hierarchical(random_state=21, n_columns=n_columns, min_timepoints=5)
+    y_true = _make_hierarchical(random_state=42, n_columns=n_columns, min_timepoints=5)
+    y_train = _make_hierarchical(random_state=7, n_columns=n_columns, min_timepoints=8)
+    y_pred = y_pred.reindex(y_true.index).fillna(1.0)
+
+    metric = metric(multioutput=multioutput, multilevel=multilevel)
+    res = metric(y_true=y_true, y_pred=y_pred, y_train=y_train)
+
+    # loop over instances, calling _evaluate once per instance
+    monkeypatch.setattr(
+        type(metric),
+        "_evaluate_vectorized",
+        BaseForecastingErrorMetric._evaluate_vectorized,
+    )
+    expected = metric(y_true=y_true, y_pred=y_pred, y_train=y_train)
+
+    assert type(res) is type(expected)
+    if isinstance(res, pd.DataFrame):
+        assert res.index.equals(expected.index)
+        assert res.columns.equals(expected.columns)
+    np.testing.assert_allclose(np.asarray(res, dtype=float), expected)
@@ -187,6 +187,13 @@ ESTIMATOR_TAG_REGISTER = [
         "bool",
         "is the transformer capable of carrying out an inverse transform?",
     ),
+    (
+        "capability:batch_panel",
+        "forecaster",
+        "bool",
+        "can the forecaster fit and predict all series of an aligned panel at once, "
+        "via _fit_batch and _predict_batch?",
+    ),
     (
         "capability:pred_int",
         "forecaster",
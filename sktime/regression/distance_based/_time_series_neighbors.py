@@ -78,6 +78,8 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         The number of parallel jobs to run for neighbors search.
         ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
         ``-1`` means using all processors.
+        If distance is a str, also the number of threads used to compute
+        the distance matrix with ``pairwise_distance``.
 
     Examples
     --------
@@ -149,7 +151,9 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
             distance_params = {}
 
         if isinstance(distance, str):
-            return pairwise_distance(X, X2, distance, **distance_params)
+            return pairwise_distance(
+                X, X2, distance, n_jobs=self.n_jobs, **distance_params
+            )
         else:
             return distance(X, X2)
 
@@ -64,6 +64,7 @@ from sktime.datatypes import (
     mtype_to_scitype,
 )
 from sktime.datatypes._series_as_panel import convert_to_scitype
+from sktime.utils.parallel import parallelize
 from sktime.utils.sklearn import (
     is_sklearn_classifier,
     is_sklearn_regressor,
@@ -96,7 +97,22 @@ def _coerce_to_list(obj):
 
 
 class BaseTransformer(BaseEstimator):
-    """Transformer base class."""
+    """Transformer base class.
+
+    Configs, set via `set_config`, control how methods are executed:
+
+    backend:parallel : str, optional, default=None
+        backend for the loop over series if the transformer is vectorized,
+        i.e., applied to Panel or Hierarchical data, or multivariate data,
+        it does not natively support.
+        None or "None" loops sequentially; "loky", "multiprocessing" and
+        "threading" use `joblib.Parallel` with the respective backend.
+        Results are in the same order as the series, for all backends.
+    backend:parallel:params : dict, optional, default=None
+        parameters passed to the backend, e.g., `n_jobs` for joblib backends.
+        the key "chunksize" sends batches of that many series per task.
+        See `sktime.utils.parallel.parallelize` for details.
+    """
 
     # default tag values - these typically make the "safest" assumption
     _tags = {
@@ -130,6 +146,12 @@ class BaseTransformer(BaseEstimator):
         "python_version": None,  # PEP 440 python version specifier to limit versions
     }
 
+    # default config values, see class docstring for descriptions
+    _config = {
+        "backend:parallel": None,  # parallelization backend for vectorization
+        "backend:parallel:params": None,  # parameters passed to the backend
+    }
+
     # allowed mtypes for transformers - Series and Panel
     ALLOWED_INPUT_MTYPES = [
         "pd.Series",
@@ -978,7 +1000,17 @@ class BaseTransformer(BaseEstimator):
     def _vectorize(self, methodname, **kwargs):
         """Vectorized/iterated loop over method of BaseTransformer.
 
-        Uses transformers_ attribute to store one forecaster per loop index.
+        Uses transformers_ attribute to store one transformer per loop index.
+
+        The loop is executed by `sktime.utils.parallel.parallelize`, with backend
+        and backend parameters taken from the "backend:parallel" and
+        "backend:parallel:params" configs of self, see class docstring.
+        Fitted transformers are returned from the loop and written to
+        transformers_, so transformers_ is available for all backends,
+        including process backends.
+
+        If the "fit_is_empty" tag is True, no transformers are stored,
+        and a single fitted clone of self is applied to all series.
         """
 
         def unwrap(kwargs):
@@ -1005,21 +1037,38 @@ class BaseTransformer(BaseEstimator):
         FIT_METHODS = ["fit", "update"]
         TRAFO_METHODS = ["transform", "inverse_transform"]
 
+        backend = self._get_config_value("backend:parallel")
+        backend_params = self._get_config_value("backend:parallel:params")
+        meta = {"methodname": methodname, "kwargs": kwargs}
+
+        def _parallelize(tasks):
+            return parallelize(
+                fun=_vectorize_one,
+                iter=tasks,
+                meta=meta,
+                backend=backend,
+                backend_params=backend_params,
+            )
+
         if methodname in FIT_METHODS:
             X, _, Xs, ys, n, row_idx, col_idx = unwrap(kwargs)
+            iloc_ix = [X.get_iloc_indexer(ix) for ix in range(n)]
 
             # if fit is called, create container of transformers, but not in update
+            # clones are created here, so workers never receive self and its data
             if methodname == "fit":
                 self.transformers_ = pd.DataFrame(index=row_idx, columns=col_idx)
-                for ix in range(n):
-                    i, j = X.get_iloc_indexer(ix)
+                for i, j in iloc_ix:
                     self.transformers_.iloc[i].iloc[j] = self.clone()
 
             # fit/update the ix-th transformer with the ix-th series/panel
-            for ix in range(n):
-                i, j = X.get_iloc_indexer(ix)
-                method = getattr(self.transformers_.iloc[i].iloc[j], methodname)
-                method(X=Xs[ix], y=ys[i], **kwargs)
+            tasks = [
+                (self.transformers_.iloc[i].iloc[j], Xs[ix], ys[i])
+                for ix, (i, j) in enumerate(iloc_ix)
+            ]
+            fitted = _parallelize(tasks)
+            for (i, j), transformer in zip(iloc_ix, fitted):
+                self.transformers_.iloc[i].iloc[j] = transformer
 
             return self
 
@@ -1040,25 +1089,24 @@ class BaseTransformer(BaseEstimator):
                     )
 
                 # transform the i-th series/panel with the i-th stored transformer
-                Xts = []
-                ix = -1
-                for i, j in product(range(n), range(m)):
-                    ix += 1
-                    method = getattr(self.transformers_.iloc[i].iloc[j], methodname)
-                    Xts += [method(X=Xs[ix], y=ys[i], **kwargs)]
+                tasks = [
+                    (self.transformers_.iloc[i].iloc[j], Xs[ix], ys[i])
+                    for ix, (i, j) in enumerate(product(range(n), range(m)))
+                ]
+                Xts = _parallelize(tasks)
                 Xt = X.reconstruct(Xts, overwrite_index=False)
 
-            # if fit_is_empty: don't store transformers, run fit/transform in one
+            # if fit_is_empty: don't store transformers, fit is a no-op,
+            # so one fitted clone of self can transform all series/panels
             else:
                 X, _, Xs, ys, n, _, _ = unwrap(kwargs)
 
-                # fit/transform the i-th series/panel with a new clone of self
-                Xts = []
-                for ix in range(n):
-                    i, j = X.get_iloc_indexer(ix)
-                    transformer = self.clone().fit(X=Xs[ix], y=ys[i], **kwargs)
-                    method = getattr(transformer, methodname)
-                    Xts += [method(X=Xs[ix], y=ys[i], **kwargs)]
+                iloc_ix = [X.get_iloc_indexer(ix) for ix in range(n)]
+                transformer = self.clone().fit(X=Xs[0], y=ys[0], **kwargs)
+                tasks = [
+                    (transformer, Xs[ix], ys[i]) for ix, (i, _) in enumerate(iloc_ix)
+                ]
+                Xts = _parallelize(tasks)
                 Xt = X.reconstruct(Xts, overwrite_index=False)
 
             # # one more thing before returning:
@@ -1238,3 +1286,31 @@ class _PanelToPanelTransformer(BaseTransformer):
         "X_inner_mtype": "nested_univ",  # which mtypes do _fit/_predict support for X?
         "y_inner_mtype": "pd.Series",  # which mtypes do _fit/_predict support for X?
     }
+
+
+def _vectorize_one(task, meta):
+    """Call one transformer method in the vectorization loop of BaseTransformer.
+
+    Defined at module level, so it can be pickled by process backends.
+
+    Parameters
+    ----------
+    task : tuple of (transformer, X, y)
+        transformer to call the method of, and data arguments for the method
+    meta : dict with keys "methodname" and "kwargs"
+        name of the method to call, and further keyword arguments to pass
+
+    Returns
+    -------
+    transformer, if method is "fit" or "update"
+    return of method, otherwise
+    """
+    transformer, X, y = task
+    methodname = meta["methodname"]
+    kwargs = meta["kwargs"]
+
+    ret = getattr(transformer, methodname)(X=X, y=y, **kwargs)
+
+    if methodname in ["fit", "update"]:
+        return transformer
+    return ret
@@ -11,7 +11,8 @@ from warnings import warn
 
 import numpy as np
 import pandas as pd
-from numpy.linalg import inv
+from scipy import sparse
+from scipy.sparse.linalg import splu
 
 from sktime.transformations.base import BaseTransformer
 from sktime.transformations.hierarchical.aggregate import _check_index_no_total
@@ -32,6 +33,11 @@ class Reconciler(BaseTransformer):
     after prediction. However they are general and can be used to transform
     hierarchical time-series data.
 
+    Forecasts of all nodes and time points are reconciled at once, as a product
+    with the summation matrix S, which is held as a sparse matrix.
+    "ols" and "wls_str" are computed by solving a sparse linear system
+    in the aggregate nodes, without forming the dense reconciliation matrix G.
+
     Please refer to [1]_ for further information
 
     Parameters
@@ -43,6 +49,16 @@ class Reconciler(BaseTransformer):
             "wls_str" - weighted least squares (structural)
             "td_fcst" - top down based on (forecast) proportions
 
+    Attributes
+    ----------
+    s_matrix : pd.DataFrame
+        summation matrix S, with a row per node and a column per bottom node
+    g_matrix : pd.DataFrame
+        reconciliation matrix G, with a row per bottom node and a column per node,
+        for "td_fcst" a template of zeros, as G depends on the forecasts
+    parent_child : pd.DataFrame
+        parent and child node of each connection in the hierarchy
+
     See Also
     --------
     Aggregator
@@ -134,26 +150,63 @@ class Reconciler(BaseTransformer):
         if _check_index_no_total(X):
             X = self._add_totals(X)
 
-        # define reconciliation matrix
-        if self.method == "bu":
-            self.g_matrix = _get_g_matrix_bu(X)
-        elif self.method == "ols":
-            self.g_matrix = _get_g_matrix_ols(X)
-        elif self.method == "wls_str":
-            self.g_matrix = _get_g_matrix_wls_str(X)
-        elif self.method == "td_fcst":
-            self.g_matrix = _get_g_matrix_td_fcst(X)
-        else:
-            raise RuntimeError("unreachable condition, error in _check_method")
+        # nodes of the hierarchy and the position of their parent and bottom nodes
+        self._nodes, self._parents, self._bottom_pos = _get_hierarchy(X)
 
         # now summation matrix
-        self.s_matrix = _get_s_matrix(X)
+        self._s_matrix = _get_s_matrix_sparse(self._parents, self._bottom_pos)
+
+        # weights of the least squares methods, diagonal of W
+        if self.method == "ols":
+            self._weights = np.ones(len(self._nodes))
+        elif self.method == "wls_str":
+            self._weights = np.asarray(self._s_matrix.sum(axis=1)).ravel()
 
         # parent child df
-        self.parent_child = _parent_child_df(self.s_matrix)
+        self.parent_child = _get_parent_child_df(self._nodes, self._parents)
 
         return self
 
+    @property
+    def s_matrix(self):
+        """Summation matrix S, as a dense pd.DataFrame."""
+        return pd.DataFrame(
+            self._s_matrix.toarray(),
+            index=self._nodes,
+            columns=self._nodes[self._bottom_pos],
+        )
+
+    @property
+    def g_matrix(self):
+        """Reconciliation matrix G, as a dense pd.DataFrame."""
+        n_nodes = len(self._nodes)
+        if self.method == "td_fcst":
+            g_matrix = np.zeros((len(self._bottom_pos), n_nodes))
+        else:
+            g_matrix = self._reconcile_bottom(np.eye(n_nodes))
+        return pd.DataFrame(
+            g_matrix,
+            index=self._nodes[self._bottom_pos],
+            columns=self._nodes,
+        )
+
+    def _reconcile_bottom(self, y):
+        """Reconcile forecasts to the bottom level, i.e., compute G y.
+
+        Parameters
+        ----------
+        y : 2D np.ndarray, forecasts with a row per node in self._nodes
+
+        Returns
+        -------
+        2D np.ndarray, reconciled forecasts with a row per bottom node
+        """
+        if self.method == "bu":
+            return y[self._bottom_pos]
+        if self.method == "td_fcst":
+            return _get_bottom_td_fcst(y, self._parents, self._bottom_pos)
+        return _get_bottom_wls(y, self._s_matrix, self._bottom_pos, self._weights)
+
     def _transform(self, X, y=None):
         """Transform X and return a transformed version.
 
@@ -186,34 +239,18 @@ class Reconciler(BaseTransformer):
             )
             X = self._add_totals(X)
 
-        # check here that index of X matches the self.s_matrix
-        al_inds = X.droplevel(level=-1).index.unique()
-        chk_newindx = np.all(self.s_matrix.index == al_inds)
-        if not chk_newindx:
+        # check here that index of X matches the nodes seen in fit
+        al_inds = X.index.droplevel(level=-1).unique()
+        if not al_inds.equals(self._nodes):
             raise ValueError(
                 "Check unique indexes of X.droplevel(level=-1) matches "
                 "the data used in Reconciler().fit(X)."
             )
 
-        X = X.groupby(level=-1)
-        # could use X.transform() with np.dot, v. marginally faster in my tests
-        # - loop can use index matching via df.dot() which is probably worth it
-        recon_preds = []
-        gmat = self.g_matrix
-        for _name, group in X:
-
-            if self.method == "td_fcst":
-                gmat = _update_td_fcst(
-                    g_matrix=gmat, x_sf=group.droplevel(-1), conn_df=self.parent_child
-                )
-            # reconcile via SGy
-            fcst = self.s_matrix.dot(gmat.dot(group.droplevel(-1)))
-            # add back in time index
-            fcst.index = group.index
-            recon_preds.append(fcst)
-
-        recon_preds = pd.concat(recon_preds, axis=0)
-        recon_preds = recon_preds.sort_index()
+        # reconcile via SGy, for all time points at once
+        block, node_pos, time_pos = _get_forecast_block(X, self._nodes)
+        recon_block = self._s_matrix @ self._reconcile_bottom(block)
+        recon_preds = _from_forecast_block(recon_block, X, node_pos, time_pos)
 
         return recon_preds
 
@@ -239,6 +276,82 @@ class Reconciler(BaseTransformer):
         return [{"method": x} for x in cls.METHOD_LIST]
 
 
+def _get_hierarchy(X):
+    """Determine the nodes of the hierarchy in X and how they are connected.
+
+    The parent of a node is the closest node in X which aggregates it, i.e., the
+    node with the most trailing levels replaced by "__total", among those in X.
+
+    Parameters
+    ----------
+    X :  Panel of mtype pd_multiindex_hier
+
+    Returns
+    -------
+    nodes : pd.Index, unique indexes of X with the time level removed
+    parents : 1D np.ndarray of int, position in nodes of the parent of each node,
+        -1 for the top node
+    bottom_pos : 1D np.ndarray of int, position in nodes of the bottom level nodes,
+        i.e., nodes which are not aggregates
+    """
+    nodes = X.index.droplevel(level=-1).unique()
+    levels = [nodes.get_level_values(i) for i in range(nodes.nlevels)]
+    is_total = np.column_stack([np.asarray(level == "__total") for level in levels])
+    bottom_pos = np.flatnonzero(~is_total[:, -1])
+
+    # number of leading levels which are not "__total"
+    depth = np.where(is_total.any(axis=1), is_total.argmax(axis=1), len(levels))
+
+    # search for the parent from the closest to the top aggregate
+    lookup = pd.MultiIndex.from_arrays(levels)
+    parents = np.full(len(nodes), -1)
+    for n_kept in range(len(levels) - 1, -1, -1):
+        search = np.flatnonzero((parents == -1) & (depth > n_kept))
+        if len(search) == 0:
+            continue
+        candidates = [
+            level[search] if i < n_kept else ["__total"] * len(search)
+            for i, level in enumerate(levels)
+        ]
+        parents[search] = lookup.get_indexer(pd.MultiIndex.from_arrays(candidates))
+
+    return nodes, parents, bottom_pos
+
+
+def _get_s_matrix_sparse(parents, bottom_pos):
+    """Determine the summation "S" matrix as a sparse matrix.
+
+    Parameters
+    ----------
+    parents : 1D np.ndarray of int, position of the parent of each node,
+        -1 for the top node, as returned by _get_hierarchy
+    bottom_pos : 1D np.ndarray of int, position of the bottom level nodes
+
+    Returns
+    -------
+    s_matrix : scipy.sparse.csr_matrix with rows equal to the number of nodes
+        in the hierarchy, and columns equal to the number of bottom level nodes,
+        with 1 where the node of the row aggregates the bottom node of the column
+    """
+    rows = []
+    cols = []
+    node = bottom_pos.copy()
+    col = np.arange(len(bottom_pos))
+    # walk up from each bottom node to the top node
+    while len(node) > 0:
+        rows.append(node)
+        cols.append(col)
+        has_parent = parents[node] >= 0
+        node = parents[node[has_parent]]
+        col = col[has_parent]
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+
+    return sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(parents), len(bottom_pos))
+    )
+
+
 def _get_s_matrix(X):
     """Determine the summation "S" matrix.
 
@@ -264,265 +377,161 @@ def _get_s_matrix(X):
     ----------
     .. [1] https://otexts.com/fpp3/hierarchical.html
     """
-    # get bottom level indexes
-    bl_inds = (
-        X.loc[~(X.index.get_level_values(level=-2).isin(["__total"]))]
-        .index.droplevel(level=-1)
-        .unique()
-    )
-    # get all level indexes
-    al_inds = X.droplevel(level=-1).index.unique()
-
-    # set up matrix
-    s_matrix = pd.DataFrame(
-        [[0.0 for i in range(len(bl_inds))] for i in range(len(al_inds))],
-        index=al_inds,
-    )
-    s_matrix.columns = bl_inds
-
-    # now insert indicator for bottom level
-    for i in s_matrix.columns:
-        s_matrix.loc[s_matrix.index == i, i] = 1.0
-
-    # now for each unique column add aggregate indicator
-    for i in s_matrix.columns:
-        if s_matrix.index.nlevels > 1:
-            # replace index with totals -> ("nodeA", "__total")
-            agg_ind = list(i)[::-1]
-            for j in range(len(agg_ind)):
-                agg_ind[j] = "__total"
-                # insert indicator
-                s_matrix.loc[tuple(agg_ind[::-1]), i] = 1.0
-        else:
-            s_matrix.loc["__total", i] = 1.0
-
-    # drop new levels not present in orginal matrix
-    s_matrix.dropna(inplace=True)
-
-    return s_matrix
+    nodes, parents, bottom_pos = _get_hierarchy(X)
+    s_matrix = _get_s_matrix_sparse(parents, bottom_pos)
 
+    return pd.DataFrame(s_matrix.toarray(), index=nodes, columns=nodes[bottom_pos])
 
-def _get_g_matrix_bu(X):
-    """Determine the reconciliation "G" matrix for the bottom up method.
 
-    Reconciliation methods require the G matrix. The G matrix is used to redefine
-    base forecasts for the entire hierarchy to the bottom-level only before
-    summation using the S matrix.
-
-    Please refer to [1]_ for further information.
+def _get_forecast_block(X, nodes):
+    """Arrange the forecasts in X in a block with a row per node.
 
     Parameters
     ----------
     X :  Panel of mtype pd_multiindex_hier
+    nodes : pd.Index, unique indexes of X with the time level removed
 
     Returns
     -------
-    g_matrix : pd.DataFrame with rows equal to the number of bottom level nodes
-        only, i.e. with no aggregate nodes, and columns equal to the number of
-        unique nodes in the hierarchy. The matrix indexes is inherited from the
-        input data, with the time level removed.
-
-    References
-    ----------
-    .. [1] https://otexts.com/fpp3/hierarchical.html
+    block : 2D np.ndarray with a row per node in nodes, and a column per
+        time point and column of X, nan where X has no row
+    node_pos : 1D np.ndarray of int, position in nodes of each row of X
+    time_pos : 1D np.ndarray of int, position of the time point of each row of X
     """
-    # get bottom level indexes
-    bl_inds = (
-        X.loc[~(X.index.get_level_values(level=-2).isin(["__total"]))]
-        .index.droplevel(level=-1)
-        .unique()
-    )
-
-    # get all level indexes
-    al_inds = X.droplevel(level=-1).index.unique()
-
-    g_matrix = pd.DataFrame(
-        [[0.0 for i in range(len(bl_inds))] for i in range(len(al_inds))],
-        index=al_inds,
-    )
-    g_matrix.columns = bl_inds
-
-    # now insert indicator for bottom level
-    for i in g_matrix.columns:
-        g_matrix.loc[g_matrix.index == i, i] = 1.0
-
-    return g_matrix.transpose()
+    node_pos = nodes.get_indexer(X.index.droplevel(level=-1))
+    time_pos, times = pd.factorize(X.index.get_level_values(-1))
 
+    block = np.full((len(nodes), len(times), X.shape[1]), np.nan)
+    block[node_pos, time_pos] = X.to_numpy(dtype="float")
 
-def _get_g_matrix_ols(X):
-    """Determine the reconciliation "G" matrix for the ordinary least squares method.
+    return block.reshape(len(nodes), -1), node_pos, time_pos
 
-    Reconciliation methods require the G matrix. The G matrix is used to redefine
-    base forecasts for the entire hierarchy to the bottom-level only before
-    summation using the S matrix.
 
-    Please refer to [1]_ for further information.
+def _from_forecast_block(block, X, node_pos, time_pos):
+    """Return the rows of X from a block, inverse of _get_forecast_block.
 
     Parameters
     ----------
-    X :  Panel of mtype pd_multiindex_hier
+    block : 2D np.ndarray, as returned by _get_forecast_block
+    X :  Panel of mtype pd_multiindex_hier, passed to _get_forecast_block
+    node_pos : 1D np.ndarray of int, as returned by _get_forecast_block
+    time_pos : 1D np.ndarray of int, as returned by _get_forecast_block
 
     Returns
     -------
-    g_ols : pd.DataFrame with rows equal to the number of bottom level nodes
-        only, i.e. with no aggregate nodes, and columns equal to the number of
-        unique nodes in the hierarchy. The matrix indexes is inherited from the
-        summation matrix.
-
-    References
-    ----------
-    .. [1] https://otexts.com/fpp3/hierarchical.html
+    pd.DataFrame with index and columns of X, sorted by index
     """
-    # get s matrix
-    smat = _get_s_matrix(X)
-    # get g
-    g_ols = pd.DataFrame(
-        np.dot(inv(np.dot(np.transpose(smat), smat)), np.transpose(smat))
-    )
-    # set indexes of matrix
-    g_ols = g_ols.transpose()
-    g_ols = g_ols.set_index(smat.index)
-    g_ols.columns = smat.columns
-    g_ols = g_ols.transpose()
+    values = block.reshape(len(block), -1, X.shape[1])[node_pos, time_pos]
+    return pd.DataFrame(values, index=X.index, columns=X.columns).sort_index()
 
-    return g_ols
 
+def _get_bottom_wls(y, s_matrix, bottom_pos, weights):
+    """Reconcile forecasts to the bottom level by weighted least squares.
 
-def _get_g_matrix_wls_str(X):
-    """Reconciliation "G" matrix for the weighted least squares (structural) method.
-
-    Reconciliation methods require the G matrix. The G matrix is used to re-define
-    base forecasts for the entire hierarchy to the bottom-level only before
-    summation using the S matrix.
-
-    Please refer to [1]_ for further information.
+    Computes G y for G = (S'WS)^-1 S'W with diagonal W, without forming G. The
+    reconciled forecasts are the projection of y on the coherent forecasts,
+    y - W^-1 U (U'W^-1 U)^-1 U'y, where U'y = 0 are the aggregation constraints,
+    see [1]_. U'W^-1 U has a row per aggregate node and is sparse, as aggregate
+    nodes only share bottom nodes with the nodes above and below them.
 
     Parameters
     ----------
-    X :  Panel of mtype pd_multiindex_hier
+    y : 2D np.ndarray, forecasts with a row per node
+    s_matrix : scipy.sparse matrix, summation matrix S
+    bottom_pos : 1D np.ndarray of int, position of the bottom level nodes
+    weights : 1D np.ndarray of float, diagonal of W
 
     Returns
     -------
-    g_wls_str : pd.DataFrame with rows equal to the number of bottom level nodes
-        only, i.e. with no aggregate nodes, and columns equal to the number of
-        unique nodes in the hierarchy. The matrix indexes is inherited from the
-        summation matrix.
+    2D np.ndarray, reconciled forecasts with a row per bottom node
 
     References
     ----------
-    .. [1] https://otexts.com/fpp3/hierarchical.html
+    .. [1] https://doi.org/10.1080/01621459.2018.1448825
     """
-    # this is similar to the ols except we have a new matrix W
-    smat = _get_s_matrix(X)
+    agg_pos = np.setdiff1d(np.arange(s_matrix.shape[0]), bottom_pos)
+    # aggregate nodes are sums of bottom nodes, y_agg = c y_bottom
+    c = s_matrix[agg_pos]
+    inv_w_agg = sparse.diags(1 / weights[agg_pos])
+    inv_w_bottom = 1 / weights[bottom_pos]
 
-    diag_data = np.diag(smat.sum(axis=1).values)
-    w_mat = pd.DataFrame(diag_data, index=smat.index, columns=smat.index)
+    m = inv_w_agg + c @ sparse.diags(inv_w_bottom) @ c.T
+    lagrange = splu(sparse.csc_matrix(m)).solve(y[agg_pos] - c @ y[bottom_pos])
 
-    g_wls_str = pd.DataFrame(
-        np.dot(
-            inv(np.dot(np.transpose(smat), np.dot(w_mat, smat))),
-            np.dot(np.transpose(smat), w_mat),
-        )
-    )
-    # set indexes of matrix
-    g_wls_str = g_wls_str.transpose()
-    g_wls_str = g_wls_str.set_index(smat.index)
-    g_wls_str.columns = smat.columns
-    g_wls_str = g_wls_str.transpose()
-
-    return g_wls_str
+    return y[bottom_pos] + inv_w_bottom[:, None] * (c.T @ lagrange)
 
 
-def _get_g_matrix_td_fcst(X):
-    """Determine the "G" matrix for the top down forecast proportions method.
+def _get_bottom_td_fcst(y, parents, bottom_pos):
+    """Reconcile forecasts to the bottom level by top down forecast proportions.
 
-    Reconciliation methods require the G matrix. The G matrix is used to redefine
-    base forecasts for the entire hierarchy to the bottom-level only before
-    summation using the S matrix.
-
-    Note that the G matrix for this method changes for each forecast. This
-    is just a template G matrix which is updated at each iteration.
-
-    Please refer to [1]_ for further information.
+    The forecast of a bottom node is the forecast of the top node, times the
+    proportion of each node in its path to the top node among its siblings.
 
     Parameters
     ----------
-    X :  Panel of mtype pd_multiindex_hier
+    y : 2D np.ndarray, forecasts with a row per node
+    parents : 1D np.ndarray of int, position of the parent of each node,
+        -1 for the top node, as returned by _get_hierarchy
+    bottom_pos : 1D np.ndarray of int, position of the bottom level nodes
 
     Returns
     -------
-    g_matrix : pd.DataFrame with rows equal to the number of bottom level nodes
-        only, i.e. with no aggregate nodes, and columns equal to the number of
-        unique nodes in the hierarchy. The matrix indexes is inherited from the
-        input data, with the time level removed.
+    2D np.ndarray, reconciled forecasts with a row per bottom node
 
     References
     ----------
     .. [1] https://otexts.com/fpp3/hierarchical.html
     """
-    g_matrix = _get_g_matrix_bu(X)
-    g_matrix = g_matrix.replace(to_replace=1, value=0)
+    children = np.flatnonzero(parents >= 0)
+    # sum of the forecasts of the children of each node
+    parent_matrix = sparse.csr_matrix(
+        (np.ones(len(children)), (parents[children], children)),
+        shape=(len(parents), len(parents)),
+    )
+    children_sums = parent_matrix @ y
 
-    return g_matrix
+    proportions = np.ones_like(y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        proportions[children] = y[children] / children_sums[parents[children]]
 
+    # walk up from each bottom node to the top node
+    bottom_proportions = proportions[bottom_pos]
+    top = bottom_pos.copy()
+    node = parents[bottom_pos]
+    has_parent = node >= 0
+    while has_parent.any():
+        top[has_parent] = node[has_parent]
+        bottom_proportions[has_parent] *= proportions[node[has_parent]]
+        node[has_parent] = parents[node[has_parent]]
+        has_parent = node >= 0
 
-def _update_td_fcst(g_matrix, x_sf, conn_df):
-    """Update the "G" matrix for the top down forecast proportions method.
+    return bottom_proportions * y[top]
 
-    Reconciliation methods require the G matrix. The G matrix is used to redefine
-    base forecasts for the entire hierarchy to the bottom-level only before
-    summation using the S matrix.
 
-    This takes the gmatrix template from _get_g_matrix_td_fcst() and updates
-    it based on a single forecast.
-    Please refer to [1]_ for further information.
+def _get_parent_child_df(nodes, parents):
+    """Extract the parent and child connections from the parents of nodes.
 
     Parameters
     ----------
-    g_matrix :  pd.DataFrame reconciliation matrix template from
-        _get_g_matrix_td_fcst()
-    x_sf : pd.Series which contains a hierarchy forecast for a single timepoint
-    conn_df : A look up table containing the child and parent of each connection
-        in a hierarchy
+    nodes : pd.Index, nodes of the hierarchy
+    parents : 1D np.ndarray of int, position in nodes of the parent of each node,
+        -1 for the top node, as returned by _get_hierarchy
 
     Returns
     -------
-    g_matrix : pd.DataFrame with rows equal to the number of bottom level nodes
-        only, i.e. with no aggregate nodes, and columns equal to the number of
-        unique nodes in the hierarchy. The matrix indexes is inherited from the
-        input data, with the time level removed.
-
-    References
-    ----------
-    .. [1] https://otexts.com/fpp3/hierarchical.html
+    df : A two column pd.DataFrame with rows equal to the number of
+        connections in a hierarchy.
     """
-    for i in g_matrix.index:
-        # start from each bottom index
-        child = i
-        props = []
-        # if the bottom level are single strings, integers, or whatever
-        if not isinstance(child, tuple):
-            child_chk = (child,)
-        else:
-            child_chk = child
-
-        while sum([j == "__total" for j in list(child_chk)]) < len(child_chk):
-            # find the parent of the child
-            parent = conn_df.loc[conn_df["child"] == child, "parent"].values[0]
-            # now need to find nodes directly connected to the parent
-            children = conn_df.loc[conn_df["parent"] == parent, "child"].unique()
-            # calculate proportions
-            props.append((x_sf.loc[child] / x_sf.loc[children].sum()).values[0])
-            # move up the chain
-            child = parent
-            if not isinstance(child, tuple):
-                child_chk = (child,)
-            else:
-                child_chk = child
-
-        g_matrix.loc[i, "__total"] = np.prod(props)
+    children = np.flatnonzero(parents >= 0)
+    df = pd.DataFrame(
+        {
+            "parent": list(nodes[parents[children]]),
+            "child": list(nodes[children]),
+        }
+    )
+    df = df.sort_values(["parent", "child"]).reset_index(drop=True)
 
-    return g_matrix
+    return df
 
 
 def _parent_child_df(s_matrix):
@@ -542,27 +551,10 @@ def _parent_child_df(s_matrix):
     df : A two column pd.DataFrame with rows equal to the number of
         connections in a hierarchy.
     """
-    parent_child = []
-    total_count = s_matrix.index.to_frame()
-    total_count = (total_count == "__total").sum(axis=1)
-
-    # for each bottom node
-    for i in s_matrix.columns:
-        # get all connections
-        connected_nodes = s_matrix[(s_matrix[i] == 1)].sum(axis=1)
-        # for non-flattened hiearchies make sure "__totals" are above
-        connected_nodes = (connected_nodes + total_count).dropna()
-        connected_nodes = connected_nodes.sort_values(ascending=False)
-
-        # starting from top add list of [parent, child]
-        for j in range(len(connected_nodes.index) - 1):
-            parent_child.append(
-                [connected_nodes.index[j], connected_nodes.index[j + 1]]
-            )
+    nodes = s_matrix.index
+    levels = [nodes.get_level_values(i) for i in range(nodes.nlevels)]
+    # the parents only depend on the nodes, and their time level is ignored
+    X = pd.DataFrame(index=pd.MultiIndex.from_arrays(levels + [[0] * len(nodes)]))
+    nodes, parents, _ = _get_hierarchy(X)
 
-    df = pd.DataFrame(parent_child)
-    df.columns = ["parent", "child"]
-
-    df = df.drop_duplicates().sort_values(["parent", "child"]).reset_index(drop=True)
-
-    return df
+    return _get_parent_child_df(nodes, parents)
@@ -65,3 +65,29 @@ def test_reconciler_fit_transform(method):
     reconciler_unnamed = Reconciler(method=method)
     msg = "Reconciler returns different output for named and unnamed indexes."
     assert prds_recon.equals(reconciler_unnamed.fit_transform(prds)), msg
+
+
+@pytest.mark.parametrize("method", ["bu", "ols", "wls_str"])
+def test_reconciler_sgy(method):
+    """Tests that reconciling all time points at once is the product SGy.
+
+    Raises
+    ------
+    This test asserts that the output of Reconciler is equal to the dense product
+    of the S and G matrices with the forecasts, for each time point, in a
+    hierarchy with more than one level.
+    """
+    agg = Aggregator(flatten_single_levels=False)
+
+    X = _bottom_hier_datagen(no_bottom_nodes=6, no_levels=2, random_seed=123)
+    X = agg.fit_transform(X)
+
+    reconciler = Reconciler(method=method)
+    X_recon = reconciler.fit_transform(X)
+
+    s_matrix = reconciler.s_matrix
+    g_matrix = reconciler.g_matrix
+    for _name, group in X.groupby(level=-1):
+        expected = s_matrix.dot(g_matrix.dot(group.droplevel(-1)))
+        actual = X_recon.loc[group.index].droplevel(-1)
+        np.testing.assert_allclose(actual.loc[expected.index], expected)
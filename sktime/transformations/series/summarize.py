@@ -6,11 +6,13 @@
 __author__ = ["mloning", "RNKuhns", "danbartl", "grzegorzrut"]
 __all__ = ["SummaryTransformer", "WindowSummarizer"]
 
+import numpy as np
 import pandas as pd
 from joblib import Parallel, delayed
 
 from sktime.transformations.base import BaseTransformer
 from sktime.utils.multiindex import flatten_multiindex
+from sktime.utils.numba.rolling import WINDOW_FUNCS, rolling_window_features
 
 
 class WindowSummarizer(BaseTransformer):
@@ -23,8 +25,9 @@ class WindowSummarizer(BaseTransformer):
     Parameters
     ----------
     n_jobs : int, optional (default=-1)
-        The number of jobs to run in parallel for applying the window functions.
-        ``-1`` means using all processors.
+        The number of jobs to run in parallel for applying the window functions
+        that are not computed by numba kernels, i.e., "corr", "cov" and custom
+        functions. ``-1`` means using all processors.
     target_cols: list of str, optional (default = None)
         Specifies which columns in X to target for applying the window functions.
         ``None`` will target the first column
@@ -93,12 +96,20 @@ class WindowSummarizer(BaseTransformer):
                 * "corr",
                 * "cov",
                 * "skew",
-                * "sem"
+                * "sem",
+                * "quantile",
+                * "count"
                 See also: https://pandas.pydata.org/docs/reference/window.html.
             The column generated will be named after the key provided, followed by the
             lag parameter and the window_length (if not a lag).
+            All functions except "corr", "cov" and custom functions are computed
+            by compiled numba kernels, in one pass over all instances of a column,
+            windows do not span more than one instance.
+            "count" counts non-missing values, also in incomplete windows.
         second value (window): list of integers
             List containg lag and window_length parameters.
+            For "quantile", a third entry with the quantile may be given,
+            e.g., [1, 7, 0.9], the default is the median, 0.5.
         truncate: str, optional (default = None)
             Defines how to deal with NAs that were created as a result of applying the
             functions in the lag_feature dict across windows that are longer than
@@ -310,26 +321,49 @@ class WindowSummarizer(BaseTransformer):
             bfill = True
         else:
             bfill = False
+        # window functions with a numba kernel are computed in one call per column,
+        # on the values of all instances, the others via pandas rolling
+        is_numba = func_dict["summarizer"].apply(
+            lambda x: not callable(x) and x in WINDOW_FUNCS
+        )
+        func_dict_numba = func_dict.loc[is_numba.to_numpy()]
+        func_dict_pandas = func_dict.loc[~is_numba.to_numpy()]
+        order, starts = _get_group_order(X.index)
+
         for cols in target_cols:
-            if isinstance(X.index, pd.MultiIndex):
-                hier_levels = list(range(X.index.nlevels - 1))
-                X_grouped = X.groupby(level=hier_levels)[cols]
-                df = Parallel(n_jobs=self.n_jobs)(
-                    delayed(_window_feature)(X_grouped, **kwargs, bfill=bfill)
-                    for index, kwargs in func_dict.iterrows()
-                )
-            else:
-                df = Parallel(n_jobs=self.n_jobs)(
-                    delayed(_window_feature)(X.loc[:, [cols]], **kwargs, bfill=bfill)
-                    for _index, kwargs in func_dict.iterrows()
+            df = []
+            if len(func_dict_numba) > 0:
+                df.append(
+                    _window_features_numba(
+                        X[cols], func_dict_numba, order, starts, bfill=bfill
+                    )
                 )
+            if len(func_dict_pandas) > 0:
+                if isinstance(X.index, pd.MultiIndex):
+                    hier_levels = list(range(X.index.nlevels - 1))
+                    X_grouped = X.groupby(level=hier_levels)[cols]
+                    df += Parallel(n_jobs=self.n_jobs)(
+                        delayed(_window_feature)(X_grouped, **kwargs, bfill=bfill)
+                        for index, kwargs in func_dict_pandas.iterrows()
+                    )
+                else:
+                    df += Parallel(n_jobs=self.n_jobs)(
+                        delayed(_window_feature)(
+                            X.loc[:, [cols]], **kwargs, bfill=bfill
+                        )
+                        for _index, kwargs in func_dict_pandas.iterrows()
+                    )
             Xt = pd.concat(df, axis=1)
+            # restore order of features as in lag_feature
+            Xt = Xt[[_get_feature_name(**kwargs) for _, kwargs in func_dict.iterrows()]]
             Xt = Xt.add_prefix(str(cols) + "_")
             Xt_out.append(Xt)
         Xt_out_df = pd.concat(Xt_out, axis=1)
         Xt_return = pd.concat([Xt_out_df, X.drop(target_cols, axis=1)], axis=1)
 
-        Xt_return = Xt_return.loc[idx]
+        # subsetting by index is expensive for large MultiIndex, avoid if possible
+        if not Xt_return.index.equals(idx):
+            Xt_return = Xt_return.loc[idx]
         return Xt_return
 
     def _update(self, X, y=None):
@@ -491,24 +525,182 @@ def _window_feature(Z, summarizer=None, window=None, bfill=False):
     if bfill is True:
         feat = feat.fillna(method="bfill")
 
+    feat.rename(
+        columns={feat.columns[0]: _get_feature_name(summarizer, window)},
+        inplace=True,
+    )
+    return feat
+
+
+def _get_feature_name(summarizer=None, window=None):
+    """Get name of the feature generated by summarizer and window, without prefix."""
     if callable(summarizer):
         name = summarizer.__name__
     else:
         name = summarizer
 
     if name == "lag":
-        feat.rename(
-            columns={feat.columns[0]: name + "_" + str(window[0])},
-            inplace=True,
-        )
-    else:
-        feat.rename(
-            columns={
-                feat.columns[0]: name + "_" + "_".join([str(item) for item in window])
-            },
-            inplace=True,
-        )
-    return feat
+        return name + "_" + str(window[0])
+    return name + "_" + "_".join([str(item) for item in window])
+
+
+def _get_group_order(index):
+    """Get order of rows that makes instances contiguous, and instance boundaries.
+
+    Parameters
+    ----------
+    index : pd.Index, row index of X, if MultiIndex, all but the last level
+        index instances, rows of each instance are in temporal order
+
+    Returns
+    -------
+    order : np.ndarray of int, or None if rows of instances are already contiguous
+        stable order of rows such that rows of each instance are contiguous
+    starts : np.ndarray of int, positions of first rows of instances in order,
+        followed by len(index)
+    """
+    n = len(index)
+    if not isinstance(index, pd.MultiIndex):
+        return None, np.array([0, n])
+
+    # one integer code per instance, from codes of the instance levels
+    codes = np.zeros(n, dtype=np.int64)
+    for level, level_codes in zip(index.levels[:-1], index.codes[:-1]):
+        codes = codes * (len(level) + 1) + level_codes + 1
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    is_new = np.ones(n, dtype=bool)
+    is_new[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    starts = np.append(np.flatnonzero(is_new), n)
+    if (order == np.arange(n)).all():
+        order = None
+    return order, starts
+
+
+def _window_features_numba(Z, func_dict, order, starts, bfill=False):
+    """Compute window features and lags of a column via numba kernels.
+
+    Same as concatenating _window_feature for all rows of func_dict, for window
+    functions in WINDOW_FUNCS, computed in one pass over the column.
+
+    Parameters
+    ----------
+    Z : pd.Series, column of X to summarize
+    func_dict : pd.DataFrame with columns "summarizer" and "window", see
+        WindowSummarizer._fit, summarizers must be keys of WINDOW_FUNCS.
+        For "quantile", window may have a third entry, the quantile, default 0.5
+    order, starts : return of _get_group_order for the index of Z
+    bfill : bool, optional (default=False), whether to backward fill
+
+    Returns
+    -------
+    pd.DataFrame with index of Z, one column per row of func_dict,
+        named as by _window_feature
+    """
+    values = Z.to_numpy(dtype=float)
+    if order is not None:
+        values = values[order]
+
+    windows = func_dict["window"].to_list()
+    summarizers = func_dict["summarizer"].to_list()
+    feat = rolling_window_features(
+        np.ascontiguousarray(values),
+        starts,
+        np.array([WINDOW_FUNCS[x] for x in summarizers], dtype=np.int64),
+        np.array([int(w[0]) for w in windows], dtype=np.int64),
+        np.array([int(w[1]) for w in windows], dtype=np.int64),
+        np.array([w[2] if len(w) > 2 else 0.5 for w in windows], dtype=float),
+        bfill,
+    )
+
+    if order is not None:
+        feat_unsorted = np.empty_like(feat)
+        feat_unsorted[order] = feat
+        feat = feat_unsorted
+
+    columns = [_get_feature_name(x, w) for x, w in zip(summarizers, windows)]
+    return pd.DataFrame(feat, index=Z.index, columns=columns)
+
+
+# window functions supported by _summarize_windows, in addition to callables
+_WINDOW_FUNCS_NUMPY = [
+    "lag",
+    "sum",
+    "mean",
+    "median",
+    "std",
+    "var",
+    "kurt",
+    "min",
+    "max",
+    "skew",
+    "sem",
+]
+
+
+def _summarize_windows(Z, summarizer):
+    """Apply summarizer to each row of a 2D array of windows, like pandas rolling.
+
+    Computes the same value as the native pandas window function, or the custom
+    function via ``rolling.apply(raw=True)``, evaluated at the last time point of
+    a window, for many windows at once. Used for incremental feature computation
+    in recursive forecasting, where only the latest window changes.
+
+    Parameters
+    ----------
+    Z : 2D np.ndarray of shape (n_windows, window_length)
+        rows are windows to summarize, in temporal order.
+    summarizer : str in _WINDOW_FUNCS_NUMPY, or callable
+        window function, see WindowSummarizer. For "lag", window_length must be 1.
+
+    Returns
+    -------
+    np.ndarray of shape (n_windows,), summary of each window,
+        nan if the window contains nan, or is too short for the window function
+    """
+    n = Z.shape[1]
+    if callable(summarizer):
+        return np.array([summarizer(z) for z in Z], dtype=float)
+    if summarizer == "lag":
+        return Z[:, -1].astype(float)
+    if summarizer in ["sum", "mean", "median", "min", "max"]:
+        return getattr(np, summarizer)(Z, axis=1).astype(float)
+
+    # the remaining functions need a minimum number of observations
+    min_obs = {"std": 2, "var": 2, "sem": 2, "skew": 3, "kurt": 4}[summarizer]
+    if n < min_obs:
+        return np.full(Z.shape[0], np.nan)
+
+    # windows with a single unique value are treated as exactly uniform, as pandas
+    is_uniform = (Z == Z[:, :1]).all(axis=1)
+    if summarizer in ["std", "var", "sem"]:
+        res = np.var(Z, axis=1, ddof=1)
+        res[is_uniform] = 0.0
+        if summarizer == "std":
+            res = np.sqrt(res)
+        elif summarizer == "sem":
+            # pandas rolling sem divides by the square root of n - ddof
+            res = np.sqrt(res / (n - 1))
+        return res
+
+    centered = Z - Z.mean(axis=1, keepdims=True)
+    m2 = (centered**2).mean(axis=1)
+    # pandas treats variances below 1e-14 as zero, which results in nan
+    ok = m2 > 1e-14
+    m2_ok = np.where(ok, m2, 1.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if summarizer == "skew":
+            m3 = (centered**3).mean(axis=1)
+            res = np.sqrt(n * (n - 1.0)) * m3 / ((n - 2.0) * m2_ok**1.5)
+            uniform_value = 0.0
+        else:
+            m4 = (centered**4).mean(axis=1)
+            res = (n * n - 1.0) * m4 / m2_ok**2 - 3.0 * (n - 1.0) ** 2
+            res = res / ((n - 2.0) * (n - 3.0))
+            uniform_value = -3.0
+    res = np.where(ok, res, np.nan)
+    res[is_uniform] = uniform_value
+    return res
 
 
 ALLOWED_SUM_FUNCS = [
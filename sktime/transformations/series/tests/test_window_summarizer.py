@@ -169,3 +169,76 @@ def test_wrong_column():
     transformer = WindowSummarizer(target_cols=["dummy"])
     Xt = transformer.fit_transform(X_ll_train)
     return Xt
+
+
+@pytest.mark.parametrize("window_length", [1, 2, 3, 4, 7])
+@pytest.mark.parametrize(
+    "summarizer",
+    [
+        "sum",
+        "mean",
+        "median",
+        "std",
+        "var",
+        "kurt",
+        "min",
+        "max",
+        "skew",
+        "sem",
+        count_gt100,
+    ],
+)
+def test_summarize_windows_against_pandas(summarizer, window_length):
+    """Test that _summarize_windows equals pandas rolling at end of windows."""
+    from sktime.transformations.series.summarize import _summarize_windows
+
+    z = y_train.to_numpy().astype(float)
+    # constant windows are a special case in pandas rolling
+    z[10:20] = 100.0
+    windows = np.lib.stride_tricks.sliding_window_view(z, window_length)
+
+    if callable(summarizer):
+        rolling = pd.Series(z).rolling(window_length).apply(summarizer, raw=True)
+    else:
+        rolling = getattr(pd.Series(z).rolling(window_length), summarizer)()
+    expected = rolling.to_numpy()[window_length - 1 :]
+
+    actual = _summarize_windows(windows, summarizer)
+    np.testing.assert_allclose(actual, expected, rtol=1e-7, atol=1e-9)
+
+
+@pytest.mark.parametrize("truncate", [None, "bfill"])
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_window_summarizer_panel_per_instance(truncate, shuffle):
+    """Test that panel features equal features computed on each instance."""
+    from sktime.utils._testing.hierarchical import _make_hierarchical
+
+    lag_feature = {
+        "lag": [0, 1, 2],
+        "mean": [[0, 3], [2, 6]],
+        "std": [[1, 4]],
+        "quantile": [[1, 5, 0.9], [1, 4]],
+        "count": [[1, 3]],
+        "kurt": [[1, 5]],
+    }
+    X = _make_hierarchical(
+        hierarchy_levels=(3, 4), min_timepoints=8, max_timepoints=12, random_state=0
+    )
+    X.iloc[[3, 17]] = np.nan
+    if shuffle:
+        # instances interleaved, as after a sort by time point
+        X = X.sample(frac=1, random_state=0).sort_index(level=-1)
+
+    transformer = WindowSummarizer(lag_feature=lag_feature, truncate=truncate)
+    Xt = transformer.fit_transform(X)
+    assert Xt.index.equals(X.index)
+
+    Xt = Xt.sort_index()
+    for instance, X_instance in X.groupby(level=[0, 1]):
+        transformer = WindowSummarizer(lag_feature=lag_feature, truncate=truncate)
+        Xt_instance = transformer.fit_transform(X_instance.droplevel([0, 1]))
+        expected = Xt.loc[instance]
+        assert Xt_instance.columns.equals(expected.columns)
+        np.testing.assert_allclose(
+            Xt_instance.to_numpy(), expected.loc[Xt_instance.index].to_numpy()
+        )
@@ -37,6 +37,7 @@ from sktime.utils._testing.scenarios_transformers import (
     TransformerFitTransformSeriesUnivariate,
 )
 from sktime.utils._testing.series import _make_series
+from sktime.utils.parallel import _get_parallel_test_fixtures
 from sktime.utils.validation._dependencies import _check_soft_dependencies
 
 # other scenarios that might be needed later in development:
@@ -630,3 +631,34 @@ def test_vectorize_reconstruct_unique_columns():
     t = Detrender.create_test_instance()
     Xt = t.fit_transform(X)
     assert set(Xt.columns) == set([0, 1])
+
+
+@pytest.mark.parametrize("backend", _get_parallel_test_fixtures())
+@pytest.mark.parametrize("transformer", [BoxCoxTransformer, ExponentTransformer])
+def test_vectorization_parallel_backend(backend, transformer):
+    """Test that vectorization gives same results for all parallel backends."""
+    from sktime.utils._testing.hierarchical import _make_hierarchical
+
+    X = _make_hierarchical(hierarchy_levels=(2, 3), random_state=84)
+
+    t_serial = transformer()
+    Xt_serial = t_serial.fit_transform(X)
+
+    t_par = transformer()
+    t_par.set_config(
+        **{
+            "backend:parallel": backend["backend"],
+            "backend:parallel:params": backend["backend_params"],
+        }
+    )
+    Xt_par = t_par.fit_transform(X)
+
+    pd.testing.assert_frame_equal(Xt_serial, Xt_par)
+
+    # fitted transformers must be retrievable after a parallel fit
+    if not t_par.get_tag("fit_is_empty"):
+        assert t_par.transformers_.shape == t_serial.transformers_.shape
+        assert all(t.is_fitted for t in t_par.transformers_.values.flatten())
+        pd.testing.assert_frame_equal(
+            t_serial.inverse_transform(Xt_serial), t_par.inverse_transform(Xt_par)
+        )
@@ -3,7 +3,7 @@
 
 Objects compared can have one of the following valid types:
     types compatible with != comparison
-    pd.Series, pd.DataFrame, np.ndarray
+    pd.Series, pd.DataFrame, np.ndarray, scipy sparse matrices
     lists, tuples, or dicts of a valid type (recursive)
 """
 
@@ -14,6 +14,7 @@ __all__ = ["deep_equals"]
 
 import numpy as np
 import pandas as pd
+from scipy.sparse import issparse
 
 
 def deep_equals(x, y, return_msg=False):
@@ -21,7 +22,7 @@ def deep_equals(x, y, return_msg=False):
 
     Correct if x/y are one of the following valid types:
         types compatible with != comparison
-        pd.Series, pd.DataFrame, np.ndarray
+        pd.Series, pd.DataFrame, np.ndarray, scipy sparse matrices
         lists, tuples, or dicts of a valid type (recursive)
 
     Important note:
@@ -107,6 +108,10 @@ def deep_equals(x, y, return_msg=False):
         if x.dtype != y.dtype:
             return ret(False, f".dtype, x.dtype = {x.dtype} != y.dtype = {y.dtype}")
         return ret(np.array_equal(x, y, equal_nan=True), ".values")
+    elif issparse(x):
+        if x.shape != y.shape:
+            return ret(False, f".shape, x.shape = {x.shape} != y.shape = {y.shape}")
+        return ret((x != y).nnz == 0, ".values")
     # recursion through lists, tuples and dicts
     elif isinstance(x, (list, tuple)):
         return ret(*_tuple_equals(x, y, return_msg=True))
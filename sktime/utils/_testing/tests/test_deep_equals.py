@@ -5,6 +5,7 @@ from copy import deepcopy
 import numpy as np
 import pandas as pd
 import pytest
+from scipy import sparse
 
 from sktime.forecasting.base import ForecastingHorizon
 from sktime.utils._testing.deep_equals import deep_equals
@@ -24,6 +25,8 @@ EXAMPLES = [
     ForecastingHorizon([1, 2, 3], is_relative=False),
     {"foo": [42], "bar": pd.Series([1, 2])},
     {"bar": [42], "foo": pd.Series([1, 2])},
+    sparse.csr_matrix(np.array([[0.0, 1.0], [2.0, 0.0]])),
+    sparse.csr_matrix(np.array([[0.0, 1.0], [3.0, 0.0]])),
 ]
 
 
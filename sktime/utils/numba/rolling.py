@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""Numba rolling window utilities."""
+
+import numpy as np
+from numba import njit
+
+# codes of window functions supported by rolling_window_features
+WINDOW_FUNCS = {
+    "lag": 0,
+    "sum": 1,
+    "mean": 2,
+    "median": 3,
+    "std": 4,
+    "var": 5,
+    "kurt": 6,
+    "min": 7,
+    "max": 8,
+    "skew": 9,
+    "sem": 10,
+    "quantile": 11,
+    "count": 12,
+}
+
+
+@njit(cache=True)
+def _quantile(w, q, buffer):
+    """Quantile of w with linear interpolation, sorting a copy of w in buffer."""
+    n = len(w)
+    sorted_w = buffer[:n]
+    if n <= 64:
+        # insertion sort, faster than sort for short windows
+        for i in range(n):
+            value = w[i]
+            j = i - 1
+            while j >= 0 and sorted_w[j] > value:
+                sorted_w[j + 1] = sorted_w[j]
+                j -= 1
+            sorted_w[j + 1] = value
+    else:
+        sorted_w[:] = w
+        sorted_w.sort()
+    position = q * (n - 1)
+    lower = int(np.floor(position))
+    upper = min(lower + 1, n - 1)
+    return sorted_w[lower] + (sorted_w[upper] - sorted_w[lower]) * (position - lower)
+
+
+@njit(cache=True)
+def _summarize_window(w, func, q, buffer):
+    """Summarize a complete window w without nan, as pandas rolling.
+
+    Parameters
+    ----------
+    w : 1D np.ndarray, values in the window, in temporal order
+    func : int, code of the window function, see WINDOW_FUNCS
+    q : float, quantile, only used if func is "quantile"
+    buffer : 1D np.ndarray of length at least len(w), used for sorting
+
+    Returns
+    -------
+    float, summary of w, nan if w is too short for func
+    """
+    n = len(w)
+    if func == 0:
+        return w[n - 1]
+    if func == 1 or func == 2:
+        total = 0.0
+        for i in range(n):
+            total += w[i]
+        return total if func == 1 else total / n
+    if func == 3:
+        return _quantile(w, 0.5, buffer)
+    if func == 7:
+        return np.min(w)
+    if func == 8:
+        return np.max(w)
+    if func == 11:
+        return _quantile(w, q, buffer)
+
+    # moment based functions, windows with a single value are uniform as in pandas
+    min_obs = 2
+    if func == 9:
+        min_obs = 3
+    elif func == 6:
+        min_obs = 4
+    if n < min_obs:
+        return np.nan
+
+    is_uniform = True
+    for i in range(1, n):
+        if w[i] != w[0]:
+            is_uniform = False
+            break
+
+    mean = 0.0
+    for i in range(n):
+        mean += w[i]
+    mean = mean / n
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for i in range(n):
+        d = w[i] - mean
+        m2 += d * d
+        m3 += d * d * d
+        m4 += d * d * d * d
+    m2 = m2 / n
+    m3 = m3 / n
+    m4 = m4 / n
+
+    if func == 4 or func == 5 or func == 10:
+        if is_uniform:
+            return 0.0
+        var = m2 * n / (n - 1.0)
+        if func == 5:
+            return var
+        if func == 4:
+            return np.sqrt(var)
+        # pandas rolling sem divides by the square root of n - ddof
+        return np.sqrt(var / (n - 1.0))
+
+    # skew and kurt, pandas treats variances below 1e-14 as zero
+    if func == 9:
+        if is_uniform:
+            return 0.0
+        if m2 <= 1e-14:
+            return np.nan
+        return np.sqrt(n * (n - 1.0)) * m3 / ((n - 2.0) * m2**1.5)
+    if is_uniform:
+        return -3.0
+    if m2 <= 1e-14:
+        return np.nan
+    kurt = (n * n - 1.0) * m4 / (m2 * m2) - 3.0 * (n - 1.0) ** 2
+    return kurt / ((n - 2.0) * (n - 3.0))
+
+
+@njit(cache=True)
+def _backfill(x):
+    """Fill nan in x in-place with the next non-nan value, as pandas bfill."""
+    next_value = np.nan
+    for i in range(len(x) - 1, -1, -1):
+        if np.isnan(x[i]):
+            x[i] = next_value
+        else:
+            next_value = x[i]
+
+
+@njit(cache=True)
+def rolling_window_features(values, starts, funcs, lags, lengths, quantiles, bfill):
+    """Compute lagged rolling window features of a column, for all groups at once.
+
+    For each feature k, the value at row t of a group is the window function
+    funcs[k], applied to the lengths[k] values of the group up to row t - lags[k],
+    i.e., the same as pandas ``shift(lag).rolling(length)`` per group.
+    Windows never span more than one group.
+
+    Parameters
+    ----------
+    values : 1D np.ndarray of float, values of the column, rows of each group
+        are contiguous and in temporal order
+    starts : 1D np.ndarray of int, of length n_groups + 1
+        positions of the first row of each group, followed by len(values)
+    funcs : 1D np.ndarray of int, codes of window functions, see WINDOW_FUNCS
+    lags : 1D np.ndarray of int, lag of each feature
+    lengths : 1D np.ndarray of int, window length of each feature
+    quantiles : 1D np.ndarray of float, quantile of each feature,
+        only used for "quantile"
+    bfill : bool, whether to backward fill the shifted values and the features
+        per group, as the truncate="bfill" option of WindowSummarizer
+
+    Returns
+    -------
+    out : 2D np.ndarray of float, of shape (len(values), len(funcs))
+        features, nan where the window is incomplete or contains nan;
+        "count" is the number of non-nan values in incomplete windows too
+    """
+    n = len(values)
+    n_features = len(funcs)
+    # features are computed in rows of out, which is returned transposed
+    out = np.full((n_features, n), np.nan)
+    shifted = np.empty(n)
+    buffer = np.empty(max(lengths.max(), 1)) if n_features > 0 else np.empty(1)
+
+    for g in range(len(starts) - 1):
+        start = starts[g]
+        end = starts[g + 1]
+        for k in range(n_features):
+            lag = lags[k]
+            length = lengths[k]
+
+            for t in range(start, end):
+                source = t - lag
+                if source >= start and source < end:
+                    shifted[t] = values[source]
+                else:
+                    shifted[t] = np.nan
+            if bfill:
+                _backfill(shifted[start:end])
+
+            # number of nan in the window, incomplete windows count as nan
+            n_nan = length
+            for t in range(start, end):
+                first = t - length + 1
+                if np.isnan(shifted[t]):
+                    n_nan += 1
+                if first - 1 < start or np.isnan(shifted[first - 1]):
+                    n_nan -= 1
+                if funcs[k] == 12:
+                    out[k, t] = length - n_nan
+                elif n_nan == 0:
+                    window = shifted[first : t + 1]
+                    q = quantiles[k]
+                    out[k, t] = _summarize_window(window, funcs[k], q, buffer)
+
+            if bfill:
+                _backfill(out[k, start:end])
+    return out.T
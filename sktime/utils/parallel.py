@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# copyright: sktime developers, BSD-3-Clause License (see LICENSE file)
+"""Common abstraction utilities for parallelization backends.
+
+New parallelization or iteration backends can be added easily as follows:
+
+* Add a new backend name to ``BACKENDS``, syntax is function_name: backend_name
+* if function_name is new, create a new function with the signature
+  ``_parallelize_<function_name>(fun, iter, meta, backend, backend_params)``
+* ensure that ``_get_parallel_test_fixtures`` covers the new backend
+"""
+
+__all__ = ["parallelize"]
+
+from joblib import Parallel, delayed
+
+BACKENDS = {
+    "none": [None, "None"],
+    "joblib": ["loky", "multiprocessing", "threading"],
+}
+
+
+def parallelize(fun, iter, meta=None, backend=None, backend_params=None):
+    """Parallelize loop over a function, with a selectable backend.
+
+    Executes ``fun(x, meta)`` for every ``x`` in ``iter``, and returns the
+    results in the same order as ``iter``, irrespective of the backend.
+
+    Parameters
+    ----------
+    fun : callable, must have exactly two arguments, first argument of type ``x``
+        with process backends, ``fun`` must be picklable, e.g., defined at module level
+    iter : iterable, elements are passed as first argument to ``fun``
+    meta : dict, optional, default=None. Passed as second argument to ``fun``
+    backend : str, optional, default=None. Backend to use for parallelization.
+
+        - None or "None": executes loop sequentially, in the calling process
+        - "loky", "multiprocessing" and "threading": uses ``joblib.Parallel`` loops,
+          with the respective joblib backend
+
+    backend_params : dict, optional, default=None. Parameters for the backend.
+        for joblib backends, passed to ``joblib.Parallel`` as keyword arguments,
+        for instance ``n_jobs``; if not passed, ``n_jobs=-1`` is used.
+        One key is special and valid for all backends:
+
+        - "chunksize": int, optional. If passed, ``iter`` is split into
+          consecutive chunks of this size, and one task processes one chunk.
+          Reduces scheduling and serialization overhead for many cheap calls.
+
+    Returns
+    -------
+    list of return values of ``fun``, i-th element is ``fun(iter[i], meta)``
+    """
+    if meta is None:
+        meta = {}
+    if backend_params is None:
+        backend_params = {}
+    else:
+        backend_params = backend_params.copy()
+
+    chunksize = backend_params.pop("chunksize", None)
+
+    if chunksize is not None:
+        if not isinstance(chunksize, int) or chunksize < 1:
+            raise ValueError(
+                "chunksize in backend_params must be a positive int, "
+                f"but found {chunksize}"
+            )
+        iter = list(iter)
+        chunks = [iter[i : i + chunksize] for i in range(0, len(iter), chunksize)]
+        chunk_meta = {"fun": fun, "meta": meta}
+        ret_chunks = parallelize(
+            fun=_run_chunk,
+            iter=chunks,
+            meta=chunk_meta,
+            backend=backend,
+            backend_params=backend_params,
+        )
+        return [x for chunk in ret_chunks for x in chunk]
+
+    backend_name = _get_backend_function_name(backend)
+    para_fun = globals()[f"_parallelize_{backend_name}"]
+
+    return para_fun(
+        fun=fun, iter=iter, meta=meta, backend=backend, backend_params=backend_params
+    )
+
+
+def _get_backend_function_name(backend):
+    """Return name of the _parallelize function for backend, raise error if invalid."""
+    for backend_name, backend_values in BACKENDS.items():
+        if backend in backend_values:
+            return backend_name
+
+    valid_backends = [x for values in BACKENDS.values() for x in values]
+    raise ValueError(f"backend must be one of {valid_backends}, but found {backend}")
+
+
+def _run_chunk(chunk, meta):
+    """Run function on all elements of one chunk, for chunked parallelization."""
+    fun = meta["fun"]
+    fun_meta = meta["meta"]
+    return [fun(x, fun_meta) for x in chunk]
+
+
+def _parallelize_none(fun, iter, meta, backend, backend_params):
+    """Execute loop via simple sequential list comprehension."""
+    return [fun(x, meta=meta) for x in iter]
+
+
+def _parallelize_joblib(fun, iter, meta, backend, backend_params):
+    """Parallelize loop via joblib Parallel."""
+    par_params = backend_params.copy()
+    par_params["backend"] = backend
+    if "n_jobs" not in par_params:
+        par_params["n_jobs"] = -1
+
+    return Parallel(**par_params)(delayed(fun)(x, meta=meta) for x in iter)
+
+
+def _get_parallel_test_fixtures():
+    """Return fixtures for parallelization tests.
+
+    Returns a list of parameter fixtures, where each fixture
+    is a dict with keys "backend" and "backend_params".
+    """
+    fixtures = []
+
+    fixtures.append({"backend": None, "backend_params": None})
+    fixtures.append({"backend": "None", "backend_params": None})
+    fixtures.append({"backend": "loky", "backend_params": {"n_jobs": 2}})
+    fixtures.append({"backend": "threading", "backend_params": {"n_jobs": 2}})
+    fixtures.append(
+        {"backend": "loky", "backend_params": {"n_jobs": 2, "chunksize": 3}}
+    )
+    fixtures.append({"backend": None, "backend_params": {"chunksize": 2}})
+
+    return fixtures
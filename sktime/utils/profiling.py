@@ -111,3 +111,81 @@ def profile_classifier(
         res_summary.columns = res_summary.columns.swaplevel().sort_values()
 
         return res_summary
+
+
+def profile_predict_overhead(
+    forecaster,
+    y,
+    fh,
+    X=None,
+    X_pred=None,
+    n_calls=100,
+    configs=None,
+):
+    """Profile time per call of forecaster.predict, for configs of the forecaster.
+
+    Fits a clone of forecaster to y, with configs set, for each entry of configs.
+    Then calls predict n_calls times and measures the time per call.
+    For small y, the time per call is dominated by the overhead of the
+    boilerplate in BaseForecaster, e.g., input checks and conversions.
+
+    Parameters
+    ----------
+    forecaster : sktime forecaster, BaseForecaster descendant, object or class
+    y : time series in sktime compatible data container format, passed to fit
+    fh : int, list, np.array or ForecastingHorizon, passed to fit
+    X : time series in sktime compatible format, optional (default=None)
+        exogeneous data passed to fit
+    X_pred : time series in sktime compatible format, optional (default=None)
+        exogeneous data passed to predict, passed as is for all configs,
+        should be of the mtype in the "X_inner_mtype" tag of forecaster
+        if any of the configs sets input_conversion to "off"
+    n_calls : int, optional, default = 100
+        number of calls of predict per config
+    configs : dict of dict, optional, default = None = the following
+        {"default": {},
+        "trusted": {"input_conversion": "off", "output_conversion": "off"}}
+        keys are names of configs in the results, values are passed to set_config
+
+    Returns
+    -------
+    pd.DataFrame with results of experiment
+        row index = names of configs, keys of configs
+        col index = "time_per_call", "time_total"
+        entries are mean time per call of predict, and total time, in seconds
+
+    Examples
+    --------
+    >>> from sktime.datasets import load_airline
+    >>> from sktime.forecasting.naive import NaiveForecaster
+    >>> from sktime.utils.profiling import profile_predict_overhead
+    >>> y = load_airline()
+    >>> results = profile_predict_overhead(NaiveForecaster(), y, fh=[1, 2, 3])
+    """
+    if isclass(forecaster):
+        forecaster = forecaster.create_test_instance()
+    if configs is None:
+        configs = {
+            "default": {},
+            "trusted": {"input_conversion": "off", "output_conversion": "off"},
+        }
+
+    time_list = []
+    for config in configs.values():
+        fcst = forecaster.clone().set_config(**config)
+        fcst.fit(y, X=X, fh=fh)
+
+        start = timer()
+        for _ in range(n_calls):
+            fcst.predict(X=X_pred)
+        end = timer()
+        time_list += [end - start]
+
+    results = pd.DataFrame(
+        {
+            "time_per_call": [t / n_calls for t in time_list],
+            "time_total": time_list,
+        },
+        index=pd.Index(list(configs.keys()), name="config"),
+    )
+    return results
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Tests for parallelization utilities."""
+
+import pytest
+
+from sktime.utils.parallel import _get_parallel_test_fixtures, parallelize
+
+
+def _square_plus(x, meta):
+    """Test function for parallelize, module level to be picklable."""
+    return x**2 + meta["plus"]
+
+
+@pytest.mark.parametrize("fixture", _get_parallel_test_fixtures())
+def test_parallelize(fixture):
+    """Test that parallelize returns the same, ordered results for all backends."""
+    iter = list(range(11))
+    expected = [x**2 + 3 for x in iter]
+
+    result = parallelize(
+        fun=_square_plus,
+        iter=iter,
+        meta={"plus": 3},
+        backend=fixture["backend"],
+        backend_params=fixture["backend_params"],
+    )
+
+    assert result == expected
+
+
+def test_parallelize_invalid_backend():
+    """Test that parallelize raises an informative error on unknown backend."""
+    with pytest.raises(ValueError, match="backend must be one of"):
+        parallelize(fun=_square_plus, iter=[1], meta={"plus": 1}, backend="foo")